@@ -394,3 +394,8 @@ def reset_response_cache() -> None:
 # disable cache for current invocation (thread-local, used by --no-cache flag)
 def disable_cache_for_invocation() -> None:
     _cache_disabled_local.disabled = True
+
+
+# whether --no-cache is active for current invocation (also bypasses stage memo)
+def cache_disabled_for_invocation() -> bool:
+    return _is_cache_disabled()
@@ -92,6 +92,11 @@ EMPTY_EDIT_PATH = (
 )
 
 
+# ! bump when sectionizer prompt or response normalization changes (invalidates
+# ! cached sections results)
+SECTIONIZER_PROMPT_VERSION = 1
+
+
 # * Build sectionizer prompt for LLM
 def build_sectionizer_prompt(resume_with_line_numbers: str) -> str:
     return (
@@ -117,4 +117,5 @@ from .commands import init as _init  # noqa: F401
 from .commands import cache as _cache  # noqa: F401
 from .commands import ats as _ats  # noqa: F401
 from .commands import bulk as _bulk  # noqa: F401
+from .commands import rebase as _rebase  # noqa: F401
 from .commands.dev import display as _display  # noqa: F401
@@ -3,10 +3,12 @@
 
 from __future__ import annotations
 
+import json
 import random
+import sqlite3
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional, TypeVar
@@ -17,6 +19,8 @@ from ..core.bulk_types import (
     JobResult,
     BulkResult,
     JobStatus,
+    CascadeSummary,
+    DuplicateCluster,
 )
 from ..core.comparison_matrix import (
     analyze_edits,
@@ -25,23 +29,57 @@ from ..core.comparison_matrix import (
     calculate_fit_score,
     detect_keyword_stuffing,
     build_validation_summary,
+    select_cascade_promotions,
+    summarize_cascade,
 )
 from ..core.constants import RiskLevel, ValidationPolicy
-from ..core.exceptions import RetryExhaustedError, JobDiscoveryError
+from ..core.exceptions import (
+    RetryExhaustedError,
+    JobDiscoveryError,
+    BulkProcessingError,
+    DocumentParseError,
+)
+from ..core.keyword_matcher import KeywordMatcher
+from ..core.prerank import score_against_query, select_ranked
+from ..core.rebase import rebase_edits
+from ..core.stage_graph import json_hash
+from ..core.interval_index import LineIndex
+from ..core.verbose import vlog_think
 from ..core.validation import validate_edits
-from ..loom_io import read_text, read_resume
+from ..loom_io import read_text, read_resume_document, DocxTemplate, docx_template
 from ..loom_io.bulk_io import (
     discover_jobs,
     deduplicate_job_specs,
+    cluster_duplicate_postings,
+    link_duplicate_artifacts,
     create_bulk_output_layout,
     write_run_metadata,
     write_job_artifacts,
     write_matrix_files,
+    read_run_metadata,
+    find_base_resume,
+    find_reusable_jobs,
+    job_content_hash,
+    latest_job_records,
+    load_bulk_result,
+)
+from ..loom_io.generics import read_json_safe, write_json_safe
+from ..loom_io.object_store import ObjectStore
+from ..loom_io.result_journal import JOURNAL_NAME, ResultJournal
+from ..loom_io.results_db import ResultsDB
+from ..loom_io.keyword_packs import (
+    find_keyword_packs,
+    keyword_pack_dirs,
+    load_keyword_matcher,
 )
-from ..loom_io.generics import read_json_safe
 from ..core.types import Lines
 from .runner import TailoringMode, TailoringRunner, build_tailoring_context
-from .logic import ArgResolver
+from .logic import (
+    ArgResolver,
+    cached_sections,
+    local_docx_sections,
+    sectionize_core,
+)
 
 
 T = TypeVar("T")
@@ -61,6 +99,32 @@ class BulkConfig:
     fail_fast: bool = False
     preserve_formatting: bool = True
     preserve_mode: str = "in_place"
+    # cascade mode: triage every job w/ cheap model, finish promoted jobs w/ model
+    triage_model: Optional[str] = None
+    cascade_top: Optional[int] = None
+    cascade_threshold: Optional[float] = None
+    # TF-IDF pre-rank cutoffs applied before any LLM call
+    top_k: Optional[int] = None
+    min_score: Optional[float] = None
+    # near-duplicate content dedup: tailor one representative per cluster (None = off)
+    dedup_threshold: Optional[float] = None
+    # extra keyword pack files/dirs on top of .loom/keywords & template keywords/
+    keyword_packs: list[Path] = field(default_factory=list)
+    # previous bulk run whose edits are rebased onto current resume instead of
+    # asking the model again (jobs w/ unchanged posting & rebasable edits only)
+    rebase_from: Optional[Path] = None
+    # re-run AI sectionizer once for the run instead of reusing cached sections
+    refresh_sections: bool = False
+    # persist edits & analysis only (edits applied in memory for coverage); resume
+    # documents are rendered on demand via `loom bulk materialize`
+    lazy: bool = False
+    # dedup job artifacts into content-addressed .loom/objects (hard-linked)
+    artifact_store: bool = True
+    # reuse finished results of earlier runs in output_dir for unchanged postings
+    # (same resume, posting, model & settings); only new/changed jobs are tailored
+    incremental: bool = False
+    # index results in .loom/results.db for cross-run `loom bulk query`
+    record_results: bool = True
 
 
 # run function w/ jittered backoff on retryable errors
@@ -103,6 +167,44 @@ def _run_with_retry(
     )
 
 
+# snapshot settings that don't change a job's edits or analysis (ignored for reuse)
+_REUSE_IGNORED_SETTINGS = frozenset(
+    {
+        "parallel",
+        "artifact_store",
+        "rebase_from",
+        "dedup_threshold",
+        "sections",
+        "incremental",
+    }
+)
+
+
+# artifact store shared by all bulk runs of project
+def artifact_store(settings: LoomSettings) -> ObjectStore:
+    return ObjectStore(settings.loom_dir / "objects")
+
+
+# results database shared by all bulk runs of project
+def results_db(settings: LoomSettings) -> ResultsDB:
+    return ResultsDB(settings.loom_dir / "results.db")
+
+
+# * Rebuild run's matrix files from its journal & (re)index results for querying
+# indexing is best effort: a locked or broken database never fails the run
+def finalize_bulk_run(
+    settings: LoomSettings, run_dir: Path, record_results: bool = True
+) -> BulkResult:
+    result = load_bulk_result(run_dir)
+    write_matrix_files(run_dir, result)
+    if record_results:
+        try:
+            results_db(settings).record_run(result, read_run_metadata(run_dir))
+        except sqlite3.Error as e:
+            vlog_think(f"Results database not updated for {run_dir.name}: {e}")
+    return result
+
+
 # read tailored resume as text for keyword analysis
 def _read_tailored_resume_text(output_path: Path, original_lines: Lines) -> str:
     suffix = output_path.suffix.lower()
@@ -126,11 +228,34 @@ class BulkRunner:
         self.resolver = ArgResolver(settings)
         # cached sections JSON string for analyze_edits
         self._sections_json: Optional[str] = None
+        # sections resolved once for the run & shared by every job (see _prepare_sections)
+        self._run_sections_path: Optional[Path] = None
+        # compiled keyword matcher (built-ins + keyword packs), loaded once per run
+        self._keyword_matcher: Optional[KeywordMatcher] = None
+        self._keyword_pack_paths: list[Path] = []
+        # resume lines indexed once & shared by every job's edit validation
+        self._resume_index: Optional[LineIndex] = None
+        # pre-rank similarity scores by job ID (populated when pre-ranking)
+        self._prerank_scores: dict[str, float] = {}
+        # previous run to rebase edits from: (run dir, run.json, base resume lines)
+        self._rebase_source: Optional[tuple[Path, dict, Lines]] = None
+        # pre-parsed source DOCX shared by all jobs' formatted writes
+        self._docx_template: Optional[DocxTemplate] = None
+        # lazy mode: tailored text by job ID (no document on disk to re-read)
+        self._tailored_texts: dict[str, str] = {}
+        # content-addressed store job artifacts are linked from (None = plain copies)
+        self._store: Optional[ObjectStore] = None
+        # incremental mode: earlier runs' finished job records by posting content hash
+        self._reusable: dict[str, list[tuple[Path, dict]]] = {}
+        # durable per-job result log of current run (matrix files are rebuilt from it)
+        self._journal: Optional[ResultJournal] = None
 
         # callbacks for progress reporting
         self.on_job_start: Optional[Callable[[JobSpec, int, int], None]] = None
         self.on_job_complete: Optional[Callable[[JobResult, int, int], None]] = None
         self.on_retry: Optional[Callable[[str], None]] = None
+        # cascade pass start: (stage, model, job_count)
+        self.on_pass_start: Optional[Callable[[str, str, int], None]] = None
 
     # * Load sections JSON if sections_path is configured
     def _load_sections_json(self) -> Optional[str]:
@@ -147,6 +272,188 @@ class BulkRunner:
 
         return self._sections_json
 
+    # * Resolve sections once per run when no sections file exists (or on refresh)
+    # confident local DOCX analysis, else cached sectionizer result for resume & model
+    # (fresh model call w/ refresh), is saved to run dir so jobs don't each re-derive
+    def _prepare_sections(self, bulk_dir: Path) -> None:
+        if self.config.resume.suffix.lower() in (".tex", ".typ"):
+            return
+        configured = self.config.sections_path or self.settings.sections_path
+        if configured.exists() and not self.config.refresh_sections:
+            return
+
+        lines = self._load_resume_index().lines
+        if self.config.refresh_sections:
+            sections, _ = sectionize_core(
+                self.settings, lines, self.config.model, refresh=True
+            )
+        else:
+            sections = local_docx_sections(
+                self.config.resume, lines
+            ) or cached_sections(self.settings, lines, self.config.model)
+        if sections is None:
+            return
+
+        self._run_sections_path = bulk_dir / "sections.json"
+        write_json_safe(sections, self._run_sections_path)
+        self._sections_json = json.dumps(sections)
+        self._store_artifacts(self._run_sections_path)
+
+    # pre-indexed resume lines for batch validation (resume is fixed for the run)
+    def _load_resume_index(self) -> LineIndex:
+        if self._resume_index is None:
+            document = read_resume_document(self.config.resume)
+            self._resume_index = LineIndex(document)
+        return self._resume_index
+
+    # * Parse source DOCX once into the shared template every job's output copies
+    # (jobs reach it through the process-wide template cache when writing)
+    def _load_docx_template(self) -> None:
+        if (
+            self.config.resume.suffix.lower() != ".docx"
+            or not self.config.preserve_formatting
+            or self.config.lazy
+        ):
+            return
+        try:
+            self._docx_template = docx_template(self.config.resume)
+        except DocumentParseError:
+            # warm-up only; each job reports its own read/write failure
+            self._docx_template = None
+
+    # * Swap written artifacts for links to store blobs (best effort; copies stay valid)
+    def _store_artifacts(self, path: Path) -> None:
+        if self._store is None:
+            return
+        try:
+            if path.is_dir():
+                self._store.adopt_dir(path)
+            else:
+                self._store.adopt(path)
+        except OSError as e:
+            vlog_think(f"Artifact store skipped for {path}: {e}")
+
+    # * Load previous run's metadata & base resume for edit rebasing
+    def _load_rebase_source(self) -> None:
+        prev_dir = self.config.rebase_from
+        if prev_dir is None:
+            return
+        run_meta = read_run_metadata(prev_dir)
+        base_resume = find_base_resume(prev_dir, run_meta)
+        if base_resume is None:
+            raise BulkProcessingError(
+                f"Cannot rebase from {prev_dir}: run has no base resume snapshot"
+            )
+        self._rebase_source = (prev_dir, run_meta, read_resume_document(base_resume))
+
+    # * Rebase previous run's edits for job into edits_path; False if model is needed
+    # requires same model, unchanged posting & every op surviving the rebase
+    def _rebase_previous_edits(
+        self, spec: JobSpec, model: str, edits_path: Path
+    ) -> bool:
+        if self._rebase_source is None or model != self.config.model:
+            return False
+        prev_dir, run_meta, old_lines = self._rebase_source
+        prev_job = run_meta.get("jobs", {}).get(spec.id)
+        prev_edits = prev_dir / spec.id / "edits.json"
+        if (
+            run_meta.get("model") != model
+            or not prev_job
+            or prev_job.get("content_hash") != job_content_hash(spec.path)
+            or not prev_edits.exists()
+        ):
+            return False
+
+        rebased = rebase_edits(
+            read_json_safe(prev_edits), old_lines, self._load_resume_index().lines
+        )
+        if not rebased.clean:
+            return False
+        write_json_safe(rebased.edits, edits_path)
+        return True
+
+    # * Key identifying runs whose job results are interchangeable w/ this one
+    # hashes resume, model, result-affecting settings, sections & keyword pack contents
+    def _reuse_key(self, settings_snapshot: dict) -> str:
+        sections_path = (
+            self._run_sections_path
+            or self.config.sections_path
+            or self.settings.sections_path
+        )
+        return json_hash(
+            {
+                "resume": job_content_hash(self.config.resume),
+                "model": self.config.model,
+                "settings": {
+                    k: v
+                    for k, v in settings_snapshot.items()
+                    if k not in _REUSE_IGNORED_SETTINGS
+                },
+                "sections": job_content_hash(sections_path),
+                "keyword_packs": [
+                    job_content_hash(p) for p in self._keyword_pack_paths
+                ],
+            }
+        )
+
+    # * Reuse earlier run's finished result for unchanged posting (None = recompute)
+    # artifacts are linked into output_dir; failed & unreadable records are skipped
+    def _reuse_previous_result(
+        self, spec: JobSpec, output_dir: Path, settings_snapshot: dict
+    ) -> Optional[JobResult]:
+        if not spec.path.exists():
+            return None
+        candidates = self._reusable.get(job_content_hash(spec.path) or "", [])
+        for prev_run, record in candidates:
+            source_dir = _recorded_job_dir(prev_run, record)
+            if source_dir is None or not source_dir.is_dir():
+                continue
+
+            result = JobResult.from_dict(record, spec)
+            write_job_artifacts(
+                output_dir,
+                spec,
+                read_text(spec.path),
+                result.model or self.config.model,
+                settings_snapshot,
+                store=self._store,
+            )
+            link_duplicate_artifacts(source_dir, output_dir)
+
+            result.output_dir = output_dir
+            if result.edits_path is not None:
+                result.edits_path = output_dir / result.edits_path.name
+            if result.resume_path is not None:
+                result.resume_path = output_dir / result.resume_path.name
+            result.prerank_score = self._prerank_scores.get(spec.id)
+            result.reused_from = prev_run.name
+            # nothing was recomputed for this job in this run
+            result.runtime_seconds = 0.0
+            self._journal_result(result)
+            return result
+        return None
+
+    # append finished result to run journal (no-op outside run())
+    def _journal_result(self, result: JobResult, stage: str = "final") -> None:
+        if self._journal is not None:
+            self._journal.append_result(result, stage)
+
+    # * Load compiled keyword matcher from discovered & configured keyword packs
+    def _load_keyword_matcher(self) -> KeywordMatcher:
+        if self._keyword_matcher is not None:
+            return self._keyword_matcher
+
+        dirs = keyword_pack_dirs(self.settings.loom_dir, self.config.resume)
+        dirs.extend(p for p in self.config.keyword_packs if p.is_dir())
+        pack_paths = find_keyword_packs(dirs)
+        pack_paths.extend(p for p in self.config.keyword_packs if not p.is_dir())
+
+        self._keyword_pack_paths = pack_paths
+        self._keyword_matcher = load_keyword_matcher(
+            pack_paths, Path(self.settings.cache_dir)
+        )
+        return self._keyword_matcher
+
     # execute bulk processing & return aggregated results
     def run(self) -> BulkResult:
         # discover jobs
@@ -157,12 +464,46 @@ class BulkRunner:
         # deduplicate IDs (handles truncation collisions)
         job_specs = deduplicate_job_specs(raw_specs)
 
+        # cluster near-duplicate postings; only representatives are tailored
+        duplicates: list[DuplicateCluster] = []
+        if self.config.dedup_threshold is not None:
+            duplicates = cluster_duplicate_postings(
+                job_specs, self.config.dedup_threshold
+            )
+        member_ids = {m for cluster in duplicates for m in cluster.members}
+        unique_specs = [spec for spec in job_specs if spec.id not in member_ids]
+
+        # pre-rank by TF-IDF similarity so only promising jobs reach the model
+        prerank_meta = None
+        if self.config.top_k is not None or self.config.min_score is not None:
+            unique_specs, prerank_meta = self._prerank(unique_specs)
+            if not unique_specs:
+                raise BulkProcessingError(
+                    "No jobs passed pre-rank cutoff (--top-k/--min-score)"
+                )
+
+        # duplicates follow their representative through pre-rank selection
+        selected_ids = {spec.id for spec in unique_specs}
+        duplicates = [c for c in duplicates if c.representative in selected_ids]
+        selected_ids.update(m for cluster in duplicates for m in cluster.members)
+        job_specs = [spec for spec in job_specs if spec.id in selected_ids]
+
         # create output layout
         bulk_dir, job_dirs = create_bulk_output_layout(
             self.config.output_dir,
             job_specs,
         )
 
+        if self.config.artifact_store:
+            self._store = artifact_store(self.settings)
+
+        # compile keyword vocabulary, load rebase source, sections & DOCX template
+        # before workers start
+        self._load_keyword_matcher()
+        self._load_rebase_source()
+        self._prepare_sections(bulk_dir)
+        self._load_docx_template()
+
         # settings snapshot for reproducibility
         settings_snapshot = {
             "risk": self.config.risk.value,
@@ -171,23 +512,63 @@ class BulkRunner:
             "preserve_mode": self.config.preserve_mode,
             "parallel": self.config.parallel,
         }
+        if self.config.triage_model:
+            settings_snapshot["cascade"] = {
+                "triage_model": self.config.triage_model,
+                "top_n": self.config.cascade_top,
+                "threshold": self.config.cascade_threshold,
+            }
+        if self._run_sections_path is not None:
+            settings_snapshot["sections"] = self._run_sections_path.name
+        if self.config.dedup_threshold is not None:
+            settings_snapshot["dedup_threshold"] = self.config.dedup_threshold
+        if self._keyword_pack_paths:
+            settings_snapshot["keyword_packs"] = [
+                str(p) for p in self._keyword_pack_paths
+            ]
+        if self.config.rebase_from is not None:
+            settings_snapshot["rebase_from"] = str(self.config.rebase_from)
+        if self.config.lazy:
+            settings_snapshot["lazy"] = True
+        if self._store is not None:
+            settings_snapshot["artifact_store"] = True
+        if self.config.incremental:
+            settings_snapshot["incremental"] = True
 
         # write run metadata
+        reuse_key = self._reuse_key(settings_snapshot)
         write_run_metadata(
             bulk_dir,
             self.config.resume,
             self.config.model,
             settings_snapshot,
             job_specs,
+            prerank=prerank_meta,
+            duplicates=duplicates,
+            store=self._store,
+            reuse_key=reuse_key,
         )
 
-        # process jobs
+        # process jobs; every finished result is journaled as it completes
         timestamp = datetime.now().isoformat()
-
-        if self.config.parallel > 1:
-            results = self._run_parallel(job_specs, job_dirs, settings_snapshot)
-        else:
-            results = self._run_sequential(job_specs, job_dirs, settings_snapshot)
+        self._journal = ResultJournal(bulk_dir / JOURNAL_NAME)
+        try:
+            results, cascade = self._process_jobs(
+                unique_specs,
+                job_specs,
+                job_dirs,
+                duplicates,
+                settings_snapshot,
+                reuse_key,
+                bulk_dir,
+            )
+        except KeyboardInterrupt:
+            # keep matrix of jobs finished so far; --incremental picks up the rest
+            finalize_bulk_run(self.settings, bulk_dir, self.config.record_results)
+            raise
+        finally:
+            self._journal.close()
+            self._journal = None
 
         # build final result
         bulk_result = BulkResult(
@@ -196,19 +577,280 @@ class BulkRunner:
             timestamp=timestamp,
             output_dir=bulk_dir,
             jobs=results,
+            cascade=cascade,
+            prerank_scored=prerank_meta["scored"] if prerank_meta else None,
+            duplicates=duplicates,
+            incremental=self.config.incremental,
         )
 
-        # write matrix files
-        write_matrix_files(bulk_dir, bulk_result)
+        # matrix files & results index are rebuilt from the journal, same as after
+        # an interruption
+        finalize_bulk_run(self.settings, bulk_dir, self.config.record_results)
 
         return bulk_result
 
+    # * Reuse earlier results (incremental), tailor the rest & fill in duplicates
+    # returns results for all jobs in discovery order & cascade summary (if any)
+    def _process_jobs(
+        self,
+        unique_specs: list[JobSpec],
+        job_specs: list[JobSpec],
+        job_dirs: dict[str, Path],
+        duplicates: list[DuplicateCluster],
+        settings_snapshot: dict,
+        reuse_key: str,
+        bulk_dir: Path,
+    ) -> tuple[list[JobResult], Optional[CascadeSummary]]:
+        # incremental: finished results of earlier (or interrupted) runs are reused,
+        # only new & changed postings go to the model
+        reused: list[JobResult] = []
+        pending_specs = unique_specs
+        if self.config.incremental:
+            self._reusable = find_reusable_jobs(
+                self.config.output_dir, reuse_key, exclude=bulk_dir
+            )
+            pending_specs = []
+            for spec in unique_specs:
+                previous = self._reuse_previous_result(
+                    spec, job_dirs[spec.id], settings_snapshot
+                )
+                if previous is None:
+                    pending_specs.append(spec)
+                else:
+                    reused.append(previous)
+
+        cascade: Optional[CascadeSummary] = None
+        if self.config.triage_model:
+            results, cascade = self._run_cascade(
+                pending_specs, job_dirs, settings_snapshot
+            )
+            if self._journal is not None:
+                self._journal.append({"type": "cascade", "summary": cascade.to_dict()})
+        else:
+            results = self._run_jobs(
+                pending_specs, job_dirs, settings_snapshot, self.config.model
+            )
+        if reused:
+            order = {spec.id: i for i, spec in enumerate(unique_specs)}
+            results = sorted(results + reused, key=lambda r: order[r.spec.id])
+        if duplicates:
+            results = self._reuse_duplicate_outputs(
+                results, duplicates, job_specs, job_dirs, settings_snapshot
+            )
+        return results, cascade
+
+    # * Score all jobs against resume in one TF-IDF pass & keep top-k / above min-score
+    def _prerank(self, job_specs: list[JobSpec]) -> tuple[list[JobSpec], dict]:
+        resume_text = "\n".join(self._load_resume_index().lines.values())
+
+        job_texts: list[str] = []
+        for spec in job_specs:
+            try:
+                job_texts.append(read_text(spec.path))
+            except (OSError, UnicodeDecodeError):
+                # unreadable jobs score 0 & surface their error if selected
+                job_texts.append("")
+
+        scores = score_against_query(resume_text, job_texts)
+        ranked = select_ranked(
+            [spec.id for spec in job_specs],
+            scores,
+            top_k=self.config.top_k,
+            min_score=self.config.min_score,
+        )
+        self._prerank_scores = dict(zip((spec.id for spec in job_specs), scores))
+
+        # keep discovery order for selected jobs
+        selected_ids = {r.job_id for r in ranked}
+        selected = [spec for spec in job_specs if spec.id in selected_ids]
+
+        all_ranked = select_ranked([spec.id for spec in job_specs], scores)
+        prerank_meta = {
+            "top_k": self.config.top_k,
+            "min_score": self.config.min_score,
+            "scored": len(job_specs),
+            "selected": len(selected),
+            "scores": [r.to_dict() for r in all_ranked],
+        }
+        return selected, prerank_meta
+
+    # * Fill in results for duplicate members from their representative's outputs
+    # returns results for all jobs in discovery order
+    def _reuse_duplicate_outputs(
+        self,
+        results: list[JobResult],
+        duplicates: list[DuplicateCluster],
+        job_specs: list[JobSpec],
+        job_dirs: dict[str, Path],
+        settings_snapshot: dict,
+    ) -> list[JobResult]:
+        by_id = {r.spec.id: r for r in results}
+        specs_by_id = {spec.id: spec for spec in job_specs}
+        for cluster in duplicates:
+            representative = by_id[cluster.representative]
+            for member_id in cluster.members:
+                by_id[member_id] = self._duplicate_result(
+                    representative,
+                    specs_by_id[member_id],
+                    job_dirs[member_id],
+                    settings_snapshot,
+                )
+                self._journal_result(by_id[member_id])
+        return [by_id[spec.id] for spec in job_specs if spec.id in by_id]
+
+    # link representative artifacts into member dir & score them against member posting
+    def _duplicate_result(
+        self,
+        representative: JobResult,
+        spec: JobSpec,
+        output_dir: Path,
+        settings_snapshot: dict,
+    ) -> JobResult:
+        result = JobResult(
+            spec=spec,
+            status=JobStatus.SKIPPED,
+            model=representative.model,
+            duplicate_of=representative.spec.id,
+            prerank_score=self._prerank_scores.get(representative.spec.id),
+        )
+        tailored_text = self._tailored_texts.get(representative.spec.id)
+        if (
+            representative.status != JobStatus.SUCCESS
+            or representative.output_dir is None
+            or (representative.resume_path is None and tailored_text is None)
+        ):
+            result.error = (
+                f"Near-duplicate of {representative.spec.id}, which did not succeed"
+            )
+            return result
+
+        try:
+            job_text = read_text(spec.path)
+            write_job_artifacts(
+                output_dir,
+                spec,
+                job_text,
+                result.model or self.config.model,
+                settings_snapshot,
+                store=self._store,
+            )
+            link_duplicate_artifacts(representative.output_dir, output_dir)
+
+            # edits & validation are shared; coverage reflects member's own posting
+            result.edits = representative.edits
+            result.validation = representative.validation
+            result.keyword_stuffing_score = representative.keyword_stuffing_score
+            matcher = self._load_keyword_matcher()
+            required_kw, preferred_kw = extract_job_keywords(job_text, matcher)
+            if tailored_text is None:
+                assert representative.resume_path is not None
+                tailored_text = _read_tailored_resume_text(
+                    representative.resume_path, {}
+                )
+            result.coverage = calculate_keyword_coverage(
+                tailored_text, required_kw, preferred_kw, matcher
+            )
+            result.fit_score = calculate_fit_score(result)
+
+            result.output_dir = output_dir
+            if representative.resume_path is not None:
+                result.resume_path = output_dir / representative.resume_path.name
+            if representative.edits_path is not None:
+                result.edits_path = output_dir / representative.edits_path.name
+            result.status = JobStatus.SUCCESS
+        except Exception as e:
+            result.status = JobStatus.FAILED
+            result.error = str(e)
+
+        return result
+
+    # * Two-tier cascade: triage all jobs w/ cheap model, re-tailor promoted jobs w/ final model
+    def _run_cascade(
+        self,
+        job_specs: list[JobSpec],
+        job_dirs: dict[str, Path],
+        settings_snapshot: dict,
+    ) -> tuple[list[JobResult], CascadeSummary]:
+        assert self.config.triage_model is not None, "triage_model required"
+        triage_model = self.config.triage_model
+
+        # triage pass writes into <job_dir>/triage so final outputs stay at top level
+        triage_dirs = {job_id: d / "triage" for job_id, d in job_dirs.items()}
+        if self.on_pass_start:
+            self.on_pass_start("triage", triage_model, len(job_specs))
+        triage_results = self._run_jobs(
+            job_specs, triage_dirs, settings_snapshot, triage_model, stage="triage"
+        )
+        for triage in triage_results:
+            triage.record_pass("triage")
+
+        # promote top-N / above-threshold jobs to final model
+        promoted_ids = set(
+            select_cascade_promotions(
+                triage_results,
+                top_n=self.config.cascade_top,
+                threshold=self.config.cascade_threshold,
+            )
+        )
+        promoted_specs = [spec for spec in job_specs if spec.id in promoted_ids]
+
+        final_results: list[JobResult] = []
+        if promoted_specs:
+            if self.on_pass_start:
+                self.on_pass_start("final", self.config.model, len(promoted_specs))
+            final_results = self._run_jobs(
+                promoted_specs, job_dirs, settings_snapshot, self.config.model
+            )
+        final_by_id = {r.spec.id: r for r in final_results}
+
+        # merge passes; failed final pass falls back to triage outputs
+        results: list[JobResult] = []
+        for triage in triage_results:
+            final = final_by_id.get(triage.spec.id)
+            if final is None:
+                results.append(triage)
+                continue
+            final.passes = list(triage.passes)
+            final.record_pass("final")
+            if final.status == JobStatus.SUCCESS:
+                results.append(final)
+            else:
+                triage.passes = final.passes
+                results.append(triage)
+        # merged results (w/ pass history) supersede journaled per-pass entries
+        for merged in results:
+            self._journal_result(merged)
+
+        cascade = summarize_cascade(
+            triage_model,
+            self.config.model,
+            triage_results,
+            final_results,
+            top_n=self.config.cascade_top,
+            threshold=self.config.cascade_threshold,
+        )
+        return results, cascade
+
+    # dispatch job processing to sequential or parallel executor
+    def _run_jobs(
+        self,
+        job_specs: list[JobSpec],
+        job_dirs: dict[str, Path],
+        settings_snapshot: dict,
+        model: str,
+        stage: str = "final",
+    ) -> list[JobResult]:
+        run = self._run_parallel if self.config.parallel > 1 else self._run_sequential
+        return run(job_specs, job_dirs, settings_snapshot, model, stage)
+
     # process jobs sequentially
     def _run_sequential(
         self,
         job_specs: list[JobSpec],
         job_dirs: dict[str, Path],
         settings_snapshot: dict,
+        model: str,
+        stage: str = "final",
     ) -> list[JobResult]:
         results: list[JobResult] = []
         total = len(job_specs)
@@ -218,9 +860,10 @@ class BulkRunner:
                 self.on_job_start(spec, i + 1, total)
 
             result = self._process_single_job(
-                spec, job_dirs[spec.id], settings_snapshot
+                spec, job_dirs[spec.id], settings_snapshot, model
             )
             results.append(result)
+            self._journal_result(result, stage)
 
             if self.on_job_complete:
                 self.on_job_complete(result, i + 1, total)
@@ -233,18 +876,24 @@ class BulkRunner:
                             spec=remaining_spec,
                             status=JobStatus.SKIPPED,
                             error="Skipped due to --fail-fast",
+                            model=model,
+                            prerank_score=self._prerank_scores.get(remaining_spec.id),
                         )
                     )
+                    self._journal_result(results[-1], stage)
                 break
 
         return results
 
     # process jobs in parallel w/ bounded concurrency & retry
+    # (results are journaled here on the coordinating thread, never by workers)
     def _run_parallel(
         self,
         job_specs: list[JobSpec],
         job_dirs: dict[str, Path],
         settings_snapshot: dict,
+        model: str,
+        stage: str = "final",
     ) -> list[JobResult]:
         results: list[JobResult] = []
         total = len(job_specs)
@@ -253,7 +902,7 @@ class BulkRunner:
         def process_with_retry(spec: JobSpec) -> JobResult:
             return _run_with_retry(
                 lambda: self._process_single_job(
-                    spec, job_dirs[spec.id], settings_snapshot
+                    spec, job_dirs[spec.id], settings_snapshot, model
                 ),
                 job_id=spec.id,
                 logger=self.on_retry,
@@ -275,9 +924,12 @@ class BulkRunner:
                         spec=spec,
                         status=JobStatus.FAILED,
                         error=str(e),
+                        model=model,
+                        prerank_score=self._prerank_scores.get(spec.id),
                     )
 
                 results.append(result)
+                self._journal_result(result, stage)
 
                 if self.on_job_complete:
                     self.on_job_complete(result, completed, total)
@@ -294,9 +946,16 @@ class BulkRunner:
         spec: JobSpec,
         output_dir: Path,
         settings_snapshot: dict,
+        model: Optional[str] = None,
     ) -> JobResult:
+        model = model or self.config.model
         start_time = time.time()
-        result = JobResult(spec=spec, status=JobStatus.RUNNING)
+        result = JobResult(
+            spec=spec,
+            status=JobStatus.RUNNING,
+            model=model,
+            prerank_score=self._prerank_scores.get(spec.id),
+        )
 
         try:
             # read job text
@@ -307,8 +966,9 @@ class BulkRunner:
                 output_dir,
                 spec,
                 job_text,
-                self.config.model,
+                model,
                 settings_snapshot,
+                store=self._store,
             )
 
             # determine output paths
@@ -316,14 +976,18 @@ class BulkRunner:
             edits_path = output_dir / "edits.json"
             output_resume_path = output_dir / f"tailored_resume{resume_suffix}"
 
+            # reuse previous run's edits when they rebase cleanly (no model call)
+            result.rebased = self._rebase_previous_edits(spec, model, edits_path)
+            mode = TailoringMode.APPLY if result.rebased else TailoringMode.TAILOR
+
             # build tailoring context
             ctx = build_tailoring_context(
                 self.settings,
                 self.resolver,
                 resume=self.config.resume,
                 job=spec.path,
-                model=self.config.model,
-                sections_path=self.config.sections_path,
+                model=model,
+                sections_path=self._run_sections_path or self.config.sections_path,
                 edits_json=edits_path,
                 output_resume=output_resume_path,
                 risk=self.config.risk,
@@ -331,29 +995,44 @@ class BulkRunner:
                 preserve_formatting=self.config.preserve_formatting,
                 preserve_mode=self.config.preserve_mode,
                 interactive=False,  # Bulk mode is always non-interactive
+                write_output=not self.config.lazy,
             )
 
             # run tailoring
-            runner = TailoringRunner(TailoringMode.TAILOR, ctx)
+            runner = TailoringRunner(mode, ctx)
             runner.run()
 
             # analyze results
             edits = read_json_safe(edits_path)
             sections_json = self._load_sections_json()
             result.edits = analyze_edits(edits, sections_json=sections_json)
+            # lines touched in written output (not op spans) when diff was produced
+            if runner.hunks is not None:
+                result.edits.lines_touched = sum(h.changed for h in runner.hunks)
 
-            # read resume for validation & coverage analysis
-            resume_lines = read_resume(self.config.resume)
+            # resume lines for validation & coverage analysis (indexed once per run)
+            resume_index = self._load_resume_index()
+            resume_lines = resume_index.lines
 
             # capture validation warnings
-            validation_warnings = validate_edits(edits, resume_lines, self.config.risk)
+            validation_warnings = validate_edits(
+                edits, resume_lines, self.config.risk, resume_index
+            )
             result.validation = build_validation_summary(validation_warnings, edits)
 
             # keyword coverage analysis
-            required_kw, preferred_kw = extract_job_keywords(job_text)
-            tailored_text = _read_tailored_resume_text(output_resume_path, resume_lines)
+            matcher = self._load_keyword_matcher()
+            required_kw, preferred_kw = extract_job_keywords(job_text, matcher)
+            if self.config.lazy:
+                assert runner.new_lines is not None
+                tailored_text = "\n".join(str(v) for v in runner.new_lines.values())
+                self._tailored_texts[spec.id] = tailored_text
+            else:
+                tailored_text = _read_tailored_resume_text(
+                    output_resume_path, resume_lines
+                )
             result.coverage = calculate_keyword_coverage(
-                tailored_text, required_kw, preferred_kw
+                tailored_text, required_kw, preferred_kw, matcher
             )
 
             # keyword stuffing check
@@ -365,12 +1044,98 @@ class BulkRunner:
             # set output paths
             result.output_dir = output_dir
             result.edits_path = edits_path
-            result.resume_path = output_resume_path
+            if not self.config.lazy:
+                result.resume_path = output_resume_path
             result.status = JobStatus.SUCCESS
 
         except Exception as e:
             result.status = JobStatus.FAILED
             result.error = str(e)
 
+        self._store_artifacts(output_dir)
         result.runtime_seconds = time.time() - start_time
         return result
+
+
+# job's output dir inside run_dir (recorded path may predate a moved run dir)
+def _recorded_job_dir(run_dir: Path, job: dict) -> Optional[Path]:
+    recorded = (job.get("outputs") or {}).get("dir")
+    if not recorded:
+        return None
+    parts = Path(recorded).parts
+    if job["id"] not in parts:
+        return run_dir / job["id"]
+    start = len(parts) - 1 - parts[::-1].index(job["id"])
+    return run_dir.joinpath(*parts[start:])
+
+
+# * Render tailored resumes for selected jobs of a bulk run from their saved edits
+# jobs follow journal ranking (top N, explicit IDs, or all); edits are applied to
+# run's base resume snapshot w/ run's settings. returns {job_id: resume path}
+def materialize_bulk_run(
+    settings: LoomSettings,
+    run_dir: Path,
+    top: Optional[int] = None,
+    job_ids: Optional[list[str]] = None,
+) -> dict[str, Path]:
+    run_meta = read_run_metadata(run_dir)
+    jobs_by_id = latest_job_records(run_dir)
+    if not jobs_by_id:
+        raise BulkProcessingError(f"No journaled job results in {run_dir}")
+
+    resume = find_base_resume(run_dir, run_meta) or Path(run_meta["resume"])
+    if not resume.exists():
+        raise BulkProcessingError(f"Base resume for {run_dir} not found: {resume}")
+
+    if job_ids:
+        unknown = [job_id for job_id in job_ids if job_id not in jobs_by_id]
+        if unknown:
+            raise BulkProcessingError(
+                f"Unknown job(s) in {run_dir.name}: {', '.join(unknown)}"
+            )
+        selected = list(job_ids)
+    else:
+        selected = [job.spec.id for job in load_bulk_result(run_dir).ranked_jobs()]
+        if top is not None:
+            selected = selected[:top]
+
+    snapshot = run_meta.get("settings", {})
+    sections_name = snapshot.get("sections")
+    resolver = ArgResolver(settings)
+    written: dict[str, Path] = {}
+    with ResultJournal(run_dir / JOURNAL_NAME) as journal:
+        for job_id in selected:
+            job = jobs_by_id[job_id]
+            job_dir = _recorded_job_dir(run_dir, job)
+            if job.get("status") != JobStatus.SUCCESS.value or job_dir is None:
+                raise BulkProcessingError(f"Job {job_id} has no edits to materialize")
+            output_resume = job_dir / f"tailored_resume{resume.suffix}"
+            # previous render may be a read-only store link; never write through it
+            output_resume.unlink(missing_ok=True)
+            ctx = build_tailoring_context(
+                settings,
+                resolver,
+                resume=resume,
+                job=job_dir / "job.txt",
+                model=job.get("model") or run_meta.get("model"),
+                sections_path=run_dir / sections_name if sections_name else None,
+                edits_json=job_dir / "edits.json",
+                output_resume=output_resume,
+                risk=RiskLevel(snapshot.get("risk", RiskLevel.MED.value)),
+                on_error=ValidationPolicy(
+                    snapshot.get("on_error", ValidationPolicy.FAIL_SOFT.value)
+                ),
+                preserve_formatting=snapshot.get("preserve_formatting", True),
+                preserve_mode=snapshot.get("preserve_mode", "in_place"),
+                interactive=False,
+            )
+            TailoringRunner(TailoringMode.APPLY, ctx).run()
+            if snapshot.get("artifact_store"):
+                artifact_store(settings).adopt(output_resume)
+            job["outputs"]["resume"] = str(output_resume)
+            # journal rendered path so matrix rebuilds (& later renders) keep it
+            journal.append({"type": "job", "stage": "final", "result": job})
+            written[job_id] = output_resume
+
+    write_matrix_files(run_dir, load_bulk_result(run_dir))
+    return written
@@ -24,6 +24,7 @@ from ..params import (
     JobArg,
     ModelOpt,
     SectionsPathOpt,
+    ExplainOpt,
     WatchOpt,
     HelpOpt,
 )
@@ -63,6 +64,7 @@ def apply(
     job: Optional[Path] = JobArg(),
     model: Optional[str] = ModelOpt(),
     sections_path: Optional[Path] = SectionsPathOpt(),
+    explain: bool = ExplainOpt(),
     watch: bool = WatchOpt(),
     help: bool = HelpOpt(),
 ) -> None:
@@ -91,6 +93,7 @@ def apply(
                 preserve_formatting=preserve_formatting,
                 preserve_mode=preserve_mode,
                 interactive=False,
+                explain=explain,
             ),
             debounce=settings.watch_debounce,
         )
@@ -110,4 +113,5 @@ def apply(
         preserve_formatting=preserve_formatting,
         preserve_mode=preserve_mode,
         interactive=interactive_mode,
+        explain=explain,
     )
@@ -1,21 +1,35 @@
 # src/cli/commands/bulk.py
-# Bulk job processing command for processing resume against multiple job postings
+# Bulk commands: run resume against many job postings & materialize chosen outputs
 
 from __future__ import annotations
 
+import json
+import re
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 import typer
+from typer.core import TyperGroup
 
 from ...config.settings import get_settings
 from ...core.bulk_types import JobStatus
 from ...core.constants import RiskLevel, ValidationPolicy
+from ...core.near_duplicates import DEFAULT_DUPLICATE_THRESHOLD
 from ...loom_io.console import console
+from ...loom_io.results_db import GROUP_KEYS, ResultQuery
+from ...ui.core.rich_components import themed_table
 
 from ..app import app
 from ..decorators import handle_loom_error
-from ..bulk_runner import BulkRunner, BulkConfig
+from ..bulk_runner import (
+    BulkRunner,
+    BulkConfig,
+    artifact_store,
+    finalize_bulk_run,
+    materialize_bulk_run,
+    results_db,
+)
 from ..params import (
     ResumeArg,
     ModelOpt,
@@ -24,10 +38,31 @@ from ..params import (
     OnErrorOpt,
     PreserveFormattingOpt,
     PreserveModeOpt,
+    RefreshSectionsOpt,
 )
 from ...ui.help.help_data import command_help
 
 
+# * Bulk group that falls back to `run` unless first arg names a subcommand
+# keeps `loom bulk <jobs> <resume>` working next to `loom bulk materialize <run>`
+class _BulkGroup(TyperGroup):
+    default_command = "run"
+
+    def parse_args(self, ctx, args):
+        if args and args[0] not in self.commands and args[0] not in ("--help", "-h"):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+# * Sub-app for bulk commands; registered on root app
+bulk_app = typer.Typer(
+    cls=_BulkGroup,
+    rich_markup_mode="rich",
+    help="[loom.accent2]Process resume against multiple job postings[/]",
+)
+app.add_typer(bulk_app, name="bulk")
+
+
 @command_help(
     name="bulk",
     description="Process resume against multiple job postings & generate comparison matrix",
@@ -42,11 +77,25 @@ from ...ui.help.help_data import command_help
         "loom bulk jobs/*.txt resume.docx --parallel 4",
         "loom bulk manifest.json resume.docx --output-dir results/",
         "loom bulk 'postings/*.txt' resume.tex --model gpt-4o",
+        "loom bulk jobs/ resume.docx --model gpt-5 --triage-model gpt-5-nano --cascade-top 10",
+        "loom bulk 'postings/*.txt' resume.docx --top-k 25 --min-score 0.1",
+        "loom bulk jobs/ resume.docx --dedup --dedup-threshold 0.85",
+        "loom bulk jobs/ resume.docx --keywords packs/healthcare.toml",
+        "loom bulk jobs/ resume.docx --rebase-from output/bulk_2025-01-10_120000",
+        "loom bulk jobs/ resume.docx --refresh-sections",
+        "loom bulk jobs/ resume.docx --lazy",
+        "loom bulk jobs/ resume.docx --incremental",
+        "loom bulk materialize output/bulk_2025-01-10_120000 --top 10",
+        "loom bulk matrix output/bulk_2025-01-10_120000",
+        "loom bulk query --since 30d --per-company 1",
+        "loom bulk query --group-by model --since 2025-01-01",
+        "loom bulk gc --dry-run",
     ],
     see_also=["tailor", "generate"],
 )
-@app.command(
-    help="Process resume against multiple job postings & generate comparison matrix"
+@bulk_app.command(
+    "run",
+    help="Process resume against multiple job postings & generate comparison matrix",
 )
 @handle_loom_error
 def bulk(
@@ -81,6 +130,79 @@ def bulk(
     on_error: Optional[ValidationPolicy] = OnErrorOpt(),
     preserve_formatting: bool = PreserveFormattingOpt(),
     preserve_mode: str = PreserveModeOpt(),
+    triage_model: Optional[str] = typer.Option(
+        None,
+        "--triage-model",
+        help="Cascade mode: triage every job w/ this cheap model, then re-tailor promoted jobs w/ --model",
+    ),
+    cascade_top: Optional[int] = typer.Option(
+        None,
+        "--cascade-top",
+        help="Cascade mode: promote top N triaged jobs to the final model",
+        min=1,
+    ),
+    cascade_threshold: Optional[float] = typer.Option(
+        None,
+        "--cascade-threshold",
+        help="Cascade mode: promote triaged jobs w/ fit score >= threshold (default 0.5 if no --cascade-top)",
+        min=0.0,
+        max=1.0,
+    ),
+    top_k: Optional[int] = typer.Option(
+        None,
+        "--top-k",
+        help="Pre-rank jobs by TF-IDF similarity to resume & only tailor the top K (requires numpy)",
+        min=1,
+    ),
+    min_score: Optional[float] = typer.Option(
+        None,
+        "--min-score",
+        help="Pre-rank jobs by TF-IDF similarity & skip jobs scoring below this (0-1, requires numpy)",
+        min=0.0,
+        max=1.0,
+    ),
+    dedup: bool = typer.Option(
+        False,
+        "--dedup",
+        help="Tailor one representative per cluster of near-duplicate postings & reuse its outputs",
+    ),
+    dedup_threshold: Optional[float] = typer.Option(
+        None,
+        "--dedup-threshold",
+        help=f"Shingle similarity for near-duplicate postings (implies --dedup, default {DEFAULT_DUPLICATE_THRESHOLD})",
+        min=0.01,
+        max=1.0,
+    ),
+    keywords: Optional[list[Path]] = typer.Option(
+        None,
+        "--keywords",
+        help="Extra keyword pack file or directory (.toml/.json), repeatable; .loom/keywords/ is always loaded",
+    ),
+    rebase_from: Optional[Path] = typer.Option(
+        None,
+        "--rebase-from",
+        help="Previous bulk run dir: rebase its edits onto the current resume & only send jobs that can't be rebased to the model",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        resolve_path=True,
+    ),
+    refresh_sections: bool = RefreshSectionsOpt(),
+    lazy: bool = typer.Option(
+        False,
+        "--lazy",
+        help="Save edits & scores only; render resumes later w/ 'loom bulk materialize'",
+    ),
+    use_store: bool = typer.Option(
+        True,
+        "--artifact-store/--no-artifact-store",
+        help="Hard-link job artifacts to deduplicated blobs in .loom/objects (default: on)",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Reuse finished results of earlier (or interrupted) runs in --output-dir & only tailor new or changed postings",
+    ),
 ) -> None:
     # Resolve settings
     settings = get_settings(ctx)
@@ -105,6 +227,16 @@ def bulk(
     if model is None:
         console.print("[red]Error: Model required (--model or set in config)[/]")
         raise typer.Exit(1)
+    if triage_model is None and (
+        cascade_top is not None or cascade_threshold is not None
+    ):
+        console.print(
+            "[red]Error: --cascade-top/--cascade-threshold require --triage-model[/]"
+        )
+        raise typer.Exit(1)
+
+    if dedup and dedup_threshold is None:
+        dedup_threshold = DEFAULT_DUPLICATE_THRESHOLD
 
     # Build config
     config = BulkConfig(
@@ -119,6 +251,18 @@ def bulk(
         fail_fast=fail_fast,
         preserve_formatting=preserve_formatting,
         preserve_mode=preserve_mode,
+        triage_model=triage_model,
+        cascade_top=cascade_top,
+        cascade_threshold=cascade_threshold,
+        top_k=top_k,
+        min_score=min_score,
+        dedup_threshold=dedup_threshold,
+        keyword_packs=list(keywords or []),
+        rebase_from=rebase_from,
+        refresh_sections=refresh_sections,
+        lazy=lazy,
+        artifact_store=use_store,
+        incremental=incremental,
     )
 
     # Create runner w/ progress callbacks
@@ -142,9 +286,16 @@ def bulk(
     def on_retry(msg):
         console.print(f"[yellow]{msg}[/]")
 
+    def on_pass_start(stage, pass_model, count):
+        console.print()
+        console.print(
+            f"[bold]{stage.capitalize()} pass[/] [dim]({pass_model}, {count} jobs)[/]"
+        )
+
     runner.on_job_start = on_start
     runner.on_job_complete = on_complete
     runner.on_retry = on_retry
+    runner.on_pass_start = on_pass_start
 
     # Header
     console.print()
@@ -152,7 +303,27 @@ def bulk(
     console.print(f"  Jobs: {jobs}")
     console.print(f"  Resume: {resume}")
     console.print(f"  Model: {model}")
+    if triage_model:
+        console.print(f"  Triage Model: {triage_model}")
+    if top_k is not None or min_score is not None:
+        cutoffs = ", ".join(
+            part
+            for part in (
+                f"top {top_k}" if top_k is not None else "",
+                f"score >= {min_score}" if min_score is not None else "",
+            )
+            if part
+        )
+        console.print(f"  Pre-rank: {cutoffs}")
+    if dedup_threshold is not None:
+        console.print(f"  Dedup: similarity >= {dedup_threshold}")
+    if rebase_from is not None:
+        console.print(f"  Rebase from: {rebase_from}")
     console.print(f"  Workers: {parallel}")
+    if lazy:
+        console.print("  Outputs: edits & scores only (--lazy)")
+    if incremental:
+        console.print(f"  Incremental: reusing earlier results in {output_dir}")
     console.print()
 
     # Run
@@ -161,16 +332,46 @@ def bulk(
     # Summary
     console.print()
     console.print("[bold]Results[/]")
+    if result.prerank_scored is not None:
+        console.print(
+            f"  Pre-ranked: {len(result.jobs)}/{result.prerank_scored} jobs selected"
+        )
     console.print(f"  Total: {len(result.jobs)}")
+    if result.duplicates:
+        reused = sum(len(c.members) for c in result.duplicates)
+        console.print(
+            f"  Near-duplicates: {reused} jobs reused outputs from {len(result.duplicates)} representatives"
+        )
+    if result.rebased_count:
+        console.print(
+            f"  Rebased: {result.rebased_count} jobs reused previous edits w/o a model call"
+        )
+    if result.incremental:
+        console.print(
+            f"  Incremental: {result.reused_count} reused, {len(result.jobs) - result.reused_count} recomputed"
+        )
     console.print(f"  Success: [green]{result.success_count}[/]")
     if result.failed_count > 0:
         console.print(f"  Failed: [red]{result.failed_count}[/]")
     if result.skipped_count > 0:
         console.print(f"  Skipped: [yellow]{result.skipped_count}[/]")
     console.print(f"  Runtime: {result.total_runtime:.1f}s")
+    if result.cascade is not None:
+        cascade = result.cascade
+        console.print(
+            f"  Cascade: {cascade.promoted}/{cascade.triaged} promoted to {cascade.final_model}, "
+            f"{cascade.final_passes_avoided} final passes avoided"
+        )
+        console.print(
+            f"  Estimated time saved: {cascade.estimated_time_saved_seconds:.1f}s"
+        )
     console.print()
     console.print(f"  Output: {result.output_dir}")
     console.print(f"  Matrix: {result.output_dir / 'matrix.md'}")
+    if lazy:
+        console.print(
+            f"  [dim]Render resumes: loom bulk materialize {result.output_dir} --top 10[/]"
+        )
 
     # Show top 3
     ranked = result.ranked_jobs()[:3]
@@ -183,3 +384,213 @@ def bulk(
             console.print(
                 f"  {i}. [cyan]{name}[/] (score: {job.fit_score:.2f}, coverage: {cov})"
             )
+
+
+# * Render tailored resumes for top-ranked (or chosen) jobs of a bulk run
+@bulk_app.command(
+    "materialize",
+    help="Render tailored resumes for selected jobs of a bulk run from saved edits",
+)
+@handle_loom_error
+def materialize(
+    ctx: typer.Context,
+    run_dir: Path = typer.Argument(
+        ...,
+        help="Bulk run directory (contains run.json & results.jsonl)",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        resolve_path=True,
+    ),
+    top: Optional[int] = typer.Option(
+        None,
+        "--top",
+        "-n",
+        help="Render the N best-ranked jobs (default: all successful jobs)",
+        min=1,
+    ),
+    job: Optional[list[str]] = typer.Option(
+        None,
+        "--job",
+        "-j",
+        help="Job ID to render, repeatable (overrides --top)",
+    ),
+) -> None:
+    settings = get_settings(ctx)
+
+    written = materialize_bulk_run(settings, run_dir, top=top, job_ids=job)
+
+    console.print()
+    console.print(f"[bold]Materialized {len(written)} resumes[/]")
+    for job_id, path in written.items():
+        console.print(f"  [green]✓[/] [cyan]{job_id}[/] {path}")
+
+
+# * Rebuild matrix files from a run's result journal (e.g. after a crash or Ctrl-C)
+@bulk_app.command(
+    "matrix",
+    help="Rebuild matrix.json & matrix.md of a bulk run from its result journal & re-index its results",
+)
+@handle_loom_error
+def matrix(
+    ctx: typer.Context,
+    run_dir: Path = typer.Argument(
+        ...,
+        help="Bulk run directory (contains run.json & results.jsonl)",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        resolve_path=True,
+    ),
+) -> None:
+    settings = get_settings(ctx)
+
+    result = finalize_bulk_run(settings, run_dir)
+
+    console.print(
+        f"Rebuilt matrix for {len(result.jobs)} jobs "
+        f"({result.success_count} success, {result.failed_count} failed)"
+    )
+    console.print(f"  Matrix: {run_dir / 'matrix.md'}")
+
+
+# * Delete stored artifacts no bulk run references anymore
+@bulk_app.command(
+    "gc",
+    help="Remove artifact store blobs no longer linked from any bulk run directory",
+)
+@handle_loom_error
+def gc(
+    ctx: typer.Context,
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Report what would be removed w/o deleting"
+    ),
+) -> None:
+    settings = get_settings(ctx)
+    store = artifact_store(settings)
+
+    result = store.gc(dry_run=dry_run)
+
+    verb = "Would remove" if dry_run else "Removed"
+    console.print(
+        f"{verb} {result.removed} unreferenced objects "
+        f"({result.freed_bytes / 1024:.1f} KiB), kept {result.kept} in {store.root}"
+    )
+
+
+_SINCE_UNITS = {"h": "hours", "d": "days", "w": "weeks"}
+
+
+# --since value (30d, 12h, 2w or ISO date/time) -> ISO timestamp lower bound
+def _parse_since(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    match = re.fullmatch(r"(\d+)([hdw])", value.strip().lower())
+    if match:
+        delta = timedelta(**{_SINCE_UNITS[match[2]]: int(match[1])})
+        return (datetime.now() - delta).isoformat()
+    try:
+        return datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        raise typer.BadParameter(
+            "expected a duration like 30d, 12h or 2w, or an ISO date",
+            param_hint="--since",
+        )
+
+
+# * Filter, rank & aggregate indexed results across all bulk runs
+@bulk_app.command(
+    "query",
+    help="Rank or aggregate results across bulk runs from the .loom/results.db index",
+)
+@handle_loom_error
+def query(
+    ctx: typer.Context,
+    company: Optional[str] = typer.Option(
+        None, "--company", "-c", help="Only companies containing this text"
+    ),
+    model: Optional[str] = typer.Option(
+        None, "--model", "-m", help="Only results produced by this model"
+    ),
+    since: Optional[str] = typer.Option(
+        None,
+        "--since",
+        help="Only runs started within a duration (30d, 12h, 2w) or since an ISO date",
+        callback=_parse_since,
+    ),
+    min_score: Optional[float] = typer.Option(
+        None, "--min-score", help="Only results w/ fit score >= this", min=0.0, max=1.0
+    ),
+    run: Optional[str] = typer.Option(
+        None, "--run", help="Only results of this run (bulk_<timestamp> dir name)"
+    ),
+    all_statuses: bool = typer.Option(
+        False, "--all", help="Include failed & skipped jobs (default: successful only)"
+    ),
+    per_company: Optional[int] = typer.Option(
+        None, "--per-company", help="Keep only each company's N best results", min=1
+    ),
+    group_by: Optional[str] = typer.Option(
+        None,
+        "--group-by",
+        "-g",
+        help=f"Aggregate counts & fit scores by {', '.join(GROUP_KEYS)} instead of ranking jobs",
+    ),
+    limit: int = typer.Option(20, "--limit", "-n", help="Maximum rows", min=1),
+    as_json: bool = typer.Option(False, "--json", help="Print rows as JSON"),
+) -> None:
+    settings = get_settings(ctx)
+    db = results_db(settings)
+
+    filters = ResultQuery(
+        company=company,
+        model=model,
+        since=since,
+        min_score=min_score,
+        run=run,
+        status=None if all_statuses else JobStatus.SUCCESS.value,
+    )
+    if group_by is not None:
+        rows = db.aggregate(filters, by=group_by, limit=limit)
+    else:
+        rows = db.top_jobs(filters, limit=limit, per_company=per_company)
+
+    if as_json:
+        typer.echo(json.dumps(rows, indent=2))
+        return
+    if not rows:
+        console.print(
+            f"[dim]No matching results in {db.path} "
+            "(runs are indexed when they finish, or via 'loom bulk matrix')[/]"
+        )
+        return
+
+    table = themed_table(show_header=True)
+    if group_by is not None:
+        table.add_column(group_by.capitalize())
+        for column in ("Jobs", "Avg Fit", "Max Fit", "Runtime"):
+            table.add_column(column, justify="right")
+        for row in rows:
+            table.add_row(
+                row["key"] or "-",
+                str(row["jobs"]),
+                f"{row['avg_fit']:.2f}",
+                f"{row['max_fit']:.2f}",
+                f"{row['runtime_seconds']:.1f}s",
+            )
+    else:
+        columns = ("#", "Fit", "Job", "Company", "Coverage", "Edits", "Model", "Run")
+        for column in columns:
+            table.add_column(column)
+        for i, row in enumerate(rows, 1):
+            table.add_row(
+                str(i),
+                f"{row['fit_score']:.2f}",
+                row["name"] or row["job_id"],
+                row["company"] or "-",
+                f"{row['required_matched']}/{row['required_total']}",
+                str(row["edits_total"]),
+                row["model"] or "-",
+                row["run"],
+            )
+    console.print(table)
@@ -22,6 +22,8 @@ from ..params import (
     RiskOpt,
     OnErrorOpt,
     UserPromptOpt,
+    ExplainOpt,
+    RefreshSectionsOpt,
     WatchOpt,
     HelpOpt,
 )
@@ -62,6 +64,8 @@ def generate(
     risk: Optional[RiskLevel] = RiskOpt(),
     on_error: Optional[ValidationPolicy] = OnErrorOpt(),
     user_prompt: Optional[str] = UserPromptOpt(),
+    explain: bool = ExplainOpt(),
+    refresh_sections: bool = RefreshSectionsOpt(),
     watch: bool = WatchOpt(),
     help: bool = HelpOpt(),
 ) -> None:
@@ -83,6 +87,8 @@ def generate(
                 risk=risk,
                 on_error=on_error,
                 user_prompt=user_prompt,
+                explain=explain,
+                refresh_sections=refresh_sections,
             ),
             debounce=settings.watch_debounce,
         )
@@ -99,4 +105,6 @@ def generate(
         risk=risk,
         on_error=on_error,
         user_prompt=user_prompt,
+        explain=explain,
+        refresh_sections=refresh_sections,
     )
@@ -0,0 +1,150 @@
+# src/cli/commands/rebase.py
+# Rebase command for carrying existing edits.json files over to an edited resume
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from ...config.settings import get_settings
+from ...core.rebase import RebaseResult, rebase_edits
+from ...core.types import Lines
+from ...loom_io import read_json_safe, read_resume_document, write_json_safe
+from ...loom_io.bulk_io import find_base_resume, read_run_metadata
+from ...loom_io.console import console
+
+from ..app import app
+from ..decorators import handle_loom_error
+from ..helpers import handle_help_flag, validate_required_args
+from ..params import ResumeArg, EditsJsonOpt, HelpOpt
+from ...ui.help.help_data import command_help
+
+
+# rebase one edits file & write result (in place unless out_path given)
+def _rebase_file(
+    edits_path: Path, old_lines: Lines, new_lines: Lines, out_path: Path | None = None
+) -> RebaseResult:
+    result = rebase_edits(read_json_safe(edits_path), old_lines, new_lines)
+    write_json_safe(result.edits, out_path or edits_path)
+    return result
+
+
+# print per-file outcome w/ dropped ops & snippet notes
+def _report(label: str, result: RebaseResult) -> None:
+    kept = len(result.edits.get("ops", []))
+    if result.clean:
+        console.print(f"  [green]✓[/] {label}: {kept} ops kept, {result.moved} moved")
+    else:
+        console.print(
+            f"  [yellow]![/] {label}: {kept} ops kept, {result.moved} moved, "
+            f"{len(result.dropped)} dropped"
+        )
+    for note in result.dropped:
+        console.print(f"      [yellow]{note}[/]")
+    for note in result.notes:
+        console.print(f"      [dim]{note}[/]")
+
+
+# * Rebase edits generated against an older resume onto the current resume
+@command_help(
+    name="rebase",
+    description="Rebase existing edits onto an edited resume",
+    long_description=(
+        "Map the line numbers of previously generated edits through a diff of "
+        "the old and new resume, so edits survive resume changes without "
+        "regenerating them. Ops whose target lines changed are dropped and "
+        "reported. Use --bulk-dir to rebase every job of a bulk run against "
+        "the resume snapshot stored with that run."
+    ),
+    examples=[
+        "loom rebase resume.docx --old-resume resume_v1.docx",
+        "loom rebase resume.docx --old-resume old.docx --out rebased.json",
+        "loom rebase resume.docx --bulk-dir output/bulk_2025-01-10_120000",
+    ],
+    see_also=["apply", "bulk"],
+)
+@app.command(help="Rebase existing edits onto an edited resume")
+@handle_loom_error
+def rebase(
+    ctx: typer.Context,
+    resume: Optional[Path] = ResumeArg(),
+    old_resume: Optional[Path] = typer.Option(
+        None,
+        "--old-resume",
+        help="Resume the edits were generated against (default for --bulk-dir: run snapshot)",
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    edits_json: Optional[Path] = EditsJsonOpt(),
+    out: Optional[Path] = typer.Option(
+        None,
+        "--out",
+        help="Write rebased edits here instead of overwriting --edits-json",
+        resolve_path=True,
+    ),
+    bulk_dir: Optional[Path] = typer.Option(
+        None,
+        "--bulk-dir",
+        help="Rebase edits.json of every job in this bulk run directory",
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+    ),
+    help: bool = HelpOpt(),
+) -> None:
+    handle_help_flag(ctx, help, "rebase")
+    settings = get_settings(ctx)
+
+    if resume is None:
+        resume = settings.resume_path
+    validate_required_args(resume=(resume, "Resume path"))
+    assert resume is not None
+    new_lines = read_resume_document(resume)
+
+    console.print()
+    console.print("[bold]Rebasing edits[/]")
+    console.print(f"  Resume: {resume}")
+
+    if bulk_dir is None:
+        if edits_json is None:
+            edits_json = settings.edits_path
+        validate_required_args(
+            old_resume=(old_resume, "Old resume (--old-resume)"),
+            edits_json=(edits_json, "Edits JSON path"),
+        )
+        assert old_resume is not None and edits_json is not None
+        result = _rebase_file(
+            edits_json, read_resume_document(old_resume), new_lines, out
+        )
+        _report(str(out or edits_json), result)
+        return
+
+    # bulk run: rebase each job dir against run snapshot, then advance snapshot
+    run_meta = read_run_metadata(bulk_dir)
+    snapshot = find_base_resume(bulk_dir, run_meta)
+    base = old_resume or snapshot
+    if base is None:
+        raise typer.BadParameter(
+            f"{bulk_dir} has no resume snapshot; provide --old-resume"
+        )
+    old_lines = read_resume_document(base)
+
+    results = []
+    for job_id in run_meta.get("jobs", {}):
+        edits_path = bulk_dir / job_id / "edits.json"
+        if edits_path.exists():
+            results.append(_rebase_file(edits_path, old_lines, new_lines))
+            _report(job_id, results[-1])
+    if snapshot is not None and snapshot.suffix == resume.suffix:
+        shutil.copy2(resume, snapshot)
+
+    clean = sum(1 for r in results if r.clean)
+    console.print()
+    console.print(
+        f"  {clean}/{len(results)} jobs rebased cleanly; "
+        "re-run the rest to regenerate dropped edits"
+    )
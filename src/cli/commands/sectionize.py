@@ -7,23 +7,19 @@ from pathlib import Path
 from typing import Optional
 import typer
 
-from ...ai.prompts import build_sectionizer_prompt
-from ...ai.clients import run_generate
-from ...ai.utils import normalize_sections_response
 from ...loom_io import (
     read_resume,
     write_json_safe,
     get_handler,
 )
-from ...core.types import number_lines
 
 from ..app import app
 from ..decorators import handle_loom_error
 from ..helpers import handle_help_flag, validate_required_args
 from ...ui.core.progress import setup_ui_with_progress
 from ...ui.display.reporting import report_result
-from ..logic import ArgResolver
-from ..params import ResumeArg, OutJsonOpt, ModelOpt, HelpOpt
+from ..logic import ArgResolver, local_docx_sections, sectionize_core
+from ..params import ResumeArg, OutJsonOpt, ModelOpt, RefreshSectionsOpt, HelpOpt
 from ...ui.help.help_data import command_help
 from ...config.settings import get_settings
 
@@ -35,13 +31,19 @@ from ...config.settings import get_settings
     long_description=(
         "analyze resume (.docx, .tex, or .typ) & identify distinct sections such as "
         "SUMMARY, EXPERIENCE & EDUCATION. Produce machine-readable JSON map "
-        "used to target edits precisely in later steps.\n\n"
+        "used to target edits precisely in later steps. DOCX sections are first "
+        "inferred locally from heading styles, bold/all-caps lines & list "
+        "numbering; the AI sectionizer runs only when that is low-confidence. AI "
+        "results are cached by resume content & model and reused by tailor, "
+        "generate & bulk when no sections file exists; --refresh-sections forces "
+        "a new model call.\n\n"
         "Defaults: paths come from config when omitted (see 'loom config')."
     ),
     examples=[
         "loom sectionize resume.docx --out-json sections.json",
         "loom sectionize my_resume.docx  # uses config defaults",
         "loom sectionize resume.docx --model gpt-4o-mini",
+        "loom sectionize resume.docx --refresh-sections",
     ],
     see_also=["tailor", "config"],
 )
@@ -52,6 +54,7 @@ def sectionize(
     resume_path: Optional[Path] = ResumeArg(),
     out_json: Optional[Path] = OutJsonOpt(),
     model: Optional[str] = ModelOpt(),
+    refresh_sections: bool = RefreshSectionsOpt(),
     help: bool = HelpOpt(),
 ) -> None:
     handle_help_flag(ctx, help, "sectionize")
@@ -79,7 +82,9 @@ def sectionize(
     resume_suffix = resume_path.suffix.lower() if resume_path else ""
     is_latex = resume_suffix == ".tex"
     is_typst = resume_suffix == ".typ"
-    if not (is_latex or is_typst):
+    is_docx = resume_suffix == ".docx"
+    # DOCX only needs a model when local analysis is low-confidence (checked below)
+    if not (is_latex or is_typst or is_docx):
         required_args["model"] = (model, "Model (provide --model or set in config)")
 
     validate_required_args(**required_args)
@@ -88,11 +93,7 @@ def sectionize(
     assert resume_path is not None
     assert out_json is not None
 
-    if not (is_latex or is_typst):
-        assert model is not None
-    total_steps = 3 if (is_latex or is_typst) else 4
-
-    with setup_ui_with_progress("Processing resume...", total=total_steps) as (
+    with setup_ui_with_progress("Processing resume...", total=3) as (
         ui,
         progress,
         task,
@@ -116,27 +117,29 @@ def sectionize(
             write_json_safe(payload, out_json)
             progress.advance(task)
         else:
-            progress.update(task, description="Numbering lines...")
-            numbered = number_lines(lines)
-            progress.advance(task)
-
-            progress.update(task, description="Building prompt and calling OpenAI...")
-            prompt = build_sectionizer_prompt(numbered)
-            assert model is not None, "Model required for non-LaTeX/Typst resumes"
-            result = run_generate(prompt, model=model)
-
-            # Handle JSON parsing errors
-            if not result.success:
-                from ...core.exceptions import AIError
-
-                raise AIError(
-                    f"AI failed to generate valid JSON: {result.error}\n\nRaw response:\n{result.raw_text}\n\nExtracted JSON:\n{result.json_text}"
+            # deterministic local analysis first; AI only when it's low-confidence
+            data = None
+            if is_docx and not refresh_sections:
+                progress.update(task, description="Analyzing DOCX structure...")
+                data = local_docx_sections(resume_path, lines)
+                if data is not None:
+                    ui.print(
+                        "[dim]Detected sections from DOCX formatting "
+                        "(no model call needed)[/]"
+                    )
+            if data is None:
+                validate_required_args(
+                    model=(model, "Model (provide --model or set in config)")
                 )
-
-            data = result.data
-            assert data is not None, "Expected non-None data from successful AI result"
-            # Normalize short keys (k->kind, h->heading_text, etc.) to full keys
-            data = normalize_sections_response(data)
+                assert model is not None
+                progress.update(task, description="Sectionizing resume with AI...")
+                data, reused = sectionize_core(
+                    settings, lines, model, refresh=refresh_sections
+                )
+                if reused:
+                    ui.print(
+                        "[dim]Reusing cached sections (resume & model unchanged)[/]"
+                    )
             progress.advance(task)
 
             progress.update(task, description="Writing sections JSON...")
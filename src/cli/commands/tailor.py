@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 import typer
 
 from ...core.constants import RiskLevel, ValidationPolicy
@@ -27,6 +28,8 @@ from ..params import (
     AutoOpt,
     UserPromptOpt,
     NoCacheOpt,
+    ExplainOpt,
+    RefreshSectionsOpt,
     WatchOpt,
     HelpOpt,
 )
@@ -53,6 +56,7 @@ from ...config.settings import get_settings
         "loom tailor job.txt resume.docx --no-preserve-formatting",
         'loom tailor job.txt resume.docx --prompt "Emphasize leadership experience"',
         "loom tailor job.txt resume.docx --watch",
+        "loom tailor job.txt resume.docx --preserve-mode rebuild --explain",
     ],
     see_also=["sectionize", "plan"],
 )
@@ -81,6 +85,8 @@ def tailor(
     auto: bool = AutoOpt(),
     user_prompt: Optional[str] = UserPromptOpt(),
     no_cache: bool = NoCacheOpt(),
+    explain: bool = ExplainOpt(),
+    refresh_sections: bool = RefreshSectionsOpt(),
     watch: bool = WatchOpt(),
     help: bool = HelpOpt(),
 ) -> None:
@@ -116,11 +122,15 @@ def tailor(
 
     # Watch mode: wrap execution in file watcher
     if watch:
-        run_with_watch(
-            paths=[resume, job, sections_path],
-            run_func=lambda: run_tailoring_command(
+
+        def run_pass(
+            pass_mode: TailoringMode,
+            pass_prompt: Optional[str],
+            scope: Optional[list[tuple[int, int]]] = None,
+        ) -> None:
+            run_tailoring_command(
                 ctx,
-                mode,
+                pass_mode,
                 resume=resume,
                 job=job,
                 model=model,
@@ -132,8 +142,38 @@ def tailor(
                 preserve_formatting=preserve_formatting,
                 preserve_mode=preserve_mode,
                 interactive=False,
-                user_prompt=user_prompt,
-            ),
+                user_prompt=pass_prompt,
+                explain=explain,
+                refresh_sections=refresh_sections,
+                scope=scope,
+            )
+
+        run_func: Callable[[], None] = partial(run_pass, mode, user_prompt)
+        # resume edits re-tailor only changed regions instead of whole resume
+        if mode != TailoringMode.APPLY:
+            from ..logic import ArgResolver
+            from ..watch import IncrementalTailorSession
+
+            common = ArgResolver(settings).resolve_common(
+                resume=resume,
+                job=job,
+                sections_path=sections_path,
+                edits_json=edits_json,
+            )
+            if common["resume"] is not None and common["edits_json"] is not None:
+                run_func = IncrementalTailorSession(
+                    run_pass,
+                    mode,
+                    resume=common["resume"],
+                    job=common["job"],
+                    sections_path=common["sections_path"],
+                    edits_json=common["edits_json"],
+                    user_prompt=user_prompt,
+                )
+
+        run_with_watch(
+            paths=[resume, job, sections_path],
+            run_func=run_func,
             debounce=settings.watch_debounce,
         )
         return
@@ -153,4 +193,6 @@ def tailor(
         preserve_mode=preserve_mode,
         interactive=interactive_mode,
         user_prompt=user_prompt,
+        explain=explain,
+        refresh_sections=refresh_sections,
     )
@@ -105,6 +105,9 @@ def run_tailoring_command(
     preserve_mode: str = "in_place",
     interactive: bool = True,
     user_prompt: str | None = None,
+    explain: bool = False,
+    refresh_sections: bool = False,
+    scope: list[tuple[int, int]] | None = None,
 ) -> None:
     # unified command execution for generate/apply/tailor/plan; resolves arguments via settings & ArgResolver, builds TailoringContext, & executes via TailoringRunner
     from .logic import ArgResolver
@@ -129,6 +132,9 @@ def run_tailoring_command(
         preserve_mode=preserve_mode,
         interactive=interactive,
         user_prompt=user_prompt,
+        explain=explain,
+        refresh_sections=refresh_sections,
+        scope=scope,
     )
 
     runner = TailoringRunner(mode, tailoring_ctx)
@@ -11,22 +11,29 @@ import json
 from pathlib import Path
 from typing import TypedDict, Any
 
+from ..ai.cache import cache_disabled_for_invocation
+from ..ai.prompts import SECTIONIZER_PROMPT_VERSION
 from ..config.settings import LoomSettings
 from ..loom_io.generics import ensure_parent, write_json_safe
+from ..loom_io.stage_store import StageStore
 from ..core.types import Lines
 from ..loom_io import (
     TemplateDescriptor,
     get_handler,
+    is_confident_payload,
 )
 from ..core.constants import RiskLevel, ValidationPolicy, EditOperation, DiffOp
 from ..core.pipeline import (
+    sectionize_lines,
     generate_edits,
     generate_corrected_edits,
     apply_edits,
     process_modify_operation,
     process_prompt_operation,
 )
+from ..core.stage_graph import StageGraph, json_hash
 from ..core.validation import validate_edits
+from ..core.relocation import relocate_ops
 from ..core.exceptions import EditError, JSONParsingError
 from .validation_handlers import handle_validation_error
 from ..ui.diff_resolution.diff_display import main_display_loop
@@ -81,6 +88,64 @@ class ArgResolver:
         }
 
 
+# stage memo store under settings.loom_dir (bypassed by --no-cache)
+def stage_store(settings: LoomSettings) -> StageStore:
+    return StageStore(
+        settings.loom_dir / "stages", enabled=not cache_disabled_for_invocation()
+    )
+
+
+# cache key for AI sectionizer output: resume text, prompt version & model
+def sections_cache_key(lines: Lines, model: str) -> str:
+    return StageGraph().key(
+        "sectionize",
+        resume=json_hash(list(lines.items())),
+        prompt_version=SECTIONIZER_PROMPT_VERSION,
+        model=model,
+    )
+
+
+# * Cached AI sectionizer result for resume & model, or None if never sectionized
+def cached_sections(settings: LoomSettings, lines: Lines, model: str) -> dict | None:
+    payload = stage_store(settings).get("sectionize", sections_cache_key(lines, model))
+    return payload.get("sections") if payload else None
+
+
+# * Sections for resume via AI sectionizer, reusing cached result unless refresh
+# returns (sections, reused from cache)
+def sectionize_core(
+    settings: LoomSettings, lines: Lines, model: str, refresh: bool = False
+) -> tuple[dict, bool]:
+    if not refresh:
+        sections = cached_sections(settings, lines, model)
+        if sections is not None:
+            return sections, True
+    sections = sectionize_lines(lines, model)
+    stage_store(settings).put(
+        "sectionize", sections_cache_key(lines, model), {"sections": sections}
+    )
+    return sections, False
+
+
+# * Sections from local DOCX formatting analysis, or None if low-confidence/not DOCX
+def local_docx_sections(resume_path: Path, lines: Lines) -> dict | None:
+    if resume_path.suffix.lower() != ".docx":
+        return None
+    handler = get_handler(resume_path)
+    _, analysis = handler.build_context(
+        resume_path, lines, "\n".join(lines.values())
+    )
+    payload = handler.sections_to_payload(analysis)
+    return payload if is_confident_payload(payload) else None
+
+
+# print snippet relocation notes as info (they never fail validation)
+def _report_relocations(ui, notes: list[str]) -> None:
+    if ui:
+        for note in notes:
+            ui.print(f"[dim]{note}[/]")
+
+
 # * Generate & validate edits; persist intermediate edits to disk for manual flows
 def generate_edits_core(
     settings: LoomSettings,
@@ -109,6 +174,11 @@ def generate_edits_core(
         json_error_warning = str(e)
         edits = None
 
+    # re-anchor ops whose line numbers drifted from their current_snippet
+    if edits is not None:
+        edits, notes = relocate_ops(edits, resume_lines)
+        _report_relocations(ui, notes)
+
     # persist edits or create placeholder for manual editing
     target_path = persist_path if persist_path is not None else settings.edits_path
 
@@ -155,6 +225,8 @@ def generate_edits_core(
                 model,
                 validation_warnings,
             )
+            new_edits, notes = relocate_ops(new_edits, resume_lines)
+            _report_relocations(ui, notes)
             # update current edits for validation
             current_edits[0] = new_edits
             return new_edits
@@ -381,6 +453,7 @@ def apply_edits_core(
     descriptor: TemplateDescriptor | None = None,
 ) -> Lines:
     filter_notes: list[str] = []
+    relocation_notes: list[str] = []
     resume_suffix = resume_path.suffix.lower() if resume_path else ""
     is_latex = resume_suffix == ".tex"
     is_typst = resume_suffix == ".typ"
@@ -388,6 +461,8 @@ def apply_edits_core(
     def sanitize_edits(data: dict) -> dict:
         if not isinstance(data, dict):
             return data
+        data, notes = relocate_ops(data, resume_lines)
+        relocation_notes[:] = notes
         if is_latex or is_typst:
             assert resume_path is not None, "resume_path required for LaTeX/Typst"
             handler = get_handler(resume_path)
@@ -474,6 +549,7 @@ def apply_edits_core(
     if filter_notes and ui:
         for note in sorted(set(filter_notes)):
             ui.print(f"[yellow]{note}[/]")
+    _report_relocations(ui, relocation_notes)
 
     # execute edit application w/ approved operations only
     return apply_edits(resume_lines, current[0])
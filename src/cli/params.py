@@ -236,6 +236,22 @@ def NoCacheOpt() -> Any:
     )
 
 
+def ExplainOpt() -> Any:
+    return typer.Option(
+        False,
+        "--explain",
+        help="Show which pipeline stages were reused from previous runs",
+    )
+
+
+def RefreshSectionsOpt() -> Any:
+    return typer.Option(
+        False,
+        "--refresh-sections",
+        help="Re-derive resume sections instead of reusing cached sectionize results",
+    )
+
+
 def WatchOpt() -> Any:
     return typer.Option(
         False,
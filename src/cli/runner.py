@@ -7,7 +7,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -15,11 +15,28 @@ from typing import Any
 from ..config.settings import LoomSettings
 from ..core.constants import RiskLevel, ValidationPolicy
 from ..core.exceptions import EditError
+from ..core.incremental import scope_lines
+from ..core.line_diff import DiffHunk
+from ..core.stage_graph import (
+    STAGE_HIT,
+    STAGE_MISS,
+    STAGE_SKIP,
+    StageGraph,
+    content_hash,
+    json_hash,
+)
 from ..core.verbose import vlog_stage, vlog_config, vlog_file_read, vlog_think
 import json
-from ..loom_io import read_resume, TemplateDescriptor, get_handler
+from ..loom_io import (
+    read_resume,
+    read_text,
+    TemplateDescriptor,
+    get_handler,
+    is_confident_payload,
+)
 from ..loom_io.generics import ensure_parent
-from ..core.types import Lines
+from ..loom_io.stage_store import StageStore
+from ..core.types import Lines, ResumeDocument
 from ..ui.core.progress import (
     setup_ui_with_progress,
     load_resume_and_job,
@@ -29,12 +46,16 @@ from ..ui.core.progress import (
 from ..ui.display.reporting import (
     persist_edits_json,
     report_result,
+    report_stage_trace,
     write_output_with_diff,
 )
 from .logic import (
     ArgResolver,
+    cached_sections,
     generate_edits_core,
     apply_edits_core,
+    sectionize_core,
+    stage_store,
 )
 from .helpers import validate_required_args
 
@@ -74,6 +95,15 @@ class TailoringContext:
     preserve_mode: str = "in_place"
     interactive: bool = True
     user_prompt: str | None = None
+    explain: bool = False
+    # re-derive sections instead of reusing cached sectionizer/analysis results
+    refresh_sections: bool = False
+    # False: apply/tailor keep edited lines in memory only (no diff or output file);
+    # callers read them from TailoringRunner.new_lines (bulk --lazy)
+    write_output: bool = True
+    # (start, end) line regions; generate sends only these lines to the model
+    # (watch mode re-tailoring changed sections)
+    scope: list[tuple[int, int]] | None = None
 
     @property
     def is_latex(self) -> bool:
@@ -83,6 +113,53 @@ class TailoringContext:
     def is_typst(self) -> bool:
         return self.resume is not None and self.resume.suffix.lower() == ".typ"
 
+    @property
+    def is_docx(self) -> bool:
+        return self.resume is not None and self.resume.suffix.lower() == ".docx"
+
+
+# stage memo for one run: keys & trace from StageGraph, outputs from StageStore
+@dataclass
+class StageMemo:
+    store: StageStore
+    graph: StageGraph = field(default_factory=StageGraph)
+
+    @property
+    def enabled(self) -> bool:
+        return self.store.enabled
+
+    # * Memoized output of stage for key; records hit/miss/skip for --explain
+    def lookup(self, stage: str, key: str, reusable: bool = True) -> dict | None:
+        if not (self.enabled and reusable):
+            self.graph.record(stage, STAGE_SKIP)
+            return None
+        payload = self.store.get(stage, key)
+        self.graph.record(stage, STAGE_HIT if payload is not None else STAGE_MISS)
+        return payload
+
+    # persist output of stage under key computed by last lookup()
+    def save(self, stage: str, payload: dict) -> None:
+        if self.enabled and stage in self.graph.keys:
+            self.store.put(stage, self.graph.keys[stage], payload)
+
+
+# memo for a run under settings.loom_dir (bypassed by --no-cache)
+def build_stage_memo(settings: LoomSettings) -> StageMemo:
+    return StageMemo(stage_store(settings))
+
+
+# read stage: parse resume, reusing parsed lines while file bytes are unchanged
+def _read_resume_memoized(path: Path, memo: StageMemo) -> Lines:
+    key = memo.graph.key(
+        "read", resume=content_hash(path.read_bytes()), suffix=path.suffix.lower()
+    )
+    payload = memo.lookup("read", key)
+    if payload is not None:
+        return {int(n): text for n, text in payload["lines"]}
+    lines = read_resume(path)
+    memo.save("read", {"lines": [[n, text] for n, text in lines.items()]})
+    return lines
+
 
 # validation requirements per mode
 VALIDATION_REQUIREMENTS: dict[TailoringMode, dict[str, str]] = {
@@ -117,31 +194,80 @@ def prepare_resume_context(
     progress,
     task,
     load_job: bool = True,
+    memo: StageMemo | None = None,
 ) -> ResumeContext:
     # load resume + optional job
     assert ctx.resume is not None, "resume path required"
-    if load_job and ctx.job is not None:
+    memoized = memo is not None and memo.enabled
+    if memoized:
+        assert memo is not None
+        progress.update(task, description="Reading resume document...")
+        lines = _read_resume_memoized(ctx.resume, memo)
+        progress.advance(task)
+        job_text = None
+        if load_job and ctx.job is not None:
+            progress.update(task, description="Reading job description...")
+            job_text = read_text(ctx.job)
+            progress.advance(task)
+    elif load_job and ctx.job is not None:
         lines, job_text = load_resume_and_job(ctx.resume, ctx.job, progress, task)
     else:
         progress.update(task, description="Reading resume document...")
         lines = read_resume(ctx.resume)
         progress.advance(task)
         job_text = None
+    # immutable document caches numbered prompt rendering across generate/retry/diff
+    lines = ResumeDocument.from_lines(lines)
 
     # build LaTeX context if applicable
     descriptor = None
     auto_sections_json = None
     template_notes: list[str] = []
 
-    if ctx.is_latex or ctx.is_typst:
-        format_name = "LaTeX" if ctx.is_latex else "Typst"
+    if ctx.is_latex or ctx.is_typst or ctx.is_docx:
+        format_name = {".tex": "LaTeX", ".typ": "Typst"}.get(
+            ctx.resume.suffix.lower(), "DOCX"
+        )
         progress.update(task, description=f"Analyzing {format_name} structure...")
 
         handler = get_handler(ctx.resume)
-        resume_text = ctx.resume.read_text(encoding="utf-8")
-        descriptor, analysis = handler.build_context(ctx.resume, lines, resume_text)
-        auto_sections_json = json.dumps(handler.sections_to_payload(analysis))
-        template_notes = analysis.notes
+        # DOCX is binary: marker detection runs over paragraph text
+        resume_text = (
+            "\n".join(lines.values())
+            if ctx.is_docx
+            else ctx.resume.read_text(encoding="utf-8")
+        )
+        if memoized:
+            # analyze stage: section inference reused while resume & template match
+            assert memo is not None
+            descriptor = handler.detect_template(ctx.resume, resume_text)
+            # DOCX sections also depend on formatting, so key on file bytes (read key)
+            key = memo.graph.key(
+                "analyze",
+                resume=(
+                    memo.graph.keys.get("read")
+                    if ctx.is_docx
+                    else json_hash(list(lines.items()))
+                ),
+                template=descriptor.id if descriptor else None,
+            )
+            payload = memo.lookup("analyze", key, reusable=not ctx.refresh_sections)
+            if payload is None:
+                if ctx.is_docx:
+                    _, analysis = handler.build_context(ctx.resume, lines, resume_text)
+                else:
+                    analysis = handler.analyze(lines, descriptor)
+                payload = {
+                    "sections": handler.sections_to_payload(analysis),
+                    "notes": list(analysis.notes),
+                }
+                memo.save("analyze", payload)
+            auto_sections_json = json.dumps(payload["sections"])
+            template_notes = payload["notes"]
+        else:
+            descriptor, analysis = handler.build_context(ctx.resume, lines, resume_text)
+            auto_sections_json = json.dumps(handler.sections_to_payload(analysis))
+            template_notes = analysis.notes
         progress.advance(task)
 
         # display template info
@@ -153,12 +279,31 @@ def prepare_resume_context(
                 ui.print(f" - {note}")
 
     # resolve sections (explicit path takes precedence over auto-detected)
-    if ctx.sections_path:
+    is_docx_like = not (ctx.is_latex or ctx.is_typst)
+    refresh = ctx.refresh_sections and is_docx_like and ctx.model is not None
+    # local DOCX analysis stands in for the AI sectionizer only when confident
+    local_ok = not is_docx_like or (
+        auto_sections_json is not None
+        and is_confident_payload(json.loads(auto_sections_json))
+    )
+    sections_json_str = None
+    if ctx.sections_path and not refresh:
         sections_json_str = load_sections(ctx.sections_path, progress, task)
-    elif ctx.is_latex or ctx.is_typst:
+    if sections_json_str is None and local_ok and not refresh:
         sections_json_str = auto_sections_json
-    else:
-        sections_json_str = None
+
+    # low-confidence local analysis: reuse AI sectionizer result cached for resume
+    if sections_json_str is None and is_docx_like and ctx.model:
+        if refresh:
+            progress.update(task, description="Sectionizing resume with AI...")
+            sections, _ = sectionize_core(ctx.settings, lines, ctx.model, refresh=True)
+            if ctx.sections_path:
+                progress.advance(task)
+        else:
+            sections = cached_sections(ctx.settings, lines, ctx.model)
+        if sections is not None:
+            sections_json_str = json.dumps(sections)
+            vlog_think("Using sectionizer result cached for this resume & model")
 
     return ResumeContext(
         lines=lines,
@@ -186,6 +331,10 @@ def build_tailoring_context(
     preserve_mode: str = "in_place",
     interactive: bool = True,
     user_prompt: str | None = None,
+    explain: bool = False,
+    refresh_sections: bool = False,
+    write_output: bool = True,
+    scope: list[tuple[int, int]] | None = None,
 ) -> TailoringContext:
     # build TailoringContext w/ resolved arguments via ArgResolver
     common = resolver.resolve_common(
@@ -214,6 +363,10 @@ def build_tailoring_context(
         preserve_mode=preserve_mode,
         interactive=interactive,
         user_prompt=user_prompt,
+        explain=explain,
+        refresh_sections=refresh_sections,
+        write_output=write_output,
+        scope=scope,
     )
 
 
@@ -225,7 +378,21 @@ class TailoringRunner:
         # state for reporting
         self._edits: dict | None = None
         self._new_lines: Lines | None = None
+        # diff hunks of written output (None when no output written)
+        self._hunks: list[DiffHunk] | None = None
         self._resume_ctx: ResumeContext | None = None
+        # make-style memo of stage outputs across invocations
+        self._memo = build_stage_memo(ctx.settings)
+
+    # edited lines from apply/tailor (None until run)
+    @property
+    def new_lines(self) -> Lines | None:
+        return self._new_lines
+
+    # structured diff of resume vs written output, reused by reports & bulk stats
+    @property
+    def hunks(self) -> list[DiffHunk] | None:
+        return self._hunks
 
     # validate required arguments based on mode
     def validate(self) -> None:
@@ -249,8 +416,8 @@ class TailoringRunner:
 
         total = base_steps[self.mode]
 
-        # add optional LaTeX/Typst step (all modes use format-specific analysis)
-        if self.ctx.is_latex or self.ctx.is_typst:
+        # add optional LaTeX/Typst/DOCX step (all modes use format-specific analysis)
+        if self.ctx.is_latex or self.ctx.is_typst or self.ctx.is_docx:
             total += 1
 
         # add optional job step (apply only - job is optional for PROMPT support)
@@ -261,6 +428,13 @@ class TailoringRunner:
         if self.ctx.sections_path is not None:
             total += 1
 
+        # in-memory apply skips diff & write steps
+        if not self.ctx.write_output and self.mode in (
+            TailoringMode.APPLY,
+            TailoringMode.TAILOR,
+        ):
+            total -= 2
+
         return total
 
     # main entry point - orchestrates the full workflow
@@ -302,6 +476,8 @@ class TailoringRunner:
 
         # report results
         self._report()
+        if self.ctx.explain:
+            report_stage_trace(self._memo.graph.trace, enabled=self._memo.enabled)
 
     # execute the appropriate workflow based on mode
     def _execute(self, ui, progress, task) -> None:
@@ -314,10 +490,96 @@ class TailoringRunner:
         elif self.mode == TailoringMode.PLAN:
             self._run_plan(ui, progress, task)
 
+    # generate stage: AI edits reused while resume, job, sections & model match
+    def _generate_edits(self, ui, resume_ctx: ResumeContext) -> dict | None:
+        assert resume_ctx.job_text is not None and self.ctx.model is not None
+        lines = resume_ctx.lines
+        if self.ctx.scope is not None:
+            lines = scope_lines(lines, self.ctx.scope)
+        key = self._memo.graph.key(
+            "generate",
+            resume=json_hash(list(lines.items())),
+            sections=content_hash(resume_ctx.sections_json_str),
+            job=content_hash(resume_ctx.job_text),
+            model=self.ctx.model,
+            risk=self.ctx.risk.value,
+            on_error=self.ctx.on_error.value,
+            user_prompt=self.ctx.user_prompt,
+        )
+        payload = self._memo.lookup("generate", key)
+        if payload is not None:
+            ui.print("[dim]Reusing edits from previous run (inputs unchanged)[/]")
+            return payload["edits"]
+
+        edits = generate_edits_core(
+            self.ctx.settings,
+            lines,
+            resume_ctx.job_text,
+            resume_ctx.sections_json_str,
+            self.ctx.model,
+            self.ctx.risk,
+            self.ctx.on_error,
+            ui,
+            persist_path=self.ctx.edits_json,
+            user_prompt=self.ctx.user_prompt,
+        )
+        if edits is not None:
+            self._memo.save("generate", {"edits": edits})
+        return edits
+
+    # apply stage: edited lines reused while resume, edits & policies match
+    # interactive runs are never reused since user decisions shape the result
+    def _apply_edits(
+        self, ui, resume_ctx: ResumeContext, edits: dict, job_text: str | None
+    ) -> Lines:
+        descriptor = resume_ctx.descriptor
+        key = self._memo.graph.key(
+            "apply",
+            resume=json_hash(list(resume_ctx.lines.items())),
+            # same extracted lines apply differently per format & template
+            format=self.ctx.resume.suffix.lower() if self.ctx.resume else None,
+            descriptor=json_hash(asdict(descriptor)) if descriptor else None,
+            edits=json_hash(edits),
+            sections=content_hash(resume_ctx.sections_json_str),
+            job=content_hash(job_text),
+            model=self.ctx.model,
+            risk=self.ctx.risk.value,
+            on_error=self.ctx.on_error.value,
+        )
+        payload = self._memo.lookup(
+            "apply", key, reusable=not self.ctx.interactive
+        )
+        if payload is not None:
+            return {int(n): text for n, text in payload["lines"]}
+
+        new_lines = apply_edits_core(
+            self.ctx.settings,
+            resume_ctx.lines,
+            edits,
+            self.ctx.risk,
+            self.ctx.on_error,
+            ui,
+            self.ctx.interactive,
+            job_text=job_text,
+            sections_json=resume_ctx.sections_json_str,
+            model=self.ctx.model,
+            persist_special_ops=self.ctx.interactive,
+            edits_json_path=self.ctx.edits_json,
+            resume_path=self.ctx.resume,
+            descriptor=resume_ctx.descriptor,
+        )
+        if not self.ctx.interactive:
+            self._memo.save(
+                "apply", {"lines": [[n, text] for n, text in new_lines.items()]}
+            )
+        return new_lines
+
     # generate mode: create edits.json only
     def _run_generate(self, ui, progress, task) -> None:
         vlog_stage("Loading resume & job", "Preparing context for generation")
-        resume_ctx = prepare_resume_context(self.ctx, ui, progress, task, load_job=True)
+        resume_ctx = prepare_resume_context(
+            self.ctx, ui, progress, task, load_job=True, memo=self._memo
+        )
         self._resume_ctx = resume_ctx
 
         vlog_think(f"Resume has {len(resume_ctx.lines)} lines")
@@ -331,18 +593,7 @@ class TailoringRunner:
         progress.update(task, description="Generating edits with AI...")
         assert resume_ctx.job_text is not None, "job_text required for generate"
         assert self.ctx.model is not None, "model required for generate"
-        self._edits = generate_edits_core(
-            self.ctx.settings,
-            resume_ctx.lines,
-            resume_ctx.job_text,
-            resume_ctx.sections_json_str,
-            self.ctx.model,
-            self.ctx.risk,
-            self.ctx.on_error,
-            ui,
-            persist_path=self.ctx.edits_json,
-            user_prompt=self.ctx.user_prompt,
-        )
+        self._edits = self._generate_edits(ui, resume_ctx)
         progress.advance(task)
 
         # persist edits
@@ -362,7 +613,7 @@ class TailoringRunner:
 
         # use shared context preparation (without loading job initially)
         resume_ctx = prepare_resume_context(
-            self.ctx, ui, progress, task, load_job=False
+            self.ctx, ui, progress, task, load_job=False, memo=self._memo
         )
 
         # optionally load job for PROMPT support (apply allows job to be optional)
@@ -384,22 +635,7 @@ class TailoringRunner:
         # apply edits using core helper
         vlog_stage("Applying edits", "Processing each edit operation")
         progress.update(task, description="Applying edits...")
-        self._new_lines = apply_edits_core(
-            self.ctx.settings,
-            resume_ctx.lines,
-            edits_obj,
-            self.ctx.risk,
-            self.ctx.on_error,
-            ui,
-            self.ctx.interactive,
-            job_text=job_text,
-            sections_json=resume_ctx.sections_json_str,
-            model=self.ctx.model,
-            persist_special_ops=self.ctx.interactive,
-            edits_json_path=self.ctx.edits_json,
-            resume_path=self.ctx.resume,
-            descriptor=resume_ctx.descriptor,
-        )
+        self._new_lines = self._apply_edits(ui, resume_ctx, edits_obj, job_text)
         progress.advance(task)
 
         # store for reporting (update job_text if loaded)
@@ -411,6 +647,8 @@ class TailoringRunner:
             template_notes=resume_ctx.template_notes,
             sections_json_str=resume_ctx.sections_json_str,
         )
+        if not self.ctx.write_output:
+            return
 
         # write output w/ diff generation
         vlog_stage("Writing output", f"To {self.ctx.output_resume}")
@@ -418,7 +656,7 @@ class TailoringRunner:
         assert (
             self.ctx.output_resume is not None
         ), "output_resume path required for apply"
-        write_output_with_diff(
+        self._hunks = write_output_with_diff(
             self.ctx.settings,
             self.ctx.resume,
             resume_ctx.lines,
@@ -433,7 +671,9 @@ class TailoringRunner:
     # tailor mode: generate edits then apply
     def _run_full_tailor(self, ui, progress, task) -> None:
         vlog_stage("Loading resume & job", "Preparing context for full tailor")
-        resume_ctx = prepare_resume_context(self.ctx, ui, progress, task, load_job=True)
+        resume_ctx = prepare_resume_context(
+            self.ctx, ui, progress, task, load_job=True, memo=self._memo
+        )
         self._resume_ctx = resume_ctx
 
         vlog_think(f"Resume has {len(resume_ctx.lines)} lines")
@@ -445,18 +685,7 @@ class TailoringRunner:
         progress.update(task, description="Generating edits with AI...")
         assert resume_ctx.job_text is not None, "job_text required for tailor"
         assert self.ctx.model is not None, "model required for tailor"
-        self._edits = generate_edits_core(
-            self.ctx.settings,
-            resume_ctx.lines,
-            resume_ctx.job_text,
-            resume_ctx.sections_json_str,
-            self.ctx.model,
-            self.ctx.risk,
-            self.ctx.on_error,
-            ui,
-            persist_path=self.ctx.edits_json,
-            user_prompt=self.ctx.user_prompt,
-        )
+        self._edits = self._generate_edits(ui, resume_ctx)
         progress.advance(task)
 
         if self._edits is None:
@@ -472,23 +701,12 @@ class TailoringRunner:
         # apply edits using core helper
         vlog_stage("Applying edits", "Processing each edit operation")
         progress.update(task, description="Applying edits...")
-        self._new_lines = apply_edits_core(
-            self.ctx.settings,
-            resume_ctx.lines,
-            self._edits,
-            self.ctx.risk,
-            self.ctx.on_error,
-            ui,
-            self.ctx.interactive,
-            job_text=resume_ctx.job_text,
-            sections_json=resume_ctx.sections_json_str,
-            model=self.ctx.model,
-            persist_special_ops=self.ctx.interactive,
-            edits_json_path=self.ctx.edits_json,
-            resume_path=self.ctx.resume,
-            descriptor=resume_ctx.descriptor,
+        self._new_lines = self._apply_edits(
+            ui, resume_ctx, self._edits, resume_ctx.job_text
         )
         progress.advance(task)
+        if not self.ctx.write_output:
+            return
 
         # write output w/ diff generation
         vlog_stage("Writing output", f"To {self.ctx.output_resume}")
@@ -496,7 +714,7 @@ class TailoringRunner:
         assert (
             self.ctx.output_resume is not None
         ), "output_resume path required for tailor"
-        write_output_with_diff(
+        self._hunks = write_output_with_diff(
             self.ctx.settings,
             self.ctx.resume,
             resume_ctx.lines,
@@ -523,7 +741,11 @@ class TailoringRunner:
 
     # generate final report based on mode
     def _report(self) -> None:
-        if self.mode == TailoringMode.GENERATE:
+        if not self.ctx.write_output and self.mode == TailoringMode.APPLY:
+            return
+        if self.mode == TailoringMode.GENERATE or (
+            not self.ctx.write_output and self.mode == TailoringMode.TAILOR
+        ):
             report_result("edits", edits_path=self.ctx.edits_json)
         elif self.mode == TailoringMode.APPLY:
             report_result(
@@ -532,6 +754,7 @@ class TailoringRunner:
                 output_path=self.ctx.output_resume,
                 preserve_formatting=self.ctx.preserve_formatting,
                 preserve_mode=self.ctx.preserve_mode,
+                hunks=self._hunks,
             )
         elif self.mode == TailoringMode.TAILOR:
             report_result(
@@ -539,6 +762,7 @@ class TailoringRunner:
                 settings=self.ctx.settings,
                 edits_path=self.ctx.edits_json,
                 output_path=self.ctx.output_resume,
+                hunks=self._hunks,
             )
         elif self.mode == TailoringMode.PLAN:
             report_result(
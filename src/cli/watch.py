@@ -7,12 +7,23 @@ import signal
 import sys
 from pathlib import Path
 from threading import Timer
-from typing import Any, Callable, Sequence
+from typing import Any, Callable, Optional, Sequence
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+from ..core.incremental import (
+    Region,
+    affected_regions,
+    format_regions,
+    merge_scoped_edits,
+    scoped_prompt,
+)
+from ..core.rebase import rebase_edits
+from ..core.types import Lines
+from ..loom_io import read_json_safe, read_resume_document, read_text, write_json_safe
 from ..loom_io.console import console
+from .runner import TailoringMode
 
 
 # file event handler w/ debounce to avoid rapid re-triggers
@@ -118,3 +129,106 @@ class WatchRunner:
             signal.signal(signal.SIGTERM, original_sigterm)
             observer.stop()
             observer.join()
+
+
+# * Re-tailoring callable for watch mode that only regenerates changed resume regions
+# first run, job changes & section changes run in full; resume-only changes rebase
+# previous edits, send model only changed/inserted sections & merge results
+class IncrementalTailorSession:
+    def __init__(
+        self,
+        run: Callable[[TailoringMode, Optional[str], Optional[list[Region]]], None],
+        mode: TailoringMode,
+        *,
+        resume: Path,
+        job: Path | None,
+        sections_path: Path | None,
+        edits_json: Path,
+        user_prompt: str | None = None,
+    ):
+        # run(mode, user_prompt, scope) executes one tailoring pass w/ all other args
+        # fixed; scope limits generation to those line regions
+        self.run = run
+        self.mode = mode
+        self.resume = resume
+        self.job = job
+        self.sections_path = sections_path
+        self.edits_json = edits_json
+        self.user_prompt = user_prompt
+        # state of last successful run
+        self._lines: Lines | None = None
+        self._inputs: tuple[str | None, str | None] | None = None
+
+    @staticmethod
+    def _read_optional(path: Path | None) -> str | None:
+        return read_text(path) if path is not None and path.exists() else None
+
+    def __call__(self) -> None:
+        lines = read_resume_document(self.resume)
+        inputs = (
+            self._read_optional(self.job),
+            self._read_optional(self.sections_path),
+        )
+
+        try:
+            if (
+                self._lines is None
+                or inputs != self._inputs
+                or not self.edits_json.exists()
+            ):
+                self.run(self.mode, self.user_prompt, None)
+            elif dict(lines) == dict(self._lines):
+                console.print("[dim]Resume content unchanged; nothing to re-tailor[/]")
+                return
+            else:
+                self._run_incremental(self._lines, lines, inputs[1])
+        except BaseException:
+            # ! edits.json may already target new resume; next save runs in full
+            self._lines = None
+            raise
+
+        self._lines, self._inputs = lines, inputs
+
+    def _run_incremental(
+        self, old_lines: Lines, new_lines: Lines, sections_json: str | None
+    ) -> None:
+        result = rebase_edits(read_json_safe(self.edits_json), old_lines, new_lines)
+        regions = affected_regions(old_lines, new_lines, sections_json)
+
+        # dropped ops outside any changed region would be lost; re-tailor everything
+        if not regions and not result.clean:
+            console.print(
+                f"[yellow]Incremental: {len(result.dropped)} ops could not be "
+                "rebased; re-tailoring in full[/]"
+            )
+            self._report_dropped(result.dropped)
+            self.run(self.mode, self.user_prompt, None)
+            return
+
+        edits = result.edits
+        summary = f"{len(edits.get('ops', []))} ops rebased"
+        if result.dropped:
+            summary += f", {len(result.dropped)} dropped"
+        if regions:
+            console.print(
+                f"[dim]Incremental: {summary}, "
+                f"regenerating lines {format_regions(regions)}[/]"
+            )
+            self._report_dropped(result.dropped)
+            self.run(
+                TailoringMode.GENERATE,
+                scoped_prompt(regions, self.user_prompt),
+                regions,
+            )
+            edits = merge_scoped_edits(edits, read_json_safe(self.edits_json), regions)
+        else:
+            console.print(f"[dim]Incremental: {summary}, no changed lines to tailor[/]")
+        write_json_safe(edits, self.edits_json)
+
+        if self.mode == TailoringMode.TAILOR:
+            self.run(TailoringMode.APPLY, self.user_prompt, None)
+
+    @staticmethod
+    def _report_dropped(notes: list[str]) -> None:
+        for note in notes:
+            console.print(f"      [yellow]{note}[/]")
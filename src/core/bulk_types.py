@@ -55,6 +55,19 @@ class EditBreakdown:
             },
         }
 
+    # rebuild from to_dict() output
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EditBreakdown":
+        by_type = data.get("by_type", {})
+        return cls(
+            total_count=data.get("total", 0),
+            lines_touched=data.get("lines_touched", 0),
+            sections_touched=list(data.get("sections", [])),
+            inserts=by_type.get("inserts", 0),
+            replacements=by_type.get("replacements", 0),
+            deletes=by_type.get("deletes", 0),
+        )
+
 
 # job keyword matching analysis
 @dataclass
@@ -89,6 +102,28 @@ class KeywordCoverage:
             "missing_required": self.missing_required[:5],
         }
 
+    # rebuild from to_dict() output (missing_required keeps only serialized top 5)
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "KeywordCoverage":
+        required = _parse_ratio(data.get("required"))
+        preferred = _parse_ratio(data.get("preferred"))
+        return cls(
+            required_matched=required[0],
+            required_total=required[1],
+            preferred_matched=preferred[0],
+            preferred_total=preferred[1],
+            missing_required=list(data.get("missing_required", [])),
+        )
+
+
+# parse "matched/total" counts; (0, 0) if absent or malformed
+def _parse_ratio(value: Optional[str]) -> tuple[int, int]:
+    try:
+        matched, total = str(value).split("/")
+        return int(matched), int(total)
+    except ValueError:
+        return 0, 0
+
 
 # summary of validation warnings & issues
 @dataclass
@@ -105,6 +140,133 @@ class ValidationSummary:
             "unsafe_claims": self.unsafe_claims,
         }
 
+    # rebuild from to_dict() output
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ValidationSummary":
+        return cls(
+            warnings_by_severity=dict(data.get("by_severity", {})),
+            unsafe_claims=data.get("unsafe_claims", 0),
+            total_warnings=data.get("total_warnings", 0),
+        )
+
+
+# summary of single tailoring pass (cascade runs record triage & final passes)
+@dataclass
+class PassResult:
+    stage: str  # "triage" | "final"
+    model: str
+    status: JobStatus = JobStatus.PENDING
+    fit_score: float = 0.0
+    runtime_seconds: float = 0.0
+    edits_count: int = 0
+    output_dir: Optional[Path] = None
+    error: Optional[str] = None
+
+    # serialize to JSON-compatible dict
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "model": self.model,
+            "status": self.status.value,
+            "fit_score": round(self.fit_score, 2),
+            "runtime_seconds": round(self.runtime_seconds, 2),
+            "edits": self.edits_count,
+            "dir": str(self.output_dir) if self.output_dir else None,
+            "error": self.error,
+        }
+
+    # rebuild from to_dict() output
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PassResult":
+        return cls(
+            stage=data["stage"],
+            model=data.get("model", ""),
+            status=JobStatus(data.get("status", JobStatus.PENDING.value)),
+            fit_score=data.get("fit_score", 0.0),
+            runtime_seconds=data.get("runtime_seconds", 0.0),
+            edits_count=data.get("edits", 0),
+            output_dir=Path(data["dir"]) if data.get("dir") else None,
+            error=data.get("error"),
+        )
+
+
+# cascade configuration & savings for two-tier (triage -> final) runs
+@dataclass
+class CascadeSummary:
+    triage_model: str
+    final_model: str
+    top_n: Optional[int] = None
+    threshold: Optional[float] = None
+    triaged: int = 0
+    promoted: int = 0
+    triage_runtime_seconds: float = 0.0
+    final_runtime_seconds: float = 0.0
+    # net estimated time saved vs. running final model on every job (may be < 0)
+    estimated_time_saved_seconds: float = 0.0
+
+    # final-model passes avoided by triage
+    @property
+    def final_passes_avoided(self) -> int:
+        return max(self.triaged - self.promoted, 0)
+
+    # serialize to JSON-compatible dict
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "triage_model": self.triage_model,
+            "final_model": self.final_model,
+            "top_n": self.top_n,
+            "threshold": self.threshold,
+            "triaged": self.triaged,
+            "promoted": self.promoted,
+            "final_passes_avoided": self.final_passes_avoided,
+            "triage_runtime_seconds": round(self.triage_runtime_seconds, 2),
+            "final_runtime_seconds": round(self.final_runtime_seconds, 2),
+            "estimated_time_saved_seconds": round(
+                self.estimated_time_saved_seconds, 2
+            ),
+        }
+
+    # rebuild from to_dict() output
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CascadeSummary":
+        return cls(
+            triage_model=data["triage_model"],
+            final_model=data["final_model"],
+            top_n=data.get("top_n"),
+            threshold=data.get("threshold"),
+            triaged=data.get("triaged", 0),
+            promoted=data.get("promoted", 0),
+            triage_runtime_seconds=data.get("triage_runtime_seconds", 0.0),
+            final_runtime_seconds=data.get("final_runtime_seconds", 0.0),
+            estimated_time_saved_seconds=data.get("estimated_time_saved_seconds", 0.0),
+        )
+
+
+# near-duplicate postings tailored once via representative job
+@dataclass
+class DuplicateCluster:
+    representative: str
+    members: list[str] = field(default_factory=list)
+    # Jaccard similarity of each member to representative, by member ID
+    similarity: dict[str, float] = field(default_factory=dict)
+
+    # serialize to JSON-compatible dict
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "representative": self.representative,
+            "members": self.members,
+            "similarity": {k: round(v, 3) for k, v in self.similarity.items()},
+        }
+
+    # rebuild from to_dict() output
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DuplicateCluster":
+        return cls(
+            representative=data["representative"],
+            members=list(data.get("members", [])),
+            similarity=dict(data.get("similarity", {})),
+        )
+
 
 # result of processing single job
 @dataclass
@@ -131,6 +293,18 @@ class JobResult:
     # computed fit score
     fit_score: float = 0.0
 
+    # TF-IDF similarity to resume from pre-rank stage (None if not pre-ranked)
+    prerank_score: Optional[float] = None
+
+    # representative job ID whose outputs were reused (near-duplicate postings)
+    duplicate_of: Optional[str] = None
+
+    # edits rebased from a previous run instead of generated by the model
+    rebased: bool = False
+
+    # earlier bulk run (dir name) whose finished result was reused (incremental runs)
+    reused_from: Optional[str] = None
+
     # output paths
     output_dir: Optional[Path] = None
     edits_path: Optional[Path] = None
@@ -139,27 +313,81 @@ class JobResult:
     # error info (if failed)
     error: Optional[str] = None
 
+    # model that produced final outputs & per-pass history (cascade mode)
+    model: Optional[str] = None
+    passes: list[PassResult] = field(default_factory=list)
+
+    # record summary of this result as a pass in its own history
+    def record_pass(self, stage: str) -> PassResult:
+        entry = PassResult(
+            stage=stage,
+            model=self.model or "",
+            status=self.status,
+            fit_score=self.fit_score,
+            runtime_seconds=self.runtime_seconds,
+            edits_count=self.edits.total_count,
+            output_dir=self.output_dir,
+            error=self.error,
+        )
+        self.passes.append(entry)
+        return entry
+
     # serialize to JSON-compatible dict
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.spec.id,
             "name": self.spec.name,
             "company": self.spec.company,
+            "model": self.model,
             "status": self.status.value,
             "runtime_seconds": round(self.runtime_seconds, 2),
             "edits": self.edits.to_dict(),
             "coverage": self.coverage.to_dict(),
             "validation": self.validation.to_dict(),
             "fit_score": round(self.fit_score, 2),
+            "prerank_score": (
+                round(self.prerank_score, 4)
+                if self.prerank_score is not None
+                else None
+            ),
             "keyword_stuffing_score": round(self.keyword_stuffing_score, 2),
+            "duplicate_of": self.duplicate_of,
+            "rebased": self.rebased,
+            "reused_from": self.reused_from,
             "outputs": {
                 "dir": str(self.output_dir) if self.output_dir else None,
                 "edits": str(self.edits_path) if self.edits_path else None,
                 "resume": str(self.resume_path) if self.resume_path else None,
             },
+            "passes": [p.to_dict() for p in self.passes],
             "error": self.error,
         }
 
+    # * Rebuild result for spec from to_dict() output (scores keep serialized rounding)
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], spec: JobSpec) -> "JobResult":
+        outputs = data.get("outputs") or {}
+        return cls(
+            spec=spec,
+            status=JobStatus(data.get("status", JobStatus.PENDING.value)),
+            runtime_seconds=data.get("runtime_seconds", 0.0),
+            edits=EditBreakdown.from_dict(data.get("edits", {})),
+            coverage=KeywordCoverage.from_dict(data.get("coverage", {})),
+            validation=ValidationSummary.from_dict(data.get("validation", {})),
+            keyword_stuffing_score=data.get("keyword_stuffing_score", 0.0),
+            fit_score=data.get("fit_score", 0.0),
+            prerank_score=data.get("prerank_score"),
+            duplicate_of=data.get("duplicate_of"),
+            rebased=data.get("rebased", False),
+            reused_from=data.get("reused_from"),
+            output_dir=Path(outputs["dir"]) if outputs.get("dir") else None,
+            edits_path=Path(outputs["edits"]) if outputs.get("edits") else None,
+            resume_path=Path(outputs["resume"]) if outputs.get("resume") else None,
+            error=data.get("error"),
+            model=data.get("model"),
+            passes=[PassResult.from_dict(p) for p in data.get("passes", [])],
+        )
+
 
 # aggregated result of bulk processing run
 @dataclass
@@ -169,6 +397,12 @@ class BulkResult:
     timestamp: str
     output_dir: Path
     jobs: list[JobResult] = field(default_factory=list)
+    cascade: Optional[CascadeSummary] = None
+    # number of discovered jobs scored by pre-rank stage (None if not pre-ranked)
+    prerank_scored: Optional[int] = None
+    duplicates: list[DuplicateCluster] = field(default_factory=list)
+    # run looked up earlier results to reuse (--incremental)
+    incremental: bool = False
 
     # count of successfully processed jobs
     @property
@@ -185,6 +419,16 @@ class BulkResult:
     def skipped_count(self) -> int:
         return sum(1 for j in self.jobs if j.status == JobStatus.SKIPPED)
 
+    # count of jobs whose edits were rebased from a previous run
+    @property
+    def rebased_count(self) -> int:
+        return sum(1 for j in self.jobs if j.rebased)
+
+    # count of jobs whose results were reused from an earlier run (incremental)
+    @property
+    def reused_count(self) -> int:
+        return sum(1 for j in self.jobs if j.reused_from)
+
     # total runtime across all jobs
     @property
     def total_runtime(self) -> float:
@@ -200,7 +444,7 @@ class BulkResult:
 
     # serialize to JSON-compatible dict
     def to_dict(self) -> dict[str, Any]:
-        return {
+        data: dict[str, Any] = {
             "version": 1,
             "meta": {
                 "resume": str(self.resume_path),
@@ -218,3 +462,15 @@ class BulkResult:
             "jobs": [j.to_dict() for j in self.jobs],
             "ranking": [j.spec.id for j in self.ranked_jobs()],
         }
+        if self.cascade is not None:
+            data["cascade"] = self.cascade.to_dict()
+        if self.prerank_scored is not None:
+            data["summary"]["prerank_scored"] = self.prerank_scored
+        if self.duplicates:
+            data["duplicates"] = [c.to_dict() for c in self.duplicates]
+        if self.rebased_count:
+            data["summary"]["rebased"] = self.rebased_count
+        if self.incremental:
+            data["summary"]["reused"] = self.reused_count
+            data["summary"]["recomputed"] = len(self.jobs) - self.reused_count
+        return data
@@ -9,49 +9,19 @@ from collections import Counter
 
 from .bulk_types import (
     JobResult,
+    JobStatus,
+    CascadeSummary,
     EditBreakdown,
     KeywordCoverage,
     ValidationSummary,
 )
-
-
-# multi-word tech terms to recognize
-MULTI_WORD_TERMS = [
-    "machine learning",
-    "deep learning",
-    "natural language processing",
-    "distributed systems",
-    "event-driven",
-    "microservices architecture",
-    "continuous integration",
-    "continuous deployment",
-    "infrastructure as code",
-    "test-driven development",
-    "object-oriented programming",
-    "functional programming",
-    "data engineering",
-    "data science",
-    "cloud native",
-    "high availability",
-    "real-time",
-    "full-stack",
-    "front-end",
-    "back-end",
-]
-
-# single-word tech patterns
-TECH_PATTERNS = [
-    r"\b(Python|Java|JavaScript|TypeScript|Go|Rust|C\+\+|C#|Ruby|PHP|Swift|Kotlin|Scala)\b",
-    r"\b(React|Angular|Vue|Next\.js|Node\.js|Django|Flask|FastAPI|Spring|Rails|Express)\b",
-    r"\b(AWS|Azure|GCP|Docker|Kubernetes|Terraform|Ansible|Jenkins|CircleCI|GitHub Actions)\b",
-    r"\b(PostgreSQL|MySQL|MongoDB|Redis|Elasticsearch|Kafka|RabbitMQ|DynamoDB|Cassandra)\b",
-    r"\b(REST|GraphQL|gRPC|WebSocket|HTTP|HTTPS)\b",
-    r"\b(Linux|Unix|Bash|Shell|PowerShell)\b",
-    r"\b(Git|GitHub|GitLab|Bitbucket)\b",
-    r"\b(Agile|Scrum|Kanban)\b",
-    r"\b(SQL|NoSQL|ORM)\b",
-    r"\b(HTML|CSS|SASS|LESS)\b",
-]
+from .keyword_matcher import (
+    DEFAULT_MATCHER,
+    MULTI_WORD_TERMS,
+    TECH_PATTERNS,
+    KeywordMatcher,
+    TermIndex,
+)
 
 
 # * Calculate fit score from job result components
@@ -70,6 +40,70 @@ def calculate_fit_score(result: JobResult) -> float:
     return max(0.0, min(1.0, raw_score - validation_penalty))
 
 
+# default fit threshold for cascade promotion when neither top-N nor threshold given
+DEFAULT_CASCADE_THRESHOLD = 0.5
+
+
+# * Select job IDs to promote from triage to final pass
+# ranks successful triage results by fit score, then applies threshold & top-N cut
+def select_cascade_promotions(
+    triage_results: list[JobResult],
+    top_n: int | None = None,
+    threshold: float | None = None,
+) -> list[str]:
+    if top_n is None and threshold is None:
+        threshold = DEFAULT_CASCADE_THRESHOLD
+
+    ranked = sorted(
+        [r for r in triage_results if r.status == JobStatus.SUCCESS],
+        key=lambda r: r.fit_score,
+        reverse=True,
+    )
+    if threshold is not None:
+        ranked = [r for r in ranked if r.fit_score >= threshold]
+    if top_n is not None:
+        ranked = ranked[: max(top_n, 0)]
+
+    return [r.spec.id for r in ranked]
+
+
+# * Summarize cascade run & estimate net time saved vs. final model on every job
+def summarize_cascade(
+    triage_model: str,
+    final_model: str,
+    triage_results: list[JobResult],
+    final_results: list[JobResult],
+    top_n: int | None = None,
+    threshold: float | None = None,
+) -> CascadeSummary:
+    triage_runtime = sum(r.runtime_seconds for r in triage_results)
+    final_runtime = sum(r.runtime_seconds for r in final_results)
+
+    triaged = sum(1 for r in triage_results if r.status == JobStatus.SUCCESS)
+    promoted = len(final_results)
+
+    # estimate per-job final cost from promoted jobs (fallback: triage average)
+    if final_results:
+        per_job = final_runtime / len(final_results)
+    elif triage_results:
+        per_job = triage_runtime / len(triage_results)
+    else:
+        per_job = 0.0
+    baseline = per_job * len(triage_results)
+
+    return CascadeSummary(
+        triage_model=triage_model,
+        final_model=final_model,
+        top_n=top_n,
+        threshold=threshold,
+        triaged=triaged,
+        promoted=promoted,
+        triage_runtime_seconds=triage_runtime,
+        final_runtime_seconds=final_runtime,
+        estimated_time_saved_seconds=baseline - (triage_runtime + final_runtime),
+    )
+
+
 # * Map line numbers to section names using sections.json structure
 def _map_lines_to_sections(lines_touched: set[int], sections_json: str) -> list[str]:
     try:
@@ -155,71 +189,33 @@ def analyze_edits(edits: dict, sections_json: str | None = None) -> EditBreakdow
 
 
 # * Extract required & preferred keywords from job description
-# extract required & preferred keywords w/ section-aware parsing; returns sorted lists for deterministic output
-def extract_job_keywords(job_text: str) -> tuple[list[str], list[str]]:
-    required: set[str] = set()
-    preferred: set[str] = set()
-
-    lines = job_text.split("\n")
-    in_required = True  # default to required section
-
-    for line in lines:
-        line_lower = line.lower()
-
-        # detect section headers
-        if any(
-            kw in line_lower
-            for kw in [
-                "required",
-                "must have",
-                "requirements",
-                "qualifications",
-                "minimum",
-            ]
-        ):
-            in_required = True
-        elif any(
-            kw in line_lower
-            for kw in ["preferred", "nice to have", "bonus", "plus", "desired"]
-        ):
-            in_required = False
-
-        target = required if in_required else preferred
-
-        # extract multi-word terms from this line
-        for term in MULTI_WORD_TERMS:
-            if term in line_lower:
-                target.add(term)
-
-        # extract single-word terms from this line
-        for pattern in TECH_PATTERNS:
-            for match in re.findall(pattern, line, re.IGNORECASE):
-                target.add(match)
-
-    # return sorted for determinism
-    return sorted(required, key=str.lower), sorted(preferred, key=str.lower)
+# section-aware single pass over compiled matcher (built-in vocabulary unless given);
+# returns sorted lists for deterministic output
+def extract_job_keywords(
+    job_text: str, matcher: KeywordMatcher | None = None
+) -> tuple[list[str], list[str]]:
+    return (matcher or DEFAULT_MATCHER).extract(job_text)
 
 
 # * Calculate keyword coverage for a resume against job keywords
-# calculate how many job keywords appear in resume
+# calculate how many job keywords appear in resume; any matcher alias counts as a match
 def calculate_keyword_coverage(
     resume_text: str,
     required_keywords: list[str],
     preferred_keywords: list[str],
+    matcher: KeywordMatcher | None = None,
 ) -> KeywordCoverage:
-    resume_lower = resume_text.lower()
+    index = TermIndex(resume_text)
+    variants = (matcher or DEFAULT_MATCHER).variants
 
-    required_matched = sum(1 for kw in required_keywords if kw.lower() in resume_lower)
-    preferred_matched = sum(
-        1 for kw in preferred_keywords if kw.lower() in resume_lower
-    )
+    def covered(keyword: str) -> bool:
+        return any(v in index for v in variants(keyword))
 
-    missing_required = [
-        kw for kw in required_keywords if kw.lower() not in resume_lower
-    ]
+    missing_required = [kw for kw in required_keywords if not covered(kw)]
+    preferred_matched = sum(1 for kw in preferred_keywords if covered(kw))
 
     return KeywordCoverage(
-        required_matched=required_matched,
+        required_matched=len(required_keywords) - len(missing_required),
         required_total=len(required_keywords),
         preferred_matched=preferred_matched,
         preferred_total=len(preferred_keywords),
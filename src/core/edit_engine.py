@@ -0,0 +1,172 @@
+# src/core/edit_engine.py
+# Linear-time edit application: ops applied in one descending merge pass w/o per-op line shifting
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from .constants import (
+    OP_DELETE_RANGE,
+    OP_INSERT_AFTER,
+    OP_REPLACE_LINE,
+    OP_REPLACE_RANGE,
+)
+from .edit_helpers import check_line_exists, check_range_exists, get_operation_line
+from .exceptions import EditError
+from .types import Lines, ResumeDocument
+
+
+# * Document split into untouched original prefix & stack of already-edited suffix
+# ops run in descending line order, so each op only touches top of stack; shifting
+# every later line is single offset update instead of moving each line
+class _LineStack:
+    def __init__(self, lines: Lines):
+        self._lines = lines
+        self._keys = sorted(lines)
+        # prefix = original lines for self._keys[:self._frontier]
+        self._frontier = len(self._keys)
+        # (stored line, text) sorted descending; actual line = stored + offset
+        self._stack: list[tuple[int, str]] = []
+        self._offset = 0
+        # lines popped off stack for current op (line -> text)
+        self._window: dict[int, str] = {}
+
+    # line exists in current document (only lines <= current window cut are asked)
+    def __contains__(self, line: object) -> bool:
+        if line in self._window:
+            return True
+        if line not in self._lines:
+            return False
+        # original line still in prefix if below first line moved onto stack
+        return self._frontier == len(self._keys) or line < self._keys[self._frontier]
+
+    # move original lines >= threshold onto stack, then pop lines <= cut into window
+    def open_window(self, threshold: int, cut: int) -> None:
+        keys, stack, offset = self._keys, self._stack, self._offset
+        while self._frontier and keys[self._frontier - 1] >= threshold:
+            self._frontier -= 1
+            key = keys[self._frontier]
+            stack.append((key - offset, self._lines[key]))
+
+        window: dict[int, str] = {}
+        while stack and stack[-1][0] + offset <= cut:
+            stored, text = stack.pop()
+            window[stored + offset] = text
+        self._window = window
+
+    # * Drop window lines in [lo, hi], shift lines after window by delta, add new lines
+    def close_window(
+        self, lo: int, hi: int, delta: int, new_start: int, new_lines: Iterable[str]
+    ) -> None:
+        self._offset += delta
+        offset = self._offset
+        stack = self._stack
+        kept = [(n, text) for n, text in self._window.items() if not lo <= n <= hi]
+        added = [(new_start + i, text) for i, text in enumerate(new_lines)]
+        for line, text in sorted(kept + added, reverse=True):
+            stack.append((line - offset, text))
+        self._window = {}
+
+    # current document as ResumeDocument; untouched prefix is one slice of source
+    def to_document(self) -> ResumeDocument:
+        frontier, offset = self._frontier, self._offset
+        if isinstance(self._lines, ResumeDocument):
+            texts = list(self._lines.texts[:frontier])
+            numbers = list(self._lines.line_numbers[:frontier])
+        else:
+            numbers = self._keys[:frontier]
+            texts = [self._lines[key] for key in numbers]
+        for stored, text in reversed(self._stack):
+            numbers.append(stored + offset)
+            texts.append(text)
+        return ResumeDocument._from_parts(tuple(texts), tuple(numbers))
+
+    # current document as Lines (ascending line order)
+    def to_lines(self) -> Lines:
+        result = {key: self._lines[key] for key in self._keys[: self._frontier]}
+        offset = self._offset
+        for stored, text in reversed(self._stack):
+            result[stored + offset] = text
+        return result
+
+
+# * Apply edit ops to lines in O(lines + op text + range spans)
+# same op order, error messages & resulting lines as sequential per-op shifting;
+# ResumeDocument input yields ResumeDocument sharing unchanged line strings w/ source
+def apply_ops(
+    resume_lines: Lines | ResumeDocument, ops: list[dict]
+) -> Lines | ResumeDocument:
+    doc = _LineStack(resume_lines)
+
+    # sort ops by line number (descending) to avoid shifting issues
+    sorted_ops = sorted(ops, key=lambda op: get_operation_line(op), reverse=True)
+
+    for op in sorted_ops:
+        op_type = op["op"]
+
+        # replace single line
+        if op_type == OP_REPLACE_LINE:
+            line_num = op["line"]
+            doc.open_window(line_num, line_num)
+            if not check_line_exists(line_num, doc):
+                raise EditError(f"Cannot replace line {line_num}: line does not exist")
+            doc.close_window(line_num, line_num, 0, line_num, [op["text"]])
+
+        # replace range of lines
+        elif op_type == OP_REPLACE_RANGE:
+            start = op["start"]
+            end = op["end"]
+            text = op["text"]
+
+            doc.open_window(min(start, end + 1), end)
+            # end reported first when out of bounds (matches sequential engine)
+            if not check_line_exists(end, doc):
+                raise EditError(
+                    f"Cannot replace range {start}-{end}: line {end} does not exist"
+                )
+            exists, missing_line = check_range_exists(start, end, doc)
+            if not exists:
+                raise EditError(
+                    f"Cannot replace range {start}-{end}: line {missing_line} does not exist"
+                )
+
+            text_lines = text.split("\n") if text else [""]
+            line_diff = len(text_lines) - (end - start + 1)
+            doc.close_window(start, end, line_diff, start, text_lines)
+
+        # insert after ___
+        elif op_type == OP_INSERT_AFTER:
+            line_num = op["line"]
+            text = op["text"]
+
+            doc.open_window(line_num + 1, line_num)
+            if not check_line_exists(line_num, doc):
+                raise EditError(
+                    f"Cannot insert after line {line_num}: line does not exist"
+                )
+
+            text_lines = text.split("\n")
+            doc.close_window(
+                line_num + 1, line_num, len(text_lines), line_num + 1, text_lines
+            )
+
+        # delete lines
+        elif op_type == OP_DELETE_RANGE:
+            start = op["start"]
+            end = op["end"]
+
+            doc.open_window(min(start, end + 1), end)
+            exists, missing_line = check_range_exists(start, end, doc)
+            if not exists:
+                raise EditError(
+                    f"Cannot delete range {start}-{end}: line {missing_line} does not exist"
+                )
+
+            doc.close_window(start, end, -(end - start + 1), start, [])
+
+        else:
+            raise EditError(f"Unknown operation type: {op_type}")
+
+    if isinstance(resume_lines, ResumeDocument):
+        return doc.to_document()
+    return doc.to_lines()
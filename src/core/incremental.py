@@ -0,0 +1,156 @@
+# src/core/incremental.py
+# Incremental re-tailoring: changed regions of an edited resume & scoped edit merging (pure)
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Optional
+
+from .constants import (
+    OP_DELETE_RANGE,
+    OP_INSERT_AFTER,
+    OP_REPLACE_LINE,
+    OP_REPLACE_RANGE,
+)
+from .line_diff import EQUAL, Opcode, diff_opcodes
+from .types import ResumeDocument
+
+Region = tuple[int, int]
+
+
+def _line_numbers(lines: Mapping[int, str]) -> list[int]:
+    if isinstance(lines, ResumeDocument):
+        return list(lines.line_numbers)
+    return sorted(lines)
+
+
+# (start, end) line ranges of top-level sections in sections JSON, if parseable
+def section_bounds(sections_json: Optional[str]) -> list[Region]:
+    if not sections_json:
+        return []
+    try:
+        data = json.loads(sections_json)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    bounds: list[Region] = []
+    for section in data.get("sections", []) if isinstance(data, dict) else []:
+        start, end = section.get("start_line"), section.get("end_line")
+        if isinstance(start, int) and isinstance(end, int) and start <= end:
+            bounds.append((start, end))
+    return bounds
+
+
+# old line number -> new line number; changed/deleted lines map to start of their
+# replacement (or last new line past end of resume)
+def _old_to_new(codes: list[Opcode], old_numbers: list[int], new_numbers: list[int]):
+    def convert(line: int) -> int:
+        pos = bisect_left(old_numbers, line)
+        for tag, i1, i2, j1, _ in codes:
+            if i1 <= pos < i2:
+                offset = pos - i1 if tag == EQUAL else 0
+                return new_numbers[min(j1 + offset, len(new_numbers) - 1)]
+        return new_numbers[-1]
+
+    return convert
+
+
+# sorted & merged copy of regions
+def _merge(regions: list[Region]) -> list[Region]:
+    merged: list[Region] = []
+    for start, end in sorted(regions):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+# * New-resume line regions needing fresh edits after resume changed
+# each inserted/replaced run widens to its enclosing section (old sections mapped
+# through the diff) or to `context` lines around it; pure deletions need no edits
+def affected_regions(
+    old_lines: Mapping[int, str],
+    new_lines: Mapping[int, str],
+    sections_json: Optional[str] = None,
+    context: int = 1,
+) -> list[Region]:
+    codes = diff_opcodes(old_lines, new_lines)
+    old_numbers, new_numbers = _line_numbers(old_lines), _line_numbers(new_lines)
+    if not new_numbers:
+        return []
+    convert = _old_to_new(codes, old_numbers, new_numbers)
+    sections = [(convert(s), convert(e)) for s, e in section_bounds(sections_json)]
+
+    regions: list[Region] = []
+    for tag, _, _, j1, j2 in codes:
+        if tag == EQUAL or j1 == j2:
+            continue
+        start, end = new_numbers[j1], new_numbers[j2 - 1]
+        # lines appended right after a section's last line belong to it
+        enclosing = [s for s in sections if s[0] <= end and s[1] >= start - 1]
+        if enclosing:
+            regions.extend(enclosing)
+            regions.append((start, end))
+        else:
+            lo = max(new_numbers[0], start - context)
+            regions.append((lo, min(new_numbers[-1], end + context)))
+    return _merge(regions)
+
+
+# lines an op reads from (insert_after counts as line it follows)
+def _op_span(op: object) -> Optional[Region]:
+    if not isinstance(op, dict):
+        return None
+    if op.get("op") in (OP_REPLACE_LINE, OP_INSERT_AFTER):
+        line = op.get("line")
+        return (line, line) if isinstance(line, int) else None
+    if op.get("op") in (OP_REPLACE_RANGE, OP_DELETE_RANGE):
+        start, end = op.get("start"), op.get("end")
+        if isinstance(start, int) and isinstance(end, int):
+            return (start, end)
+    return None
+
+
+def _touches(span: Optional[Region], regions: list[Region]) -> bool:
+    return span is not None and any(
+        span[0] <= end and span[1] >= start for start, end in regions
+    )
+
+
+# * Keep kept ops outside regions & take regenerated ops inside them
+def merge_scoped_edits(kept: dict, regenerated: dict, regions: list[Region]) -> dict:
+    ops = [op for op in kept.get("ops", []) if not _touches(_op_span(op), regions)]
+    ops.extend(
+        op
+        for op in regenerated.get("ops", [])
+        if _touches(_op_span(op), regions)
+    )
+    ops.sort(key=lambda op: (_op_span(op) or (0, 0))[0])
+    meta = {**kept.get("meta", {}), **regenerated.get("meta", {})}
+    return {**kept, "meta": meta, "ops": ops}
+
+
+# * Lines inside regions (original numbering kept) so a scoped generate call only
+# sends changed sections to the model
+def scope_lines(lines: Mapping[int, str], regions: list[Region]) -> dict[int, str]:
+    return {
+        n: text
+        for n, text in lines.items()
+        if any(start <= n <= end for start, end in regions)
+    }
+
+
+# "3, 6-9" style listing of regions
+def format_regions(regions: list[Region]) -> str:
+    return ", ".join(str(s) if s == e else f"{s}-{e}" for s, e in regions)
+
+
+# * Prompt restricting a generate call to changed regions
+def scoped_prompt(regions: list[Region], user_prompt: Optional[str] = None) -> str:
+    prompt = (
+        f"Only propose edits for lines {format_regions(regions)}. "
+        "All other lines are already tailored; do not edit them."
+    )
+    return f"{prompt}\n{user_prompt}" if user_prompt else prompt
@@ -0,0 +1,75 @@
+# src/core/interval_index.py
+# Sorted interval structures for O(log n) line-range queries (pure)
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Iterable, Optional
+
+from .types import Lines
+
+
+# * Pre-indexed resume lines: O(1) existence & O(log n) first-missing-line lookups
+# build once per resume & reuse across every edit set validated against it
+class LineIndex:
+    def __init__(self, lines: Lines):
+        self.lines = lines
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        for line in sorted(k for k in lines if isinstance(k, int)):
+            if self._ends and line == self._ends[-1] + 1:
+                self._ends[-1] = line
+            else:
+                self._starts.append(line)
+                self._ends.append(line)
+
+    def __contains__(self, line: object) -> bool:
+        return line in self.lines
+
+    # first line in [start, end] absent from resume, or None if whole range exists
+    def first_missing(self, start: int, end: int) -> Optional[int]:
+        i = bisect_right(self._starts, start) - 1
+        if i < 0 or self._ends[i] < start:
+            return start
+        return None if self._ends[i] >= end else self._ends[i] + 1
+
+
+# * Set of used lines stored as sorted disjoint runs; add & first-hit are O(log n)
+class IntervalSet:
+    def __init__(self) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+    # lowest member in [start, end], or None
+    def first_in(self, start: int, end: int) -> Optional[int]:
+        i = bisect_right(self._starts, start) - 1
+        if i >= 0 and self._ends[i] >= start:
+            return start
+        if i + 1 < len(self._starts) and self._starts[i + 1] <= end:
+            return self._starts[i + 1]
+        return None
+
+    # add [start, end], merging w/ overlapping & adjacent runs
+    def add(self, start: int, end: int) -> None:
+        lo = bisect_left(self._ends, start - 1)
+        hi = bisect_right(self._starts, end + 1)
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+
+
+# * Static ranges answering "does any range intersect [lo, hi]" in O(log n)
+# ranges sorted by start w/ running max of ends; start > end ranges are kept as-is
+class RangeIndex:
+    def __init__(self, ranges: Iterable[tuple[int, int]]):
+        ordered = sorted(ranges)
+        self._starts = [s for s, _ in ordered]
+        self._max_ends = list(accumulate((e for _, e in ordered), max))
+
+    # some range (s, e) has s <= hi & e >= lo
+    def intersects(self, lo: int, hi: int) -> bool:
+        i = bisect_right(self._starts, hi)
+        return i > 0 and self._max_ends[i - 1] >= lo
@@ -0,0 +1,334 @@
+# src/core/keyword_matcher.py
+# Compiled single-pass keyword & section-label matcher for job postings (pure)
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from .exceptions import CacheCorruptError
+
+
+# section labels that switch extraction into required / preferred mode
+REQUIRED_LABELS = ["required", "must have", "requirements", "qualifications", "minimum"]
+PREFERRED_LABELS = ["preferred", "nice to have", "bonus", "plus", "desired"]
+
+# multi-word tech terms to recognize
+MULTI_WORD_TERMS = [
+    "machine learning",
+    "deep learning",
+    "natural language processing",
+    "distributed systems",
+    "event-driven",
+    "microservices architecture",
+    "continuous integration",
+    "continuous deployment",
+    "infrastructure as code",
+    "test-driven development",
+    "object-oriented programming",
+    "functional programming",
+    "data engineering",
+    "data science",
+    "cloud native",
+    "high availability",
+    "real-time",
+    "full-stack",
+    "front-end",
+    "back-end",
+]
+
+# single-word tech patterns
+TECH_PATTERNS = [
+    r"\b(Python|Java|JavaScript|TypeScript|Go|Rust|C\+\+|C#|Ruby|PHP|Swift|Kotlin|Scala)\b",
+    r"\b(React|Angular|Vue|Next\.js|Node\.js|Django|Flask|FastAPI|Spring|Rails|Express)\b",
+    r"\b(AWS|Azure|GCP|Docker|Kubernetes|Terraform|Ansible|Jenkins|CircleCI|GitHub Actions)\b",
+    r"\b(PostgreSQL|MySQL|MongoDB|Redis|Elasticsearch|Kafka|RabbitMQ|DynamoDB|Cassandra)\b",
+    r"\b(REST|GraphQL|gRPC|WebSocket|HTTP|HTTPS)\b",
+    r"\b(Linux|Unix|Bash|Shell|PowerShell)\b",
+    r"\b(Git|GitHub|GitLab|Bitbucket)\b",
+    r"\b(Agile|Scrum|Kanban)\b",
+    r"\b(SQL|NoSQL|ORM)\b",
+    r"\b(HTML|CSS|SASS|LESS)\b",
+]
+
+# bump when serialized matcher layout changes (invalidates on-disk caches)
+MATCHER_FORMAT = 1
+
+# match roles
+LABEL_REQUIRED = "required"
+LABEL_PREFERRED = "preferred"
+PHRASE = "phrase"
+WORD = "word"
+
+
+# * Expand \b(A|B|...)\b patterns into literal terms (escapes removed, casing kept)
+def pattern_terms(patterns: Iterable[str]) -> list[str]:
+    terms: list[str] = []
+    for pattern in patterns:
+        inner = pattern.removeprefix(r"\b(").removesuffix(r")\b")
+        terms.extend(alt.replace("\\", "") for alt in inner.split("|"))
+    return terms
+
+
+_WORD_RUN_RE = re.compile(r"\w+")
+
+
+# regex \w semantics for str patterns, used for \b checks outside the regex engine
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+# \b at both ends of text[start:end]
+def _bounded_at(text: str, start: int, end: int) -> bool:
+    before = start > 0 and _is_word_char(text[start - 1])
+    after = end < len(text) and _is_word_char(text[end])
+    return before != _is_word_char(text[start]) and after != _is_word_char(
+        text[end - 1]
+    )
+
+
+# start offsets of word in line where it forms a whole \w+ run
+def _word_starts(line: str, word: str) -> Iterator[int]:
+    start = line.find(word)
+    while start != -1:
+        if _bounded_at(line, start, start + len(word)):
+            yield start
+        start = line.find(word, start + 1)
+
+
+# lowercase w/o changing length so match offsets map back onto original text
+def _lower_aligned(text: str) -> str:
+    lower = text.lower()
+    if len(lower) == len(text):
+        return lower
+    return "".join(ch.lower()[:1] for ch in text)
+
+
+# * Build regex source for literals as character trie so matching branches once per char
+# greedy optional tails make each start position yield its longest literal
+def _trie_pattern(literals: Iterable[str]) -> str:
+    trie: dict = {}
+    for literal in literals:
+        node = trie
+        for ch in literal:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        branches = [
+            re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+# single literal to match: role, reported term & whether it needs word boundaries
+@dataclass(frozen=True)
+class _Entry:
+    literal: str
+    role: str
+    term: str
+    bounded: bool
+    # report term (canonical name for alias) instead of text as written
+    canonical: bool = False
+
+
+# * Compiled matcher: one trie regex & one token table, each scanned once per text
+# substring roles (labels, phrases) & punctuated words share the regex scan;
+# shorter literals sharing a start w/ longest match are recovered from a prefix table
+class KeywordMatcher:
+    def __init__(
+        self,
+        phrases: Sequence[str] = MULTI_WORD_TERMS,
+        words: Sequence[str] = tuple(pattern_terms(TECH_PATTERNS)),
+        required_labels: Sequence[str] = REQUIRED_LABELS,
+        preferred_labels: Sequence[str] = PREFERRED_LABELS,
+        aliases: Mapping[str, Sequence[str]] | None = None,
+    ):
+        entries: list[_Entry] = []
+        for label in required_labels:
+            entries.append(_Entry(label.lower(), LABEL_REQUIRED, label, False))
+        for label in preferred_labels:
+            entries.append(_Entry(label.lower(), LABEL_PREFERRED, label, False))
+        for phrase in phrases:
+            entries.append(_Entry(phrase.lower(), PHRASE, phrase, False))
+        for word in words:
+            entries.append(_Entry(word.lower(), WORD, word, True))
+        # aliases & synonyms are word-bounded & report their canonical term
+        for term, alias_list in (aliases or {}).items():
+            for alias in alias_list:
+                entries.append(_Entry(alias.lower(), WORD, term, True, True))
+
+        entries = [e for e in entries if e.literal]
+        self._load(entries)
+
+    # set up lookup tables & regex from entry table (trie source rebuilt if not given)
+    # plain-word literals are looked up per token; only the rest go into the regex
+    def _load(self, entries: list[_Entry], pattern: str | None = None) -> None:
+        self._entries = list(dict.fromkeys(entries))
+
+        by_literal: dict[str, list[_Entry]] = {}
+        self._token_entries: dict[str, list[_Entry]] = {}
+        for entry in self._entries:
+            table = (
+                self._token_entries
+                if entry.bounded and _WORD_RUN_RE.fullmatch(entry.literal)
+                else by_literal
+            )
+            table.setdefault(entry.literal, []).append(entry)
+
+        # longest literal wins at each position; literal prefixes are checked afterwards
+        self._candidates: dict[str, list[_Entry]] = {
+            literal: [
+                entry
+                for size in range(1, len(literal) + 1)
+                for entry in by_literal.get(literal[:size], ())
+            ]
+            for literal in by_literal
+        }
+        self._pattern = _trie_pattern(by_literal) if pattern is None else pattern
+        self._regex = re.compile(f"({self._pattern})") if self._pattern else None
+
+        # canonical term -> [term, *aliases] for coverage checks
+        self._variants: dict[str, list[str]] = {}
+        for entry in self._entries:
+            if entry.canonical:
+                group = self._variants.setdefault(entry.term.lower(), [entry.term])
+                group.append(entry.literal)
+
+    # number of distinct literals matched
+    def __len__(self) -> int:
+        return len(self._candidates) + len(self._token_entries)
+
+    # * Spellings that satisfy keyword in coverage checks (keyword first, then aliases)
+    def variants(self, keyword: str) -> list[str]:
+        return self._variants.get(keyword.lower(), [keyword])
+
+    # serialize compiled form (entry table & trie source) for on-disk caching
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": MATCHER_FORMAT,
+            "pattern": self._pattern,
+            "entries": [
+                [e.literal, e.role, e.term, e.bounded, e.canonical]
+                for e in self._entries
+            ],
+        }
+
+    # * Rebuild matcher from to_dict() output w/o re-deriving trie
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> KeywordMatcher:
+        if data.get("format") != MATCHER_FORMAT:
+            raise CacheCorruptError(
+                f"Unsupported keyword matcher format: {data.get('format')!r}"
+            )
+        try:
+            entries = [_Entry(*row) for row in data["entries"]]
+            pattern = str(data["pattern"])
+        except (KeyError, TypeError) as e:
+            raise CacheCorruptError(f"Invalid keyword matcher data: {e}") from e
+        matcher = cls.__new__(cls)
+        matcher._load(entries, pattern)
+        return matcher
+
+    # * Yield (line_number, entry, text as written) for every literal occurrence
+    def _scan(self, text: str, lower: str) -> Iterator[tuple[int, _Entry, str]]:
+        if self._regex is not None:
+            line = 0
+            line_end = text.find("\n")
+            # restart one char past each match start so overlapping literals are seen
+            search = self._regex.search
+            match = search(lower)
+            while match is not None:
+                start = match.start()
+                while line_end != -1 and start > line_end:
+                    line += 1
+                    line_end = text.find("\n", line_end + 1)
+                for entry in self._candidates[match.group(1)]:
+                    end = start + len(entry.literal)
+                    if entry.bounded and not _bounded_at(lower, start, end):
+                        continue
+                    yield line, entry, text[start:end]
+                match = search(lower, start + 1)
+
+        # \b-bounded plain words are exactly the maximal \w+ runs equal to them
+        if self._token_entries:
+            text_lines = text.split("\n")
+            for line, lower_line in enumerate(lower.split("\n")):
+                words = set(_WORD_RUN_RE.findall(lower_line))
+                for word in words.intersection(self._token_entries):
+                    for entry in self._token_entries[word]:
+                        if entry.canonical:
+                            yield line, entry, entry.term
+                            continue
+                        original = text_lines[line]
+                        for start in _word_starts(lower_line, word):
+                            yield line, entry, original[start : start + len(word)]
+
+    # * Extract required & preferred keywords w/ section-aware parsing in one pass
+    # labels on a line switch mode for that whole line (required wins), then persist;
+    # phrases & aliases report canonical term, words report text as written
+    def extract(self, text: str) -> tuple[list[str], list[str]]:
+        labels: dict[int, str] = {}
+        terms: dict[int, list[str]] = {}
+        for line, entry, written in self._scan(text, _lower_aligned(text)):
+            if entry.role == LABEL_REQUIRED:
+                labels[line] = LABEL_REQUIRED
+            elif entry.role == LABEL_PREFERRED:
+                labels.setdefault(line, LABEL_PREFERRED)
+            elif entry.role == PHRASE or entry.canonical:
+                terms.setdefault(line, []).append(entry.term)
+            else:
+                terms.setdefault(line, []).append(written)
+
+        required: set[str] = set()
+        preferred: set[str] = set()
+        in_required = True  # default to required section
+        for line in sorted(labels.keys() | terms.keys()):
+            if line in labels:
+                in_required = labels[line] == LABEL_REQUIRED
+            (required if in_required else preferred).update(terms.get(line, ()))
+
+        # return sorted for determinism
+        return sorted(required, key=str.lower), sorted(preferred, key=str.lower)
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+
+# * Token index over resume text for keyword coverage checks
+# keywords match whole token sequences ("Go" no longer matches "good"), case-insensitive
+class TermIndex:
+    def __init__(self, text: str):
+        self._tokens = _TOKEN_RE.findall(text.lower())
+        self._positions: dict[str, list[int]] = {}
+        for pos, token in enumerate(self._tokens):
+            self._positions.setdefault(token, []).append(pos)
+        self._cache: dict[str, bool] = {}
+
+    # keyword's tokens appear consecutively in indexed text
+    def __contains__(self, keyword: str) -> bool:
+        key = keyword.lower()
+        hit = self._cache.get(key)
+        if hit is None:
+            hit = self._lookup(_TOKEN_RE.findall(key))
+            self._cache[key] = hit
+        return hit
+
+    def _lookup(self, tokens: list[str]) -> bool:
+        if not tokens:
+            return False
+        starts = self._positions.get(tokens[0], [])
+        if len(tokens) == 1:
+            return bool(starts)
+        n = len(tokens)
+        return any(self._tokens[pos : pos + n] == tokens for pos in starts)
+
+
+# shared matcher for built-in vocabulary (compiled once at import)
+DEFAULT_MATCHER = KeywordMatcher()
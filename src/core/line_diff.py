@@ -0,0 +1,342 @@
+# src/core/line_diff.py
+# Interned-line diff (linear-space Myers + patience fallback) w/ hunk API (pure)
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+
+from .types import ResumeDocument
+
+# edit distance explored per Myers split before a segment is emitted as replace
+MAX_EDIT_DISTANCE = 512
+
+# opcode tags (difflib-compatible)
+EQUAL = "equal"
+REPLACE = "replace"
+DELETE = "delete"
+INSERT = "insert"
+
+Opcode = tuple[str, int, int, int, int]
+
+
+# * Contiguous change region w/ surrounding context, unified-diff positions
+# starts are 1-based positions in each side's line order; lines hold (" "|"-"|"+", text)
+@dataclass(frozen=True)
+class DiffHunk:
+    old_start: int
+    old_count: int
+    new_start: int
+    new_count: int
+    lines: tuple[tuple[str, str], ...]
+
+    @property
+    def added(self) -> int:
+        return sum(1 for tag, _ in self.lines if tag == "+")
+
+    @property
+    def removed(self) -> int:
+        return sum(1 for tag, _ in self.lines if tag == "-")
+
+    # lines touched: each run of -/+ lines counts its longer side (replacements once)
+    @property
+    def changed(self) -> int:
+        total = removed = added = 0
+        for tag, _ in (*self.lines, (" ", "")):
+            if tag == "-":
+                removed += 1
+            elif tag == "+":
+                added += 1
+            else:
+                total += max(removed, added)
+                removed = added = 0
+        return total
+
+    # "@@ -a,b +c,d @@" header (counts of 1 omitted, empty sides point before hunk)
+    @property
+    def header(self) -> str:
+        return (
+            f"@@ -{_format_range(self.old_start, self.old_count)} "
+            f"+{_format_range(self.new_start, self.new_count)} @@"
+        )
+
+
+def _format_range(start: int, count: int) -> str:
+    if count == 1:
+        return str(start)
+    return f"{start - 1 if count == 0 else start},{count}"
+
+
+# line texts in line-number order (ResumeDocument already ordered)
+def _texts(lines: Mapping[int, str] | Iterable[str]) -> list[str]:
+    if isinstance(lines, ResumeDocument):
+        return list(lines.texts)
+    if isinstance(lines, Mapping):
+        return [lines[k] for k in sorted(lines)]
+    return list(lines)
+
+
+# * Map each distinct line to small int so comparisons are int equality
+def intern_lines(a: list[str], b: list[str]) -> tuple[list[int], list[int]]:
+    ids: dict[str, int] = {}
+    return (
+        [ids.setdefault(line, len(ids)) for line in a],
+        [ids.setdefault(line, len(ids)) for line in b],
+    )
+
+
+# lines occurring exactly once in both segments, as (i, j) pairs in a-order
+def _unique_pairs(
+    a: list[int], alo: int, ahi: int, b: list[int], blo: int, bhi: int
+) -> list[tuple[int, int]]:
+    seen_a: dict[int, int] = {}
+    for i in range(alo, ahi):
+        seen_a[a[i]] = -1 if a[i] in seen_a else i
+    seen_b: dict[int, int] = {}
+    for j in range(blo, bhi):
+        if seen_a.get(b[j], -1) != -1:
+            seen_b[b[j]] = -1 if b[j] in seen_b else j
+    pairs = [(seen_a[x], j) for x, j in seen_b.items() if j != -1]
+    pairs.sort()
+    return pairs
+
+
+# longest increasing subsequence of pairs by j (patience sorting)
+def _patience_anchors(pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    from bisect import bisect_left
+
+    tails: list[int] = []
+    tail_idx: list[int] = []
+    prev: list[int] = [-1] * len(pairs)
+    for idx, (_, j) in enumerate(pairs):
+        pos = bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_idx.append(idx)
+        else:
+            tails[pos] = j
+            tail_idx[pos] = idx
+        prev[idx] = tail_idx[pos - 1] if pos else -1
+    anchors: list[tuple[int, int]] = []
+    idx = tail_idx[-1] if tail_idx else -1
+    while idx != -1:
+        anchors.append(pairs[idx])
+        idx = prev[idx]
+    anchors.reverse()
+    return anchors
+
+
+# * Myers middle snake: split point (x, y) of an optimal path through segment
+# forward & reverse searches meet in O((n+m)·d) time, O(n+m) space; None if
+# segment shares nothing or distance exceeds MAX_EDIT_DISTANCE
+def _middle_snake(
+    a: list[int], alo: int, ahi: int, b: list[int], blo: int, bhi: int
+) -> tuple[int, int] | None:
+    n, m = ahi - alo, bhi - blo
+    max_d = min((n + m + 1) // 2, MAX_EDIT_DISTANCE)
+    v_offset = max_d + 1
+    v_length = 2 * v_offset + 2
+    v1 = [-1] * v_length
+    v2 = [-1] * v_length
+    v1[v_offset + 1] = 0
+    v2[v_offset + 1] = 0
+    delta = n - m
+    front = delta % 2 != 0
+    k1start = k1end = k2start = k2end = 0
+    for d in range(max_d):
+        for k1 in range(-d + k1start, d + 1 - k1end, 2):
+            k1_offset = v_offset + k1
+            if k1 == -d or (k1 != d and v1[k1_offset - 1] < v1[k1_offset + 1]):
+                x1 = v1[k1_offset + 1]
+            else:
+                x1 = v1[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[alo + x1] == b[blo + y1]:
+                x1 += 1
+                y1 += 1
+            v1[k1_offset] = x1
+            if x1 > n:
+                k1end += 2
+            elif y1 > m:
+                k1start += 2
+            elif front:
+                k2_offset = v_offset + delta - k1
+                if 0 <= k2_offset < v_length and v2[k2_offset] != -1:
+                    if x1 >= n - v2[k2_offset]:
+                        return alo + x1, blo + y1
+        for k2 in range(-d + k2start, d + 1 - k2end, 2):
+            k2_offset = v_offset + k2
+            if k2 == -d or (k2 != d and v2[k2_offset - 1] < v2[k2_offset + 1]):
+                x2 = v2[k2_offset + 1]
+            else:
+                x2 = v2[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < n and y2 < m and a[ahi - x2 - 1] == b[bhi - y2 - 1]:
+                x2 += 1
+                y2 += 1
+            v2[k2_offset] = x2
+            if x2 > n:
+                k2end += 2
+            elif y2 > m:
+                k2start += 2
+            elif not front:
+                k1_offset = v_offset + delta - k2
+                if 0 <= k1_offset < v_length and v1[k1_offset] != -1:
+                    x1 = v1[k1_offset]
+                    if x1 >= n - x2:
+                        return alo + x1, blo + x1 - (k1_offset - v_offset)
+    return None
+
+
+# * Matched (i, j) line pairs in order: trim common ends, split segments at Myers
+# middle snake; segments over edit budget split on lines unique to both sides
+# (patience) & otherwise become replace; explicit stack, no recursion
+def matching_pairs(a: list[int], b: list[int]) -> list[tuple[int, int]]:
+    pairs: list[tuple[int, int]] = []
+    # work items: ("seg", alo, ahi, blo, bhi) or ("run", i, j, size)
+    stack: list[tuple] = [("seg", 0, len(a), 0, len(b))]
+    while stack:
+        item = stack.pop()
+        if item[0] == "run":
+            _, i, j, size = item
+            pairs.extend((i + k, j + k) for k in range(size))
+            continue
+
+        _, alo, ahi, blo, bhi = item
+        head = 0
+        while alo + head < ahi and blo + head < bhi and a[alo + head] == b[blo + head]:
+            head += 1
+        tail = 0
+        while (
+            alo + head < ahi - tail
+            and blo + head < bhi - tail
+            and a[ahi - tail - 1] == b[bhi - tail - 1]
+        ):
+            tail += 1
+        pairs.extend((alo + k, blo + k) for k in range(head))
+        alo, blo = alo + head, blo + head
+        inner_ahi, inner_bhi = ahi - tail, bhi - tail
+
+        # pushed in reverse so output stays in order
+        if tail:
+            stack.append(("run", inner_ahi, inner_bhi, tail))
+        if alo == inner_ahi or blo == inner_bhi:
+            continue
+
+        split = _middle_snake(a, alo, inner_ahi, b, blo, inner_bhi)
+        if split not in (None, (alo, blo), (inner_ahi, inner_bhi)):
+            x, y = split
+            stack.append(("seg", x, inner_ahi, y, inner_bhi))
+            stack.append(("seg", alo, x, blo, y))
+            continue
+
+        # over edit budget (or nothing shared): split on unique-line anchors instead
+        anchors = _patience_anchors(
+            _unique_pairs(a, alo, inner_ahi, b, blo, inner_bhi)
+        )
+        if anchors:
+            bounds = [(alo - 1, blo - 1), *anchors, (inner_ahi, inner_bhi)]
+            for (i0, j0), (i1, j1) in reversed(list(zip(bounds, bounds[1:]))):
+                if (i1, j1) != (inner_ahi, inner_bhi):
+                    stack.append(("run", i1, j1, 1))
+                stack.append(("seg", i0 + 1, i1, j0 + 1, j1))
+    return pairs
+
+
+# * difflib-style opcodes (tag, i1, i2, j1, j2) from ordered matched pairs
+def opcodes_from_pairs(
+    pairs: list[tuple[int, int]], n: int, m: int
+) -> list[Opcode]:
+    codes: list[Opcode] = []
+    i = j = 0
+    for pi, pj in [*pairs, (n, m)]:
+        if pi > i or pj > j:
+            tag = REPLACE if pi > i and pj > j else DELETE if pi > i else INSERT
+            codes.append((tag, i, pi, j, pj))
+        if pi < n:
+            if codes and codes[-1][0] == EQUAL and codes[-1][2] == pi:
+                _, i1, _, j1, _ = codes[-1]
+                codes[-1] = (EQUAL, i1, pi + 1, j1, pj + 1)
+            else:
+                codes.append((EQUAL, pi, pi + 1, pj, pj + 1))
+        i, j = pi + 1, pj + 1
+    return codes
+
+
+# * Opcodes for two documents (Lines, ResumeDocument or line lists)
+def diff_opcodes(
+    old: Mapping[int, str] | Iterable[str], new: Mapping[int, str] | Iterable[str]
+) -> list[Opcode]:
+    a, b = intern_lines(_texts(old), _texts(new))
+    return opcodes_from_pairs(matching_pairs(a, b), len(a), len(b))
+
+
+# group opcodes into change clusters w/ up to `context` equal lines around each
+def _grouped(codes: list[Opcode], context: int) -> Iterator[list[Opcode]]:
+    if not codes:
+        return
+    codes = list(codes)
+    if codes[0][0] == EQUAL:
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2
+    if codes[-1][0] == EQUAL:
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)
+
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == EQUAL and i2 - i1 > 2 * context:
+            group.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == EQUAL):
+        yield group
+
+
+# * Structured hunks for two documents; reuse instead of re-diffing for stats & display
+def diff_hunks(
+    old: Mapping[int, str] | Iterable[str],
+    new: Mapping[int, str] | Iterable[str],
+    context: int = 3,
+) -> list[DiffHunk]:
+    a, b = _texts(old), _texts(new)
+    ia, ib = intern_lines(a, b)
+    codes = opcodes_from_pairs(matching_pairs(ia, ib), len(a), len(b))
+
+    hunks: list[DiffHunk] = []
+    for group in _grouped(codes, context):
+        lines: list[tuple[str, str]] = []
+        for tag, i1, i2, j1, j2 in group:
+            if tag == EQUAL:
+                lines.extend((" ", text) for text in a[i1:i2])
+                continue
+            lines.extend(("-", text) for text in a[i1:i2])
+            lines.extend(("+", text) for text in b[j1:j2])
+        first, last = group[0], group[-1]
+        hunks.append(
+            DiffHunk(
+                old_start=first[1] + 1,
+                old_count=last[2] - first[1],
+                new_start=first[3] + 1,
+                new_count=last[4] - first[3],
+                lines=tuple(lines),
+            )
+        )
+    return hunks
+
+
+# * Unified diff text, one newline-terminated line at a time (for streaming writes)
+def iter_unified_diff(
+    hunks: Iterable[DiffHunk], fromfile: str = "old", tofile: str = "new"
+) -> Iterator[str]:
+    started = False
+    for hunk in hunks:
+        if not started:
+            yield f"--- {fromfile}\n"
+            yield f"+++ {tofile}\n"
+            started = True
+        yield hunk.header + "\n"
+        for tag, text in hunk.lines:
+            yield f"{tag}{text}\n"
@@ -0,0 +1,135 @@
+# src/core/near_duplicates.py
+# Near-duplicate text detection via word-shingle MinHash signatures & LSH banding (pure)
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Sequence
+
+from .exceptions import ConfigurationError
+
+# default Jaccard similarity above which postings are treated as reposts
+DEFAULT_DUPLICATE_THRESHOLD = 0.8
+
+# signature size & banding; 16 bands x 4 rows catches pairs from ~0.5 similarity
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+
+# Mersenne prime modulus for universal hash permutations
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 64) - 1
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+
+# near-duplicate group of text indices w/ first index as representative
+@dataclass
+class DuplicateGroup:
+    representative: int
+    # (index, Jaccard similarity to representative) for each duplicate
+    members: list[tuple[int, float]]
+
+
+# * Build set of hashed k-word shingles from normalized text
+def shingle_hashes(text: str, k: int = 5) -> set[int]:
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return set()
+    if len(tokens) < k:
+        # short texts collapse into single shingle
+        tokens = [" ".join(tokens)]
+        k = 1
+
+    hashes: set[int] = set()
+    for i in range(len(tokens) - k + 1):
+        shingle = " ".join(tokens[i : i + k]).encode("utf-8")
+        digest = hashlib.blake2b(shingle, digest_size=8).digest()
+        hashes.add(int.from_bytes(digest, "big"))
+    return hashes
+
+
+# deterministic (a, b) coefficients for num_perm universal hash permutations
+def _permutations(num_perm: int, seed: int = 1) -> list[tuple[int, int]]:
+    rng = random.Random(seed)
+    return [
+        (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+    ]
+
+
+# * Compute MinHash signature: minimum permuted hash per permutation
+def minhash_signature(
+    hashes: set[int], permutations: Sequence[tuple[int, int]]
+) -> tuple[int, ...]:
+    if not hashes:
+        return tuple(_MAX_HASH for _ in permutations)
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in permutations)
+
+
+# exact Jaccard similarity of two shingle sets
+def jaccard(a: set[int], b: set[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+# * Group near-duplicate texts; earliest text in each group is its representative
+# LSH band collisions propose candidates, exact shingle Jaccard confirms them
+def find_near_duplicates(
+    texts: Sequence[str],
+    threshold: float = DEFAULT_DUPLICATE_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    bands: int = DEFAULT_BANDS,
+) -> list[DuplicateGroup]:
+    if not 0.0 < threshold <= 1.0:
+        raise ConfigurationError(
+            f"Duplicate threshold must be in (0, 1], got {threshold}"
+        )
+    if num_perm % bands != 0:
+        raise ConfigurationError(
+            f"num_perm ({num_perm}) must be divisible by bands ({bands})"
+        )
+
+    rows = num_perm // bands
+    permutations = _permutations(num_perm)
+    shingles = [shingle_hashes(text) for text in texts]
+
+    # bucket every non-empty text by each band of its signature
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = defaultdict(list)
+    for idx, hashes in enumerate(shingles):
+        if not hashes:
+            continue
+        signature = minhash_signature(hashes, permutations)
+        for band in range(bands):
+            key = (band, signature[band * rows : (band + 1) * rows])
+            buckets[key].append(idx)
+
+    candidates: dict[int, set[int]] = defaultdict(set)
+    for bucket in buckets.values():
+        if len(bucket) < 2:
+            continue
+        for idx in bucket:
+            candidates[idx].update(bucket)
+
+    # star clustering in input order: members verified against representative
+    assigned: set[int] = set()
+    groups: list[DuplicateGroup] = []
+    for idx in range(len(texts)):
+        if idx in assigned or idx not in candidates:
+            continue
+        members: list[tuple[int, float]] = []
+        for other in sorted(candidates[idx]):
+            if other <= idx or other in assigned:
+                continue
+            similarity = jaccard(shingles[idx], shingles[other])
+            if similarity >= threshold:
+                members.append((other, similarity))
+                assigned.add(other)
+        if members:
+            assigned.add(idx)
+            groups.append(DuplicateGroup(representative=idx, members=members))
+
+    return groups
@@ -2,33 +2,23 @@
 # Core processing pipeline for edit generation, validation, & application
 
 from typing import List
-import difflib
 from datetime import datetime, timezone
-from .exceptions import EditError
+from .exceptions import AIError, EditError
 from ..ai.prompts import (
     build_generate_prompt,
     build_edit_prompt,
     build_prompt_operation_prompt,
+    build_sectionizer_prompt,
 )
 from ..ai.clients import run_generate
-from ..ai.utils import process_ai_response
+from ..ai.utils import normalize_sections_response, process_ai_response
 
 from .types import Lines, number_lines
-from .constants import (
-    EditOperation,
-    OP_REPLACE_LINE,
-    OP_REPLACE_RANGE,
-    OP_INSERT_AFTER,
-    OP_DELETE_RANGE,
-)
+from .constants import EditOperation
 from .debug import debug_ai
-from .edit_helpers import (
-    check_line_exists,
-    check_range_exists,
-    get_operation_line,
-    collect_lines_to_move,
-    shift_lines,
-)
+from .edit_engine import apply_ops
+from .edit_helpers import get_operation_line
+from .line_diff import diff_hunks, iter_unified_diff
 
 
 # * Generate edits.json for resume using AI model w/ job description & sections context
@@ -66,6 +56,19 @@ def generate_edits(
     return edits
 
 
+# * Parse resume into sections JSON using AI sectionizer
+def sectionize_lines(resume_lines: Lines, model: str) -> dict:
+    prompt = build_sectionizer_prompt(number_lines(resume_lines))
+    result = run_generate(prompt, model=model)
+    if not result.success:
+        raise AIError(
+            f"AI failed to generate valid JSON: {result.error}\n\nRaw response:\n{result.raw_text}\n\nExtracted JSON:\n{result.json_text}"
+        )
+    assert result.data is not None, "Expected non-None data from successful AI result"
+    # normalize short keys (k->kind, h->heading_text, etc.) to full keys
+    return normalize_sections_response(result.data)
+
+
 # * Generate corrected edits based on validation warnings
 def generate_corrected_edits(
     current_edits_json: str,
@@ -201,126 +204,14 @@ def process_prompt_operation(
 
 
 # * Apply edits to resume lines & return new lines dict
+# single merge pass over lines (see edit_engine), no per-op renumbering of later lines
 def apply_edits(resume_lines: Lines, edits: dict) -> Lines:
     if edits.get("version") != 1:
         raise EditError(f"Unsupported edits version: {edits.get('version')}")
 
-    new_lines = dict(resume_lines)
-    ops = edits.get("ops", [])
-
-    # sort ops by line number (descending) to avoid shifting issues
-    sorted_ops = sorted(ops, key=lambda op: get_operation_line(op), reverse=True)
-
-    for op in sorted_ops:
-        op_type = op["op"]
-
-        # replace single line
-        if op_type == OP_REPLACE_LINE:
-            line_num = op["line"]
-            if not check_line_exists(line_num, new_lines):
-                raise EditError(f"Cannot replace line {line_num}: line does not exist")
-            new_lines[line_num] = op["text"]
-
-        # replace range of lines
-        elif op_type == OP_REPLACE_RANGE:
-            start = op["start"]
-            end = op["end"]
-            text = op["text"]
-
-            # validate range exists
-            # align error message w/ tests: explicitly report missing 'end' if out of bounds
-            if not check_line_exists(end, new_lines):
-                raise EditError(
-                    f"Cannot replace range {start}-{end}: line {end} does not exist"
-                )
-            exists, missing_line = check_range_exists(start, end, new_lines)
-            if not exists:
-                raise EditError(
-                    f"Cannot replace range {start}-{end}: line {missing_line} does not exist"
-                )
-
-            text_lines = text.split("\n") if text else [""]
-            old_line_count = end - start + 1
-            new_line_count = len(text_lines)
-            line_diff = new_line_count - old_line_count
-
-            # collect lines after range (uses shared helper)
-            lines_to_move = collect_lines_to_move(new_lines, end)
-
-            # for REPLACE_RANGE, we need to: delete lines_to_move, delete range,
-            # insert new content, then reinsert lines_to_move at shifted positions
-            if line_diff != 0:
-                # remove lines that will be moved
-                for k, v in lines_to_move:
-                    del new_lines[k]
-
-            # remove old lines in the range
-            for line_num in range(start, end + 1):
-                del new_lines[line_num]
-
-            # insert new lines
-            for i, line_text in enumerate(text_lines):
-                new_lines[start + i] = line_text
-
-            # reinsert moved lines at new positions
-            if line_diff != 0:
-                for k, v in lines_to_move:
-                    new_lines[k + line_diff] = v
-
-        # insert after ___
-        elif op_type == OP_INSERT_AFTER:
-            line_num = op["line"]
-            text = op["text"]
-
-            if not check_line_exists(line_num, new_lines):
-                raise EditError(
-                    f"Cannot insert after line {line_num}: line does not exist"
-                )
-
-            # shift all lines after insert point (uses shared helpers)
-            text_lines = text.split("\n")
-            insert_count = len(text_lines)
-
-            lines_to_move = collect_lines_to_move(new_lines, line_num)
-            shift_lines(new_lines, lines_to_move, insert_count)
-
-            # insert new lines
-            for i, line_text in enumerate(text_lines):
-                new_lines[line_num + 1 + i] = line_text
-
-        # delete lines
-        elif op_type == OP_DELETE_RANGE:
-            start = op["start"]
-            end = op["end"]
-
-            # validate range exists
-            exists, missing_line = check_range_exists(start, end, new_lines)
-            if not exists:
-                raise EditError(
-                    f"Cannot delete range {start}-{end}: line {missing_line} does not exist"
-                )
-
-            delete_count = end - start + 1
-
-            # delete the range
-            for line_num in range(start, end + 1):
-                del new_lines[line_num]
-
-            # shift everything after 'end' down (uses shared helpers)
-            lines_to_move = collect_lines_to_move(new_lines, end)
-            shift_lines(new_lines, lines_to_move, -delete_count)
-
-        else:
-            raise EditError(f"Unknown operation type: {op_type}")
-
-    return new_lines
-
-
-# * Generate unified diff b/w two line dicts
-def diff_lines(old: Lines, new: Lines) -> str:
-    old_list = [f"{i:>4} {old[i]}" for i in sorted(old.keys())]
-    new_list = [f"{i:>4} {new[i]}" for i in sorted(new.keys())]
+    return apply_ops(resume_lines, edits.get("ops", []))
 
-    return "".join(
-        difflib.unified_diff(old_list, new_list, fromfile="old", tofile="new")
-    )
+
+# * Generate unified diff b/w two line dicts (texts compared; renumbering is no change)
+def diff_lines(old: Lines, new: Lines) -> str:
+    return "".join(iter_unified_diff(diff_hunks(old, new)))
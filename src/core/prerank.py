@@ -0,0 +1,138 @@
+# src/core/prerank.py
+# TF-IDF pre-ranking of job postings against resume before any LLM call (pure, NumPy-backed)
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from .keyword_matcher import MULTI_WORD_TERMS, TECH_PATTERNS, pattern_terms
+from .exceptions import ConfigurationError
+
+
+# common English & job-posting filler words excluded from free-text tokens
+STOPWORDS = frozenset(
+    """
+    the and for with you your our are this that will have from they their them
+    who what when where which while about into over under more most such than
+    then also been being can could should would may might must not but all any
+    each other some very just its it's we're you'll etc per via using use used
+    work working team teams role roles job jobs company including include strong
+    experience years year ability able skills skill knowledge understanding
+    """.split()
+)
+
+
+# vocabulary split into single-token terms (set lookup) & phrases (one regex)
+_TECH_TERMS = [t.lower() for t in pattern_terms(TECH_PATTERNS)]
+_SINGLE_TERMS = frozenset(t for t in _TECH_TERMS if " " not in t)
+_PHRASES = sorted(
+    {*MULTI_WORD_TERMS, *(t for t in _TECH_TERMS if " " in t)}, key=len, reverse=True
+)
+_PHRASE_RE = re.compile(r"\b(?:" + "|".join(re.escape(t) for t in _PHRASES) + r")\b")
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+# prefix separating vocabulary keyword tokens from free-text tokens
+KEYWORD_PREFIX = "kw:"
+
+
+# ranked pre-rank score for single job
+@dataclass
+class PrerankScore:
+    job_id: str
+    score: float
+    rank: int
+
+    # serialize to JSON-compatible dict
+    def to_dict(self) -> dict[str, Any]:
+        return {"id": self.job_id, "score": round(self.score, 4), "rank": self.rank}
+
+
+# import NumPy lazily so pre-ranking stays an optional feature
+def _require_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ConfigurationError(
+            "NumPy required for job pre-ranking (--top-k/--min-score). "
+            "Install with: pip install numpy"
+        )
+    return numpy
+
+
+# * Tokenize text into vocabulary keyword tokens (kw:*) plus free-text words
+def tokenize_for_ranking(text: str) -> list[str]:
+    lower = text.lower()
+    words = _WORD_RE.findall(lower)
+    tokens = [KEYWORD_PREFIX + m for m in _PHRASE_RE.findall(lower)]
+    tokens.extend(KEYWORD_PREFIX + w for w in words if w in _SINGLE_TERMS)
+    tokens.extend(w for w in words if len(w) > 2 and w not in STOPWORDS)
+    return tokens
+
+
+# * Score documents against query via cosine similarity over sparse TF-IDF matrix
+# rows: [query, *documents]; tf = 1 + log(count), smoothed idf; returns one score per document
+def score_against_query(query_text: str, documents: Sequence[str]) -> list[float]:
+    np = _require_numpy()
+    if not documents:
+        return []
+
+    # build sparse COO triplets (row, col, count) w/ shared vocabulary
+    vocab: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    counts: list[int] = []
+    for row, text in enumerate([query_text, *documents]):
+        for token, count in Counter(tokenize_for_ranking(text)).items():
+            col = vocab.setdefault(token, len(vocab))
+            rows.append(row)
+            cols.append(col)
+            counts.append(count)
+
+    n_rows = len(documents) + 1
+    if not vocab:
+        return [0.0] * len(documents)
+
+    row_idx = np.asarray(rows, dtype=np.int64)
+    col_idx = np.asarray(cols, dtype=np.int64)
+    tf = 1.0 + np.log(np.asarray(counts, dtype=np.float64))
+
+    # smoothed idf over all rows (query included)
+    df = np.bincount(col_idx, minlength=len(vocab))
+    idf = np.log((1.0 + n_rows) / (1.0 + df)) + 1.0
+    weights = tf * idf[col_idx]
+
+    # dense query vector, then sparse mat-vec & row norms via bincount
+    query = np.zeros(len(vocab), dtype=np.float64)
+    is_query = row_idx == 0
+    query[col_idx[is_query]] = weights[is_query]
+
+    dots = np.bincount(row_idx, weights=weights * query[col_idx], minlength=n_rows)
+    norms = np.sqrt(np.bincount(row_idx, weights=weights * weights, minlength=n_rows))
+    denom = norms * norms[0]
+    sims = np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0)
+
+    return [float(s) for s in sims[1:]]
+
+
+# * Rank job IDs by score & apply top-k / min-score cutoffs (stable on ties)
+def select_ranked(
+    job_ids: Sequence[str],
+    scores: Sequence[float],
+    top_k: int | None = None,
+    min_score: float | None = None,
+) -> list[PrerankScore]:
+    order = sorted(range(len(job_ids)), key=lambda i: -scores[i])
+    ranked = [
+        PrerankScore(job_id=job_ids[i], score=scores[i], rank=rank)
+        for rank, i in enumerate(order, 1)
+    ]
+
+    if min_score is not None:
+        ranked = [r for r in ranked if r.score >= min_score]
+    if top_k is not None:
+        ranked = ranked[: max(top_k, 0)]
+
+    return ranked
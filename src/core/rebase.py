@@ -0,0 +1,109 @@
+# src/core/rebase.py
+# Rebase edit ops onto a changed resume by mapping line numbers through its diff (pure)
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .constants import (
+    OP_DELETE_RANGE,
+    OP_INSERT_AFTER,
+    OP_REPLACE_LINE,
+    OP_REPLACE_RANGE,
+)
+from .line_diff import EQUAL, diff_opcodes
+from .relocation import relocate_ops
+from .types import ResumeDocument
+
+
+# * Outcome of rebasing one edits document
+@dataclass
+class RebaseResult:
+    edits: dict
+    # ops whose line numbers changed
+    moved: int = 0
+    # one note per op dropped because its target content changed
+    dropped: list[str] = field(default_factory=list)
+    # info notes (snippet relocations & unverifiable snippets)
+    notes: list[str] = field(default_factory=list)
+
+    # every op survived; edits can be applied w/o asking the model again
+    @property
+    def clean(self) -> bool:
+        return not self.dropped
+
+
+def _line_numbers(lines: Mapping[int, str]) -> list[int]:
+    if isinstance(lines, ResumeDocument):
+        return list(lines.line_numbers)
+    return sorted(lines)
+
+
+# * Old line number -> new line number for every line unchanged by the diff
+def line_mapping(
+    old_lines: Mapping[int, str], new_lines: Mapping[int, str]
+) -> dict[int, int]:
+    old_numbers, new_numbers = _line_numbers(old_lines), _line_numbers(new_lines)
+    mapping: dict[int, int] = {}
+    for tag, i1, i2, j1, _ in diff_opcodes(old_lines, new_lines):
+        if tag == EQUAL:
+            mapping.update(zip(old_numbers[i1:i2], new_numbers[j1 : j1 + i2 - i1]))
+    return mapping
+
+
+# old lines an op reads from, or None if op is malformed/unknown (kept verbatim)
+def _target_lines(op: dict) -> Optional[list[int]]:
+    kind = op.get("op")
+    if kind in (OP_REPLACE_LINE, OP_INSERT_AFTER):
+        line = op.get("line")
+        return [line] if isinstance(line, int) else None
+    if kind in (OP_REPLACE_RANGE, OP_DELETE_RANGE):
+        start, end = op.get("start"), op.get("end")
+        if isinstance(start, int) and isinstance(end, int) and start <= end:
+            return list(range(start, end + 1))
+    return None
+
+
+# * Map each op through old->new resume diff; drop ops whose target lines changed
+# surviving ops are then snippet-checked against new resume (see relocation)
+def rebase_edits(
+    edits: dict, old_lines: Mapping[int, str], new_lines: Mapping[int, str]
+) -> RebaseResult:
+    ops = edits.get("ops")
+    if not isinstance(ops, list):
+        return RebaseResult(edits=edits)
+
+    mapping = line_mapping(old_lines, new_lines)
+    result = RebaseResult(edits=edits)
+    rebased: list = []
+    for i, op in enumerate(ops):
+        target = _target_lines(op) if isinstance(op, dict) else None
+        if target is None:
+            rebased.append(op)
+            continue
+
+        mapped = [mapping[line] for line in target if line in mapping]
+        if len(mapped) != len(target) or mapped[-1] - mapped[0] != len(target) - 1:
+            span = str(target[0]) if len(target) == 1 else f"{target[0]}-{target[-1]}"
+            result.dropped.append(
+                f"Op {i}: {op['op']} on line {span} targets changed content; dropped"
+            )
+            continue
+
+        delta = mapped[0] - target[0]
+        if delta == 0:
+            rebased.append(op)
+            continue
+        moved = dict(op)
+        if op["op"] in (OP_REPLACE_LINE, OP_INSERT_AFTER):
+            moved["line"] = op["line"] + delta
+        else:
+            moved["start"] = op["start"] + delta
+            moved["end"] = op["end"] + delta
+        rebased.append(moved)
+        result.moved += 1
+
+    result.edits, result.notes = relocate_ops({**edits, "ops": rebased}, new_lines)
+    return result
@@ -0,0 +1,160 @@
+# src/core/relocation.py
+# Snippet-anchored relocation of edit ops w/ drifted line numbers (pure)
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from difflib import SequenceMatcher
+from typing import Optional
+
+from .constants import OP_DELETE_RANGE, OP_REPLACE_RANGE
+from .types import Lines
+
+# lines searched on either side of op's target
+RELOCATION_WINDOW = 8
+# minimum similarity for fuzzy re-anchoring
+MIN_SNIPPET_RATIO = 0.85
+
+
+# whitespace-collapsed, case-folded form used for snippet comparison
+def normalize_line(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+# * Normalized-line hash index: text -> sorted line numbers, built once per resume
+class SnippetIndex:
+    def __init__(self, lines: Lines):
+        self.lines = lines
+        self._normalized: dict[int, str] = {}
+        self._positions: dict[str, list[int]] = {}
+        for line in sorted(lines):
+            norm = normalize_line(lines[line])
+            self._normalized[line] = norm
+            self._positions.setdefault(norm, []).append(line)
+
+    # lines whose normalized text equals `norm` within [lo, hi]
+    def exact(self, norm: str, lo: int, hi: int) -> list[int]:
+        found = self._positions.get(norm, [])
+        return found[bisect_left(found, lo) : bisect_right(found, hi)]
+
+    # normalized snippet lines match consecutive resume lines starting at `line`
+    def matches_at(self, line: int, snippet: list[str]) -> bool:
+        return all(
+            self._normalized.get(line + k) == text for k, text in enumerate(snippet)
+        )
+
+    # similarity of snippet to same number of lines starting at `line`
+    def ratio_at(self, line: int, snippet: list[str]) -> float:
+        target: list[str] = []
+        for k in range(len(snippet)):
+            norm = self._normalized.get(line + k)
+            if norm is None:
+                return 0.0
+            target.append(norm)
+        matcher = SequenceMatcher(None, "\n".join(snippet), "\n".join(target))
+        if matcher.real_quick_ratio() < MIN_SNIPPET_RATIO:
+            return 0.0
+        return matcher.ratio()
+
+
+# target line & span of op (insert_after anchors on line it follows)
+def _op_target(op: dict) -> Optional[tuple[int, int]]:
+    if op.get("op") in (OP_REPLACE_RANGE, OP_DELETE_RANGE):
+        start, end = op.get("start"), op.get("end")
+        if isinstance(start, int) and isinstance(end, int) and start <= end:
+            return start, end - start + 1
+        return None
+    line = op.get("line")
+    return (line, 1) if isinstance(line, int) else None
+
+
+# op shifted by delta lines
+def _shift(op: dict, delta: int) -> dict:
+    moved = dict(op)
+    if op.get("op") in (OP_REPLACE_RANGE, OP_DELETE_RANGE):
+        moved["start"] = op["start"] + delta
+        moved["end"] = op["end"] + delta
+    else:
+        moved["line"] = op["line"] + delta
+    return moved
+
+
+def _describe(op: dict) -> str:
+    if op.get("op") in (OP_REPLACE_RANGE, OP_DELETE_RANGE):
+        return f"{op['op']} {op['start']}-{op['end']}"
+    return f"{op.get('op')} line {op['line']}"
+
+
+# * Verify each op's current_snippet against its target & re-anchor drifted ops
+# exact normalized-hash hit nearest target wins, else best fuzzy ratio in window;
+# returns (edits w/ relocated ops, info notes); unverifiable ops are left as-is
+def relocate_ops(
+    edits: dict,
+    resume_lines: Lines,
+    window: int = RELOCATION_WINDOW,
+    min_ratio: float = MIN_SNIPPET_RATIO,
+    index: Optional[SnippetIndex] = None,
+) -> tuple[dict, list[str]]:
+    ops = edits.get("ops") if isinstance(edits, dict) else None
+    if not isinstance(ops, list):
+        return edits, []
+
+    notes: list[str] = []
+    relocated: list = []
+    for i, op in enumerate(ops):
+        relocated.append(op)
+        if not isinstance(op, dict):
+            continue
+        snippet_text = op.get("current_snippet")
+        target = _op_target(op)
+        if not isinstance(snippet_text, str) or not snippet_text.strip() or not target:
+            continue
+        if index is None:
+            index = SnippetIndex(resume_lines)
+
+        line, span = target
+        snippet = [normalize_line(s) for s in snippet_text.strip("\n").split("\n")]
+        snippet = snippet[:span]
+        if index.matches_at(line, snippet):
+            continue
+
+        # exact hash hits, nearest first (earlier line wins ties)
+        candidates = [
+            c
+            for c in index.exact(snippet[0], line - window, line + window)
+            if c != line and index.matches_at(c, snippet)
+        ]
+        how = "current_snippet matched"
+        best: Optional[int] = None
+        if candidates:
+            best = min(candidates, key=lambda c: (abs(c - line), c))
+        else:
+            scored = [
+                (index.ratio_at(c, snippet), -abs(c - line), -c)
+                for c in range(line - window, line + window + 1)
+            ]
+            ratio, _, neg_c = max(scored)
+            if ratio >= min_ratio:
+                if neg_c == -line:
+                    continue
+                best = -neg_c
+                how = f"fuzzy match {ratio:.2f}"
+
+        if best is None:
+            notes.append(
+                f"Op {i}: current_snippet does not match {_describe(op)}; left in place"
+            )
+            continue
+        # relocated span must stay inside resume
+        if any(best + k not in resume_lines for k in range(span)):
+            continue
+
+        relocated[-1] = _shift(op, best - line)
+        notes.append(
+            f"Op {i}: relocated {_describe(op)} -> "
+            f"{_describe(relocated[-1]).split(' ', 1)[1]} ({how})"
+        )
+
+    if not any(a is not b for a, b in zip(relocated, ops)):
+        return edits, notes
+    return {**edits, "ops": relocated}, notes
@@ -0,0 +1,68 @@
+# src/core/stage_graph.py
+# Content-hash keys & run trace for memoized tailoring pipeline stages (pure)
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+# outcome of one stage in a run (shown by --explain)
+STAGE_HIT = "hit"
+STAGE_MISS = "miss"
+STAGE_SKIP = "skip"  # memo not consulted (disabled or stage not reusable this run)
+
+# pipeline stages in dependency order w/ the upstream outputs each one consumes
+STAGE_INPUTS: dict[str, tuple[str, ...]] = {
+    "read": ("resume file",),
+    "analyze": ("read", "template"),
+    "generate": ("read", "sections", "job", "model", "risk", "prompt"),
+    "apply": ("read", "edits", "job", "risk", "on_error"),
+}
+
+
+# short sha256 of text or bytes; None stays None so absent inputs hash distinctly
+def content_hash(data: str | bytes | None) -> Optional[str]:
+    if data is None:
+        return None
+    raw = data.encode("utf-8") if isinstance(data, str) else data
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+# short sha256 of a JSON-serializable value w/ stable key order
+def json_hash(value: Any) -> str:
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return content_hash(text) or ""
+
+
+# trace entry for one stage evaluation
+@dataclass(frozen=True)
+class StageRecord:
+    stage: str
+    key: str
+    status: str
+
+
+# * Make-style keys for pipeline stages of one run plus hit/miss trace
+# keys hash the stage's input *values* (not upstream keys), so a stage that reruns
+# but yields identical output still lets everything downstream hit (early cutoff)
+@dataclass
+class StageGraph:
+    keys: dict[str, str] = field(default_factory=dict)
+    trace: list[StageRecord] = field(default_factory=list)
+
+    # * Compute & remember key of stage from content hashes/values of its inputs
+    def key(self, stage: str, **inputs: Any) -> str:
+        key = json_hash({"stage": stage, "inputs": inputs})
+        self.keys[stage] = key
+        return key
+
+    # record outcome of evaluating stage
+    def record(self, stage: str, status: str) -> None:
+        self.trace.append(StageRecord(stage, self.keys.get(stage, ""), status))
+
+    # stages reused from memo in this run
+    @property
+    def hits(self) -> list[str]:
+        return [r.stage for r in self.trace if r.status == STAGE_HIT]
@@ -1,10 +1,168 @@
 # src/core/types.py
 # Core type definitions used throughout Loom
 
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Optional
+
 # Line number to text content mapping (1-indexed)
 Lines = dict[int, str]
 
 
+# * Immutable resume document backed by contiguous tuple of line texts
+# read-only Mapping[int, str] so code written against Lines accepts it unchanged;
+# numbering is first..first+len-1 unless built from gapped Lines
+class ResumeDocument(Mapping):
+    __slots__ = (
+        "_texts",
+        "_first",
+        "_numbers",
+        "_positions",
+        "_hashes",
+        "_numbered_lines",
+        "_numbered",
+    )
+
+    def __init__(
+        self,
+        texts: Iterable[str],
+        first: int = 1,
+        numbers: Optional[Iterable[int]] = None,
+    ):
+        texts = tuple(texts)
+        if numbers is not None:
+            numbers = tuple(numbers)
+            if len(numbers) != len(texts):
+                raise ValueError("Document numbers & texts differ in length")
+            if any(a >= b for a, b in zip(numbers, numbers[1:])):
+                raise ValueError("Document line numbers must be strictly ascending")
+        self._init(texts, first, numbers)
+
+    # set fields w/o validation; contiguous explicit numbering collapses to first
+    def _init(
+        self, texts: tuple[str, ...], first: int, numbers: Optional[tuple[int, ...]]
+    ) -> None:
+        if numbers is not None and (
+            not numbers or numbers[-1] - numbers[0] == len(numbers) - 1
+        ):
+            first = numbers[0] if numbers else first
+            numbers = None
+        setattr_ = object.__setattr__
+        setattr_(self, "_texts", texts)
+        setattr_(self, "_first", first)
+        setattr_(self, "_numbers", numbers)
+        setattr_(
+            self,
+            "_positions",
+            None if numbers is None else {n: i for i, n in enumerate(numbers)},
+        )
+        setattr_(self, "_hashes", None)
+        setattr_(self, "_numbered_lines", None)
+        setattr_(self, "_numbered", None)
+
+    # trusted constructor for already-ascending numbering (edit engine output)
+    @classmethod
+    def _from_parts(
+        cls, texts: tuple[str, ...], numbers: tuple[int, ...]
+    ) -> ResumeDocument:
+        doc = cls.__new__(cls)
+        doc._init(texts, 1, numbers)
+        return doc
+
+    # * Build from Lines (sorted once); ResumeDocuments are returned as-is
+    @classmethod
+    def from_lines(cls, lines: Mapping[int, str]) -> ResumeDocument:
+        if isinstance(lines, ResumeDocument):
+            return lines
+        numbers = tuple(sorted(lines))
+        return cls._from_parts(tuple(lines[n] for n in numbers), numbers)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ResumeDocument is immutable")
+
+    # pickle/copy via constructor (slots are write-protected)
+    def __reduce__(self) -> tuple:
+        return (ResumeDocument, (self._texts, self._first, self._numbers))
+
+    # O(1) lookup by line number
+    def __getitem__(self, line: int) -> str:
+        if self._positions is not None:
+            return self._texts[self._positions[line]]
+        if isinstance(line, int):
+            pos = line - self._first
+            if 0 <= pos < len(self._texts):
+                return self._texts[pos]
+        raise KeyError(line)
+
+    # O(1) bounds check
+    def __contains__(self, line: object) -> bool:
+        if self._positions is not None:
+            return line in self._positions
+        return isinstance(line, int) and 0 <= line - self._first < len(self._texts)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.line_numbers)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ResumeDocument):
+            return (
+                self._texts == other._texts
+                and tuple(self.line_numbers) == tuple(other.line_numbers)
+            )
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ResumeDocument({len(self)} lines)"
+
+    # line numbers in ascending order
+    @property
+    def line_numbers(self) -> range | tuple[int, ...]:
+        if self._numbers is not None:
+            return self._numbers
+        return range(self._first, self._first + len(self._texts))
+
+    # line texts in line order (shared, never copied)
+    @property
+    def texts(self) -> tuple[str, ...]:
+        return self._texts
+
+    # per-line hashes in line order (process-local; for interning & equality checks)
+    @property
+    def line_hashes(self) -> tuple[int, ...]:
+        if self._hashes is None:
+            object.__setattr__(self, "_hashes", tuple(map(hash, self._texts)))
+        return self._hashes  # type: ignore[return-value]
+
+    # "   N text" rendering per line, as used by prompts & diffs
+    @property
+    def numbered_lines(self) -> tuple[str, ...]:
+        if self._numbered_lines is None:
+            rendered = tuple(
+                f"{i:>4} {text}" for i, text in zip(self.line_numbers, self._texts)
+            )
+            object.__setattr__(self, "_numbered_lines", rendered)
+        return self._numbered_lines  # type: ignore[return-value]
+
+    # full numbered rendering (same output as number_lines)
+    @property
+    def numbered(self) -> str:
+        if self._numbered is None:
+            object.__setattr__(self, "_numbered", "\n".join(self.numbered_lines))
+        return self._numbered  # type: ignore[return-value]
+
+    # mutable Lines copy for callers that edit in place
+    def to_lines(self) -> Lines:
+        return dict(zip(self.line_numbers, self._texts))
+
+
 # * Format resume lines w/ right-aligned 4-char line numbers
-def number_lines(lines: Lines) -> str:
+def number_lines(lines: Mapping[int, str]) -> str:
+    if isinstance(lines, ResumeDocument):
+        return lines.numbered
     return "\n".join(f"{i:>4} {text}" for i, text in sorted(lines.items()))
@@ -2,7 +2,7 @@
 # Pure validation logic for edit operations (no I/O)
 
 from dataclasses import dataclass, field
-from typing import List, Any, Optional
+from typing import Iterable, List, Any, Optional
 from .constants import (
     RiskLevel,
     OP_REPLACE_LINE,
@@ -12,7 +12,8 @@ from .constants import (
 )
 
 from .types import Lines
-from .edit_helpers import check_line_exists, check_range_exists, count_text_lines
+from .edit_helpers import count_text_lines
+from .interval_index import IntervalSet, LineIndex, RangeIndex
 
 
 # * Standard result type for validation operations (pure data, no I/O)
@@ -103,8 +104,26 @@ def check_range_usage(
     return warnings
 
 
-# * Validate cross-operation interactions
-def validate_operation_interactions(ops: List[dict]) -> List[str]:
+# positions compared by interaction checks are all ints (else fall back to pairwise scan)
+def _int_positions(ops: List[dict]) -> bool:
+    for op in ops:
+        if not isinstance(op, dict):
+            return False
+        op_type = op.get("op")
+        # absent fields are skipped by interaction checks, so default to valid int
+        if op_type == OP_INSERT_AFTER:
+            values = [op.get("line", 0)]
+        elif op_type in (OP_DELETE_RANGE, OP_REPLACE_RANGE):
+            values = [op.get("start", 0), op.get("end", 0)]
+        else:
+            continue
+        if not all(isinstance(v, int) for v in values):
+            return False
+    return True
+
+
+# pairwise interaction checks; only used for ops w/ non-integer positions
+def _pairwise_interactions(ops: List[dict]) -> List[str]:
     warnings: List[str] = []
 
     delete_ranges = [
@@ -133,6 +152,49 @@ def validate_operation_interactions(ops: List[dict]) -> List[str]:
                     f"Op {i}: delete_range overlaps a replace_range; split or reorder ops"
                 )
 
+    return warnings
+
+
+# interval-set counterpart of check_range_usage: warn on first reused line, then mark range
+def _range_usage(start: int, end: int, used: IntervalSet, op_index: int) -> List[str]:
+    reused = used.first_in(start, end)
+    used.add(start, end)
+    if reused is None:
+        return []
+    return [f"Op {op_index}: duplicate operation on line {reused}"]
+
+
+# * Validate cross-operation interactions in O(n log n) via sorted range indexes
+def validate_operation_interactions(ops: List[dict]) -> List[str]:
+    if not _int_positions(ops):
+        warnings = _pairwise_interactions(ops)
+    else:
+        warnings = []
+        deletes = [
+            (i, op["start"], op["end"])
+            for i, op in enumerate(ops)
+            if op.get("op") == OP_DELETE_RANGE and "start" in op and "end" in op
+        ]
+        deleted = RangeIndex((s, e) for _, s, e in deletes)
+        for i, op in enumerate(ops):
+            if op.get("op") == OP_INSERT_AFTER and "line" in op:
+                ln = op["line"]
+                if deleted.intersects(ln, ln):
+                    warnings.append(
+                        f"Op {i}: insert_after on line {ln} that is deleted by a delete_range"
+                    )
+
+        replaced = RangeIndex(
+            (op["start"], op["end"])
+            for op in ops
+            if op.get("op") == OP_REPLACE_RANGE and "start" in op and "end" in op
+        )
+        for i, s, e in deletes:
+            if replaced.intersects(s, e):
+                warnings.append(
+                    f"Op {i}: delete_range overlaps a replace_range; split or reorder ops"
+                )
+
     seen_inserts: set[int] = set()
     for i, op in enumerate(ops):
         if op.get("op") == OP_INSERT_AFTER and "line" in op:
@@ -153,8 +215,12 @@ class ValidationOutcome:
 
 
 # * Edit JSON validation logic (moved from pipeline.py)
+# bounds & duplicate checks use interval indexes; pass prebuilt index to reuse it
 def validate_edits(
-    edits: dict, resume_lines: dict[int, str], risk: RiskLevel
+    edits: dict,
+    resume_lines: dict[int, str],
+    risk: RiskLevel,
+    index: Optional[LineIndex] = None,
 ) -> List[str]:
     warnings: List[str] = []
 
@@ -171,7 +237,9 @@ def validate_edits(
         warnings.append("'ops' list is empty")
         return warnings
 
-    line_usage: dict[int, str] = {}
+    if index is None:
+        index = LineIndex(resume_lines)
+    used_lines = IntervalSet()
 
     for i, op in enumerate(ops):
         if not isinstance(op, dict):
@@ -204,13 +272,13 @@ def validate_edits(
                 warnings.append(error)
                 continue
 
-            if not check_line_exists(line, resume_lines):
+            if line not in index:
                 warnings.append(f"Op {i}: line {line} not in resume bounds")
                 continue
 
-            if line in line_usage:
+            if used_lines.first_in(line, line) is not None:
                 warnings.append(f"Op {i}: duplicate operation on line {line}")
-            line_usage[line] = op_type
+            used_lines.add(line, line)
 
         elif op_type == OP_REPLACE_RANGE:
             is_valid, error = validate_required_fields(
@@ -233,8 +301,8 @@ def validate_edits(
                 warnings.append(error)
                 continue
 
-            exists, missing_line = check_range_exists(start, end, resume_lines)
-            if not exists:
+            missing_line = index.first_missing(int(start), int(end))
+            if missing_line is not None:
                 warnings.append(f"Op {i}: line {missing_line} not in resume bounds")
                 continue
 
@@ -247,8 +315,7 @@ def validate_edits(
                 else:
                     warnings.append(msg)
 
-            dup_warnings = check_range_usage(start, end, line_usage, op_type, i)
-            warnings.extend(dup_warnings)
+            warnings.extend(_range_usage(int(start), int(end), used_lines, i))
 
         elif op_type == OP_INSERT_AFTER:
             is_valid, error = validate_required_fields(
@@ -271,7 +338,7 @@ def validate_edits(
                 warnings.append(error)
                 continue
 
-            if not check_line_exists(line, resume_lines):
+            if line not in index:
                 warnings.append(f"Op {i}: line {line} not in resume bounds")
                 continue
 
@@ -289,13 +356,12 @@ def validate_edits(
                 warnings.append(error)
                 continue
 
-            exists, missing_line = check_range_exists(start, end, resume_lines)
-            if not exists:
+            missing_line = index.first_missing(int(start), int(end))
+            if missing_line is not None:
                 warnings.append(f"Op {i}: line {missing_line} not in resume bounds")
                 continue
 
-            dup_warnings = check_range_usage(start, end, line_usage, op_type, i)
-            warnings.extend(dup_warnings)
+            warnings.extend(_range_usage(int(start), int(end), used_lines, i))
 
         else:
             warnings.append(f"Op {i}: unknown operation type '{op_type}'")
@@ -303,3 +369,11 @@ def validate_edits(
     warnings.extend(validate_operation_interactions(ops))
 
     return warnings
+
+
+# * Validate many edit sets against one resume, indexing its lines once
+def validate_edit_sets(
+    edit_sets: Iterable[dict], resume_lines: dict[int, str], risk: RiskLevel
+) -> List[List[str]]:
+    index = LineIndex(resume_lines)
+    return [validate_edits(edits, resume_lines, risk, index) for edits in edit_sets]
@@ -4,12 +4,18 @@
 from .documents import (
     read_docx,
     read_resume,
+    read_resume_document,
     read_latex,
     read_typst,
     write_docx,
     write_text_lines,
     read_text,
     read_docx_with_formatting,
+    load_docx,
+    clear_document_cache,
+    ParsedDocx,
+    DocxTemplate,
+    docx_template,
     apply_edits_to_docx,
     get_handler,
     clear_handler_cache,
@@ -17,6 +23,7 @@ from .documents import (
 from .generics import (
     write_json_safe,
     read_json_safe,
+    write_text_stream,
     ensure_parent,
     exit_with_error,
 )
@@ -45,6 +52,7 @@ from .base_handler import BaseDocumentHandler
 # Handler classes (OO API)
 from .latex_handler import LatexHandler
 from .typst_handler import TypstHandler
+from .docx_handler import DocxHandler, is_confident_payload
 
 # Typst frozen range utilities (useful externally)
 from .typst_handler import (
@@ -59,17 +67,29 @@ from .bulk_io import (
     write_job_artifacts,
     write_matrix_files,
 )
+from .keyword_packs import (
+    KeywordPack,
+    load_keyword_pack,
+    find_keyword_packs,
+    load_keyword_matcher,
+)
 
 __all__ = [
     # Document I/O
     "read_docx",
     "read_resume",
+    "read_resume_document",
     "read_latex",
     "read_typst",
     "write_docx",
     "write_text_lines",
     "read_text",
     "read_docx_with_formatting",
+    "load_docx",
+    "clear_document_cache",
+    "ParsedDocx",
+    "DocxTemplate",
+    "docx_template",
     "apply_edits_to_docx",
     # Handler registry (primary API)
     "get_handler",
@@ -77,6 +97,7 @@ __all__ = [
     # Generics
     "write_json_safe",
     "read_json_safe",
+    "write_text_stream",
     "ensure_parent",
     "exit_with_error",
     # Shared template utilities
@@ -96,6 +117,8 @@ __all__ = [
     "BaseDocumentHandler",
     "LatexHandler",
     "TypstHandler",
+    "DocxHandler",
+    "is_confident_payload",
     # Typst frozen range utilities
     "find_frozen_ranges",
     "is_in_frozen_range",
@@ -106,4 +129,9 @@ __all__ = [
     "write_run_metadata",
     "write_job_artifacts",
     "write_matrix_files",
+    # Keyword packs
+    "KeywordPack",
+    "load_keyword_pack",
+    "find_keyword_packs",
+    "load_keyword_matcher",
 ]
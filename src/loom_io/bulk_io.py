@@ -6,14 +6,26 @@ from __future__ import annotations
 import glob as glob_module
 import hashlib
 import json
+import os
 import re
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .generics import ensure_parent, write_json_safe
-from ..core.bulk_types import JobSpec, BulkResult
+from .object_store import ObjectStore
+from .result_journal import JOURNAL_NAME, read_journal
+from ..core.bulk_types import (
+    JobSpec,
+    JobResult,
+    BulkResult,
+    CascadeSummary,
+    DuplicateCluster,
+    JobStatus,
+)
 from ..core.exceptions import JobDiscoveryError, ConfigurationError
+from ..core.near_duplicates import DEFAULT_DUPLICATE_THRESHOLD, find_near_duplicates
 
 
 # * Discover jobs from directory (glob *.txt & *.md), manifest file (.yaml/.json), or glob pattern (*, ?, [)
@@ -141,6 +153,54 @@ def deduplicate_job_specs(job_specs: list[JobSpec], max_len: int = 50) -> list[J
     return result
 
 
+# * Cluster near-duplicate postings (reposts across cities/agencies) by content
+# first job in discovery order represents each cluster; unreadable jobs never cluster
+def cluster_duplicate_postings(
+    job_specs: list[JobSpec],
+    threshold: float = DEFAULT_DUPLICATE_THRESHOLD,
+) -> list[DuplicateCluster]:
+    texts: list[str] = []
+    for spec in job_specs:
+        try:
+            texts.append(spec.path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            texts.append("")
+
+    clusters: list[DuplicateCluster] = []
+    for group in find_near_duplicates(texts, threshold=threshold):
+        member_ids = [job_specs[idx].id for idx, _ in group.members]
+        clusters.append(
+            DuplicateCluster(
+                representative=job_specs[group.representative].id,
+                members=member_ids,
+                similarity={
+                    job_specs[idx].id: similarity for idx, similarity in group.members
+                },
+            )
+        )
+    return clusters
+
+
+# * Reuse representative outputs in duplicate job dir via hard links (copy fallback)
+# per-job job.json & job.txt are skipped since each member writes its own
+def link_duplicate_artifacts(source_dir: Path, target_dir: Path) -> list[Path]:
+    linked: list[Path] = []
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for source in sorted(source_dir.iterdir()):
+        if not source.is_file() or source.name in ("job.json", "job.txt"):
+            continue
+        target = target_dir / source.name
+        if target.exists():
+            target.unlink()
+        try:
+            os.link(source, target)
+        except OSError:
+            # cross-device or unsupported filesystem
+            shutil.copy2(source, target)
+        linked.append(target)
+    return linked
+
+
 # * Create timestamped output directory w/ per-job subdirs; returns (bulk_output_dir, {job_id: job_output_dir})
 def create_bulk_output_layout(
     base_dir: Path,
@@ -148,7 +208,15 @@ def create_bulk_output_layout(
 ) -> tuple[Path, dict[str, Path]]:
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
     bulk_dir = base_dir / f"bulk_{timestamp}"
-    bulk_dir.mkdir(parents=True, exist_ok=True)
+    # runs started within the same second get their own suffixed dir
+    attempt = 1
+    while True:
+        try:
+            bulk_dir.mkdir(parents=True)
+            break
+        except FileExistsError:
+            attempt += 1
+            bulk_dir = base_dir / f"bulk_{timestamp}_{attempt}"
 
     job_dirs: dict[str, Path] = {}
     for spec in job_specs:
@@ -159,6 +227,17 @@ def create_bulk_output_layout(
     return bulk_dir, job_dirs
 
 
+# short content hash of job posting file (recorded in run.json)
+def job_content_hash(path: Path) -> str | None:
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+# copy of run's base resume kept beside run.json so later runs can rebase its edits
+BASE_RESUME_STEM = "base_resume"
+
+
 # * Write run.json w/ metadata for reproducibility
 def write_run_metadata(
     bulk_dir: Path,
@@ -166,13 +245,16 @@ def write_run_metadata(
     model: str,
     settings_snapshot: dict[str, Any],
     job_specs: list[JobSpec],
+    prerank: dict[str, Any] | None = None,
+    duplicates: list[DuplicateCluster] | None = None,
+    store: ObjectStore | None = None,
+    reuse_key: str | None = None,
 ) -> None:
     # Hash each job file
     job_hashes: dict[str, str] = {}
     for spec in job_specs:
         if spec.path.exists():
-            content = spec.path.read_bytes()
-            job_hashes[spec.id] = hashlib.sha256(content).hexdigest()[:16]
+            job_hashes[spec.id] = job_content_hash(spec.path)
 
     # Get loom version
     try:
@@ -187,6 +269,7 @@ def write_run_metadata(
         "loom_version": loom_version,
         "timestamp": datetime.now().isoformat(),
         "resume": str(resume_path),
+        "resume_hash": job_content_hash(resume_path),
         "model": model,
         "settings": settings_snapshot,
         "jobs": {
@@ -199,10 +282,133 @@ def write_run_metadata(
             for spec in job_specs
         },
     }
+    if reuse_key is not None:
+        run_meta["reuse_key"] = reuse_key
+    if prerank is not None:
+        run_meta["prerank"] = prerank
+    if duplicates:
+        run_meta["duplicates"] = [c.to_dict() for c in duplicates]
+    if resume_path.exists():
+        snapshot = bulk_dir / f"{BASE_RESUME_STEM}{resume_path.suffix}"
+        if store is not None:
+            # unchanged resume across re-runs is stored (& copied) once
+            store.put_file(resume_path, snapshot)
+        else:
+            shutil.copy2(resume_path, snapshot)
+        run_meta["resume_snapshot"] = snapshot.name
 
     write_json_safe(run_meta, bulk_dir / "run.json")
 
 
+# * Load run.json of a previous bulk run
+def read_run_metadata(bulk_dir: Path) -> dict[str, Any]:
+    run_path = bulk_dir / "run.json"
+    if not run_path.exists():
+        raise ConfigurationError(f"Not a bulk run directory (no run.json): {bulk_dir}")
+    try:
+        return json.loads(run_path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise ConfigurationError(f"Invalid run.json in {bulk_dir}: {e}") from e
+
+
+# base resume snapshot of a previous run (None for runs predating snapshots)
+def find_base_resume(bulk_dir: Path, run_meta: dict[str, Any]) -> Path | None:
+    name = run_meta.get("resume_snapshot")
+    if not name or not (bulk_dir / name).exists():
+        return None
+    return bulk_dir / name
+
+
+# * Latest journaled result record per job ID: final pass if any, else triage pass
+# (unless include_triage is off); later entries supersede earlier ones
+def latest_job_records(
+    bulk_dir: Path, include_triage: bool = True
+) -> dict[str, dict[str, Any]]:
+    final: dict[str, dict[str, Any]] = {}
+    triage: dict[str, dict[str, Any]] = {}
+    for entry in read_journal(bulk_dir / JOURNAL_NAME):
+        if entry.get("type") != "job":
+            continue
+        record = entry["result"]
+        target = triage if entry.get("stage") == "triage" else final
+        target[record["id"]] = record
+    if not include_triage:
+        return final
+    return {**{k: v for k, v in triage.items() if k not in final}, **final}
+
+
+# * Rebuild run's BulkResult from run.json & its result journal
+# works for interrupted runs (jobs finished so far); jobs keep discovery order
+def load_bulk_result(bulk_dir: Path) -> BulkResult:
+    run_meta = read_run_metadata(bulk_dir)
+    records = latest_job_records(bulk_dir)
+
+    cascade = None
+    for entry in read_journal(bulk_dir / JOURNAL_NAME):
+        if entry.get("type") == "cascade":
+            cascade = CascadeSummary.from_dict(entry["summary"])
+
+    jobs: list[JobResult] = []
+    for job_id, job in run_meta.get("jobs", {}).items():
+        if job_id not in records:
+            continue
+        spec = JobSpec(
+            path=Path(job.get("path", "")),
+            id=job_id,
+            name=job.get("name"),
+            company=job.get("company"),
+        )
+        jobs.append(JobResult.from_dict(records[job_id], spec))
+
+    prerank = run_meta.get("prerank")
+    return BulkResult(
+        resume_path=Path(run_meta.get("resume", "")),
+        model=run_meta.get("model", ""),
+        timestamp=run_meta.get("timestamp", ""),
+        output_dir=bulk_dir,
+        jobs=jobs,
+        cascade=cascade,
+        prerank_scored=prerank["scored"] if prerank else None,
+        duplicates=[
+            DuplicateCluster.from_dict(c) for c in run_meta.get("duplicates", [])
+        ],
+        incremental=run_meta.get("settings", {}).get("incremental", False),
+    )
+
+
+# * Index successful journaled jobs of earlier runs w/ matching reuse key by posting
+# content hash; newest run first: {content_hash: [(run_dir, result record), ...]}
+def find_reusable_jobs(
+    base_dir: Path,
+    reuse_key: str,
+    exclude: Path | None = None,
+) -> dict[str, list[tuple[Path, dict[str, Any]]]]:
+    index: dict[str, list[tuple[Path, dict[str, Any]]]] = {}
+    runs = sorted(
+        Path(base_dir).glob("bulk_*/run.json"),
+        key=lambda p: p.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for run_json in runs:
+        run_dir = run_json.parent
+        if run_dir == exclude:
+            continue
+        try:
+            run_meta = read_run_metadata(run_dir)
+        except ConfigurationError:
+            continue
+        if run_meta.get("reuse_key") != reuse_key:
+            continue
+        jobs = run_meta.get("jobs", {})
+        # triage-only records of interrupted cascade runs are never final results
+        records = latest_job_records(run_dir, include_triage=False)
+        for job_id, record in records.items():
+            content_hash = jobs.get(job_id, {}).get("content_hash")
+            if content_hash and record.get("status") == JobStatus.SUCCESS.value:
+                index.setdefault(content_hash, []).append((run_dir, record))
+    return index
+
+
 # * Write per-job metadata & normalized job text
 def write_job_artifacts(
     job_dir: Path,
@@ -210,6 +416,7 @@ def write_job_artifacts(
     job_text: str,
     model: str,
     settings_snapshot: dict[str, Any],
+    store: ObjectStore | None = None,
 ) -> None:
     # Job.json - metadata
     write_json_safe(
@@ -225,8 +432,11 @@ def write_job_artifacts(
         job_dir / "job.json",
     )
 
-    # Job.txt - normalized text fed to model
-    (job_dir / "job.txt").write_text(job_text, encoding="utf-8")
+    # Job.txt - normalized text fed to model (linked from store when already stored)
+    if store is not None:
+        store.put_bytes(job_text.encode("utf-8"), job_dir / "job.txt")
+    else:
+        (job_dir / "job.txt").write_text(job_text, encoding="utf-8")
 
 
 # * Write matrix.json & matrix.md to bulk output directory
@@ -251,6 +461,39 @@ def _generate_markdown_matrix(result: BulkResult) -> str:
         f"**Total Runtime:** {result.total_runtime:.1f}s",
         "",
     ]
+    if result.prerank_scored is not None:
+        lines.insert(
+            -1,
+            f"**Pre-ranked:** {len(result.jobs)} of {result.prerank_scored} jobs selected",
+        )
+
+    if result.incremental:
+        lines.insert(
+            -1,
+            f"**Incremental:** {result.reused_count} jobs reused from earlier runs, {len(result.jobs) - result.reused_count} recomputed",
+        )
+
+    if result.duplicates:
+        duplicate_count = sum(len(c.members) for c in result.duplicates)
+        lines.insert(
+            -1,
+            f"**Near-duplicates:** {duplicate_count} jobs reused outputs from {len(result.duplicates)} representatives",
+        )
+
+    # Cascade summary (two-tier triage -> final runs)
+    if result.cascade is not None:
+        cascade = result.cascade
+        lines.extend(
+            [
+                "## Cascade",
+                "",
+                f"- **Triage Model:** {cascade.triage_model} ({cascade.triaged} jobs, {cascade.triage_runtime_seconds:.1f}s)",
+                f"- **Final Model:** {cascade.final_model} ({cascade.promoted} promoted, {cascade.final_runtime_seconds:.1f}s)",
+                f"- **Final Passes Avoided:** {cascade.final_passes_avoided}",
+                f"- **Estimated Time Saved:** {cascade.estimated_time_saved_seconds:.1f}s",
+                "",
+            ]
+        )
 
     # Ranked table
     ranked = result.ranked_jobs()
@@ -288,6 +531,8 @@ def _generate_markdown_matrix(result: BulkResult) -> str:
 
         if job.status.value == "success":
             lines.append(f"- **Fit Score:** {job.fit_score:.2f}")
+            if job.prerank_score is not None:
+                lines.append(f"- **Pre-rank Score:** {job.prerank_score:.3f}")
             lines.append(
                 f"- **Required Keywords:** {job.coverage.required_matched}/{job.coverage.required_total}"
             )
@@ -298,6 +543,13 @@ def _generate_markdown_matrix(result: BulkResult) -> str:
                 f"- **Edits:** {job.edits.total_count} ({job.edits.replacements} replacements, {job.edits.inserts} inserts, {job.edits.deletes} deletes)"
             )
             lines.append(f"- **Runtime:** {job.runtime_seconds:.1f}s")
+            if job.duplicate_of:
+                lines.append(f"- **Duplicate Of:** {job.duplicate_of}")
+            if len(job.passes) > 1:
+                passes = " → ".join(
+                    f"{p.stage} ({p.model}, {p.fit_score:.2f})" for p in job.passes
+                )
+                lines.append(f"- **Passes:** {passes}")
             if job.coverage.missing_required:
                 missing = ", ".join(job.coverage.missing_required[:5])
                 lines.append(f"- **Missing Required:** {missing}")
@@ -1,18 +1,30 @@
 # src/loom_io/documents.py
 # Document I/O operations for reading & writing DOCX files w/ formatting preservation, plus basic LaTeX/text support
 
+import copy
+import functools
+import threading
 import zipfile
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import groupby
 from pathlib import Path
 
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.oxml import serialize_part_xml
 from docx.oxml import OxmlElement
 from typing import Dict, Tuple, Any, List, Set
 
-from ..core.types import Lines
+from ..core.types import Lines, ResumeDocument
 from ..core.exceptions import LaTeXError, TypstError, DocumentParseError
 from ..core.verbose import vlog_file_read, vlog_file_write
+from .docx_text import read_docx_text
+from .docx_zip import write_patched_package
 from .generics import ensure_parent
 from .latex_patterns import is_preservable_content, requires_trailing_blank
 
@@ -20,8 +32,99 @@ from .latex_patterns import is_preservable_content, requires_trailing_blank
 # ! Moved to lazy import below to avoid circular dependency w/ core/validation
 
 
-# * Read DOCX file & return text content w/ document object
-def read_docx_with_formatting(path: Path) -> Tuple[Lines, Any, Dict[int, Paragraph]]:
+# === Parsed DOCX Cache ===
+# Process-wide cache so each source DOCX is parsed once no matter how many readers
+# (tailor, apply, bulk jobs, keyword coverage) touch it; keyed by path + mtime + size
+
+# max cached documents (bulk outputs are cached too, so bound memory)
+_DOCX_CACHE_SIZE = 32
+
+
+# parsed DOCX: text lines, python-docx tree & line -> paragraph map
+# ! cached instances are shared; never mutate doc/paragraphs, use clone() first
+@dataclass(frozen=True)
+class ParsedDocx:
+    lines: Lines
+    doc: Any
+    paragraph_map: Dict[int, Paragraph]
+    # (mtime_ns, size) of file this was parsed from (None if never on disk)
+    signature: Tuple[int, int] | None = None
+
+    # * Private deep copy for mutation (copy-on-write; cheaper than re-parsing)
+    # ! copy the part, not the Document: Document caches a body proxy that deepcopy
+    # would detach from the copied element tree
+    def clone(self) -> "ParsedDocx":
+        positions = {id(el): i for i, el in enumerate(self.doc.element.body)}
+        doc = copy.deepcopy(self.doc.part).document
+        children = list(doc.element.body)
+        # relocate lines by body position; re-reading paragraph text is the slow part
+        paragraph_map = {
+            ln: Paragraph(children[positions[id(p._element)]], doc._body)
+            for ln, p in self.paragraph_map.items()
+        }
+        return ParsedDocx(dict(self.lines), doc, paragraph_map, self.signature)
+
+
+# full python-docx parses & text-only (streamed) reads, both keyed by resolved path
+_docx_cache: "OrderedDict[Path, Tuple[Tuple[int, int], ParsedDocx]]" = OrderedDict()
+_text_cache: "OrderedDict[Path, Tuple[Tuple[int, int], Lines]]" = OrderedDict()
+_docx_cache_lock = threading.Lock()
+
+
+def _cache_get(cache: OrderedDict, path: Path) -> Any:
+    signature = _file_signature(path)
+    if signature is None:
+        return None
+    key = path.resolve()
+    with _docx_cache_lock:
+        hit = cache.get(key)
+        if hit is None or hit[0] != signature:
+            return None
+        cache.move_to_end(key)
+        return hit[1]
+
+
+def _cache_put(
+    cache: OrderedDict, path: Path, signature: Tuple[int, int] | None, value: Any
+) -> None:
+    if signature is None:
+        return
+    key = path.resolve()
+    with _docx_cache_lock:
+        cache[key] = (signature, value)
+        cache.move_to_end(key)
+        while len(cache) > _DOCX_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+# number non-empty paragraphs from 1 (line numbering shared by all DOCX readers)
+def _index_docx(doc: Any, signature: Tuple[int, int] | None = None) -> ParsedDocx:
+    lines: Lines = {}
+    paragraph_map: Dict[int, Paragraph] = {}
+    line_number = 1
+    for p in doc.paragraphs:
+        text = p.text.strip()
+        if text:
+            lines[line_number] = text
+            paragraph_map[line_number] = p
+            line_number += 1
+    return ParsedDocx(lines, doc, paragraph_map, signature)
+
+
+def _file_signature(path: Path) -> Tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _remember_docx(path: Path, parsed: ParsedDocx) -> None:
+    _cache_put(_docx_cache, path, parsed.signature, parsed)
+
+
+def _parse_docx(path: Path) -> ParsedDocx:
+    signature = _file_signature(path)
     try:
         doc = Document(str(path))
     except FileNotFoundError:
@@ -31,25 +134,166 @@ def read_docx_with_formatting(path: Path) -> Tuple[Lines, Any, Dict[int, Paragra
     except Exception as e:
         raise DocumentParseError(f"Failed to open DOCX file {path}: {e}") from e
 
-    lines = {}
-    paragraph_map = {}
-    line_number = 1
+    parsed = _index_docx(doc, signature)
+    vlog_file_read(path, path.stat().st_size if path.exists() else None)
+    return parsed
 
-    for p in doc.paragraphs:
-        text = p.text.strip()
-        if text:
-            lines[line_number] = text
-            paragraph_map[line_number] = p
-            line_number += 1
 
-    vlog_file_read(path, path.stat().st_size if path.exists() else None)
-    return lines, doc, paragraph_map
+# * Shared parsed DOCX for path (read-only; re-parsed only when mtime/size change)
+def load_docx(path: Path) -> ParsedDocx:
+    path = Path(path)
+    cached = _cache_get(_docx_cache, path)
+    if cached is not None:
+        return cached
+
+    parsed = _parse_docx(path)
+    _remember_docx(path, parsed)
+    return parsed
+
+
+# clear parsed DOCX cache (primarily for testing)
+def clear_document_cache() -> None:
+    with _docx_cache_lock:
+        _docx_cache.clear()
+        _text_cache.clear()
+        _template_cache.clear()
+
+
+# * Save DOCX & cache its parse so later readers of output skip re-opening it
+# ! doc is handed to the cache; caller must not mutate it after saving
+def _save_docx(doc: Any, output_path: Path) -> None:
+    ensure_parent(output_path)
+    doc.save(str(output_path))
+    vlog_file_write(output_path)
+    _remember_docx(
+        Path(output_path), _index_docx(doc, _file_signature(Path(output_path)))
+    )
+
+
+# === DOCX Templates ===
+# Immutable pre-parsed source shared by every write from it (e.g. all bulk jobs):
+# writes copy only the document XML, never re-open or re-parse the source package
+
+_template_cache: "OrderedDict[Path, Tuple[Tuple[int, int], DocxTemplate]]" = (
+    OrderedDict()
+)
+
+
+# settable public properties of proxy class (computed once per class, not per write)
+@functools.lru_cache(maxsize=None)
+def _settable_properties(cls: type) -> Tuple[str, ...]:
+    return tuple(
+        name
+        for name in dir(cls)
+        if not name.startswith("_")
+        and isinstance(getattr(cls, name, None), property)
+        and getattr(cls, name).fset is not None
+    )
+
+
+# non-None settable paragraph-format properties as (name, value) pairs
+def _paragraph_format_props(source_format: Any) -> Tuple[Tuple[str, Any], ...]:
+    props = []
+    for prop in _settable_properties(type(source_format)):
+        try:
+            value = getattr(source_format, prop)
+        except Exception:
+            continue
+        if value is not None:
+            props.append((prop, value))
+    return tuple(props)
+
+
+# immutable parsed source DOCX + per-line lookup tables for cheap per-write copies
+# ! parsed tree is shared; writes mutate only copies from clone_body()
+@dataclass(frozen=True)
+class DocxTemplate:
+    source: Path
+    parsed: ParsedDocx
+    # line -> position of paragraph among body children (locates it in a body copy)
+    body_index: Dict[int, int]
+    # line -> settable paragraph-format properties (rebuild mode)
+    paragraph_formats: Dict[int, Tuple[Tuple[str, Any], ...]]
+    # zero-copy writes are safe: every package part exists in source zip & styles
+    # part is present, so style lookups on the shared package never add parts
+    patchable: bool
+
+    # * Deep copy of document XML only w/ line -> paragraph map into the copy
+    # paragraphs keep template body as parent, so style lookups use shared parts
+    def clone_body(self) -> Tuple[Any, Dict[int, Paragraph]]:
+        element = copy.deepcopy(self.parsed.doc.element)
+        children = list(element.body)
+        parent = self.parsed.doc._body
+        return element, {
+            ln: Paragraph(children[i], parent) for ln, i in self.body_index.items()
+        }
+
+    # check template still matches source on disk (safe to patch source package)
+    def is_current(self) -> bool:
+        return _file_signature(self.source) == self.parsed.signature
+
+
+def _is_patchable(source: Path, doc: Any) -> bool:
+    try:
+        doc.part.part_related_by(RT.STYLES)
+    except KeyError:
+        return False
+    with zipfile.ZipFile(source) as zf:
+        names = set(zf.namelist())
+    parts = doc.part.package.iter_parts()
+    return all(str(part.partname).lstrip("/") in names for part in parts)
+
+
+def _build_template(path: Path, parsed: ParsedDocx) -> DocxTemplate:
+    positions = {id(el): i for i, el in enumerate(parsed.doc.element.body)}
+    return DocxTemplate(
+        source=path,
+        parsed=parsed,
+        body_index={
+            ln: positions[id(p._element)] for ln, p in parsed.paragraph_map.items()
+        },
+        paragraph_formats={
+            ln: _paragraph_format_props(p.paragraph_format)
+            for ln, p in parsed.paragraph_map.items()
+        },
+        patchable=_is_patchable(path, parsed.doc),
+    )
+
+
+# * Immutable template for source DOCX (built once per file version per process)
+def docx_template(path: Path) -> DocxTemplate:
+    path = Path(path)
+    template = _cache_get(_template_cache, path)
+    if template is not None:
+        return template
+    parsed = load_docx(path)
+    template = _build_template(path, parsed)
+    _cache_put(_template_cache, path, parsed.signature, template)
+    return template
 
 
-# * Read DOCX file & return text content (backward compatibility)
+# * Read DOCX file & return text content w/ document object
+# returns a private clone, so callers may mutate the document freely
+def read_docx_with_formatting(path: Path) -> Tuple[Lines, Any, Dict[int, Paragraph]]:
+    parsed = load_docx(path).clone()
+    return parsed.lines, parsed.doc, parsed.paragraph_map
+
+
+# * Read DOCX file & return text content
+# text-only readers stream word/document.xml (no python-docx object model); a full
+# parse already cached for the file (e.g. just-written output) is reused instead
 def read_docx(path: Path) -> Lines:
-    lines, _, _ = read_docx_with_formatting(path)
-    return lines
+    path = Path(path)
+    parsed = _cache_get(_docx_cache, path)
+    if parsed is not None:
+        return dict(parsed.lines)
+    lines = _cache_get(_text_cache, path)
+    if lines is None:
+        signature = _file_signature(path)
+        lines = read_docx_text(path)
+        vlog_file_read(path, signature[1] if signature else None)
+        _cache_put(_text_cache, path, signature, lines)
+    return dict(lines)
 
 
 # * Read LaTeX (.tex) file as numbered lines
@@ -159,6 +403,15 @@ def read_resume(path: Path, preserve_structure: bool = False) -> Lines:
     return read_docx(path)
 
 
+# * Read resume as immutable ResumeDocument (shim over read_resume for hot paths)
+def read_resume_document(
+    path: Path, preserve_structure: bool = False
+) -> ResumeDocument:
+    return ResumeDocument.from_lines(
+        read_resume(path, preserve_structure=preserve_structure)
+    )
+
+
 # * Apply edits to document w/ different preservation modes (in_place: better formatting, rebuild: faster)
 def apply_edits_to_docx(
     original_path: Path,
@@ -176,74 +429,85 @@ def _apply_edits_in_place(
     original_path: Path, new_lines: Lines, output_path: Path
 ) -> None:
     # Edit document in-place to preserve formatting & styles
-    # Reuse existing reader for lines & paragraph map
-    lines, doc, paragraph_map = read_docx_with_formatting(original_path)
+    template = docx_template(original_path)
+    lines = template.parsed.lines
+
+    if template.patchable and template.is_current():
+        # copy only document XML; other package parts are zip-copied byte-for-byte
+        element, paragraph_map = template.clone_body()
+        _edit_body(
+            element.body, template.parsed.doc._body, paragraph_map, lines, new_lines
+        )
+        part_name = template.parsed.doc.part.partname.lstrip("/")
+        ensure_parent(output_path)
+        write_patched_package(
+            original_path, output_path, {part_name: serialize_part_xml(element)}
+        )
+        vlog_file_write(output_path)
+        return
 
+    # Private clone of the cached parse (cached tree stays pristine for other readers)
+    parsed = template.parsed.clone()
+    doc = parsed.doc
+    _edit_body(doc.element.body, doc._body, parsed.paragraph_map, lines, new_lines)
+    _save_docx(doc, output_path)
+
+
+# * Apply line edits to body element in one pass over sorted edit lists
+# paragraph_map locates original lines in body; additions arrive sorted & grouped
+# by anchor line, so each anchor gets one batched insert
+def _edit_body(
+    body: Any,
+    parent: Any,
+    paragraph_map: Dict[int, Paragraph],
+    lines: Lines,
+    new_lines: Lines,
+) -> None:
     # Compute modifications, additions, deletions
     modifications, additions, deletions = _categorize_edits(lines, new_lines)
 
-    # Apply deletions from end to start
-    for line_num in sorted(deletions, reverse=True):
-        if line_num in paragraph_map:
-            para = paragraph_map[line_num]
-            p_element = para._element
-            p_element.getparent().remove(p_element)
+    # Insert additions first, so lines anchored to a deleted line aren't orphaned
+    for insert_after, group in groupby(additions, key=lambda a: a[0]):
+        texts = [text for _, _, text in group]
+        if insert_after is None:
+            # Insert at beginning in reverse order
+            for text in reversed(texts):
+                body.insert(0, _new_paragraph_element(parent, text))
+            continue
+        reference_para = paragraph_map.get(insert_after)
+        if not reference_para:
+            continue
+        # resolve reference style once per anchor, not per inserted line
+        style_id = None
+        reference_style = reference_para.style
+        if reference_style:
+            style_id = reference_para.part.get_style_id(
+                reference_style, WD_STYLE_TYPE.PARAGRAPH
+            )
+        for text in reversed(texts):
+            new_p = _new_paragraph_element(reference_para._parent, text)
+            if reference_style:
+                new_p.style = style_id
+            reference_para._p.addnext(new_p)
 
     # Apply modifications preserving run formatting
     for line_num, new_text in modifications.items():
         if line_num in paragraph_map:
-            para = paragraph_map[line_num]
-            _set_paragraph_text_preserving_format(para, new_text)
-
-    # Group additions by insertion position
-    additions_by_position: Dict[int | None, List[Tuple[int, str]]] = {}
-    for insert_after, line_num, text in additions:
-        if insert_after not in additions_by_position:
-            additions_by_position[insert_after] = []
-        additions_by_position[insert_after].append((line_num, text))
-
-    # Sort groups by line number
-    for position in additions_by_position:
-        additions_by_position[position].sort(key=lambda x: x[0])
-
-    # Insert new paragraph content
-    # Sort numeric positions only
-    numeric_positions = sorted(
-        [p for p in additions_by_position.keys() if p is not None], reverse=True
-    )
+            _set_paragraph_text_preserving_format(paragraph_map[line_num], new_text)
 
-    # Insert after paragraphs bottom-up
-    for insert_after in numeric_positions:
-        reference_para = paragraph_map.get(insert_after)
-        if not reference_para:
-            continue
-        for line_num, text in reversed(additions_by_position[insert_after]):
-            new_para = _insert_paragraph_after(reference_para, text)
-            # Copy reference paragraph style
-            if reference_para.style:
-                new_para.style = reference_para.style
-
-    # Insert at beginning in reverse order
-    if None in additions_by_position:
-        for line_num, text in reversed(additions_by_position[None]):
-            new_para = doc.add_paragraph(text)
-            doc.element.body.insert(0, new_para._element)
-
-    # Persist modified document
-    ensure_parent(output_path)
-    doc.save(str(output_path))
-    vlog_file_write(output_path)
+    # Apply deletions
+    for line_num in deletions:
+        if line_num in paragraph_map:
+            p_element = paragraph_map[line_num]._element
+            p_element.getparent().remove(p_element)
 
 
-def _insert_paragraph_after(paragraph: Paragraph, text: str) -> Paragraph:
-    # Insert paragraph after given one (python-docx safe)
+def _new_paragraph_element(parent: Any, text: str) -> Any:
+    # Detached paragraph element (python-docx safe), w/ one run if text is non-empty
     new_p = OxmlElement("w:p")
-    # Insert after reference paragraph
-    paragraph._p.addnext(new_p)
-    new_para = Paragraph(new_p, paragraph._parent)
     if text:
-        new_para.add_run(text)
-    return new_para
+        Paragraph(new_p, parent).add_run(text)
+    return new_p
 
 
 def _copy_run_formatting(source_run: Run | None, target_run: Run) -> None:
@@ -292,31 +556,20 @@ def _categorize_edits(
     # Categorize edits by type
     modifications: Dict[int, str] = {}
     additions: List[Tuple[int | None, int, str]] = []
-    deletions: Set[int] = set()
-
-    original_set = set(original_lines.keys())
-    new_set = set(new_lines.keys())
-
-    # Identify modified lines
-    for line_num in sorted(new_set):
-        if line_num in original_set and new_lines[line_num] != original_lines[line_num]:
-            modifications[line_num] = new_lines[line_num]
-
-    # Identify deleted lines
-    for line_num in original_set:
-        if line_num not in new_set:
-            deletions.add(line_num)
-
-    # Identify added lines
-    for line_num in sorted(new_set):
-        if line_num not in original_set:
-            insert_after = None
-            for existing_line in sorted(original_set):
-                if existing_line < line_num:
-                    insert_after = existing_line
-                else:
-                    break
-            additions.append((insert_after, line_num, new_lines[line_num]))
+    deletions: Set[int] = set(original_lines.keys() - new_lines.keys())
+
+    # one merge over sorted line numbers; additions anchor to the nearest
+    # preceding original line (bisect), so output stays sorted by line number
+    original_sorted = sorted(original_lines)
+    for line_num in sorted(new_lines):
+        new_text = new_lines[line_num]
+        if line_num in original_lines:
+            if new_text != original_lines[line_num]:
+                modifications[line_num] = new_text
+            continue
+        anchor = bisect_left(original_sorted, line_num)
+        insert_after = original_sorted[anchor - 1] if anchor else None
+        additions.append((insert_after, line_num, new_text))
 
     return modifications, additions, deletions
 
@@ -325,8 +578,9 @@ def _apply_edits_rebuild(
     original_path: Path, new_lines: Lines, output_path: Path
 ) -> None:
     # Rebuild document from scratch (faster)
-    # Load original document
-    lines, _, paragraph_map = read_docx_with_formatting(original_path)
+    # Original is only read (formatting copied into new doc), so share the template
+    template = docx_template(original_path)
+    lines, paragraph_map = template.parsed.lines, template.parsed.paragraph_map
 
     # Sort line numbers for iteration
     sorted_line_nums = sorted(new_lines.keys())
@@ -341,10 +595,10 @@ def _apply_edits_rebuild(
         if line_num <= max_original_line and line_num in paragraph_map:
             # Preserve existing paragraph formatting
             para = paragraph_map[line_num]
-            paragraphs_to_process.append(("modify", para, new_text))
+            paragraphs_to_process.append(("modify", line_num, para, new_text))
         else:
             # Create new paragraph
-            paragraphs_to_process.append(("new", None, new_text))
+            paragraphs_to_process.append(("new", line_num, None, new_text))
 
     # Create document w/ edits
     new_doc = Document()
@@ -352,7 +606,7 @@ def _apply_edits_rebuild(
     # Note: document styles use defaults
 
     # Process paragraphs sequentially
-    for action, original_para, new_text in paragraphs_to_process:
+    for action, line_num, original_para, new_text in paragraphs_to_process:
         if action == "modify" and original_para:
             # Preserve original formatting
             new_para = new_doc.add_paragraph()
@@ -361,8 +615,8 @@ def _apply_edits_rebuild(
             if original_para.style:
                 new_para.style = original_para.style
             if original_para.paragraph_format:
-                _copy_paragraph_format(
-                    original_para.paragraph_format, new_para.paragraph_format
+                _apply_paragraph_format(
+                    template.paragraph_formats[line_num], new_para.paragraph_format
                 )
 
             # Preserve character formatting via runs
@@ -377,25 +631,22 @@ def _apply_edits_rebuild(
             new_doc.add_paragraph(new_text)
 
     # Persist modified document
-    ensure_parent(output_path)
-    new_doc.save(str(output_path))
+    _save_docx(new_doc, output_path)
 
 
 def _copy_paragraph_format(source_format: Any, target_format: Any) -> None:
     # Copy paragraph formatting properties
-    for prop in dir(source_format):
-        if prop.startswith("_"):
-            continue
-        try:
-            value = getattr(source_format, prop)
-        except Exception:
-            continue
-        if callable(value) or value is None:
-            continue
+    _apply_paragraph_format(_paragraph_format_props(source_format), target_format)
+
+
+def _apply_paragraph_format(
+    props: Tuple[Tuple[str, Any], ...], target_format: Any
+) -> None:
+    for prop, value in props:
         try:
             setattr(target_format, prop, value)
         except Exception:
-            # Handle read-only or unsupported properties
+            # Handle unsupported values
             pass
 
 
@@ -404,9 +655,7 @@ def write_docx(lines: Lines, output_path: Path) -> None:
     doc = Document()
     for line_num in sorted(lines.keys()):
         doc.add_paragraph(lines[line_num])
-    ensure_parent(output_path)
-    doc.save(str(output_path))
-    vlog_file_write(output_path)
+    _save_docx(doc, output_path)
 
 
 # * Write numbered lines to plain text file (.tex or .txt)
@@ -437,6 +686,7 @@ if TYPE_CHECKING:
 _HANDLER_REGISTRY: dict[str, str] = {
     ".tex": "latex",
     ".typ": "typst",
+    ".docx": "docx",
 }
 
 # Cached handler instances (singleton per format)
@@ -461,6 +711,10 @@ def get_handler(path: Path) -> "BaseDocumentHandler":
             from .typst_handler import TypstHandler
 
             _handler_cache[format_key] = TypstHandler()
+        elif format_key == "docx":
+            from .docx_handler import DocxHandler
+
+            _handler_cache[format_key] = DocxHandler()
 
     return _handler_cache[format_key]
 
@@ -0,0 +1,252 @@
+# src/loom_io/docx_handler.py
+# DOCX handler w/ deterministic local section detection from paragraph formatting
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Pattern, Tuple
+
+from ..core.exceptions import DocumentParseError
+from ..core.types import Lines
+from .base_handler import BaseDocumentHandler
+from .docx_patterns import (
+    BULLET_GLYPH_RE,
+    LOW_CONFIDENCE,
+    MAX_HEADING_CHARS,
+    MAX_HEADING_WORDS,
+    SEMANTIC_MATCHERS,
+    ParagraphFeatures,
+    paragraph_features,
+)
+from .shared_patterns import infer_section_kind
+from .template_io import TemplateDescriptor
+from .types import DocumentAnalysis, DocumentSection
+
+# DOCX inline marker is plain paragraph text (e.g. hidden or white "loom-template: x")
+_INLINE_MARKER_RE = re.compile(
+    r"loom-template:\s*(?P<id>[A-Za-z0-9_\-]+)", re.IGNORECASE
+)
+_MARKER_SEARCH_LINES = 30
+
+# minimum heading score for a line to start a section
+_HEADING_THRESHOLD = 0.5
+# headings w/o a recognized section kind need strong formatting (e.g. bold + caps)
+_UNKNOWN_KIND_THRESHOLD = 0.7
+
+_LOW_CONFIDENCE_NOTE = (
+    "Low-confidence DOCX section detection; AI sectionizer recommended"
+)
+
+
+# * Load formatting features keyed by line number (same numbering as read_docx)
+def read_docx_features(path: Path) -> dict[int, ParagraphFeatures]:
+    from .documents import load_docx
+
+    paragraph_map = load_docx(path).paragraph_map
+    return {ln: paragraph_features(p) for ln, p in paragraph_map.items()}
+
+
+def _is_all_caps(text: str) -> bool:
+    letters = [c for c in text if c.isalpha()]
+    return len(letters) >= 3 and all(c.isupper() for c in letters)
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_") or "section"
+
+
+# * Score how likely a line is a section heading (returns score & semantic kind)
+def heading_score(
+    text: str, features: ParagraphFeatures | None = None
+) -> Tuple[float, str | None]:
+    kind = infer_section_kind(text.rstrip(":").strip(), SEMANTIC_MATCHERS)
+
+    if features is not None and features.numbered:
+        return 0.0, kind
+    if BULLET_GLYPH_RE.match(text):
+        return 0.0, kind
+
+    # explicit Heading N style is the strongest signal (Title is the name line)
+    if features is not None and features.heading_level:
+        score = 0.95 if features.heading_level <= 2 else 0.8
+        return score, kind
+
+    words = len(text.split())
+    if (
+        words > MAX_HEADING_WORDS
+        or len(text) > MAX_HEADING_CHARS
+        or text.rstrip().endswith((".", ","))
+    ):
+        return 0.0, kind
+
+    caps = _is_all_caps(text) or bool(features and features.caps)
+    bold = bool(features and features.bold)
+
+    score = 0.0
+    if caps and bold:
+        score = 0.7
+    elif caps:
+        score = 0.55
+    elif bold:
+        score = 0.5
+
+    if kind:
+        # bare semantic heading ("Experience") still counts when it's short
+        score = score + 0.25 if score else (0.5 if words <= 3 else 0.0)
+        if text.rstrip().endswith(":"):
+            score += 0.05
+
+    return min(score, 0.95), kind
+
+
+# * Mean section confidence of payload (0.0 when no sections)
+def payload_confidence(payload: dict) -> float:
+    confidences = [s.get("confidence") or 0.0 for s in payload.get("sections", [])]
+    if not confidences:
+        return 0.0
+    return sum(confidences) / len(confidences)
+
+
+# * Check whether local DOCX sections are trustworthy w/o the AI sectionizer
+def is_confident_payload(payload: dict) -> bool:
+    sections = payload.get("sections", [])
+    if len(sections) < 2:
+        return False
+    if not any(s.get("kind") in SEMANTIC_MATCHERS for s in sections):
+        return False
+    return payload_confidence(payload) >= LOW_CONFIDENCE
+
+
+# handler for Word (.docx) resumes; sections inferred locally from paragraph styles,
+# bold/all-caps runs, numbering properties & heading text
+class DocxHandler(BaseDocumentHandler):
+    format_type = "docx"
+
+    @property
+    def inline_marker_pattern(self) -> Pattern[str]:
+        return _INLINE_MARKER_RE
+
+    @property
+    def inline_marker_max_lines(self) -> int | None:
+        return _MARKER_SEARCH_LINES
+
+    @property
+    def semantic_matchers(self) -> dict[str, Pattern[str]]:
+        return SEMANTIC_MATCHERS
+
+    # * Analyze DOCX lines & detect sections (features=None falls back to text-only)
+    def analyze(
+        self,
+        lines: Lines,
+        descriptor: TemplateDescriptor | None = None,
+        features: dict[int, ParagraphFeatures] | None = None,
+    ) -> DocumentAnalysis:
+        notes: list[str] = []
+        if features is None:
+            notes.append("No DOCX formatting available; using text-only heuristics")
+        feats = features or {}
+
+        line_numbers = sorted(lines)
+        headings: list[Tuple[int, float, str | None]] = []
+        for idx, ln in enumerate(line_numbers):
+            text = lines[ln].strip()
+            score, kind = heading_score(text, feats.get(ln))
+            threshold = _HEADING_THRESHOLD if kind else _UNKNOWN_KIND_THRESHOLD
+            # first line w/o a known kind is the name/contact header, not a section
+            if score < threshold or (idx == 0 and not kind):
+                continue
+            headings.append((ln, score, kind))
+
+        sections: list[DocumentSection] = []
+        seen_keys: dict[str, int] = {}
+        last_line = line_numbers[-1] if line_numbers else 0
+        for i, (ln, score, kind) in enumerate(headings):
+            end = headings[i + 1][0] - 1 if i + 1 < len(headings) else last_line
+            base_key = kind or _slug(lines[ln].rstrip(":"))
+            seen_keys[base_key] = seen_keys.get(base_key, 0) + 1
+            key = (
+                base_key
+                if seen_keys[base_key] == 1
+                else f"{base_key}_{seen_keys[base_key]}"
+            )
+            items = [
+                n
+                for n in range(ln + 1, end + 1)
+                if n in lines
+                and (
+                    (n in feats and feats[n].numbered)
+                    or BULLET_GLYPH_RE.match(lines[n])
+                )
+            ]
+            sections.append(
+                DocumentSection(
+                    key=key,
+                    heading_text=lines[ln].strip(),
+                    start_line=ln,
+                    end_line=end,
+                    confidence=score,
+                    items=items,
+                    source="generic",
+                    kind=kind,
+                )
+            )
+
+        header_lines = [
+            ln for ln in line_numbers if not headings or ln < headings[0][0]
+        ]
+        analysis = DocumentAnalysis(
+            sections=sections,
+            normalized_order=[s.key for s in sections],
+            notes=notes,
+            descriptor=descriptor,
+            format_type="docx",
+            header_lines=header_lines,
+        )
+        if not is_confident_payload(self.sections_to_payload(analysis)):
+            notes.append(_LOW_CONFIDENCE_NOTE)
+        return analysis
+
+    # DOCX paragraphs carry no markup, so no line is structural
+    def is_structural_line(
+        self, line: str, frozen_patterns: list[str] | None = None
+    ) -> bool:
+        return False
+
+    def _validate_edit(
+        self, op: dict, lines: Lines, affected_lines: list[int], notes: list[str]
+    ) -> bool:
+        return True
+
+    # DOCX is validated when opened by python-docx; there is no source syntax
+    def validate_syntax(self, content: str) -> bool:
+        return True
+
+    def validate_compilation(self, content: str) -> Dict[str, Any]:
+        return {"success": True, "errors": [], "warnings": []}
+
+    def check_tool_availability(self) -> Dict[str, bool]:
+        return {}
+
+    # * Build context from DOCX file; text is the paragraph lines (DOCX is binary)
+    def build_context(
+        self, resume_path: Path, lines: Lines, text: str
+    ) -> Tuple[TemplateDescriptor | None, DocumentAnalysis]:
+        descriptor = self.detect_template(resume_path, text)
+        try:
+            features = read_docx_features(resume_path)
+        except DocumentParseError:
+            features = None
+        # formatting only lines up w/ lines read from this same file
+        if features is not None and len(features) != len(lines):
+            features = None
+        return descriptor, self.analyze(lines, descriptor, features)
+
+
+__all__ = [
+    "DocxHandler",
+    "heading_score",
+    "is_confident_payload",
+    "payload_confidence",
+    "read_docx_features",
+]
@@ -0,0 +1,103 @@
+# src/loom_io/docx_patterns.py
+# DOCX pattern constants & paragraph formatting features for local section detection
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from .shared_patterns import COMMON_SEMANTIC_MATCHERS
+
+# * Semantic matchers for inferring resume section type from heading text
+# Extends common matchers w/ sections typical of word-processor resumes
+SEMANTIC_MATCHERS = {
+    **COMMON_SEMANTIC_MATCHERS,
+    "summary": re.compile(
+        r"\bsummary\b|\bobjective\b|\bprofile\b|\babout me\b", re.IGNORECASE
+    ),
+    "awards": re.compile(r"\bawards?\b|\bhonou?rs\b|\bachievements\b", re.IGNORECASE),
+    "languages": re.compile(r"^languages?\b", re.IGNORECASE),
+    "volunteer": re.compile(r"\bvolunteer", re.IGNORECASE),
+    "interests": re.compile(r"\binterests\b|\bhobbies\b", re.IGNORECASE),
+}
+
+# * Built-in paragraph styles: "Heading 1".."Heading 9" & "Title"
+HEADING_STYLE_RE = re.compile(r"^(?:heading\s*(?P<level>\d)|title)$", re.IGNORECASE)
+
+# * Bullet glyphs typed (or pasted) at start of paragraph text
+BULLET_GLYPH_RE = re.compile(r"^\s*[•·▪◦●■‣\-–—*]\s+")
+
+# * Heading shape limits (longer lines are content, not headings)
+MAX_HEADING_WORDS = 6
+MAX_HEADING_CHARS = 60
+
+# * Mean heading confidence below which local analysis defers to the AI sectionizer
+LOW_CONFIDENCE = 0.6
+
+
+# formatting signals of one DOCX paragraph relevant to heading detection
+@dataclass(frozen=True)
+class ParagraphFeatures:
+    style: str = ""
+    # 1-9 for Heading N styles, 0 for Title, None otherwise
+    heading_level: int | None = None
+    # every non-blank run is bold (directly or via paragraph style)
+    bold: bool = False
+    # every non-blank run has caps/smallCaps run property
+    caps: bool = False
+    # paragraph has numbering properties (bullets or numbered list)
+    numbered: bool = False
+
+
+def _style_chain_has_numbering(style: Any) -> bool:
+    while style is not None:
+        ppr = style.element.pPr
+        if ppr is not None and ppr.numPr is not None:
+            return True
+        style = style.base_style
+    return False
+
+
+# * Extract heading-relevant formatting features from python-docx paragraph
+def paragraph_features(paragraph: Any) -> ParagraphFeatures:
+    style = paragraph.style
+    style_name = (style.name or "") if style is not None else ""
+    match = HEADING_STYLE_RE.match(style_name.strip())
+    level = None
+    if match:
+        level = int(match.group("level")) if match.group("level") else 0
+
+    style_bold = bool(style is not None and style.font.bold)
+    style_caps = bool(
+        style is not None and (style.font.all_caps or style.font.small_caps)
+    )
+    runs = [r for r in paragraph.runs if r.text.strip()]
+    bold = bool(runs) and all(r.bold or (r.bold is None and style_bold) for r in runs)
+    caps = bool(runs) and all(
+        r.font.all_caps or r.font.small_caps or style_caps for r in runs
+    )
+
+    ppr = paragraph._p.pPr
+    numbered = (ppr is not None and ppr.numPr is not None) or (
+        style is not None and _style_chain_has_numbering(style)
+    )
+    return ParagraphFeatures(
+        style=style_name,
+        heading_level=level,
+        bold=bold,
+        caps=caps,
+        numbered=numbered,
+    )
+
+
+__all__ = [
+    "SEMANTIC_MATCHERS",
+    "HEADING_STYLE_RE",
+    "BULLET_GLYPH_RE",
+    "MAX_HEADING_WORDS",
+    "MAX_HEADING_CHARS",
+    "LOW_CONFIDENCE",
+    "ParagraphFeatures",
+    "paragraph_features",
+]
@@ -0,0 +1,115 @@
+# src/loom_io/docx_text.py
+# Streaming DOCX text reader: iterparse over main document part w/o python-docx objects
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+from typing import Iterator
+
+from lxml import etree
+
+from ..core.exceptions import DocumentParseError
+from ..core.types import Lines
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY = f"{_W}body"
+_P = f"{_W}p"
+_TBL = f"{_W}tbl"
+_SDT = f"{_W}sdt"
+_R = f"{_W}r"
+_HYPERLINK = f"{_W}hyperlink"
+_T = f"{_W}t"
+_TAB = f"{_W}tab"
+_PTAB = f"{_W}ptab"
+_BR = f"{_W}br"
+_CR = f"{_W}cr"
+_NO_BREAK_HYPHEN = f"{_W}noBreakHyphen"
+_BR_TYPE = f"{_W}type"
+
+_DEFAULT_MAIN_PART = "word/document.xml"
+
+# run children w/ fixed text equivalents (matches python-docx Run.text)
+_RUN_CHAR = {_TAB: "\t", _PTAB: "\t", _CR: "\n", _NO_BREAK_HYPHEN: "-"}
+
+
+# main document part from package relationships (usually word/document.xml)
+def _main_part_name(zf: zipfile.ZipFile) -> str:
+    try:
+        rels = etree.fromstring(zf.read("_rels/.rels"))
+    except KeyError:
+        return _DEFAULT_MAIN_PART
+    for rel in rels:
+        if rel.get("Type", "").endswith("/officeDocument") and rel.get("Target"):
+            return rel.get("Target").lstrip("/")
+    return _DEFAULT_MAIN_PART
+
+
+def _run_text(run: etree._Element) -> str:
+    parts: list[str] = []
+    for child in run:
+        tag = child.tag
+        if tag == _T:
+            parts.append(child.text or "")
+        elif tag == _BR:
+            # only text-wrapping breaks are newlines; page/column breaks are empty
+            if child.get(_BR_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _RUN_CHAR:
+            parts.append(_RUN_CHAR[tag])
+    return "".join(parts)
+
+
+# paragraph text from direct runs & hyperlink runs (same as python-docx Paragraph.text)
+def _paragraph_text(p: etree._Element) -> str:
+    parts: list[str] = []
+    for child in p:
+        if child.tag == _R:
+            parts.append(_run_text(child))
+        elif child.tag == _HYPERLINK:
+            parts.extend(_run_text(r) for r in child if r.tag == _R)
+    return "".join(parts)
+
+
+# * Yield text of each top-level body paragraph in document order
+# elements are freed as soon as they're read, so memory stays flat on long documents
+def iter_docx_paragraph_text(path: Path) -> Iterator[str]:
+    try:
+        with zipfile.ZipFile(path) as zf:
+            part = _main_part_name(zf)
+            with zf.open(part) as stream:
+                events = etree.iterparse(
+                    stream,
+                    events=("end",),
+                    tag=(_P, _TBL, _SDT),
+                    resolve_entities=False,
+                )
+                for _, elem in events:
+                    parent = elem.getparent()
+                    # paragraphs in tables/content controls aren't resume lines
+                    if parent is None or parent.tag != _BODY:
+                        continue
+                    if elem.tag == _P:
+                        yield _paragraph_text(elem)
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del parent[0]
+    except FileNotFoundError:
+        raise DocumentParseError(f"DOCX file not found: {path}")
+    except zipfile.BadZipFile:
+        raise DocumentParseError(f"Invalid DOCX file (not a valid zip archive): {path}")
+    except (KeyError, etree.XMLSyntaxError) as e:
+        raise DocumentParseError(f"Failed to open DOCX file {path}: {e}") from e
+
+
+# * Numbered non-empty paragraph text, identical to read_docx line numbering
+def read_docx_text(path: Path) -> Lines:
+    lines: Lines = {}
+    for text in iter_docx_paragraph_text(path):
+        text = text.strip()
+        if text:
+            lines[len(lines) + 1] = text
+    return lines
+
+
+__all__ = ["iter_docx_paragraph_text", "read_docx_text"]
@@ -0,0 +1,164 @@
+# src/loom_io/docx_zip.py
+# Zero-copy DOCX package writer: raw-copies unchanged zip members & replaces patched parts
+
+from __future__ import annotations
+
+import os
+import struct
+import tempfile
+import zipfile
+import zlib
+from pathlib import Path
+
+from ..core.exceptions import DocumentParseError
+
+# zip record layouts (APPNOTE 4.3.7, 4.3.12, 4.3.16)
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_LOCAL_SIG = b"PK\x03\x04"
+_CENTRAL_SIG = b"PK\x01\x02"
+_END_SIG = b"PK\x05\x06"
+
+# general purpose flag bits
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+
+_ZIP32_LIMIT = 0xFFFFFFFF
+
+
+def _dos_datetime(date_time: tuple) -> tuple[int, int]:
+    year, month, day, hour, minute, second = date_time
+    return (
+        (hour << 11) | (minute << 5) | (second // 2),
+        ((year - 1980) << 9) | (month << 5) | day,
+    )
+
+
+# raw (still compressed) bytes of member, read straight from source archive
+def _raw_member(fp, info: zipfile.ZipInfo) -> bytes:
+    fp.seek(info.header_offset)
+    header = fp.read(_LOCAL_HEADER.size)
+    if header[:4] != _LOCAL_SIG:
+        raise DocumentParseError(f"Corrupt DOCX member header: {info.filename}")
+    name_len, extra_len = _LOCAL_HEADER.unpack(header)[-2:]
+    fp.seek(info.header_offset + _LOCAL_HEADER.size + name_len + extra_len)
+    return fp.read(info.compress_size)
+
+
+# deflate patched part & build its zip entry (keeps original name, date & attrs)
+def _deflated_member(
+    info: zipfile.ZipInfo, data: bytes
+) -> tuple[zipfile.ZipInfo, bytes]:
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    raw = compressor.compress(data) + compressor.flush()
+    out = zipfile.ZipInfo(info.filename, info.date_time)
+    out.compress_type = zipfile.ZIP_DEFLATED
+    out.external_attr = info.external_attr
+    out.create_system = info.create_system
+    out.CRC = zlib.crc32(data)
+    out.file_size = len(data)
+    out.compress_size = len(raw)
+    return out, raw
+
+
+# * Write source package to output w/ some parts replaced; others copied byte-for-byte
+# untouched members are never decompressed or recompressed (images, fonts, styles...)
+def write_patched_package(
+    source: Path, output: Path, replacements: dict[str, bytes]
+) -> None:
+    output = Path(output)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=output.parent, prefix=f".{output.name}.", suffix=".tmp"
+    )
+    try:
+        with zipfile.ZipFile(source) as zin, os.fdopen(fd, "wb") as out:
+            central: list[bytes] = []
+            for info in zin.infolist():
+                if info.filename in replacements:
+                    info, raw = _deflated_member(info, replacements[info.filename])
+                else:
+                    raw = _raw_member(zin.fp, info)
+                sizes = (info.file_size, info.compress_size, out.tell())
+                if max(sizes) >= _ZIP32_LIMIT:
+                    raise DocumentParseError("DOCX too large for zero-copy writer")
+
+                try:
+                    name = info.filename.encode("ascii")
+                    flags = info.flag_bits & ~_FLAG_UTF8
+                except UnicodeEncodeError:
+                    name = info.filename.encode("utf-8")
+                    flags = info.flag_bits | _FLAG_UTF8
+                # sizes & CRC go in the local header, so no trailing data descriptor
+                flags &= ~_FLAG_DATA_DESCRIPTOR
+                dostime, dosdate = _dos_datetime(info.date_time)
+                offset = out.tell()
+
+                out.write(
+                    _LOCAL_HEADER.pack(
+                        _LOCAL_SIG,
+                        info.extract_version,
+                        flags,
+                        info.compress_type,
+                        dostime,
+                        dosdate,
+                        info.CRC,
+                        info.compress_size,
+                        info.file_size,
+                        len(name),
+                        0,
+                    )
+                )
+                out.write(name)
+                out.write(raw)
+                central.append(
+                    _CENTRAL_HEADER.pack(
+                        _CENTRAL_SIG,
+                        info.create_version,
+                        info.create_system,
+                        info.extract_version,
+                        0,
+                        flags,
+                        info.compress_type,
+                        dostime,
+                        dosdate,
+                        info.CRC,
+                        info.compress_size,
+                        info.file_size,
+                        len(name),
+                        0,
+                        0,
+                        0,
+                        info.internal_attr,
+                        info.external_attr,
+                        offset,
+                    )
+                    + name
+                )
+
+            directory_offset = out.tell()
+            for record in central:
+                out.write(record)
+            out.write(
+                _END_RECORD.pack(
+                    _END_SIG,
+                    0,
+                    0,
+                    len(central),
+                    len(central),
+                    out.tell() - directory_offset,
+                    directory_offset,
+                    0,
+                )
+            )
+        os.replace(tmp_name, output)
+    except zipfile.BadZipFile as e:
+        raise DocumentParseError(
+            f"Invalid DOCX file (not a valid zip archive): {source}"
+        ) from e
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+__all__ = ["write_patched_package"]
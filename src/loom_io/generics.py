@@ -2,8 +2,10 @@
 # Generic utilities for Loom IO operations & filesystem helpers
 
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Iterable, Union
 import json
+import os
+import threading
 
 from ..core.verbose import vlog_file_read, vlog_file_write
 
@@ -17,12 +19,32 @@ def ensure_parent(path: Union[Path, str]) -> None:
 # write JSON w/ UTF-8 encoding, creating parent dirs as needed
 def write_json_safe(obj: dict[str, Any], path: Path) -> None:
     # write JSON safely & create parent dirs
+    # replaced via temp file, never rewritten in place: bulk job files may be hard
+    # links to shared (read-only) artifact store blobs
+    path = Path(path)
     ensure_parent(path)
     content = json.dumps(obj, indent=2)
-    path.write_text(content, encoding="utf-8")
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
     vlog_file_write(path, len(content))
 
 
+# stream text chunks to file w/o building full string in memory; returns chars written
+def write_text_stream(chunks: Iterable[str], path: Path) -> int:
+    ensure_parent(path)
+    written = 0
+    with Path(path).open("w", encoding="utf-8") as f:
+        for chunk in chunks:
+            f.write(chunk)
+            written += len(chunk)
+    vlog_file_write(path, written)
+    return written
+
+
 # read JSON w/ UTF-8 encoding, return dict
 def read_json_safe(path: Path) -> dict[str, Any]:
     from ..core.exceptions import JSONParsingError
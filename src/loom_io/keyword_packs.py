@@ -0,0 +1,194 @@
+# src/loom_io/keyword_packs.py
+# Loading of user keyword packs (TOML/JSON) & content-hash cached compiled matchers
+
+from __future__ import annotations
+
+import hashlib
+import json
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from .generics import read_json_safe, write_json_safe
+from .template_io import find_template_descriptor_path
+from ..core.exceptions import CacheCorruptError, ConfigurationError, JSONParsingError
+from ..core.keyword_matcher import (
+    DEFAULT_MATCHER,
+    MATCHER_FORMAT,
+    MULTI_WORD_TERMS,
+    PREFERRED_LABELS,
+    REQUIRED_LABELS,
+    TECH_PATTERNS,
+    KeywordMatcher,
+    pattern_terms,
+)
+
+KEYWORDS_DIRNAME = "keywords"
+PACK_SUFFIXES = (".toml", ".json")
+
+
+# user vocabulary extending built-in skill keywords
+@dataclass
+class KeywordPack:
+    name: str
+    words: list[str] = field(default_factory=list)
+    phrases: list[str] = field(default_factory=list)
+    # canonical term -> aliases & synonyms (k8s -> Kubernetes)
+    aliases: dict[str, list[str]] = field(default_factory=dict)
+    required_labels: list[str] = field(default_factory=list)
+    preferred_labels: list[str] = field(default_factory=list)
+    source_path: Path | None = None
+
+
+# validate list-of-strings field from raw pack data
+def _string_list(raw: dict[str, Any], key: str, path: Path) -> list[str]:
+    value = raw.get(key, [])
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise ConfigurationError(
+            f"Keyword pack {path}: '{key}' must be list of strings"
+        )
+    return value
+
+
+# * Load & validate single keyword pack (.toml or .json)
+def load_keyword_pack(path: Path) -> KeywordPack:
+    try:
+        if path.suffix.lower() == ".toml":
+            with open(path, "rb") as f:
+                raw = tomllib.load(f)
+        else:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise ConfigurationError(f"Keyword pack not found: {path}")
+    except (tomllib.TOMLDecodeError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ConfigurationError(f"Invalid keyword pack {path}: {e}") from e
+
+    if not isinstance(raw, dict):
+        raise ConfigurationError(f"Keyword pack {path} must be a table/object")
+
+    aliases_raw = raw.get("aliases", {})
+    if not isinstance(aliases_raw, dict):
+        raise ConfigurationError(f"Keyword pack {path}: 'aliases' must be a table")
+    aliases: dict[str, list[str]] = {}
+    for term, values in aliases_raw.items():
+        values = [values] if isinstance(values, str) else values
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise ConfigurationError(
+                f"Keyword pack {path}: aliases for '{term}' must be string or list"
+            )
+        aliases[term] = values
+
+    labels = raw.get("labels", {})
+    if not isinstance(labels, dict):
+        raise ConfigurationError(f"Keyword pack {path}: 'labels' must be a table")
+
+    pack_meta = raw.get("pack", {})
+    return KeywordPack(
+        name=str(pack_meta.get("name") or path.stem),
+        words=_string_list(raw, "words", path),
+        phrases=_string_list(raw, "phrases", path),
+        aliases=aliases,
+        required_labels=_string_list(labels, "required", path),
+        preferred_labels=_string_list(labels, "preferred", path),
+        source_path=path,
+    )
+
+
+# * Pack directories in precedence order: .loom/keywords, then <template dir>/keywords
+def keyword_pack_dirs(loom_dir: Path, resume_path: Path | None = None) -> list[Path]:
+    dirs = [loom_dir / KEYWORDS_DIRNAME]
+    if resume_path is not None:
+        descriptor = find_template_descriptor_path(resume_path)
+        if descriptor is not None:
+            dirs.append(descriptor.parent / KEYWORDS_DIRNAME)
+    return dirs
+
+
+# find pack files in directories (sorted per dir for deterministic merge order)
+def find_keyword_packs(dirs: Iterable[Path]) -> list[Path]:
+    paths: list[Path] = []
+    for directory in dirs:
+        if directory.is_dir():
+            paths.extend(
+                p
+                for p in sorted(directory.iterdir())
+                if p.is_file() and p.suffix.lower() in PACK_SUFFIXES
+            )
+    return paths
+
+
+# * Compile built-in vocabulary plus packs into single matcher
+def build_keyword_matcher(packs: Iterable[KeywordPack]) -> KeywordMatcher:
+    words = pattern_terms(TECH_PATTERNS)
+    phrases = list(MULTI_WORD_TERMS)
+    required = list(REQUIRED_LABELS)
+    preferred = list(PREFERRED_LABELS)
+    aliases: dict[str, list[str]] = {}
+    for pack in packs:
+        words.extend(pack.words)
+        phrases.extend(pack.phrases)
+        required.extend(pack.required_labels)
+        preferred.extend(pack.preferred_labels)
+        for term, values in pack.aliases.items():
+            aliases.setdefault(term, []).extend(values)
+            # canonical term itself is recognized even if pack only lists aliases
+            if " " in term:
+                phrases.append(term)
+            else:
+                words.append(term)
+    return KeywordMatcher(
+        phrases=phrases,
+        words=words,
+        required_labels=required,
+        preferred_labels=preferred,
+        aliases=aliases,
+    )
+
+
+# content hash over matcher format, built-in vocabulary & pack file bytes
+def _packs_digest(pack_paths: list[Path]) -> str:
+    digest = hashlib.sha256(f"format={MATCHER_FORMAT}\n".encode("utf-8"))
+    builtin = [MULTI_WORD_TERMS, TECH_PATTERNS, REQUIRED_LABELS, PREFERRED_LABELS]
+    digest.update(json.dumps(builtin).encode("utf-8"))
+    for path in pack_paths:
+        digest.update(f"\n{path.name}\n".encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# * Load compiled matcher for pack files, reusing on-disk compiled form keyed by content hash
+# no packs -> shared built-in matcher; unreadable/stale cache entries are rebuilt
+def load_keyword_matcher(pack_paths: list[Path], cache_dir: Path) -> KeywordMatcher:
+    if not pack_paths:
+        return DEFAULT_MATCHER
+
+    try:
+        cache_path = cache_dir / f"keywords-{_packs_digest(pack_paths)}.json"
+    except OSError as e:
+        raise ConfigurationError(f"Cannot read keyword pack: {e}") from e
+
+    if cache_path.exists():
+        try:
+            return KeywordMatcher.from_dict(read_json_safe(cache_path))
+        except (CacheCorruptError, JSONParsingError):
+            pass
+
+    matcher = build_keyword_matcher(load_keyword_pack(p) for p in pack_paths)
+    try:
+        write_json_safe(matcher.to_dict(), cache_path)
+    except OSError:
+        # caching is best-effort; matcher is still usable
+        pass
+    return matcher
+
+
+__all__ = [
+    "KEYWORDS_DIRNAME",
+    "KeywordPack",
+    "load_keyword_pack",
+    "keyword_pack_dirs",
+    "find_keyword_packs",
+    "build_keyword_matcher",
+    "load_keyword_matcher",
+]
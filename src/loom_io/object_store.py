@@ -0,0 +1,141 @@
+# src/loom_io/object_store.py
+# Content-addressed artifact store: sha256-named blobs under .loom/objects, hard-linked
+# into bulk job dirs so identical outputs across jobs & re-runs share one copy on disk
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import stat
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..core.verbose import vlog_think
+
+# blobs are read-only so in-place edits of a linked file can't change other runs
+_BLOB_MODE = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+# result of garbage collection pass
+@dataclass
+class GCResult:
+    removed: int = 0
+    freed_bytes: int = 0
+    kept: int = 0
+
+
+# * sha256-addressed blob store (git-like objects/<2 hex>/<62 hex> fan-out)
+# job dirs hold hard links to blobs; blob w/ no other link is garbage
+class ObjectStore:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:]
+
+    # * Store bytes & link them at target; writes nothing if blob already exists
+    def put_bytes(self, data: bytes, target: Path) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            self._write_blob(blob, lambda tmp: tmp.write_bytes(data))
+        if not self._link(blob, target):
+            Path(target).write_bytes(data)
+        return digest
+
+    # * Store copy of source file & link it at target (copy only if blob is new)
+    def put_file(self, source: Path, target: Path) -> str:
+        digest = _file_digest(source)
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            self._write_blob(blob, lambda tmp: shutil.copyfile(source, tmp))
+        if not self._link(blob, target):
+            shutil.copy2(source, target)
+        return digest
+
+    # * Move existing file into store: first copy becomes the blob (no data copy),
+    # later identical files are swapped for links to it. None if linking unsupported
+    def adopt(self, path: Path) -> str | None:
+        path = Path(path)
+        digest = _file_digest(path)
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path, blob)
+            except FileExistsError:
+                pass  # stored concurrently by another job
+            except OSError:
+                return None  # cross-device or no hard link support
+            else:
+                os.chmod(blob, _BLOB_MODE)
+                return digest
+        if os.path.samefile(blob, path):
+            return digest
+        return digest if self._link(blob, path) else None
+
+    # * Adopt every regular file directly inside directory; returns adopted count
+    def adopt_dir(self, directory: Path) -> int:
+        adopted = 0
+        for path in sorted(Path(directory).iterdir()):
+            if path.is_file() and not path.is_symlink():
+                adopted += self.adopt(path) is not None
+        return adopted
+
+    # * Remove blobs no job dir links to anymore (link count 1 = store only)
+    # ! a blob is briefly unlinked while a bulk run stores it; don't gc mid-run
+    def gc(self, dry_run: bool = False) -> GCResult:
+        result = GCResult()
+        if not self.root.is_dir():
+            return result
+        for fanout in sorted(self.root.iterdir()):
+            if not fanout.is_dir() or len(fanout.name) != 2:
+                continue
+            for blob in fanout.iterdir():
+                if blob.name.startswith("."):
+                    continue  # in-flight temp file
+                st = blob.stat()
+                if st.st_nlink > 1:
+                    result.kept += 1
+                    continue
+                result.removed += 1
+                result.freed_bytes += st.st_size
+                if not dry_run:
+                    blob.unlink()
+            if not dry_run and not any(fanout.iterdir()):
+                fanout.rmdir()
+        return result
+
+    # write new blob via temp file so readers never see partial content
+    def _write_blob(self, blob: Path, write) -> None:
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_name(f".{blob.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            write(tmp)
+            os.chmod(tmp, _BLOB_MODE)
+            os.replace(tmp, blob)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    # atomically replace target w/ hard link to blob; False if linking unsupported
+    def _link(self, blob: Path, target: Path) -> bool:
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex}.lnk")
+        try:
+            os.link(blob, tmp)
+        except OSError:
+            return False
+        os.replace(tmp, target)
+        vlog_think(f"Linked {target.name} -> object {blob.parent.name}{blob.name[:8]}")
+        return True
+
+
+def _file_digest(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+__all__ = ["ObjectStore", "GCResult"]
@@ -0,0 +1,79 @@
+# src/loom_io/result_journal.py
+# Append-only JSONL journal of bulk results: one fsync'd line per finished job so a
+# crash or Ctrl-C loses at most the job in flight
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator, Optional, TextIO
+
+from ..core.bulk_types import JobResult
+
+# journal file inside each bulk run dir
+JOURNAL_NAME = "results.jsonl"
+
+
+# * Durable append-only writer; entries are {"type": "job", "stage", "result"} per
+# finished pass & {"type": "cascade", "summary"} once cascade runs complete
+# ! not thread-safe; bulk runner appends from its coordinating thread only
+class ResultJournal:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file: Optional[TextIO] = None
+
+    # * Append entry & fsync before returning so it survives a crash right after
+    def append(self, entry: dict[str, Any]) -> None:
+        line = json.dumps(entry, separators=(",", ":"), default=str)
+        handle = self._open()
+        handle.write(line + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+
+    # append job result for pass stage ("triage" results are superseded by "final")
+    def append_result(self, result: JobResult, stage: str = "final") -> None:
+        self.append({"type": "job", "stage": stage, "result": result.to_dict()})
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> ResultJournal:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # open for append; terminate torn line left by a crash so new entries stay whole
+    def _open(self) -> TextIO:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            torn = False
+            if self.path.exists() and self.path.stat().st_size:
+                with open(self.path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    torn = f.read(1) != b"\n"
+            self._file = open(self.path, "a", encoding="utf-8")
+            if torn:
+                self._file.write("\n")
+        return self._file
+
+
+# * Stream journal entries in write order; unparseable (torn) lines are skipped
+def read_journal(path: Path) -> Iterator[dict[str, Any]]:
+    path = Path(path)
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+__all__ = ["ResultJournal", "read_journal", "JOURNAL_NAME"]
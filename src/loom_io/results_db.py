@@ -0,0 +1,234 @@
+# src/loom_io/results_db.py
+# SQLite index of bulk job results under .loom/ for filtering, ranking & aggregation
+# across runs; queries run in SQL w/ LIMIT so results are never all loaded at once
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from ..core.bulk_types import BulkResult, JobStatus
+from ..core.exceptions import ConfigurationError
+
+# bump w/ schema changes; older databases are rebuilt (results re-indexed on demand)
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_dir TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    resume TEXT,
+    resume_hash TEXT,
+    model TEXT,
+    settings TEXT
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    run_dir TEXT NOT NULL REFERENCES runs(run_dir) ON DELETE CASCADE,
+    job_id TEXT NOT NULL,
+    name TEXT,
+    company TEXT,
+    content_hash TEXT,
+    model TEXT,
+    status TEXT NOT NULL,
+    fit_score REAL NOT NULL,
+    prerank_score REAL,
+    required_matched INTEGER NOT NULL,
+    required_total INTEGER NOT NULL,
+    preferred_matched INTEGER NOT NULL,
+    preferred_total INTEGER NOT NULL,
+    edits_total INTEGER NOT NULL,
+    inserts INTEGER NOT NULL,
+    replacements INTEGER NOT NULL,
+    deletes INTEGER NOT NULL,
+    lines_touched INTEGER NOT NULL,
+    warnings INTEGER NOT NULL,
+    unsafe_claims INTEGER NOT NULL,
+    keyword_stuffing_score REAL NOT NULL,
+    runtime_seconds REAL NOT NULL,
+    duplicate_of TEXT,
+    rebased INTEGER NOT NULL,
+    reused_from TEXT,
+    timestamp TEXT NOT NULL,
+    PRIMARY KEY (run_dir, job_id)
+);
+CREATE INDEX IF NOT EXISTS jobs_status_fit ON jobs(status, fit_score DESC);
+CREATE INDEX IF NOT EXISTS jobs_company_fit ON jobs(company, fit_score DESC);
+CREATE INDEX IF NOT EXISTS jobs_model ON jobs(model);
+CREATE INDEX IF NOT EXISTS jobs_timestamp ON jobs(timestamp);
+"""
+
+# aggregate group keys -> SQL expression
+GROUP_KEYS = {
+    "company": "COALESCE(j.company, '')",
+    "model": "COALESCE(j.model, '')",
+    "run": "r.name",
+}
+
+
+# filters shared by ranking & aggregate queries (None = no filter)
+@dataclass
+class ResultQuery:
+    # case-insensitive substring of company
+    company: Optional[str] = None
+    model: Optional[str] = None
+    # ISO timestamp lower bound on run start
+    since: Optional[str] = None
+    min_score: Optional[float] = None
+    # run dir name (bulk_<timestamp>)
+    run: Optional[str] = None
+    status: Optional[str] = JobStatus.SUCCESS.value
+
+    # WHERE clause & parameters over jobs j JOIN runs r
+    def where(self) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if self.status is not None:
+            clauses.append("j.status = ?")
+            params.append(self.status)
+        if self.company is not None:
+            clauses.append("j.company LIKE ? ESCAPE '\\'")
+            params.append(f"%{_escape_like(self.company)}%")
+        if self.model is not None:
+            clauses.append("j.model = ?")
+            params.append(self.model)
+        if self.since is not None:
+            clauses.append("j.timestamp >= ?")
+            params.append(self.since)
+        if self.min_score is not None:
+            clauses.append("j.fit_score >= ?")
+            params.append(self.min_score)
+        if self.run is not None:
+            clauses.append("r.name = ?")
+            params.append(self.run)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+# * Results database: one row per (run dir, job), upserted when a run finishes
+class ResultsDB:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    # * Index run's results (replaces earlier rows of same run); returns job count
+    def record_run(self, result: BulkResult, run_meta: dict[str, Any]) -> int:
+        run_dir = str(Path(result.output_dir).resolve())
+        timestamp = run_meta.get("timestamp") or result.timestamp
+        job_meta = run_meta.get("jobs", {})
+        rows = [
+            (
+                run_dir,
+                job.spec.id,
+                job.spec.name,
+                job.spec.company,
+                job_meta.get(job.spec.id, {}).get("content_hash"),
+                job.model,
+                job.status.value,
+                job.fit_score,
+                job.prerank_score,
+                job.coverage.required_matched,
+                job.coverage.required_total,
+                job.coverage.preferred_matched,
+                job.coverage.preferred_total,
+                job.edits.total_count,
+                job.edits.inserts,
+                job.edits.replacements,
+                job.edits.deletes,
+                job.edits.lines_touched,
+                job.validation.total_warnings,
+                job.validation.unsafe_claims,
+                job.keyword_stuffing_score,
+                job.runtime_seconds,
+                job.duplicate_of,
+                int(job.rebased),
+                job.reused_from,
+                timestamp,
+            )
+            for job in result.jobs
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM jobs WHERE run_dir = ?", (run_dir,))
+            conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_dir,
+                    Path(run_dir).name,
+                    timestamp,
+                    str(result.resume_path),
+                    run_meta.get("resume_hash"),
+                    result.model,
+                    json.dumps(run_meta.get("settings", {}), sort_keys=True),
+                ),
+            )
+            conn.executemany(f"INSERT INTO jobs VALUES ({', '.join('?' * 26)})", rows)
+        return len(rows)
+
+    # * Best jobs by fit score; per_company keeps only each company's top N
+    def top_jobs(
+        self,
+        query: ResultQuery,
+        limit: int = 20,
+        per_company: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        where, params = query.where()
+        select = (
+            f"SELECT j.*, r.name AS run FROM jobs j JOIN runs r USING (run_dir){where}"
+        )
+        if per_company is not None:
+            select = (
+                "SELECT * FROM (SELECT ranked.*, ROW_NUMBER() OVER ("
+                "PARTITION BY COALESCE(company, '') ORDER BY fit_score DESC"
+                f") AS company_rank FROM ({select}) AS ranked) WHERE company_rank <= ?"
+            )
+            params.append(per_company)
+        sql = f"{select} ORDER BY fit_score DESC, timestamp DESC LIMIT ?"
+        return self._fetch(sql, [*params, limit])
+
+    # * Per-group counts & fit score / runtime stats, best average fit first
+    def aggregate(
+        self, query: ResultQuery, by: str = "company", limit: int = 20
+    ) -> list[dict[str, Any]]:
+        if by not in GROUP_KEYS:
+            raise ConfigurationError(
+                f"Unknown group '{by}' (expected one of: {', '.join(GROUP_KEYS)})"
+            )
+        where, params = query.where()
+        sql = (
+            f"SELECT {GROUP_KEYS[by]} AS key, COUNT(*) AS jobs, "
+            "AVG(j.fit_score) AS avg_fit, MAX(j.fit_score) AS max_fit, "
+            "SUM(j.runtime_seconds) AS runtime_seconds "
+            f"FROM jobs j JOIN runs r USING (run_dir){where} "
+            "GROUP BY key ORDER BY avg_fit DESC, jobs DESC LIMIT ?"
+        )
+        return self._fetch(sql, [*params, limit])
+
+    def _fetch(self, sql: str, params: list[Any]) -> list[dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        with closing(self._connect()) as conn:
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in conn.execute(sql, params)]
+
+    # open database, creating or rebuilding schema when version differs
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA foreign_keys = ON")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS jobs")
+                conn.execute("DROP TABLE IF EXISTS runs")
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        return conn
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+__all__ = ["ResultsDB", "ResultQuery", "GROUP_KEYS"]
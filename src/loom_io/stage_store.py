@@ -0,0 +1,50 @@
+# src/loom_io/stage_store.py
+# On-disk memo of tailoring pipeline stage outputs keyed by stage content hash
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from ..core.verbose import vlog_think
+
+
+# JSON payload per (stage, key) under <loom_dir>/stages/<stage>/<key>.json
+class StageStore:
+    def __init__(self, root: Path, enabled: bool = True):
+        self.root = Path(root)
+        self.enabled = enabled
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.root / stage / f"{key}.json"
+
+    # * Stored output of stage for key (None if disabled, missing or corrupt)
+    def get(self, stage: str, key: str) -> dict[str, Any] | None:
+        if not self.enabled:
+            return None
+        path = self._path(stage, key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            # corrupted entry - drop it & recompute
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(payload, dict):
+            path.unlink(missing_ok=True)
+            return None
+        vlog_think(f"Stage memo hit: {stage} [{key}]")
+        return payload
+
+    # * Persist stage output atomically so readers never see partial entries
+    def put(self, stage: str, key: str, payload: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        path = self._path(stage, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, path)
@@ -11,11 +11,12 @@ from ...loom_io import (
     apply_edits_to_docx,
     write_docx,
     write_text_lines,
-    ensure_parent,
+    write_text_stream,
 )
 from ...loom_io.console import console
 from ...core.types import Lines
-from ...core.pipeline import diff_lines
+from ...core.line_diff import DiffHunk, diff_hunks, iter_unified_diff
+from ...core.stage_graph import STAGE_HIT, STAGE_INPUTS, STAGE_MISS, StageRecord
 from ...core.exceptions import LaTeXError
 from ..theming.theme_engine import styled_checkmark, styled_arrow, success_gradient
 
@@ -43,6 +44,18 @@ def persist_edits_json(
     progress.advance(task)
 
 
+# " (+a -r in n hunks)" suffix for diff lines when output hunks are known
+def _diff_stats(hunks: list[DiffHunk] | None) -> str:
+    if hunks is None:
+        return ""
+    if not hunks:
+        return " (no changes)"
+    added = sum(h.added for h in hunks)
+    removed = sum(h.removed for h in hunks)
+    noun = "hunk" if len(hunks) == 1 else "hunks"
+    return f" (+{added} -{removed} in {len(hunks)} {noun})"
+
+
 # * Report results consistently across commands to the console
 def report_result(
     result_type: str, settings: LoomSettings | None = None, **paths
@@ -58,8 +71,9 @@ def report_result(
         console.print(f"   Edits {arrow} {paths['edits_path']}", style="loom.accent2")
         console.print(f"   Resume {arrow} {paths['output_path']}", style="loom.accent2")
         if settings:
+            stats = _diff_stats(paths.get("hunks"))
             console.print(
-                f"   Diff {arrow} {settings.diff_path}", style="progress.path"
+                f"   Diff {arrow} {settings.diff_path}{stats}", style="progress.path"
             )
     elif result_type == "apply":
         out_path = Path(paths["output_path"])
@@ -74,8 +88,11 @@ def report_result(
             _print_success_line("Wrote text", out_path)
         if settings:
             checkmark = styled_checkmark()
+            stats = _diff_stats(paths.get("hunks"))
             console.print(
-                checkmark, f"Diff {arrow} {settings.diff_path}", style="loom.accent2"
+                checkmark,
+                f"Diff {arrow} {settings.diff_path}{stats}",
+                style="loom.accent2",
             )
     elif result_type == "plan":
         _print_success_line("Wrote edits", paths["edits_path"])
@@ -87,6 +104,7 @@ def report_result(
 
 
 # * Generate diff & write tailored resume output w/ formatting preservation
+# returns diff hunks so callers can reuse them w/o re-diffing
 def write_output_with_diff(
     settings: LoomSettings,
     resume_path: Path,
@@ -97,12 +115,11 @@ def write_output_with_diff(
     preserve_mode: str,
     progress,
     task,
-) -> None:
-    # generate diff
+) -> list[DiffHunk]:
+    # generate diff & stream hunks to disk (no full diff string held in memory)
     progress.update(task, description="Generating diff...")
-    diff = diff_lines(resume_lines, new_lines)
-    ensure_parent(settings.diff_path)
-    settings.diff_path.write_text(diff, encoding="utf-8")
+    hunks = diff_hunks(resume_lines, new_lines)
+    write_text_stream(iter_unified_diff(hunks), settings.diff_path)
     progress.advance(task)
 
     # write output
@@ -139,3 +156,22 @@ def write_output_with_diff(
             )
         else:
             raise  # re-raise non-LaTeX errors as-is
+
+    return hunks
+
+
+# * Print which pipeline stages were reused from memo vs recomputed (--explain)
+def report_stage_trace(trace: list[StageRecord], enabled: bool = True) -> None:
+    console.print()
+    console.print("[bold]Pipeline stages[/]")
+    if not enabled:
+        console.print("[dim]   Stage memo bypassed (--no-cache)[/]")
+    styles = {STAGE_HIT: "green", STAGE_MISS: "yellow"}
+    for record in trace:
+        style = styles.get(record.status, "dim")
+        inputs = ", ".join(STAGE_INPUTS.get(record.stage, ()))
+        console.print(
+            f"   [{style}]{record.status:<4}[/] {record.stage:<8} "
+            f"[dim]{record.key or '-'}  <- {inputs}[/]"
+        )
+    console.print("   [dim]run  write    always runs (output & diff files)[/]")
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import random
 import string
+import time
 from typing import List, Dict
 
 import pytest
@@ -108,3 +109,42 @@ def test_apply_edits_large_input_many_ops() -> None:
     # ensure overall size stayed within a plausible bound (not exploding)
     # baseline +/- inserts/deletes/replacements — just guardrail against runaway growth
     assert 1500 <= len(result) <= 2600
+
+
+# * Mixed ops spread over doc, each anchored on distinct original line
+def _spread_ops(total_lines: int, count: int, rng: random.Random) -> List[Dict]:
+    anchors = rng.sample(range(1, total_lines - 5), count)
+    ops: List[Dict] = []
+    for i, line in enumerate(anchors):
+        kind = i % 4
+        if kind == 0:
+            ops.append({"op": "replace_line", "line": line, "text": f"R{line}"})
+        elif kind == 1:
+            ops.append({"op": "insert_after", "line": line, "text": "a\nb"})
+        elif kind == 2:
+            ops.append(
+                {"op": "replace_range", "start": line, "end": line, "text": "x\ny\nz"}
+            )
+        else:
+            ops.append({"op": "delete_range", "start": line, "end": line})
+    return ops
+
+
+@pytest.mark.slow
+# * Benchmark: 100k lines & 10k ops applied in well under a second
+def test_apply_edits_100k_lines_10k_ops() -> None:
+    rng = random.Random(100)
+    total_lines = 100_000
+    resume_lines: Lines = {i: f"Line {i}" for i in range(1, total_lines + 1)}
+    edits = {"version": 1, "ops": _spread_ops(total_lines, 10_000, rng)}
+
+    start = time.perf_counter()
+    result = apply_edits(resume_lines, edits)
+    elapsed = time.perf_counter() - start
+
+    # replace_line: +0, insert_after: +2, replace_range 1->3: +2, delete: -1
+    assert len(result) == total_lines + 2500 * 3
+    assert sorted(result) == list(range(1, len(result) + 1))
+    assert result[len(result)] == f"Line {total_lines}"
+    # per-op shifting takes minutes at this size; merge pass is linear
+    assert elapsed < 2.0
@@ -0,0 +1,63 @@
+# tests/stress/test_docx_reader_stress.py
+# Micro-benchmark for streaming DOCX text reader vs. python-docx object model
+
+from __future__ import annotations
+
+import random
+import time
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from src.loom_io.documents import _index_docx
+from src.loom_io.docx_text import read_docx_text
+
+_WORDS = (
+    "designed built shipped scalable services python kubernetes reliability "
+    "customers latency pipeline migration team mentored reduced cost platform"
+).split()
+
+
+# * Multi-page resume-like DOCX: headings, multi-run bullets & skills tables
+def _write_large_docx(path: Path, pages: int, rng: random.Random) -> Path:
+    doc = Document()
+    for page in range(pages):
+        doc.add_heading(f"Experience {page}", level=1)
+        for _ in range(40):
+            para = doc.add_paragraph(style="List Bullet")
+            for _ in range(3):
+                run = para.add_run(" ".join(rng.choices(_WORDS, k=6)) + " ")
+                run.bold = rng.random() < 0.3
+        table = doc.add_table(rows=2, cols=3)
+        for cell in table._cells:
+            cell.text = rng.choice(_WORDS)
+    doc.save(str(path))
+    return path
+
+
+# best-of-N wall time for fn(path)
+def _best_seconds(fn, path: Path, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.slow
+# * Streaming reader matches & beats full object model on a 50-page DOCX
+def test_read_50_page_docx(tmp_path) -> None:
+    path = _write_large_docx(tmp_path / "large.docx", 50, random.Random(11))
+
+    def model(p: Path) -> dict:
+        return _index_docx(Document(str(p))).lines
+
+    assert read_docx_text(path) == model(path)
+
+    full = _best_seconds(model, path)
+    streamed = _best_seconds(read_docx_text, path)
+
+    print(f"\n50 pages: model {full * 1e3:.1f}ms, streamed {streamed * 1e3:.1f}ms")
+    assert streamed < full * 0.5
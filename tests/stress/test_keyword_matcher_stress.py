@@ -0,0 +1,107 @@
+# tests/stress/test_keyword_matcher_stress.py
+# Micro-benchmark for compiled keyword extraction vs. per-line pattern scan
+
+from __future__ import annotations
+
+import random
+import re
+import time
+
+import pytest
+
+from src.core.comparison_matrix import calculate_keyword_coverage
+from src.core.keyword_matcher import (
+    DEFAULT_MATCHER,
+    MULTI_WORD_TERMS,
+    PREFERRED_LABELS,
+    REQUIRED_LABELS,
+    TECH_PATTERNS,
+)
+
+_FILLER = (
+    "we are looking for an engineer to join our team and help build reliable "
+    "scalable products for customers across the world with ownership and care"
+).split()
+_TERMS = ["Python", "Kubernetes", "AWS", "PostgreSQL", "machine learning", "React"]
+
+
+# * Posting generator: ~70 char lines, sparse vocabulary hits & section labels
+def _random_posting(rng: random.Random, size: int) -> str:
+    lines: list[str] = []
+    total = 0
+    while total < size:
+        words = [rng.choice(_FILLER) for _ in range(11)]
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(_TERMS))
+        if rng.random() < 0.05:
+            words.insert(0, rng.choice(REQUIRED_LABELS + PREFERRED_LABELS) + ":")
+        line = " ".join(words)
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)
+
+
+# per-line scan that the compiled matcher replaces (timing baseline)
+def _per_line_extract(job_text: str) -> None:
+    in_required = True
+    found: tuple[set[str], set[str]] = (set(), set())
+    for line in job_text.split("\n"):
+        line_lower = line.lower()
+        if any(kw in line_lower for kw in REQUIRED_LABELS):
+            in_required = True
+        elif any(kw in line_lower for kw in PREFERRED_LABELS):
+            in_required = False
+        target = found[0] if in_required else found[1]
+        for term in MULTI_WORD_TERMS:
+            if term in line_lower:
+                target.add(term)
+        for pattern in TECH_PATTERNS:
+            target.update(re.findall(pattern, line, re.IGNORECASE))
+
+
+# best-of-N wall time for fn over postings, per posting
+def _per_job_seconds(fn, postings: list[str], repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for posting in postings:
+            fn(posting)
+        best = min(best, time.perf_counter() - start)
+    return best / len(postings)
+
+
+@pytest.mark.slow
+# * Compiled matcher beats per-line scan on a single 100KB posting
+def test_extract_100kb_posting() -> None:
+    posting = _random_posting(random.Random(7), 100_000)
+
+    baseline = _per_job_seconds(_per_line_extract, [posting])
+    compiled = _per_job_seconds(DEFAULT_MATCHER.extract, [posting])
+
+    print(
+        f"\n100KB posting: per-line {baseline * 1e3:.1f}ms, "
+        f"compiled {compiled * 1e3:.1f}ms"
+    )
+    assert compiled < baseline
+
+
+@pytest.mark.slow
+# * Extraction & coverage over 10k typical postings beats per-line extraction alone
+def test_extract_10k_posting_corpus() -> None:
+    rng = random.Random(11)
+    postings = [_random_posting(rng, 3_000) for _ in range(10_000)]
+    resume = _random_posting(rng, 5_000)
+
+    def extract_and_cover(posting: str) -> None:
+        required, preferred = DEFAULT_MATCHER.extract(posting)
+        calculate_keyword_coverage(resume, required, preferred)
+
+    baseline = _per_job_seconds(_per_line_extract, postings[:1_000])
+    compiled = _per_job_seconds(extract_and_cover, postings, repeats=1)
+
+    print(
+        f"\n10k postings: per-line {baseline * 1e6:.0f}us/job, "
+        f"compiled+coverage {compiled * 1e6:.0f}us/job"
+    )
+    assert compiled < baseline
+    assert compiled * len(postings) < 10.0
@@ -0,0 +1,41 @@
+# tests/stress/test_prerank_stress.py
+# Slow stress test for TF-IDF pre-ranking over large posting corpora
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from src.core.prerank import score_against_query, select_ranked
+
+pytest.importorskip("numpy")
+
+_VOCAB = (
+    "python java kubernetes docker terraform react django flask postgresql redis "
+    "kafka aws gcp azure graphql rest microservices backend frontend platform data "
+    "pipeline analytics security compliance mentoring leadership scalable reliable"
+).split()
+
+
+# * Random posting generator w/ shared tech vocabulary
+def _random_posting(rng: random.Random, words: int = 300) -> str:
+    return " ".join(rng.choice(_VOCAB) for _ in range(words))
+
+
+@pytest.mark.slow
+# * Scoring 10k postings completes within a few seconds
+def test_prerank_10k_postings() -> None:
+    rng = random.Random(42)
+    postings = [_random_posting(rng) for _ in range(10_000)]
+    resume = _random_posting(rng, words=600)
+
+    start = time.perf_counter()
+    scores = score_against_query(resume, postings)
+    ranked = select_ranked([str(i) for i in range(len(postings))], scores, top_k=50)
+    elapsed = time.perf_counter() - start
+
+    assert len(scores) == 10_000
+    assert len(ranked) == 50
+    assert elapsed < 10.0
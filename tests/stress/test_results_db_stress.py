@@ -0,0 +1,57 @@
+# tests/stress/test_results_db_stress.py
+# Benchmark for results index queries over tens of thousands of bulk job results
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from src.core.bulk_types import BulkResult, JobResult, JobSpec, JobStatus
+from src.loom_io.results_db import ResultQuery, ResultsDB
+
+
+@pytest.mark.slow
+# * Ranking, per-company top N & aggregation stay fast over 20k indexed results
+def test_queries_over_20k_results(tmp_path) -> None:
+    rng = random.Random(7)
+    db = ResultsDB(tmp_path / "results.db")
+    start = time.perf_counter()
+    for run in range(50):
+        jobs = [
+            JobResult(
+                spec=JobSpec(
+                    path=tmp_path / f"{i}.txt", id=f"job_{i}", company=f"Co {i % 300}"
+                ),
+                status=JobStatus.SUCCESS,
+                model=("gpt-5", "gpt-5-mini")[i % 2],
+                fit_score=rng.random(),
+            )
+            for i in range(400)
+        ]
+        db.record_run(
+            BulkResult(
+                resume_path=tmp_path / "resume.docx",
+                model="gpt-5",
+                timestamp=f"2025-01-{run % 28 + 1:02d}T09:00:00",
+                output_dir=tmp_path / f"bulk_{run}",
+                jobs=jobs,
+            ),
+            {"timestamp": f"2025-01-{run % 28 + 1:02d}T09:00:00"},
+        )
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    top = db.top_jobs(ResultQuery(min_score=0.5), limit=20)
+    per_company = db.top_jobs(
+        ResultQuery(since="2025-01-15"), limit=50, per_company=1
+    )
+    groups = db.aggregate(ResultQuery(), by="company", limit=300)
+    queried = time.perf_counter() - start
+
+    print(f"\nindex 20k results: {indexed * 1e3:.0f}ms, queries: {queried * 1e3:.1f}ms")
+    assert top[0]["fit_score"] >= top[-1]["fit_score"] >= 0.5
+    assert len({row["company"] for row in per_company}) == len(per_company) == 50
+    assert len(groups) == 300 and sum(g["jobs"] for g in groups) == 20000
+    assert queried < 1.0
@@ -271,7 +271,7 @@ def create_error_mock(mock_ai: DeterministicMockAI, scenario: str):
 # * Get patch path for AI calls in specific command
 def get_ai_patch_path(command: str) -> str:
     if command == "sectionize":
-        return "src.cli.commands.sectionize.run_generate"
+        return "src.core.pipeline.run_generate"
     elif command == "tailor":
         return "src.core.pipeline.run_generate"
     else:
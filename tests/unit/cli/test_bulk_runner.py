@@ -0,0 +1,490 @@
+# tests/unit/cli/test_bulk_runner.py
+# Unit tests for bulk runner orchestration (cascade, dedup, packs, rebase, lazy &
+# incremental mode, result journal & index)
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from src.cli.app import app
+from src.cli.bulk_runner import BulkRunner, BulkConfig, results_db
+from src.config.settings import LoomSettings
+from src.core.constants import RiskLevel
+from src.core.bulk_types import JobSpec, JobResult, JobStatus, DuplicateCluster
+from src.loom_io.bulk_io import job_content_hash
+from src.loom_io.results_db import ResultQuery
+
+TRIAGE_SCORES = {"a": 0.9, "b": 0.2, "c": 0.7}
+FINAL_SCORES = {"a": 0.95, "c": 0.8}
+
+
+def _make_runner(tmp_path: Path, **overrides) -> BulkRunner:
+    overrides.setdefault("triage_model", "gpt-5-nano")
+    config = BulkConfig(
+        resume=tmp_path / "resume.docx",
+        jobs_path=tmp_path,
+        model="gpt-5",
+        output_dir=tmp_path / "out",
+        **overrides,
+    )
+    return BulkRunner(config, LoomSettings())
+
+
+# fake per-job processing: score by model tier, fail final pass for "c" on demand
+def _fake_process(fail_final: set[str] = frozenset()):
+    def process(spec, output_dir, settings_snapshot, model=None):
+        is_final = model == "gpt-5"
+        if is_final and spec.id in fail_final:
+            return JobResult(
+                spec=spec, status=JobStatus.FAILED, error="boom", model=model
+            )
+        scores = FINAL_SCORES if is_final else TRIAGE_SCORES
+        return JobResult(
+            spec=spec,
+            status=JobStatus.SUCCESS,
+            fit_score=scores[spec.id],
+            runtime_seconds=10.0 if is_final else 1.0,
+            model=model,
+            output_dir=output_dir,
+        )
+
+    return process
+
+
+def _specs_and_dirs(tmp_path: Path):
+    specs = [JobSpec(path=tmp_path / f"{j}.txt", id=j) for j in "abc"]
+    dirs = {s.id: tmp_path / "out" / s.id for s in specs}
+    return specs, dirs
+
+
+class TestCascade:
+    # * Promoted jobs are re-tailored w/ final model & record both passes
+    def test_promotes_top_jobs(self, tmp_path, monkeypatch):
+        runner = _make_runner(tmp_path, cascade_top=2)
+        monkeypatch.setattr(runner, "_process_single_job", _fake_process())
+        specs, dirs = _specs_and_dirs(tmp_path)
+
+        results, cascade = runner._run_cascade(specs, dirs, {})
+
+        by_id = {r.spec.id: r for r in results}
+        assert [r.spec.id for r in results] == ["a", "b", "c"]
+        assert by_id["a"].model == "gpt-5"
+        assert [p.stage for p in by_id["a"].passes] == ["triage", "final"]
+        assert by_id["a"].passes[0].output_dir == dirs["a"] / "triage"
+        assert by_id["b"].model == "gpt-5-nano"
+        assert [p.stage for p in by_id["b"].passes] == ["triage"]
+        assert cascade.promoted == 2
+        assert cascade.final_passes_avoided == 1
+
+    # * Failed final pass falls back to triage result w/ both passes recorded
+    def test_failed_final_falls_back_to_triage(self, tmp_path, monkeypatch):
+        runner = _make_runner(tmp_path, cascade_threshold=0.5)
+        monkeypatch.setattr(
+            runner, "_process_single_job", _fake_process(fail_final={"c"})
+        )
+        specs, dirs = _specs_and_dirs(tmp_path)
+
+        results, _ = runner._run_cascade(specs, dirs, {})
+
+        c = next(r for r in results if r.spec.id == "c")
+        assert c.status == JobStatus.SUCCESS
+        assert c.model == "gpt-5-nano"
+        assert [p.status for p in c.passes] == [JobStatus.SUCCESS, JobStatus.FAILED]
+
+
+class TestDuplicateReuse:
+    # * Members reuse representative outputs & are scored against own posting
+    def test_member_reuses_representative(self, tmp_path):
+        runner = _make_runner(tmp_path, triage_model=None)
+        specs, dirs = _specs_and_dirs(tmp_path)
+        for spec in specs:
+            spec.path.write_text("Required: Python, Kubernetes")
+        for d in dirs.values():
+            d.mkdir(parents=True)
+        (dirs["a"] / "tailored_resume.txt").write_text("Python developer")
+        (dirs["a"] / "edits.json").write_text("{}")
+        representative = JobResult(
+            spec=specs[0],
+            status=JobStatus.SUCCESS,
+            model="gpt-5",
+            output_dir=dirs["a"],
+            edits_path=dirs["a"] / "edits.json",
+            resume_path=dirs["a"] / "tailored_resume.txt",
+        )
+        other = JobResult(spec=specs[1], status=JobStatus.SUCCESS)
+        cluster = DuplicateCluster(representative="a", members=["c"])
+
+        results = runner._reuse_duplicate_outputs(
+            [representative, other], [cluster], specs, dirs, {}
+        )
+
+        assert [r.spec.id for r in results] == ["a", "b", "c"]
+        member = results[2]
+        assert member.status == JobStatus.SUCCESS
+        assert member.duplicate_of == "a"
+        assert member.resume_path == dirs["c"] / "tailored_resume.txt"
+        assert member.resume_path.read_text() == "Python developer"
+        assert (dirs["c"] / "job.txt").read_text() == "Required: Python, Kubernetes"
+
+    # * Members of failed representative are skipped w/ reason
+    def test_failed_representative_skips_members(self, tmp_path):
+        runner = _make_runner(tmp_path, triage_model=None)
+        specs, dirs = _specs_and_dirs(tmp_path)
+        representative = JobResult(spec=specs[0], status=JobStatus.FAILED)
+        cluster = DuplicateCluster(representative="a", members=["b", "c"])
+
+        results = runner._reuse_duplicate_outputs(
+            [representative], [cluster], specs, dirs, {}
+        )
+
+        assert [r.status for r in results[1:]] == [JobStatus.SKIPPED] * 2
+        assert "Near-duplicate of a" in results[1].error
+
+    # * run() tailors only representatives & records clusters in result
+    def test_run_processes_representatives_only(self, tmp_path, monkeypatch):
+        posting = (
+            "Data engineer building batch & streaming pipelines w/ Spark, Kafka "
+            "and Airflow; model warehouse tables, own data quality checks and "
+            "support analysts across finance, growth and operations teams."
+        )
+        jobs_dir = tmp_path / "jobs"
+        jobs_dir.mkdir()
+        (jobs_dir / "a.txt").write_text(posting + " Location: Austin.")
+        (jobs_dir / "b.txt").write_text("Line cook for evening service.")
+        (jobs_dir / "c.txt").write_text(posting + " Location: Denver.")
+        runner = BulkRunner(
+            BulkConfig(
+                resume=tmp_path / "resume.docx",
+                jobs_path=jobs_dir,
+                model="gpt-5",
+                output_dir=tmp_path / "out",
+                dedup_threshold=0.75,
+            ),
+            LoomSettings(base_dir=str(tmp_path / ".loom")),
+        )
+        processed: list[str] = []
+
+        def process(spec, output_dir, settings_snapshot, model=None):
+            processed.append(spec.id)
+            return JobResult(spec=spec, status=JobStatus.FAILED, error="boom")
+
+        monkeypatch.setattr(runner, "_process_single_job", process)
+
+        result = runner.run()
+
+        assert processed == ["a", "b"]
+        assert [j.spec.id for j in result.jobs] == ["a", "b", "c"]
+        assert result.jobs[2].duplicate_of == "a"
+        assert result.duplicates[0].members == ["c"]
+
+
+class TestKeywordPacks:
+    # * Packs from .loom/keywords & --keywords files load once into cached matcher
+    def test_loads_discovered_and_configured_packs(self, tmp_path):
+        keywords_dir = tmp_path / ".loom" / "keywords"
+        keywords_dir.mkdir(parents=True)
+        (keywords_dir / "health.toml").write_text('words = ["HIPAA"]')
+        extra = tmp_path / "extra.json"
+        extra.write_text('{"aliases": {"Kubernetes": ["k8s"]}}')
+        config = BulkConfig(
+            resume=tmp_path / "resume.docx",
+            jobs_path=tmp_path,
+            model="gpt-5",
+            output_dir=tmp_path / "out",
+            keyword_packs=[extra],
+        )
+        settings = LoomSettings(
+            base_dir=str(tmp_path / ".loom"), cache_dir=str(tmp_path / "cache")
+        )
+        runner = BulkRunner(config, settings)
+
+        matcher = runner._load_keyword_matcher()
+
+        assert runner._load_keyword_matcher() is matcher
+        assert runner._keyword_pack_paths == [keywords_dir / "health.toml", extra]
+        assert matcher.extract("HIPAA & k8s") == (["HIPAA", "Kubernetes"], [])
+        assert list((tmp_path / "cache").glob("keywords-*.json"))
+
+
+def _tex(*lines: str) -> str:
+    return "\n".join(["\\begin{document}", *lines, "\\end{document}"]) + "\n"
+
+
+# previous bulk run w/ base resume snapshot & edits for job "a"
+def _previous_run(tmp_path: Path, job_path: Path, model: str = "gpt-5") -> Path:
+    prev = tmp_path / "prev"
+    (prev / "a").mkdir(parents=True)
+    (prev / "base_resume.tex").write_text(_tex("Jane", "Python", "Go"))
+    (prev / "a" / "edits.json").write_text(
+        json.dumps(
+            {"version": 1, "ops": [{"op": "replace_line", "line": 4, "text": "Rust"}]}
+        )
+    )
+    (prev / "run.json").write_text(
+        json.dumps(
+            {
+                "model": model,
+                "resume_snapshot": "base_resume.tex",
+                "jobs": {"a": {"content_hash": job_content_hash(job_path)}},
+            }
+        )
+    )
+    return prev
+
+
+class TestRebaseFrom:
+    # * Unchanged posting w/ rebasable edits skips model; changed posting does not
+    def test_rebases_previous_edits(self, tmp_path):
+        job = tmp_path / "a.txt"
+        job.write_text("Python role")
+        resume = tmp_path / "resume.tex"
+        resume.write_text(_tex("Jane", "Remote", "Python", "Go"))
+        prev = _previous_run(tmp_path, job)
+        runner = _make_runner(tmp_path, triage_model=None, rebase_from=prev)
+        runner.config.resume = resume
+        runner._load_rebase_source()
+        spec = JobSpec(path=job, id="a")
+        edits_path = tmp_path / "edits.json"
+
+        assert runner._rebase_previous_edits(spec, "gpt-5", edits_path)
+        assert json.loads(edits_path.read_text())["ops"][0]["line"] == 5
+        assert not runner._rebase_previous_edits(spec, "gpt-5-nano", edits_path)
+        job.write_text("Changed posting")
+        assert not runner._rebase_previous_edits(spec, "gpt-5", edits_path)
+
+    # * Edits touching changed resume lines go back to the model
+    def test_changed_target_not_rebased(self, tmp_path):
+        job = tmp_path / "a.txt"
+        job.write_text("Python role")
+        resume = tmp_path / "resume.tex"
+        resume.write_text(_tex("Jane", "Python", "Go, Rust"))
+        runner = _make_runner(
+            tmp_path, triage_model=None, rebase_from=_previous_run(tmp_path, job)
+        )
+        runner.config.resume = resume
+        runner._load_rebase_source()
+
+        edits_path = tmp_path / "edits.json"
+        assert not runner._rebase_previous_edits(
+            JobSpec(path=job, id="a"), "gpt-5", edits_path
+        )
+        assert not edits_path.exists()
+
+
+class TestRunSections:
+    # * Cached sectionizer result is written once to run dir & shared by jobs
+    def test_cached_sections_shared(self, tmp_path):
+        from src.loom_io.documents import write_docx
+
+        runner = _make_runner(tmp_path, triage_model=None)
+        runner.settings = LoomSettings(
+            base_dir=str(tmp_path / ".loom"), data_dir=str(tmp_path / "data")
+        )
+        write_docx({1: "Jane", 2: "SKILLS"}, runner.config.resume)
+        sections = {"sections": [{"kind": "skills", "start_line": 2}]}
+        bulk_dir = tmp_path / "run"
+        bulk_dir.mkdir()
+
+        with patch("src.cli.bulk_runner.cached_sections", return_value=sections):
+            runner._prepare_sections(bulk_dir)
+
+        assert runner._run_sections_path == bulk_dir / "sections.json"
+        assert json.loads(runner._run_sections_path.read_text()) == sections
+        assert json.loads(runner._load_sections_json() or "") == sections
+
+    # * Existing sections file wins unless refresh requested
+    def test_sections_file_and_refresh(self, tmp_path):
+        sections_file = tmp_path / "sections.json"
+        sections_file.write_text("{}")
+        runner = _make_runner(
+            tmp_path, triage_model=None, sections_path=sections_file
+        )
+
+        bulk_dir = tmp_path / "run"
+        bulk_dir.mkdir()
+
+        runner._prepare_sections(bulk_dir)
+        assert runner._run_sections_path is None
+
+        runner.config.refresh_sections = True
+        runner._load_resume_index = lambda: Mock(lines={1: "Jane"})
+        with patch(
+            "src.cli.bulk_runner.sectionize_core", return_value=({"s": 1}, False)
+        ) as ai:
+            runner._prepare_sections(bulk_dir)
+
+        ai.assert_called_once()
+        assert ai.call_args.kwargs == {"refresh": True}
+        assert runner._run_sections_path == bulk_dir / "sections.json"
+
+
+# run (lazy by default) over one job whose previous edits rebase cleanly (no model)
+def _lazy_run(tmp_path: Path, lazy: bool = True):
+    jobs = tmp_path / "jobs"
+    jobs.mkdir()
+    job = jobs / "a.txt"
+    job.write_text("Requirements: Rust")
+    resume = tmp_path / "resume.tex"
+    resume.write_text(_tex("Jane", "Remote", "Python", "Go"))
+    runner = _make_runner(
+        tmp_path,
+        triage_model=None,
+        rebase_from=_previous_run(tmp_path, job),
+        lazy=lazy,
+    )
+    runner.config.resume = resume
+    runner.config.jobs_path = jobs
+    runner.settings = LoomSettings(
+        base_dir=str(tmp_path / ".loom"), data_dir=str(tmp_path / "data")
+    )
+    return runner, runner.run()
+
+
+class TestLazyMaterialize:
+    # * Lazy run scores edits applied in memory & writes no resume document
+    def test_lazy_run_skips_documents(self, tmp_path):
+        _, result = _lazy_run(tmp_path)
+
+        job = result.jobs[0]
+        assert job.status == JobStatus.SUCCESS, job.error
+        assert job.rebased
+        assert job.resume_path is None
+        assert job.coverage.required_matched == job.coverage.required_total == 1
+        assert (job.output_dir / "edits.json").exists()
+        assert not list(job.output_dir.glob("tailored_resume*"))
+
+    # * Eager run counts lines touched from written output's diff hunks
+    def test_eager_run_lines_touched_from_diff(self, tmp_path):
+        with patch("src.cli.runner.report_result"):
+            _, result = _lazy_run(tmp_path, lazy=False)
+
+        job = result.jobs[0]
+        assert job.status == JobStatus.SUCCESS, job.error
+        assert job.edits.lines_touched == 1
+        assert "Rust" in job.resume_path.read_text()
+
+    # * Materialize renders ranked jobs from saved edits & records outputs
+    def test_materialize_top_jobs(self, tmp_path):
+        from src.cli.bulk_runner import materialize_bulk_run
+
+        runner, result = _lazy_run(tmp_path)
+        with patch("src.cli.runner.report_result"):
+            written = materialize_bulk_run(runner.settings, result.output_dir, top=1)
+
+        output = result.output_dir / "a" / "tailored_resume.tex"
+        assert written == {"a": output}
+        assert "Rust" in output.read_text()
+        matrix = json.loads((result.output_dir / "matrix.json").read_text())
+        assert matrix["jobs"][0]["outputs"]["resume"] == str(output)
+
+    # * Re-runs link identical job artifacts & resume snapshot to shared blobs
+    def test_rerun_shares_stored_artifacts(self, tmp_path):
+        runner, first = _lazy_run(tmp_path)
+        second = runner.run()
+
+        for name in ("a/job.txt", "a/edits.json", "base_resume.tex"):
+            assert os.path.samefile(first.output_dir / name, second.output_dir / name)
+        assert runner.settings.loom_dir.joinpath("objects").is_dir()
+
+
+# swap job processing for a fake that records which jobs reached it
+# (& simulates Ctrl-C when reaching interrupt_on)
+def _record_processed(
+    runner: BulkRunner, monkeypatch, interrupt_on: str | None = None
+) -> list[str]:
+    processed: list[str] = []
+
+    def process(spec, output_dir, settings_snapshot, model=None):
+        processed.append(spec.id)
+        if spec.id == interrupt_on:
+            raise KeyboardInterrupt
+        return JobResult(
+            spec=spec, status=JobStatus.SUCCESS, model=model, output_dir=output_dir
+        )
+
+    monkeypatch.setattr(runner, "_process_single_job", process)
+    return processed
+
+
+class TestIncremental:
+    # * Interrupted run's finished jobs are reused; only new postings are tailored
+    def test_reuses_unchanged_jobs(self, tmp_path, monkeypatch):
+        runner, first = _lazy_run(tmp_path)
+        # interrupted runs never wrote a matrix; per-job records are enough
+        (first.output_dir / "matrix.json").unlink()
+        (tmp_path / "jobs" / "b.txt").write_text("Requirements: Go")
+        runner.config.incremental = True
+        processed = _record_processed(runner, monkeypatch)
+
+        second = runner.run()
+
+        assert processed == ["b"]
+        reused = second.jobs[0]
+        assert reused.reused_from == first.output_dir.name
+        assert reused.fit_score == round(first.jobs[0].fit_score, 2)
+        assert reused.edits_path == second.output_dir / "a" / "edits.json"
+        assert os.path.samefile(
+            reused.edits_path, first.output_dir / "a" / "edits.json"
+        )
+        assert second.reused_count == second.to_dict()["summary"]["recomputed"] == 1
+        matrix_md = (second.output_dir / "matrix.md").read_text()
+        assert "1 jobs reused from earlier runs, 1 recomputed" in matrix_md
+
+    # * Changed posting or result-affecting settings invalidate earlier results
+    def test_changed_inputs_recomputed(self, tmp_path, monkeypatch):
+        runner, _ = _lazy_run(tmp_path)
+        runner.config.incremental = True
+        processed = _record_processed(runner, monkeypatch)
+
+        runner.config.risk = RiskLevel.HIGH
+        runner.run()
+        runner.config.risk = RiskLevel.MED
+        (tmp_path / "jobs" / "a.txt").write_text("Requirements: Rust, Go")
+        runner.run()
+
+        assert processed == ["a", "a"]
+
+
+class TestResultJournaling:
+    # * Ctrl-C keeps journaled jobs in a partial matrix; next incremental run resumes
+    def test_interrupt_then_resume(self, tmp_path, monkeypatch):
+        runner, first = _lazy_run(tmp_path)
+        (tmp_path / "jobs" / "b.txt").write_text("Requirements: Go")
+        processed = _record_processed(runner, monkeypatch, interrupt_on="b")
+
+        with pytest.raises(KeyboardInterrupt):
+            runner.run()
+
+        (interrupted,) = set(runner.config.output_dir.glob("bulk_*")) - {
+            first.output_dir
+        }
+        matrix = json.loads((interrupted / "matrix.json").read_text())
+        assert [job["id"] for job in matrix["jobs"]] == ["a"]
+
+        processed = _record_processed(runner, monkeypatch)
+        runner.config.incremental = True
+        resumed = runner.run()
+
+        assert processed == ["b"]
+        assert resumed.jobs[0].reused_from == interrupted.name
+        rebuilt = json.loads((resumed.output_dir / "matrix.json").read_text())
+        assert rebuilt["ranking"] == [job.spec.id for job in resumed.ranked_jobs()]
+        assert rebuilt["summary"]["reused"] == 1
+
+    # * Finished runs are indexed in results.db & ranked by `loom bulk query`
+    def test_run_indexed_for_query(self, tmp_path):
+        runner, first = _lazy_run(tmp_path)
+        db = results_db(runner.settings)
+
+        rows = db.top_jobs(ResultQuery())
+        with patch("src.cli.commands.bulk.results_db", return_value=db):
+            cli = CliRunner().invoke(app, ["bulk", "query", "--since", "1d", "--json"])
+
+        assert [(r["run"], r["job_id"]) for r in rows] == [(first.output_dir.name, "a")]
+        assert rows[0]["fit_score"] == round(first.jobs[0].fit_score, 2)
+        assert cli.exit_code == 0, cli.output
+        assert json.loads(cli.output) == rows
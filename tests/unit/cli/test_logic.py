@@ -14,6 +14,7 @@ from src.cli.logic import (
     convert_dict_edits_to_operations,
     convert_operations_to_dict_edits,
     process_special_operations,
+    sectionize_core,
 )
 from src.cli.helpers import validate_required_args
 from src.config.settings import LoomSettings
@@ -1793,3 +1794,36 @@ class TestErrorHandlingRecovery:
         # should still process modify operations (they don't require job text)
         mock_process_modify.assert_called_once()
         assert len(result) == 1
+
+
+# * Test content-hash cache for AI sectionizer results
+class TestSectionizeCache:
+    # * Identical resume & model reuse cached sections; refresh & other models call AI
+    def test_reuse_and_refresh(self, tmp_path):
+        settings = LoomSettings(base_dir=str(tmp_path / ".loom"))
+        lines = {1: "Jane Doe", 2: "EXPERIENCE"}
+        sections = {"sections": [{"kind": "experience", "start_line": 2}]}
+
+        with (
+            patch("src.cli.logic.cache_disabled_for_invocation", return_value=False),
+            patch("src.cli.logic.sectionize_lines", return_value=sections) as ai,
+        ):
+            first = sectionize_core(settings, lines, "gpt-5")
+            second = sectionize_core(settings, dict(lines), "gpt-5")
+            refreshed = sectionize_core(settings, lines, "gpt-5", refresh=True)
+            other = sectionize_core(settings, lines, "gpt-5-mini")
+            edited = sectionize_core(settings, {1: "Jane Doe"}, "gpt-5")
+
+        assert first == (sections, False) and second == (sections, True)
+        assert refreshed == (sections, False) and not other[1] and not edited[1]
+        assert ai.call_count == 4
+
+    # * --no-cache bypasses reuse
+    def test_disabled(self, tmp_path):
+        settings = LoomSettings(base_dir=str(tmp_path / ".loom"))
+
+        with patch("src.cli.logic.sectionize_lines", return_value={}) as ai:
+            sectionize_core(settings, {1: "a"}, "gpt-5")
+            sectionize_core(settings, {1: "a"}, "gpt-5")
+
+        assert ai.call_count == 2
@@ -304,7 +304,7 @@ class TestTailoringRunnerStepCalculation:
             model="gpt-4o",
         )
         runner = TailoringRunner(TailoringMode.GENERATE, ctx)
-        assert runner.calculate_total_steps() == 4
+        assert runner.calculate_total_steps() == 5  # 4 + 1 for DOCX analysis
 
     # * Verify calculate steps generate w/ sections
     def test_calculate_steps_generate_with_sections(self, mock_settings):
@@ -316,7 +316,7 @@ class TestTailoringRunnerStepCalculation:
             sections_path=Path("sections.json"),
         )
         runner = TailoringRunner(TailoringMode.GENERATE, ctx)
-        assert runner.calculate_total_steps() == 5  # 4 + 1 for sections
+        assert runner.calculate_total_steps() == 6  # 4 + 1 DOCX + 1 sections
 
     # * Verify calculate steps apply base
     def test_calculate_steps_apply_base(self, mock_settings):
@@ -327,7 +327,7 @@ class TestTailoringRunnerStepCalculation:
             output_resume=Path("output.docx"),
         )
         runner = TailoringRunner(TailoringMode.APPLY, ctx)
-        assert runner.calculate_total_steps() == 5
+        assert runner.calculate_total_steps() == 6  # 5 + 1 for DOCX analysis
 
     # * Verify calculate steps apply w/ latex
     def test_calculate_steps_apply_with_latex(self, mock_settings):
@@ -350,7 +350,7 @@ class TestTailoringRunnerStepCalculation:
             output_resume=Path("output.docx"),
         )
         runner = TailoringRunner(TailoringMode.APPLY, ctx)
-        assert runner.calculate_total_steps() == 6  # 5 + 1 for optional job
+        assert runner.calculate_total_steps() == 7  # 5 + 1 DOCX + 1 optional job
 
     # * Verify calculate steps apply full
     def test_calculate_steps_apply_full(self, mock_settings):
@@ -375,7 +375,7 @@ class TestTailoringRunnerStepCalculation:
             output_resume=Path("output.docx"),
         )
         runner = TailoringRunner(TailoringMode.TAILOR, ctx)
-        assert runner.calculate_total_steps() == 7
+        assert runner.calculate_total_steps() == 8  # 7 + 1 for DOCX analysis
 
     # * Verify calculate steps tailor w/ latex
     def test_calculate_steps_tailor_with_latex(self, mock_settings):
@@ -389,6 +389,19 @@ class TestTailoringRunnerStepCalculation:
         runner = TailoringRunner(TailoringMode.TAILOR, ctx)
         assert runner.calculate_total_steps() == 8  # 7 + 1 for LaTeX
 
+    # * Verify calculate steps tailor w/o writing output (in-memory apply)
+    def test_calculate_steps_tailor_without_output(self, mock_settings):
+        ctx = TailoringContext(
+            settings=mock_settings,
+            resume=Path("resume.tex"),
+            job=Path("job.txt"),
+            model="gpt-4o",
+            output_resume=Path("output.tex"),
+            write_output=False,
+        )
+        runner = TailoringRunner(TailoringMode.TAILOR, ctx)
+        assert runner.calculate_total_steps() == 6  # 7 + 1 LaTeX - diff & write
+
     # * Verify calculate steps plan base
     def test_calculate_steps_plan_base(self, mock_settings):
         ctx = TailoringContext(
@@ -398,7 +411,7 @@ class TestTailoringRunnerStepCalculation:
             model="gpt-4o",
         )
         runner = TailoringRunner(TailoringMode.PLAN, ctx)
-        assert runner.calculate_total_steps() == 5
+        assert runner.calculate_total_steps() == 6  # 5 + 1 for DOCX analysis
 
 
 # * Test prepare_resume_context function
@@ -550,6 +563,37 @@ class TestPrepareResumeContext:
         mock_load_sections.assert_called_once()
 
 
+    @patch("src.cli.runner.read_resume")
+    @patch("src.cli.runner.load_sections")
+    @patch("src.cli.runner.cached_sections")
+    # * Verify DOCX w/o sections file reuses cached sectionizer result
+    def test_prepare_context_cached_sections(
+        self,
+        mock_cached,
+        mock_load_sections,
+        mock_read_resume,
+        mock_settings,
+        mock_ui,
+        mock_progress,
+    ):
+        progress, task = mock_progress
+        mock_read_resume.return_value = {1: "line 1"}
+        mock_load_sections.return_value = None
+        mock_cached.return_value = {"sections": [{"kind": "skills"}]}
+
+        ctx = TailoringContext(
+            settings=mock_settings,
+            resume=Path("resume.docx"),
+            model="gpt-4o",
+            sections_path=Path("missing.json"),
+        )
+
+        result = prepare_resume_context(ctx, mock_ui, progress, task, load_job=False)
+
+        assert result.sections_json_str == '{"sections": [{"kind": "skills"}]}'
+        assert mock_cached.call_args.args[2] == "gpt-4o"
+
+
 # * Test TailoringRunner execution methods
 class TestTailoringRunnerExecution:
     @pytest.fixture
@@ -608,6 +652,42 @@ class TestTailoringRunnerExecution:
         mock_persist.assert_called_once()
         mock_report.assert_called_once_with("edits", edits_path=Path("edits.json"))
 
+    @patch("src.cli.runner.setup_ui_with_progress")
+    @patch("src.cli.runner.prepare_resume_context")
+    @patch("src.cli.runner.generate_edits_core")
+    @patch("src.cli.runner.persist_edits_json")
+    @patch("src.cli.runner.report_result")
+    # * Scoped generate sends only lines inside scope to the model
+    def test_run_generate_scoped(
+        self,
+        mock_report,
+        mock_persist,
+        mock_generate,
+        mock_prepare,
+        mock_setup,
+        mock_settings,
+    ):
+        mock_setup.return_value.__enter__ = Mock(return_value=(Mock(), Mock(), Mock()))
+        mock_setup.return_value.__exit__ = Mock(return_value=False)
+        mock_prepare.return_value = ResumeContext(
+            lines={1: "Name", 2: "EXPERIENCE", 3: "• Built APIs", 4: "SKILLS"},
+            job_text="job text",
+        )
+        mock_generate.return_value = {"version": 1, "ops": []}
+
+        ctx = TailoringContext(
+            settings=mock_settings,
+            resume=Path("resume.tex"),
+            job=Path("job.txt"),
+            model="gpt-4o",
+            edits_json=Path("edits.json"),
+            scope=[(2, 3)],
+        )
+        TailoringRunner(TailoringMode.GENERATE, ctx).run()
+
+        assert mock_generate.call_args.args[1] == {2: "EXPERIENCE", 3: "• Built APIs"}
+        assert mock_generate.call_args.args[2] == "job text"
+
     @patch("src.cli.runner.setup_ui_with_progress")
     @patch("src.cli.runner.read_resume")
     @patch("src.cli.runner.load_edits_json")
@@ -789,3 +869,101 @@ class TestTailoringRunnerExecution:
 
         with pytest.raises(EditError, match="Failed to generate valid edits"):
             runner.run()
+
+
+# * Test stage memo reuse across runner invocations
+class TestStageMemo:
+    @pytest.fixture
+    def paths(self, tmp_path):
+        settings = LoomSettings(
+            data_dir=str(tmp_path / "data"),
+            output_dir=str(tmp_path / "output"),
+            base_dir=str(tmp_path / ".loom"),
+        )
+        resume = tmp_path / "resume.docx"
+        resume.write_bytes(b"docx bytes")
+        job = tmp_path / "job.txt"
+        job.write_text("Python developer")
+        return settings, resume, job
+
+    def _run(self, settings, resume, job, **overrides):
+        ctx = TailoringContext(
+            settings=settings,
+            resume=resume,
+            job=job,
+            model="gpt-4o",
+            edits_json=Path(settings.loom_dir) / "edits.json",
+            output_resume=Path(settings.output_dir) / "out.docx",
+            interactive=False,
+            **overrides,
+        )
+        setup = Mock()
+        setup.return_value.__enter__ = Mock(return_value=(Mock(), Mock(), Mock()))
+        setup.return_value.__exit__ = Mock(return_value=False)
+        with (
+            patch("src.cli.logic.cache_disabled_for_invocation", return_value=False),
+            patch("src.cli.runner.setup_ui_with_progress", setup),
+            patch("src.cli.runner.read_resume", return_value={1: "Jane"}) as read,
+            patch(
+                "src.cli.runner.generate_edits_core",
+                return_value={"version": 1, "ops": []},
+            ) as generate,
+            patch("src.cli.runner.apply_edits_core", return_value={1: "J"}) as apply,
+            patch("src.cli.runner.write_output_with_diff") as write,
+            patch("src.cli.runner.report_result"),
+        ):
+            runner = TailoringRunner(TailoringMode.TAILOR, ctx)
+            runner.run()
+        calls = (read.call_count, generate.call_count, apply.call_count)
+        return runner, calls, write
+
+    # * Changing only preserve mode reuses read, generate & apply stages
+    def test_output_option_change_skips_generation(self, paths):
+        settings, resume, job = paths
+
+        _, first, _ = self._run(settings, resume, job)
+        runner, second, write = self._run(
+            settings, resume, job, preserve_mode="rebuild"
+        )
+
+        assert first == (1, 1, 1)
+        assert second == (0, 0, 0)
+        assert runner._memo.graph.hits == ["read", "analyze", "generate", "apply"]
+        assert write.call_args.args[3] == {1: "J"}
+        assert write.call_args.args[6] == "rebuild"
+        assert runner.hunks is write.return_value
+
+    # * Changing only job reruns generate & apply but reuses parsed & analyzed resume
+    def test_job_change_reruns_generation(self, paths):
+        settings, resume, job = paths
+
+        self._run(settings, resume, job)
+        job.write_text("Go developer")
+        runner, calls, _ = self._run(settings, resume, job)
+
+        assert calls == (0, 1, 1)
+        assert runner._memo.graph.hits == ["read", "analyze"]
+
+    # * Same extracted lines in another resume format don't reuse applied lines
+    def test_apply_keyed_on_resume_format(self, paths, tmp_path):
+        settings, resume, _ = paths
+        resume_ctx = ResumeContext(lines={1: "Jane"}, sections_json_str="{}")
+        edits = {"version": 1, "ops": []}
+
+        def apply_with(path):
+            ctx = TailoringContext(
+                settings=settings, resume=path, model="gpt-4o", interactive=False
+            )
+            with (
+                patch(
+                    "src.cli.logic.cache_disabled_for_invocation", return_value=False
+                ),
+                patch("src.cli.runner.apply_edits_core", return_value={1: "J"}) as core,
+            ):
+                runner = TailoringRunner(TailoringMode.APPLY, ctx)
+                runner._apply_edits(Mock(), resume_ctx, edits, None)
+            return core.call_count
+
+        assert apply_with(resume) == 1
+        assert apply_with(resume) == 0
+        assert apply_with(tmp_path / "resume.tex") == 1
@@ -231,3 +231,150 @@ class TestWatchSettings:
 
         settings = LoomSettings(watch_debounce=2.5)
         assert settings.watch_debounce == 2.5
+
+
+# Tests for incremental re-tailoring across watch triggers.
+class TestIncrementalTailorSession:
+
+    OLD = {1: "John Doe", 2: "EXPERIENCE", 3: "• Built APIs", 4: "SKILLS", 5: "Go"}
+
+    def _session(
+        self,
+        tmp_path: Path,
+        generated: list[dict],
+        apply_error: Exception | None = None,
+    ):
+        from src.cli.runner import TailoringMode
+        from src.cli.watch import IncrementalTailorSession
+        from src.loom_io import write_json_safe
+
+        job = tmp_path / "job.txt"
+        job.write_text("Python developer")
+        edits_path = tmp_path / "edits.json"
+        calls: list = []
+
+        # fake pass: generate modes write next queued edits
+        def run(mode, prompt, scope):
+            calls.append((mode, prompt, scope))
+            if mode == TailoringMode.APPLY and apply_error is not None:
+                raise apply_error
+            if mode != TailoringMode.APPLY:
+                write_json_safe({"meta": {}, "ops": generated.pop(0)}, edits_path)
+
+        session = IncrementalTailorSession(
+            run,
+            TailoringMode.TAILOR,
+            resume=tmp_path / "resume.tex",
+            job=job,
+            sections_path=None,
+            edits_json=edits_path,
+        )
+        return session, calls, job, edits_path
+
+    # * Resume-only change rebases old ops & regenerates only changed lines
+    def test_resume_change_regenerates_region(self, tmp_path: Path):
+        from src.cli.runner import TailoringMode
+        from src.loom_io import read_json_safe
+
+        first = [
+            {"op": "replace_line", "line": 1, "text": "Jane Doe"},
+            {"op": "replace_line", "line": 5, "text": "Go, Python"},
+        ]
+        scoped = [
+            {"op": "replace_line", "line": 4, "text": "• Built Python APIs"},
+            {"op": "replace_line", "line": 1, "text": "ignored"},
+        ]
+        session, calls, _, edits_path = self._session(tmp_path, [first, scoped])
+        new = {1: "John Doe", 2: "EXPERIENCE", 3: "Acme", 4: "• Built APIs"}
+        new.update({5: "SKILLS", 6: "Go"})
+
+        with patch(
+            "src.cli.watch.read_resume_document", side_effect=[self.OLD, new]
+        ):
+            session()
+            session()
+
+        assert [mode for mode, _, _ in calls] == [
+            TailoringMode.TAILOR,
+            TailoringMode.GENERATE,
+            TailoringMode.APPLY,
+        ]
+        assert calls[1][1].startswith("Only propose edits for lines 2-4.")
+        assert calls[1][2] == [(2, 4)]
+        ops = read_json_safe(edits_path)["ops"]
+        assert [(op["line"], op["text"]) for op in ops] == [
+            (1, "Jane Doe"),
+            (4, "• Built Python APIs"),
+            (6, "Go, Python"),
+        ]
+
+    # * Deletion-only changes & unchanged resumes skip the model; job change runs full
+    def test_skips_and_full_runs(self, tmp_path: Path):
+        from src.cli.runner import TailoringMode
+
+        first = [{"op": "replace_line", "line": 5, "text": "Go, Python"}]
+        session, calls, job, _ = self._session(tmp_path, [first, first])
+        shorter = {1: "John Doe", 2: "EXPERIENCE", 3: "SKILLS", 4: "Go"}
+
+        with patch(
+            "src.cli.watch.read_resume_document",
+            side_effect=[self.OLD, shorter, shorter, shorter],
+        ):
+            session()
+            session()
+            session()
+            job.write_text("Go developer")
+            session()
+
+        assert [mode for mode, _, _ in calls] == [
+            TailoringMode.TAILOR,
+            TailoringMode.APPLY,
+            TailoringMode.TAILOR,
+        ]
+
+    # * Failed apply leaves no stale state; next save re-tailors in full
+    def test_failed_apply_forces_full_run(self, tmp_path: Path):
+        from src.cli.runner import TailoringMode
+
+        first = [{"op": "replace_line", "line": 5, "text": "Go, Python"}]
+        scoped = [{"op": "replace_line", "line": 4, "text": "• Built Python APIs"}]
+        session, calls, _, _ = self._session(
+            tmp_path, [first, scoped, first], apply_error=RuntimeError("boom")
+        )
+        new = {1: "John Doe", 2: "EXPERIENCE", 3: "Acme", 4: "• Built APIs"}
+        new.update({5: "SKILLS", 6: "Go"})
+        newer = {**new, 7: "Python"}
+
+        with patch(
+            "src.cli.watch.read_resume_document", side_effect=[self.OLD, new, newer]
+        ):
+            session()
+            with pytest.raises(RuntimeError):
+                session()
+            session()
+
+        assert [mode for mode, _, _ in calls] == [
+            TailoringMode.TAILOR,
+            TailoringMode.GENERATE,
+            TailoringMode.APPLY,
+            TailoringMode.TAILOR,
+        ]
+
+    # * Ops dropped w/o a changed region to regenerate fall back to full run
+    def test_dropped_ops_without_regions_run_full(self, tmp_path: Path):
+        from src.cli.runner import TailoringMode
+
+        first = [{"op": "replace_line", "line": 3, "text": "• Built Python APIs"}]
+        session, calls, _, _ = self._session(tmp_path, [first, first])
+        shorter = {1: "John Doe", 2: "EXPERIENCE", 3: "SKILLS", 4: "Go"}
+
+        with patch(
+            "src.cli.watch.read_resume_document", side_effect=[self.OLD, shorter]
+        ):
+            session()
+            session()
+
+        assert [mode for mode, _, _ in calls] == [
+            TailoringMode.TAILOR,
+            TailoringMode.TAILOR,
+        ]
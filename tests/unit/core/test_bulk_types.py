@@ -13,6 +13,7 @@ from src.core.bulk_types import (
     ValidationSummary,
     JobResult,
     BulkResult,
+    CascadeSummary,
 )
 
 
@@ -142,6 +143,49 @@ class TestJobResult:
         assert data["status"] == "failed"
         assert data["error"] == "API rate limit exceeded"
 
+    # * from_dict rebuilds serialized result (incl. passes) for another spec
+    def test_from_dict_round_trip(self, tmp_path):
+        result = JobResult(
+            spec=JobSpec.from_path(tmp_path / "job.txt"),
+            status=JobStatus.SUCCESS,
+            fit_score=0.75,
+            model="gpt-5",
+            edits=EditBreakdown(total_count=3, replacements=2, inserts=1),
+            coverage=KeywordCoverage(
+                required_matched=4, required_total=5, missing_required=["Go"]
+            ),
+            output_dir=tmp_path / "out",
+            edits_path=tmp_path / "out" / "edits.json",
+        )
+        result.record_pass("final")
+        spec = JobSpec.from_path(tmp_path / "renamed.txt")
+
+        rebuilt = JobResult.from_dict(result.to_dict(), spec)
+
+        assert rebuilt.spec is spec
+        assert rebuilt.to_dict() | {"id": "job", "name": "job"} == result.to_dict()
+
+
+class TestJobResultPasses:
+    # * record_pass snapshots current result into pass history
+    def test_record_pass(self, tmp_path):
+        result = JobResult(
+            spec=JobSpec.from_path(tmp_path / "job.txt"),
+            status=JobStatus.SUCCESS,
+            fit_score=0.4,
+            model="gpt-5-nano",
+            edits=EditBreakdown(total_count=2),
+        )
+
+        entry = result.record_pass("triage")
+
+        assert entry.model == "gpt-5-nano"
+        assert entry.edits_count == 2
+        data = result.to_dict()
+        assert data["model"] == "gpt-5-nano"
+        assert data["passes"][0]["stage"] == "triage"
+        assert data["passes"][0]["status"] == "success"
+
 
 class TestBulkResult:
     # * success_count counts successful jobs
@@ -221,3 +265,25 @@ class TestBulkResult:
         assert data["version"] == 1
         assert data["meta"]["model"] == "gpt-4o"
         assert data["summary"]["total"] == 0
+
+    # * to_dict includes cascade summary when present
+    def test_to_dict_with_cascade(self, tmp_path):
+        result = BulkResult(
+            resume_path=tmp_path / "resume.docx",
+            model="gpt-5",
+            timestamp="2025-01-01T00:00:00",
+            output_dir=tmp_path / "output",
+            cascade=CascadeSummary(
+                triage_model="gpt-5-nano", final_model="gpt-5", triaged=5, promoted=2
+            ),
+        )
+
+        data = result.to_dict()
+
+        assert data["cascade"]["final_passes_avoided"] == 3
+        assert "cascade" not in BulkResult(
+            resume_path=tmp_path / "r.docx",
+            model="gpt-5",
+            timestamp="t",
+            output_dir=tmp_path,
+        ).to_dict()
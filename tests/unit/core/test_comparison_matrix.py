@@ -12,8 +12,17 @@ from src.core.comparison_matrix import (
     categorize_warnings,
     count_unsafe_claims,
     build_validation_summary,
+    select_cascade_promotions,
+    summarize_cascade,
+)
+from src.core.keyword_matcher import KeywordMatcher
+from src.core.bulk_types import (
+    JobResult,
+    JobSpec,
+    JobStatus,
+    KeywordCoverage,
+    ValidationSummary,
 )
-from src.core.bulk_types import JobResult, JobSpec, KeywordCoverage, ValidationSummary
 from pathlib import Path
 
 
@@ -140,6 +149,19 @@ class TestCalculateKeywordCoverage:
 
         assert coverage.required_matched == 2
 
+    # * Alias in resume satisfies canonical keyword
+    def test_alias_counts_as_match(self):
+        matcher = KeywordMatcher(aliases={"Kubernetes": ["k8s"]})
+
+        coverage = calculate_keyword_coverage(
+            "Ran k8s in production", ["Kubernetes"], [], matcher
+        )
+
+        assert coverage.required_matched == 1
+        assert calculate_keyword_coverage(
+            "Ran k8s in production", ["Kubernetes"], []
+        ).missing_required == ["Kubernetes"]
+
 
 class TestDetectKeywordStuffing:
     # * Normal text has no stuffing
@@ -422,3 +444,71 @@ class TestSectionsTouched:
         breakdown = analyze_edits(edits, sections_json=sections_json)
 
         assert breakdown.sections_touched == ["EDUCATION", "EXPERIENCE", "SKILLS"]
+
+
+def _triage_result(job_id: str, score: float, status=JobStatus.SUCCESS, runtime=1.0):
+    return JobResult(
+        spec=JobSpec(path=Path(f"{job_id}.txt"), id=job_id),
+        status=status,
+        fit_score=score,
+        runtime_seconds=runtime,
+    )
+
+
+class TestSelectCascadePromotions:
+    # * Top-N promotes highest-scoring successful jobs
+    def test_top_n(self):
+        results = [
+            _triage_result("a", 0.2),
+            _triage_result("b", 0.9),
+            _triage_result("c", 0.6),
+        ]
+
+        assert select_cascade_promotions(results, top_n=2) == ["b", "c"]
+
+    # * Threshold filters by fit score
+    def test_threshold(self):
+        results = [_triage_result("a", 0.2), _triage_result("b", 0.7)]
+
+        assert select_cascade_promotions(results, threshold=0.5) == ["b"]
+
+    # * Threshold & top-N combine
+    def test_threshold_and_top_n(self):
+        results = [
+            _triage_result("a", 0.95),
+            _triage_result("b", 0.9),
+            _triage_result("c", 0.1),
+        ]
+
+        assert select_cascade_promotions(results, top_n=5, threshold=0.5) == [
+            "a",
+            "b",
+        ]
+
+    # * Failed triage results are never promoted
+    def test_excludes_failed(self):
+        results = [_triage_result("a", 0.9, status=JobStatus.FAILED)]
+
+        assert select_cascade_promotions(results, top_n=1) == []
+
+    # * Default threshold applies when no rule given
+    def test_default_threshold(self):
+        results = [_triage_result("a", 0.49), _triage_result("b", 0.5)]
+
+        assert select_cascade_promotions(results) == ["b"]
+
+
+class TestSummarizeCascade:
+    # * Counts triaged & promoted jobs & estimates net time saved
+    def test_summary_counts_and_savings(self):
+        triage = [_triage_result(j, 0.5, runtime=1.0) for j in "abcd"]
+        final = [_triage_result("a", 0.8, runtime=10.0)]
+
+        summary = summarize_cascade("gpt-5-nano", "gpt-5", triage, final, top_n=1)
+
+        assert summary.triaged == 4
+        assert summary.promoted == 1
+        assert summary.final_passes_avoided == 3
+        # baseline 4 * 10s vs actual 4 * 1s + 10s
+        assert summary.estimated_time_saved_seconds == pytest.approx(26.0)
+        assert summary.to_dict()["top_n"] == 1
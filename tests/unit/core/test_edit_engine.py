@@ -0,0 +1,170 @@
+# tests/unit/core/test_edit_engine.py
+# Unit & differential tests for linear-time edit application engine
+
+import random
+
+import pytest
+
+from src.core.constants import (
+    OP_DELETE_RANGE,
+    OP_INSERT_AFTER,
+    OP_REPLACE_LINE,
+    OP_REPLACE_RANGE,
+)
+from src.core.edit_engine import apply_ops
+from src.core.edit_helpers import (
+    check_line_exists,
+    check_range_exists,
+    collect_lines_to_move,
+    get_operation_line,
+    shift_lines,
+)
+from src.core.exceptions import EditError
+
+
+# reference implementation: sequential dict mutation, shifting later lines per op
+def _reference_apply(resume_lines: dict, ops: list) -> dict:
+    new_lines = dict(resume_lines)
+    for op in sorted(ops, key=lambda op: get_operation_line(op), reverse=True):
+        op_type = op["op"]
+        if op_type == OP_REPLACE_LINE:
+            line_num = op["line"]
+            if not check_line_exists(line_num, new_lines):
+                raise EditError(f"Cannot replace line {line_num}: line does not exist")
+            new_lines[line_num] = op["text"]
+        elif op_type == OP_REPLACE_RANGE:
+            start, end, text = op["start"], op["end"], op["text"]
+            if not check_line_exists(end, new_lines):
+                raise EditError(
+                    f"Cannot replace range {start}-{end}: line {end} does not exist"
+                )
+            exists, missing = check_range_exists(start, end, new_lines)
+            if not exists:
+                raise EditError(
+                    f"Cannot replace range {start}-{end}: line {missing} does not exist"
+                )
+            text_lines = text.split("\n") if text else [""]
+            line_diff = len(text_lines) - (end - start + 1)
+            lines_to_move = collect_lines_to_move(new_lines, end)
+            if line_diff != 0:
+                for k, _ in lines_to_move:
+                    del new_lines[k]
+            for line_num in range(start, end + 1):
+                del new_lines[line_num]
+            for i, line_text in enumerate(text_lines):
+                new_lines[start + i] = line_text
+            if line_diff != 0:
+                for k, v in lines_to_move:
+                    new_lines[k + line_diff] = v
+        elif op_type == OP_INSERT_AFTER:
+            line_num, text = op["line"], op["text"]
+            if not check_line_exists(line_num, new_lines):
+                raise EditError(
+                    f"Cannot insert after line {line_num}: line does not exist"
+                )
+            text_lines = text.split("\n")
+            shift_lines(
+                new_lines, collect_lines_to_move(new_lines, line_num), len(text_lines)
+            )
+            for i, line_text in enumerate(text_lines):
+                new_lines[line_num + 1 + i] = line_text
+        elif op_type == OP_DELETE_RANGE:
+            start, end = op["start"], op["end"]
+            exists, missing = check_range_exists(start, end, new_lines)
+            if not exists:
+                raise EditError(
+                    f"Cannot delete range {start}-{end}: line {missing} does not exist"
+                )
+            for line_num in range(start, end + 1):
+                del new_lines[line_num]
+            shift_lines(
+                new_lines, collect_lines_to_move(new_lines, end), -(end - start + 1)
+            )
+        else:
+            raise EditError(f"Unknown operation type: {op_type}")
+    return new_lines
+
+
+# random op near/inside document bounds, occasionally degenerate or out of range
+def _random_op(rng: random.Random, size: int) -> dict:
+    line = rng.randint(0, size + 2)
+    span = rng.choice([0, 0, 1, 2, 5, -1, -2])
+    text = "\n".join(f"t{rng.randint(0, 999)}" for _ in range(rng.randint(0, 3)))
+    kind = rng.choice(
+        [OP_REPLACE_LINE, OP_REPLACE_RANGE, OP_INSERT_AFTER, OP_DELETE_RANGE]
+    )
+    if kind == OP_REPLACE_LINE:
+        return {"op": kind, "line": line, "text": text}
+    if kind == OP_INSERT_AFTER:
+        return {"op": kind, "line": line, "text": text}
+    if kind == OP_REPLACE_RANGE:
+        return {"op": kind, "start": line, "end": line + span, "text": text}
+    return {"op": kind, "start": line, "end": line + span}
+
+
+# outcome as comparable value: result lines or raised error message
+def _outcome(fn, lines: dict, ops: list):
+    try:
+        return fn(lines, ops)
+    except EditError as e:
+        return f"error: {e}"
+
+
+class TestApplyOps:
+    # * Matches sequential engine on random docs (gaps, overlaps, degenerate ranges)
+    def test_differential_against_reference(self):
+        rng = random.Random(31)
+        errors = 0
+        for _ in range(3000):
+            size = rng.randint(0, 25)
+            keys = [k for k in range(1, size + 1) if rng.random() > 0.1]
+            lines = {k: f"line {k}" for k in keys}
+            ops = [_random_op(rng, size) for _ in range(rng.randint(0, 8))]
+
+            expected = _outcome(_reference_apply, lines, ops)
+            actual = _outcome(apply_ops, lines, ops)
+
+            assert actual == expected, (lines, ops)
+            errors += isinstance(expected, str)
+        # fuzz exercises both success & error paths
+        assert 0 < errors < 3000
+
+    # * Input lines are not mutated & result is in ascending line order
+    def test_input_untouched_and_sorted(self):
+        lines = {3: "c", 1: "a", 2: "b"}
+        ops = [{"op": OP_INSERT_AFTER, "line": 1, "text": "x\ny"}]
+
+        result = apply_ops(lines, ops)
+
+        assert lines == {3: "c", 1: "a", 2: "b"}
+        assert list(result.items()) == [
+            (1, "a"),
+            (2, "x"),
+            (3, "y"),
+            (4, "b"),
+            (5, "c"),
+        ]
+
+    # * Ops are resolved against original numbering
+    def test_ops_use_original_numbering(self):
+        lines = {i: f"L{i}" for i in range(1, 7)}
+        ops = [
+            {"op": OP_DELETE_RANGE, "start": 2, "end": 3},
+            {"op": OP_INSERT_AFTER, "line": 4, "text": "new"},
+            {"op": OP_REPLACE_LINE, "line": 6, "text": "L6*"},
+        ]
+
+        result = apply_ops(lines, ops)
+
+        assert list(result.values()) == ["L1", "L4", "new", "L5", "L6*"]
+
+    # * Errors raised in same op order w/ same messages
+    def test_errors(self):
+        lines = {1: "a", 2: "b"}
+
+        with pytest.raises(EditError, match="Cannot replace range 1-5: line 5"):
+            apply_ops(
+                lines, [{"op": OP_REPLACE_RANGE, "start": 1, "end": 5, "text": ""}]
+            )
+        with pytest.raises(EditError, match="Unknown operation type: bogus"):
+            apply_ops(lines, [{"op": "bogus", "line": 1}])
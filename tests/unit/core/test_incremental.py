@@ -0,0 +1,109 @@
+# tests/unit/core/test_incremental.py
+# Unit tests for changed-region detection & scoped edit merging
+
+import json
+
+from src.core.incremental import (
+    affected_regions,
+    merge_scoped_edits,
+    scope_lines,
+    scoped_prompt,
+    section_bounds,
+)
+
+OLD = {
+    1: "John Doe",
+    2: "EXPERIENCE",
+    3: "• Built REST APIs",
+    4: "• Led team of 4",
+    5: "SKILLS",
+    6: "Python, Go",
+    7: "EDUCATION",
+    8: "BSc CS",
+}
+
+SECTIONS = json.dumps(
+    {
+        "sections": [
+            {"kind": "experience", "start_line": 2, "end_line": 4},
+            {"kind": "skills", "start_line": 5, "end_line": 6},
+            {"kind": "education", "start_line": 7, "end_line": 8},
+        ]
+    }
+)
+
+
+class TestAffectedRegions:
+    # * Unchanged resume has no regions; deletion-only change has none either
+    def test_no_regions(self):
+        shorter = {k if k < 4 else k - 1: v for k, v in OLD.items() if k != 4}
+
+        assert affected_regions(OLD, dict(OLD)) == []
+        assert affected_regions(OLD, shorter, SECTIONS) == []
+
+    # * Edited line widens to context lines w/o sections
+    def test_context_region(self):
+        new = dict(OLD)
+        new[6] = "Python, Go, Rust"
+
+        assert affected_regions(OLD, new) == [(5, 7)]
+        assert affected_regions(OLD, new, context=0) == [(6, 6)]
+
+    # * Inserted line widens to its enclosing section, mapped to new numbering
+    def test_section_region(self):
+        texts = list(OLD.values())
+        texts.insert(1, "jane@doe.dev")
+        texts.insert(7, "Rust")
+        new = {i + 1: t for i, t in enumerate(texts)}
+
+        assert affected_regions(OLD, new, SECTIONS) == [(1, 3), (6, 8)]
+
+    # * Malformed sections JSON is ignored
+    def test_bad_sections(self):
+        assert section_bounds("not json") == []
+        assert section_bounds(json.dumps({"sections": [{"start_line": 3}]})) == []
+
+
+class TestMergeScopedEdits:
+    # * Ops inside regions come from regeneration, all others from kept edits
+    def test_merge(self):
+        kept = {
+            "version": 1,
+            "meta": {"model": "a"},
+            "ops": [
+                {"op": "replace_line", "line": 1, "text": "Jane"},
+                {"op": "replace_range", "start": 3, "end": 4, "text": "x"},
+                {"op": "insert_after", "line": 8, "text": "y"},
+            ],
+        }
+        regenerated = {
+            "meta": {"model": "b"},
+            "ops": [
+                {"op": "delete_range", "start": 4, "end": 4},
+                {"op": "replace_line", "line": 1, "text": "ignored"},
+            ],
+        }
+
+        merged = merge_scoped_edits(kept, regenerated, [(4, 5)])
+
+        assert merged["version"] == 1 and merged["meta"] == {"model": "b"}
+        assert merged["ops"] == [
+            kept["ops"][0],
+            regenerated["ops"][0],
+            kept["ops"][2],
+        ]
+
+    # * Scoped lines keep original numbering & only lines inside regions
+    def test_scope_lines(self):
+        assert scope_lines(OLD, [(2, 3), (6, 6)]) == {
+            2: "EXPERIENCE",
+            3: "• Built REST APIs",
+            6: "Python, Go",
+        }
+
+    # * Prompt lists regions & keeps user prompt
+    def test_scoped_prompt(self):
+        prompt = scoped_prompt([(3, 3), (6, 9)], "Emphasize Go")
+
+        assert prompt.startswith("Only propose edits for lines 3, 6-9.")
+        assert prompt.endswith("\nEmphasize Go")
@@ -0,0 +1,251 @@
+# tests/unit/core/test_interval_index.py
+# Unit & differential tests for interval indexes & indexed edit validation
+
+import random
+import time
+
+import pytest
+
+from src.core.constants import (
+    OP_DELETE_RANGE,
+    OP_INSERT_AFTER,
+    OP_REPLACE_LINE,
+    OP_REPLACE_RANGE,
+    RiskLevel,
+)
+from src.core.edit_helpers import (
+    check_line_exists,
+    check_range_exists,
+    count_text_lines,
+)
+from src.core.interval_index import IntervalSet, LineIndex, RangeIndex
+from src.core.validation import (
+    check_range_usage,
+    validate_edit_sets,
+    validate_edits,
+    validate_line_number,
+    validate_range_bounds,
+    validate_required_fields,
+    validate_text_field,
+)
+
+REQUIRED = {
+    OP_REPLACE_LINE: ["line", "text"],
+    OP_REPLACE_RANGE: ["start", "end", "text"],
+    OP_INSERT_AFTER: ["line", "text"],
+    OP_DELETE_RANGE: ["start", "end"],
+}
+
+
+# reference implementation: line-by-line range walks & pairwise interaction scans
+def _reference_validate(edits: dict, resume_lines: dict, risk: RiskLevel) -> list:
+    if "ops" not in edits:
+        return ["Missing 'ops' field in edits"]
+    ops = edits["ops"]
+    if not isinstance(ops, list):
+        return ["'ops' field must be a list"]
+    if not ops:
+        return ["'ops' list is empty"]
+
+    warnings: list[str] = []
+    line_usage: dict[int, str] = {}
+    for i, op in enumerate(ops):
+        if not isinstance(op, dict):
+            warnings.append(f"Op {i}: must be an object")
+            continue
+        op_type = op.get("op")
+        if not op_type:
+            warnings.append(f"Op {i}: missing 'op' field")
+            continue
+        if op_type not in REQUIRED:
+            warnings.append(f"Op {i}: unknown operation type '{op_type}'")
+            continue
+
+        ok, err = validate_required_fields(op, REQUIRED[op_type], op_type, i)
+        if ok and "line" in REQUIRED[op_type]:
+            ok, err = validate_line_number(op["line"], i)
+        elif ok:
+            ok, err = validate_range_bounds(op["start"], op["end"], i)
+        if ok and "text" in op:
+            ok, err = validate_text_field(
+                op["text"], allow_newlines=op_type != OP_REPLACE_LINE, op_index=i
+            )
+        if not ok:
+            warnings.append(err)
+            continue
+
+        if "line" in REQUIRED[op_type]:
+            line = op["line"]
+            if not check_line_exists(line, resume_lines):
+                warnings.append(f"Op {i}: line {line} not in resume bounds")
+                continue
+            if op_type == OP_REPLACE_LINE:
+                if line in line_usage:
+                    warnings.append(f"Op {i}: duplicate operation on line {line}")
+                line_usage[line] = op_type
+            continue
+
+        start, end = op["start"], op["end"]
+        exists, missing = check_range_exists(start, end, resume_lines)
+        if not exists:
+            warnings.append(f"Op {i}: line {missing} not in resume bounds")
+            continue
+        if op_type == OP_REPLACE_RANGE:
+            text_count = count_text_lines(op["text"])
+            range_count = end - start + 1
+            if text_count != range_count:
+                msg = f"Op {i}: replace_range line count mismatch ({range_count} -> {text_count})"
+                if risk in [RiskLevel.MED, RiskLevel.HIGH, RiskLevel.STRICT]:
+                    msg += " (will cause line collisions)"
+                warnings.append(msg)
+        warnings.extend(check_range_usage(start, end, line_usage, op_type, i))
+
+    deletes = [
+        (op["start"], op["end"])
+        for op in ops
+        if op.get("op") == OP_DELETE_RANGE and "start" in op and "end" in op
+    ]
+    for i, op in enumerate(ops):
+        if op.get("op") == OP_INSERT_AFTER and "line" in op:
+            if any(s <= op["line"] <= e for s, e in deletes):
+                warnings.append(
+                    f"Op {i}: insert_after on line {op['line']} that is deleted by a delete_range"
+                )
+    replaces = [
+        (op["start"], op["end"])
+        for op in ops
+        if op.get("op") == OP_REPLACE_RANGE and "start" in op and "end" in op
+    ]
+    for i, op in enumerate(ops):
+        if op.get("op") == OP_DELETE_RANGE and "start" in op and "end" in op:
+            s, e = op["start"], op["end"]
+            if any(not (e2 < s or s2 > e) for s2, e2 in replaces):
+                warnings.append(
+                    f"Op {i}: delete_range overlaps a replace_range; split or reorder ops"
+                )
+    seen: set[int] = set()
+    for i, op in enumerate(ops):
+        if op.get("op") == OP_INSERT_AFTER and "line" in op:
+            if op["line"] in seen:
+                warnings.append(f"Op {i}: multiple insert_after on line {op['line']}")
+            seen.add(op["line"])
+    return warnings
+
+
+# random op w/ occasional missing fields, bad types & out-of-bounds lines
+def _random_op(rng: random.Random, size: int) -> object:
+    roll = rng.random()
+    if roll < 0.02:
+        return "not an op"
+    kind = rng.choice(list(REQUIRED) + ["", "bogus"])
+    line = rng.choice([rng.randint(-1, size + 3), rng.randint(1, size)])
+    span = rng.choice([0, 0, 1, 3, -1])
+    text = "\n".join("t" for _ in range(rng.randint(0, 3)))
+    op = {"op": kind, "line": line, "start": line, "end": line + span, "text": text}
+    for key in ("line", "start", "end", "text"):
+        if rng.random() < 0.05:
+            del op[key]
+    if rng.random() < 0.03:
+        op["start"] = True
+    if kind == OP_DELETE_RANGE or kind == OP_REPLACE_RANGE:
+        op.pop("line", None)
+    return op
+
+
+class TestLineIndex:
+    # * First missing line matches line-by-line walk across gaps
+    def test_first_missing(self):
+        lines = {k: "x" for k in (1, 2, 3, 6, 7, 10)}
+        index = LineIndex(lines)
+
+        for start in range(1, 12):
+            for end in range(start, 12):
+                exists, missing = check_range_exists(start, end, lines)
+                assert index.first_missing(start, end) == (None if exists else missing)
+        assert 6 in index and 5 not in index
+
+
+class TestIntervalSet:
+    # * Lowest used line in range reported; adjacent & overlapping runs merge
+    def test_first_in_and_merge(self):
+        used = IntervalSet()
+        used.add(5, 7)
+        used.add(10, 10)
+        used.add(8, 9)
+
+        assert used.first_in(1, 4) is None
+        assert used.first_in(1, 6) == 5
+        assert used.first_in(9, 20) == 9
+        assert used.first_in(11, 20) is None
+        assert used._starts == [5] and used._ends == [10]
+
+
+class TestRangeIndex:
+    # * Intersection matches pairwise overlap test, incl. start > end ranges
+    def test_intersects_matches_pairwise(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            ranges = [
+                (rng.randint(1, 20), rng.randint(1, 20)) for _ in range(rng.randint(0, 5))
+            ]
+            index = RangeIndex(ranges)
+            lo, hi = rng.randint(1, 20), rng.randint(1, 20)
+            expected = any(not (e < lo or s > hi) for s, e in ranges)
+            assert index.intersects(lo, hi) == expected
+
+
+class TestIndexedValidation:
+    # * Same warnings in same order as line-walking reference validator
+    @pytest.mark.parametrize("risk", [RiskLevel.LOW, RiskLevel.MED])
+    def test_differential_against_reference(self, risk):
+        rng = random.Random(32)
+        for _ in range(2000):
+            size = rng.randint(1, 20)
+            lines = {k: "x" for k in range(1, size + 1) if rng.random() > 0.1}
+            edits = {"version": 1, "ops": [_random_op(rng, size) for _ in range(8)]}
+
+            try:
+                expected = _reference_validate(edits, lines, risk)
+            except (TypeError, AttributeError) as e:
+                expected = type(e)
+            try:
+                actual = validate_edits(edits, lines, risk)
+            except (TypeError, AttributeError) as e:
+                actual = type(e)
+
+            assert actual == expected, edits
+
+    # * Batch API validates each edit set against one shared index
+    def test_batch_matches_individual(self):
+        lines = {i: "x" for i in range(1, 11)}
+        edit_sets = [
+            {"ops": [{"op": OP_REPLACE_LINE, "line": 2, "text": "a"}] * 2},
+            {"ops": [{"op": OP_DELETE_RANGE, "start": 9, "end": 12}]},
+            {"ops": []},
+        ]
+
+        results = validate_edit_sets(edit_sets, lines, RiskLevel.MED)
+
+        assert results == [
+            validate_edits(edits, lines, RiskLevel.MED) for edits in edit_sets
+        ]
+        assert results[0] == ["Op 1: duplicate operation on line 2"]
+
+    # * Large disjoint edit set validates quickly (quadratic scans take seconds)
+    def test_large_edit_set(self):
+        lines = {i: "x" for i in range(1, 200_001)}
+        ops = []
+        for i in range(5_000):
+            base = i * 40 + 1
+            ops.append({"op": OP_DELETE_RANGE, "start": base, "end": base + 9})
+            ops.append(
+                {"op": OP_REPLACE_RANGE, "start": base + 10, "end": base + 19, "text": "a"}
+            )
+            ops.append({"op": OP_INSERT_AFTER, "line": base + 25, "text": "b"})
+
+        start = time.perf_counter()
+        warnings = validate_edits({"ops": ops}, lines, RiskLevel.LOW)
+        elapsed = time.perf_counter() - start
+
+        assert len(warnings) == 5_000
+        assert elapsed < 1.0
@@ -0,0 +1,171 @@
+# tests/unit/core/test_keyword_matcher.py
+# Unit & differential tests for compiled keyword matcher & term index
+
+import random
+import re
+
+import pytest
+
+from src.core.exceptions import CacheCorruptError
+from src.core.keyword_matcher import (
+    MATCHER_FORMAT,
+    MULTI_WORD_TERMS,
+    PREFERRED_LABELS,
+    REQUIRED_LABELS,
+    TECH_PATTERNS,
+    KeywordMatcher,
+    TermIndex,
+    pattern_terms,
+)
+
+MATCHER = KeywordMatcher()
+
+
+# reference implementation: per-line substring & per-pattern regex scan
+def _reference_extract(job_text: str) -> tuple[list[str], list[str]]:
+    required: set[str] = set()
+    preferred: set[str] = set()
+    in_required = True
+    for line in job_text.split("\n"):
+        line_lower = line.lower()
+        if any(kw in line_lower for kw in REQUIRED_LABELS):
+            in_required = True
+        elif any(kw in line_lower for kw in PREFERRED_LABELS):
+            in_required = False
+        target = required if in_required else preferred
+        for term in MULTI_WORD_TERMS:
+            if term in line_lower:
+                target.add(term)
+        for pattern in TECH_PATTERNS:
+            for match in re.findall(pattern, line, re.IGNORECASE):
+                target.add(match)
+    return sorted(required, key=str.lower), sorted(preferred, key=str.lower)
+
+
+# random posting text built from vocabulary fragments, glue & casing noise
+def _random_posting(rng: random.Random, n_tokens: int = 120) -> str:
+    vocab = (
+        pattern_terms(TECH_PATTERNS)
+        + MULTI_WORD_TERMS
+        + REQUIRED_LABELS
+        + PREFERRED_LABELS
+        + ["JavaScripts", "GoLang", "surplus", "C++17", "node", "git-hub", "data"]
+    )
+    glue = [" ", " ", " ", "\n", ", ", ".", "-", "/", "(", ")", "", "_", ": "]
+    parts: list[str] = []
+    for _ in range(n_tokens):
+        word = rng.choice(vocab)
+        casing = rng.random()
+        if casing < 0.3:
+            word = word.upper()
+        elif casing < 0.6:
+            word = word.lower()
+        parts.append(word + rng.choice(glue))
+    return "".join(parts)
+
+
+class TestKeywordMatcher:
+    # * Matches reference implementation on randomized postings
+    def test_differential_against_reference(self):
+        rng = random.Random(1234)
+        for _ in range(300):
+            text = _random_posting(rng)
+            # case variants of one term tie under str.lower sort, so compare as sets
+            actual = [set(keywords) for keywords in MATCHER.extract(text)]
+            expected = [set(keywords) for keywords in _reference_extract(text)]
+            assert actual == expected, text
+
+    # * Overlapping terms sharing a start are all reported
+    def test_shared_prefix_terms(self):
+        required, _ = MATCHER.extract("Experience w/ GitHub Actions")
+
+        assert required == ["GitHub", "GitHub Actions"]
+
+    # * Label anywhere on line switches mode for whole line
+    def test_label_applies_to_whole_line(self):
+        text = "Python required\nDocker is a plus\nAWS"
+
+        required, preferred = MATCHER.extract(text)
+
+        assert required == ["Python"]
+        assert preferred == ["AWS", "Docker"]
+
+    # * Custom vocabulary & empty matcher
+    def test_custom_vocabulary(self):
+        matcher = KeywordMatcher(
+            phrases=["site reliability"],
+            words=["SRE"],
+            required_labels=[],
+            preferred_labels=["ideally"],
+        )
+
+        required, preferred = matcher.extract("SRE / site reliability\nideally sre")
+
+        assert required == ["site reliability", "SRE"]
+        assert preferred == ["sre"]
+        assert KeywordMatcher([], [], [], []).extract("anything") == ([], [])
+
+
+class TestTermIndex:
+    # * Matches whole tokens & token sequences case-insensitively
+    def test_token_matching(self):
+        index = TermIndex("Built JavaScript services on AWS Lambda, node.js & C++.")
+
+        assert "javascript" in index
+        assert "Node.js" in index
+        assert "C++" in index
+        assert "aws lambda" in index
+        assert "Python" not in index
+
+    # * Short keywords no longer match inside longer words
+    def test_no_partial_word_matches(self):
+        index = TermIndex("Good interest in performance, unless Google")
+
+        assert "Go" not in index
+        assert "REST" not in index
+        assert "ORM" not in index
+        assert "LESS" not in index
+
+    # * Hyphenated & spaced forms of phrase are equivalent
+    def test_hyphenated_phrases(self):
+        index = TermIndex("Designed event driven, real-time systems")
+
+        assert "event-driven" in index
+        assert "real-time" in index
+        assert "time systems" in index
+
+
+class TestAliases:
+    # * Aliases report canonical term & count as coverage for it
+    def test_alias_maps_to_canonical(self):
+        matcher = KeywordMatcher(
+            words=["Kubernetes"], aliases={"Kubernetes": ["k8s", "kube"]}
+        )
+
+        required, _ = matcher.extract("Run K8S clusters w/ Kubernetes operators")
+
+        assert required == ["Kubernetes"]
+        assert matcher.variants("kubernetes") == ["Kubernetes", "k8s", "kube"]
+        assert matcher.variants("Python") == ["Python"]
+
+    # * Serialized matcher rebuilds w/ identical behavior
+    def test_round_trip(self):
+        matcher = KeywordMatcher(
+            phrases=["site reliability"],
+            words=["SRE", "Node.js"],
+            aliases={"Kubernetes": ["k8s"]},
+        )
+        text = "Required: SRE, site reliability, node.js\nPreferred: k8s"
+
+        restored = KeywordMatcher.from_dict(matcher.to_dict())
+
+        assert restored.extract(text) == matcher.extract(text)
+        assert restored.variants("Kubernetes") == ["Kubernetes", "k8s"]
+        assert len(restored) == len(matcher)
+
+    # * Unknown format rejected as corrupt cache
+    def test_from_dict_rejects_bad_format(self):
+        with pytest.raises(CacheCorruptError):
+            KeywordMatcher.from_dict({"format": -1, "pattern": "", "entries": []})
+        with pytest.raises(CacheCorruptError):
+            KeywordMatcher.from_dict({"format": MATCHER_FORMAT, "entries": [[1]]})
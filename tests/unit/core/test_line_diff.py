@@ -0,0 +1,153 @@
+# tests/unit/core/test_line_diff.py
+# Unit & differential tests for interned line diff & unified hunk output
+
+import difflib
+import random
+import time
+
+from src.core.line_diff import (
+    DiffHunk,
+    diff_hunks,
+    diff_opcodes,
+    iter_unified_diff,
+)
+from src.core.types import ResumeDocument
+
+
+# rebuild new side from old side & opcodes
+def _apply_opcodes(a: list[str], b: list[str], codes) -> list[str]:
+    out: list[str] = []
+    prev_i = prev_j = 0
+    for tag, i1, i2, j1, j2 in codes:
+        assert (i1, j1) == (prev_i, prev_j)
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+            out.extend(a[i1:i2])
+        else:
+            out.extend(b[j1:j2])
+        prev_i, prev_j = i2, j2
+    assert (prev_i, prev_j) == (len(a), len(b))
+    return out
+
+
+def _changed(codes) -> int:
+    return sum(i2 - i1 + j2 - j1 for tag, i1, i2, j1, j2 in codes if tag != "equal")
+
+
+# random LaTeX-like document w/ heavy line repetition
+def _random_doc(rng: random.Random, size: int) -> list[str]:
+    pool = ["\\item Built APIs", "\\vspace{2pt}", "", "\\end{itemize}", "}", "x"]
+    return [
+        rng.choice(pool) if rng.random() < 0.6 else f"line {rng.randint(0, 30)}"
+        for _ in range(size)
+    ]
+
+
+def _mutate(rng: random.Random, doc: list[str]) -> list[str]:
+    out = list(doc)
+    for _ in range(rng.randint(0, 6)):
+        pos = rng.randint(0, len(out))
+        roll = rng.random()
+        if roll < 0.4:
+            out.insert(pos, f"new {rng.randint(0, 5)}")
+        elif roll < 0.7 and out:
+            del out[min(pos, len(out) - 1)]
+        elif out:
+            out[min(pos, len(out) - 1)] = rng.choice(["\\item Led team", "}", "x"])
+    return out
+
+
+class TestDiffOpcodes:
+    # * Opcodes reconstruct new side & never change more lines than difflib
+    def test_differential_against_difflib(self):
+        rng = random.Random(34)
+        for _ in range(1500):
+            a = _random_doc(rng, rng.randint(0, 25))
+            b = _mutate(rng, a) if rng.random() < 0.8 else _random_doc(rng, 10)
+
+            codes = diff_opcodes(a, b)
+
+            assert _apply_opcodes(a, b, codes) == b
+            reference = difflib.SequenceMatcher(None, a, b, autojunk=False)
+            assert _changed(codes) <= _changed(reference.get_opcodes())
+
+    # * Line texts compared, so renumbering alone is not a change
+    def test_ignores_line_numbers(self):
+        old = {1: "a", 2: "b", 3: "c"}
+        new = ResumeDocument(["a", "b", "c"], numbers=[1, 5, 9])
+
+        assert diff_opcodes(old, new) == [("equal", 0, 3, 0, 3)]
+        assert diff_hunks(old, new) == []
+
+
+class TestDiffHunks:
+    # * Unified text matches difflib output for same alignment
+    def test_unified_matches_difflib(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            a = [f"l{rng.randint(0, 9)}" for _ in range(rng.randint(0, 30))]
+            b = _mutate(rng, a)
+            lines = {i + 1: t for i, t in enumerate(a)}
+            new_lines = {i + 1: t for i, t in enumerate(b)}
+
+            ours = "".join(iter_unified_diff(diff_hunks(lines, new_lines)))
+            expected = "".join(
+                difflib.unified_diff(
+                    [t + "\n" for t in a],
+                    [t + "\n" for t in b],
+                    fromfile="old",
+                    tofile="new",
+                    lineterm="\n",
+                )
+            )
+
+            # identical text whenever both engines pick same alignment
+            reference = difflib.SequenceMatcher(None, a, b, autojunk=False)
+            if diff_opcodes(a, b) == reference.get_opcodes():
+                assert ours == expected
+            assert bool(ours) == bool(expected)
+
+    # * Header positions & counts follow unified-diff conventions
+    def test_headers(self):
+        old = {i: f"l{i}" for i in range(1, 21)}
+        new = dict(old)
+        new[2] = "changed"
+        del new[18]
+
+        hunks = diff_hunks(old, new)
+
+        assert [h.header for h in hunks] == ["@@ -1,5 +1,5 @@", "@@ -15,6 +15,5 @@"]
+        assert hunks[0].lines[:3] == ((" ", "l1"), ("-", "l2"), ("+", "changed"))
+        assert (hunks[1].added, hunks[1].removed) == (0, 1)
+        assert DiffHunk(1, 0, 1, 2, ()).header == "@@ -0,0 +1,2 @@"
+
+    # * Changed lines count replacements once & pure inserts/deletes per line
+    def test_changed(self):
+        old = {i: f"l{i}" for i in range(1, 21)}
+        new = dict(old)
+        new[2] = "changed"
+        new[5] = "l5\nextra"
+        del new[18]
+        new = {i + 1: t for i, t in enumerate("\n".join(new.values()).split("\n"))}
+
+        hunks = diff_hunks(old, new)
+
+        assert [h.changed for h in hunks] == [2, 1]
+        assert DiffHunk(1, 0, 1, 2, (("+", "a"), ("+", "b"))).changed == 2
+
+    # * Large repetitive document diffs quickly (difflib degrades on repeated lines)
+    def test_large_repetitive_input(self):
+        rng = random.Random(1)
+        block = ["\\begin{itemize}", "\\item Did work", "\\vspace{2pt}", "}"]
+        a = [rng.choice(block) for _ in range(20_000)]
+        b = list(a)
+        for _ in range(200):
+            b.insert(rng.randint(0, len(b)), "\\item Added")
+
+        start = time.perf_counter()
+        codes = diff_opcodes(a, b)
+        elapsed = time.perf_counter() - start
+
+        assert _apply_opcodes(a, b, codes) == b
+        assert _changed(codes) == 200
+        assert elapsed < 2.0
@@ -0,0 +1,86 @@
+# tests/unit/core/test_near_duplicates.py
+# Unit tests for MinHash/LSH near-duplicate detection
+
+import pytest
+
+from src.core.exceptions import ConfigurationError
+from src.core.near_duplicates import (
+    find_near_duplicates,
+    jaccard,
+    shingle_hashes,
+)
+
+BASE_POSTING = (
+    "Senior Backend Engineer. We are hiring a senior backend engineer to design, "
+    "build and operate distributed services in Python and Go. You will own our "
+    "payments platform, partner with product and data teams, mentor engineers, "
+    "and improve reliability through observability, automated testing and "
+    "continuous delivery. Requirements include five years of experience with "
+    "PostgreSQL, Kafka, Kubernetes and AWS, plus strong communication skills."
+)
+
+
+def _repost(city: str, agency: str) -> str:
+    return f"{BASE_POSTING} Location: {city}. Posted by {agency}."
+
+
+class TestShingleHashes:
+    # * Normalizes case & punctuation before shingling
+    def test_case_and_punctuation_insensitive(self):
+        assert shingle_hashes("Python, Go & AWS!") == shingle_hashes("python go aws")
+
+    # * Empty text has no shingles
+    def test_empty_text(self):
+        assert shingle_hashes("  ...  ") == set()
+
+    # * Jaccard of identical sets is 1 & of disjoint sets is 0
+    def test_jaccard_bounds(self):
+        a = shingle_hashes(BASE_POSTING)
+        assert jaccard(a, a) == 1.0
+        assert jaccard(a, shingle_hashes("completely unrelated words here")) == 0.0
+
+
+class TestFindNearDuplicates:
+    # * Reposts across cities & agencies cluster under first posting
+    def test_clusters_reposts(self):
+        texts = [
+            _repost("Austin, TX", "Acme Staffing"),
+            "Pastry chef wanted for busy downtown bakery, early mornings, "
+            "laminated doughs, sourdough program and wedding cakes.",
+            _repost("Denver, CO", "Globex Recruiting"),
+            _repost("Remote (US)", "Initech Talent"),
+        ]
+
+        groups = find_near_duplicates(texts, threshold=0.8)
+
+        assert len(groups) == 1
+        assert groups[0].representative == 0
+        assert [idx for idx, _ in groups[0].members] == [2, 3]
+        assert all(sim >= 0.8 for _, sim in groups[0].members)
+
+    # * Distinct postings & empty texts never cluster
+    def test_distinct_and_empty_not_clustered(self):
+        texts = [
+            BASE_POSTING,
+            "Registered nurse for night shift in pediatric intensive care unit.",
+            "",
+            "",
+        ]
+
+        assert find_near_duplicates(texts) == []
+
+    # * Threshold of 1.0 only groups exact shingle matches
+    def test_strict_threshold(self):
+        texts = [BASE_POSTING, BASE_POSTING.upper(), _repost("Austin", "Acme")]
+
+        groups = find_near_duplicates(texts, threshold=1.0)
+
+        assert len(groups) == 1
+        assert [idx for idx, _ in groups[0].members] == [1]
+
+    # * Invalid threshold & banding raise ConfigurationError
+    def test_invalid_parameters(self):
+        with pytest.raises(ConfigurationError):
+            find_near_duplicates([BASE_POSTING], threshold=0.0)
+        with pytest.raises(ConfigurationError):
+            find_near_duplicates([BASE_POSTING], num_perm=64, bands=7)
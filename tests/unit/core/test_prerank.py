@@ -0,0 +1,73 @@
+# tests/unit/core/test_prerank.py
+# Unit tests for TF-IDF job pre-ranking
+
+import pytest
+
+from src.core.prerank import (
+    KEYWORD_PREFIX,
+    tokenize_for_ranking,
+    score_against_query,
+    select_ranked,
+)
+
+pytest.importorskip("numpy")
+
+
+class TestTokenizeForRanking:
+    # * Emits keyword tokens for vocabulary terms plus free-text words
+    def test_keyword_and_free_text_tokens(self):
+        tokens = tokenize_for_ranking("Python engineer for machine learning")
+
+        assert KEYWORD_PREFIX + "python" in tokens
+        assert KEYWORD_PREFIX + "machine learning" in tokens
+        assert "engineer" in tokens
+        # stopwords & short words dropped
+        assert "for" not in tokens
+
+    # * Keyword matching is case-insensitive & canonicalized to lowercase
+    def test_case_insensitive_keywords(self):
+        tokens = tokenize_for_ranking("KUBERNETES and Docker")
+
+        assert KEYWORD_PREFIX + "kubernetes" in tokens
+        assert KEYWORD_PREFIX + "docker" in tokens
+
+
+class TestScoreAgainstQuery:
+    # * Similar documents score higher than unrelated ones
+    def test_similar_documents_rank_higher(self):
+        resume = "Python developer w/ Django, PostgreSQL & machine learning"
+        jobs = [
+            "Looking for Java Spring engineer w/ Oracle",
+            "Python Django engineer, PostgreSQL, machine learning a plus",
+        ]
+
+        scores = score_against_query(resume, jobs)
+
+        assert scores[1] > scores[0]
+        assert all(0.0 <= s <= 1.0 + 1e-9 for s in scores)
+
+    # * Empty documents score zero & empty input returns empty list
+    def test_empty_inputs(self):
+        assert score_against_query("Python", []) == []
+        assert score_against_query("Python", [""]) == [0.0]
+
+
+class TestSelectRanked:
+    # * Applies top-k after sorting by score
+    def test_top_k(self):
+        ranked = select_ranked(["a", "b", "c"], [0.1, 0.9, 0.5], top_k=2)
+
+        assert [r.job_id for r in ranked] == ["b", "c"]
+        assert [r.rank for r in ranked] == [1, 2]
+
+    # * Applies min-score filter
+    def test_min_score(self):
+        ranked = select_ranked(["a", "b", "c"], [0.1, 0.9, 0.5], min_score=0.5)
+
+        assert [r.job_id for r in ranked] == ["b", "c"]
+
+    # * Ties keep input order
+    def test_stable_ties(self):
+        ranked = select_ranked(["a", "b"], [0.5, 0.5])
+
+        assert [r.job_id for r in ranked] == ["a", "b"]
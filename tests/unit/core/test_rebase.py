@@ -0,0 +1,91 @@
+# tests/unit/core/test_rebase.py
+# Unit tests for rebasing edit ops onto an edited resume
+
+import random
+
+from src.core.pipeline import apply_edits
+from src.core.rebase import line_mapping, rebase_edits
+
+OLD = {
+    1: "John Doe",
+    2: "EXPERIENCE",
+    3: "• Built REST APIs",
+    4: "• Led team of 4",
+    5: "SKILLS",
+    6: "Python, Go",
+}
+
+
+def _edits(*ops) -> dict:
+    return {"version": 1, "meta": {"model": "gpt-5"}, "ops": list(ops)}
+
+
+class TestLineMapping:
+    # * Unchanged lines map through inserted & deleted lines
+    def test_mapping(self):
+        new = {1: "John Doe", 2: "Remote", 3: "EXPERIENCE", 4: "• Led team of 4"}
+
+        assert line_mapping(OLD, new) == {1: 1, 2: 3, 4: 4}
+
+
+class TestRebaseEdits:
+    # * Ops below an inserted line shift; untouched ops are kept as-is
+    def test_shifts_ops(self):
+        new = {1: "John Doe", 2: "john@doe.dev"}
+        new.update({k + 1: v for k, v in OLD.items() if k > 1})
+        edits = _edits(
+            {"op": "replace_line", "line": 1, "text": "Jane Doe"},
+            {"op": "replace_range", "start": 3, "end": 4, "text": "a\nb"},
+            {
+                "op": "insert_after",
+                "line": 6,
+                "text": "Rust",
+                "current_snippet": "Python, Go",
+            },
+        )
+
+        result = rebase_edits(edits, OLD, new)
+
+        ops = result.edits["ops"]
+        assert result.clean and result.moved == 2 and result.notes == []
+        assert ops[0] is edits["ops"][0]
+        assert (ops[1]["start"], ops[1]["end"]) == (4, 5)
+        assert ops[2]["line"] == 7
+        assert result.edits["meta"] == edits["meta"]
+
+    # * Ops whose target line was edited or split by an insertion are dropped
+    def test_drops_changed_targets(self):
+        new = dict(OLD)
+        new[4] = "• Led team of 6"
+        edits = _edits(
+            {"op": "replace_line", "line": 4, "text": "x"},
+            {"op": "delete_range", "start": 3, "end": 4},
+            {"op": "replace_line", "line": 6, "text": "Python, Go, Rust"},
+        )
+
+        result = rebase_edits(edits, OLD, new)
+
+        assert not result.clean
+        assert result.dropped == [
+            "Op 0: replace_line on line 4 targets changed content; dropped",
+            "Op 1: delete_range on line 3-4 targets changed content; dropped",
+        ]
+        assert result.edits["ops"] == [edits["ops"][2]]
+
+    # * Clean rebase applied to new resume equals old result w/ same insertion
+    def test_equivalent_output(self):
+        rng = random.Random(36)
+        for _ in range(300):
+            old = {i: f"line {i}" for i in range(1, 30)}
+            at = rng.randint(0, 29)
+            new_texts = list(old.values())
+            new_texts[at:at] = ["added"] * rng.randint(1, 3)
+            new = {i + 1: t for i, t in enumerate(new_texts)}
+            line = rng.choice([k for k in old if k != at])
+            edits = _edits({"op": "replace_line", "line": line, "text": "X"})
+
+            result = rebase_edits(edits, old, new)
+
+            expected = list(apply_edits(old, edits).values())
+            expected[at:at] = ["added"] * (len(new) - len(old))
+            assert list(apply_edits(new, result.edits).values()) == expected
@@ -0,0 +1,156 @@
+# tests/unit/core/test_relocation.py
+# Unit tests for snippet-anchored relocation of drifted edit ops
+
+from src.core.relocation import SnippetIndex, normalize_line, relocate_ops
+from src.core.constants import RiskLevel
+from src.core.validation import validate_edits
+
+LINES = {
+    1: "John Doe",
+    2: "EXPERIENCE",
+    3: "Software Engineer",
+    4: "• Built REST APIs in Python",
+    5: "• Led team of 4 engineers",
+    6: "• Migrated services to AWS",
+    7: "",
+    8: "SKILLS",
+    9: "Python, Go, SQL",
+}
+
+
+def _edits(*ops) -> dict:
+    return {"version": 1, "meta": {}, "ops": list(ops)}
+
+
+class TestSnippetIndex:
+    # * Normalization ignores whitespace runs & case
+    def test_normalize(self):
+        assert normalize_line("  Led   Team\tof 4 ") == "led team of 4"
+
+    # * Exact lookup restricted to window bounds
+    def test_exact_window(self):
+        index = SnippetIndex({1: "a", 2: "b", 5: "a", 9: "a"})
+
+        assert index.exact("a", 2, 8) == [5]
+        assert index.matches_at(1, ["a", "b"]) and not index.matches_at(5, ["a", "b"])
+
+
+class TestRelocateOps:
+    # * Matching snippet leaves edits untouched & silent
+    def test_verified_op_unchanged(self):
+        edits = _edits(
+            {
+                "op": "replace_line",
+                "line": 5,
+                "text": "x",
+                "current_snippet": "• Led team of 4 engineers",
+            },
+        )
+
+        result, notes = relocate_ops(edits, LINES)
+
+        assert result is edits and notes == []
+
+    # * Off-by-N line re-anchored on exact snippet hit
+    def test_exact_relocation(self):
+        edits = _edits(
+            {
+                "op": "replace_line",
+                "line": 4,
+                "text": "x",
+                "current_snippet": "•  led team of 4 engineers",
+            },
+            {
+                "op": "insert_after",
+                "line": 8,
+                "text": "y",
+                "current_snippet": "Python, Go, SQL",
+            },
+        )
+
+        result, notes = relocate_ops(edits, LINES)
+
+        assert [op["line"] for op in result["ops"]] == [5, 9]
+        assert edits["ops"][0]["line"] == 4
+        assert notes[0] == (
+            "Op 0: relocated replace_line line 4 -> line 5 (current_snippet matched)"
+        )
+
+    # * Ranges shift as a whole on multi-line snippet
+    def test_range_relocation(self):
+        edits = _edits(
+            {
+                "op": "replace_range",
+                "start": 3,
+                "end": 4,
+                "text": "a\nb",
+                "current_snippet": (
+                    "• Led team of 4 engineers\n• Migrated services to AWS"
+                ),
+            }
+        )
+
+        result, _ = relocate_ops(edits, LINES)
+
+        assert (result["ops"][0]["start"], result["ops"][0]["end"]) == (5, 6)
+
+    # * Near-verbatim snippet re-anchored by fuzzy ratio; unrelated snippet noted only
+    def test_fuzzy_and_unmatched(self):
+        edits = _edits(
+            {
+                "op": "replace_line",
+                "line": 3,
+                "text": "x",
+                "current_snippet": "• Migrated service to AWS",
+            },
+            {
+                "op": "replace_line",
+                "line": 1,
+                "text": "x",
+                "current_snippet": "Kubernetes",
+            },
+        )
+
+        result, notes = relocate_ops(edits, LINES)
+
+        assert result["ops"][0]["line"] == 6
+        assert "fuzzy match" in notes[0]
+        assert result["ops"][1]["line"] == 1
+        assert notes[1].endswith("left in place")
+
+    # * Hits outside window are ignored
+    def test_window_bound(self):
+        edits = _edits(
+            {
+                "op": "replace_line",
+                "line": 1,
+                "text": "x",
+                "current_snippet": "Python, Go, SQL",
+            },
+        )
+
+        result, _ = relocate_ops(edits, LINES, window=3)
+
+        assert result["ops"][0]["line"] == 1
+
+    # * Relocated edits pass validation that raw edits fail
+    def test_relocation_clears_duplicate(self):
+        edits = _edits(
+            {
+                "op": "replace_line",
+                "line": 5,
+                "text": "x",
+                "current_snippet": "• Led team of 4 engineers",
+            },
+            {
+                "op": "replace_line",
+                "line": 5,
+                "text": "y",
+                "current_snippet": "• Migrated services to AWS",
+            },
+        )
+
+        result, _ = relocate_ops(edits, LINES)
+
+        assert validate_edits(edits, LINES, RiskLevel.MED)
+        assert validate_edits(result, LINES, RiskLevel.MED) == []
@@ -0,0 +1,61 @@
+# tests/unit/core/test_stage_graph.py
+# Unit tests for stage content-hash keys & on-disk stage memo
+
+from src.core.stage_graph import (
+    STAGE_HIT,
+    STAGE_MISS,
+    StageGraph,
+    content_hash,
+    json_hash,
+)
+from src.loom_io.stage_store import StageStore
+
+
+class TestStageGraph:
+    # * Keys depend on stage name & input values only, not on kwarg order
+    def test_keys(self):
+        graph = StageGraph()
+
+        a = graph.key("generate", job=content_hash("job"), model="gpt-4o")
+        b = StageGraph().key("generate", model="gpt-4o", job=content_hash("job"))
+
+        assert a == b == graph.keys["generate"]
+        assert StageGraph().key("apply", job=content_hash("job"), model="gpt-4o") != a
+        assert StageGraph().key("generate", job=content_hash("j2"), model="gpt-4o") != a
+
+    # * Absent inputs hash differently from empty ones
+    def test_hashes(self):
+        assert content_hash(None) is None
+        assert content_hash("") != content_hash(None)
+        assert content_hash("x") == content_hash(b"x")
+        assert json_hash({"a": 1, "b": 2}) == json_hash({"b": 2, "a": 1})
+
+    # * Trace records hits in evaluation order
+    def test_trace(self):
+        graph = StageGraph()
+        graph.key("read", resume="r")
+        graph.record("read", STAGE_HIT)
+        graph.key("generate", job="j")
+        graph.record("generate", STAGE_MISS)
+
+        assert graph.hits == ["read"]
+        assert graph.trace[1].key == graph.keys["generate"]
+
+
+class TestStageStore:
+    # * Round trip, disabled store & corrupt entries
+    def test_store(self, tmp_path):
+        store = StageStore(tmp_path)
+
+        store.put("generate", "abc", {"edits": {"ops": []}})
+        (tmp_path / "read").mkdir()
+        (tmp_path / "read" / "bad.json").write_text("{")
+
+        assert store.get("generate", "abc") == {"edits": {"ops": []}}
+        assert store.get("generate", "missing") is None
+        assert store.get("read", "bad") is None
+        assert not (tmp_path / "read" / "bad.json").exists()
+        assert StageStore(tmp_path, enabled=False).get("generate", "abc") is None
+        assert list((tmp_path / "generate").iterdir()) == [
+            tmp_path / "generate" / "abc.json"
+        ]
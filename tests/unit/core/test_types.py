@@ -0,0 +1,81 @@
+# tests/unit/core/test_types.py
+# Unit tests for immutable ResumeDocument model & Lines compatibility
+
+import copy
+import pickle
+
+import pytest
+
+from src.core.pipeline import apply_edits, diff_lines
+from src.core.types import ResumeDocument, number_lines
+
+LINES = {1: "John Doe", 2: "Engineer", 3: "", 4: "Python, Go"}
+
+
+class TestResumeDocument:
+    # * Behaves as read-only Lines mapping in ascending line order
+    def test_mapping_compat(self):
+        doc = ResumeDocument.from_lines({4: "d", 2: "b", 1: "a", 3: "c"})
+
+        assert list(doc) == [1, 2, 3, 4]
+        assert list(doc.items()) == [(1, "a"), (2, "b"), (3, "c"), (4, "d")]
+        assert doc == {1: "a", 2: "b", 3: "c", 4: "d"}
+        assert {1: "a", 2: "b", 3: "c", 4: "d"} == doc
+        assert doc[3] == "c" and doc.get(9) is None
+        assert 4 in doc and 0 not in doc and 5 not in doc and "1" not in doc
+        assert doc.to_lines() == {1: "a", 2: "b", 3: "c", 4: "d"}
+
+    # * Gapped numbering keeps explicit line numbers
+    def test_gapped_numbering(self):
+        doc = ResumeDocument.from_lines({1: "a", 5: "b", 7: "c"})
+
+        assert list(doc.line_numbers) == [1, 5, 7]
+        assert doc[5] == "b" and 3 not in doc
+        with pytest.raises(KeyError):
+            doc[3]
+        assert ResumeDocument(["x", "y"], numbers=[3, 4]).line_numbers == range(3, 5)
+        with pytest.raises(ValueError):
+            ResumeDocument(["x", "y"], numbers=[4, 3])
+
+    # * Fields cannot be reassigned
+    def test_immutable(self):
+        doc = ResumeDocument(["a"])
+
+        with pytest.raises(AttributeError):
+            doc._texts = ("b",)
+        with pytest.raises(TypeError):
+            doc[1] = "b"
+
+    # * Numbered rendering & hashes are computed once & match Lines helpers
+    def test_cached_views(self):
+        doc = ResumeDocument.from_lines(LINES)
+
+        assert number_lines(doc) == number_lines(LINES)
+        assert number_lines(doc) is number_lines(doc)
+        assert doc.line_hashes == tuple(hash(t) for t in LINES.values())
+        assert doc.line_hashes is doc.line_hashes
+
+    # * Applied edits yield document sharing unchanged line strings
+    def test_apply_edits_shares_lines(self):
+        doc = ResumeDocument.from_lines(LINES)
+        edits = {
+            "version": 1,
+            "ops": [
+                {"op": "insert_after", "line": 1, "text": "Remote"},
+                {"op": "replace_line", "line": 4, "text": "Python, Rust"},
+            ],
+        }
+
+        result = apply_edits(doc, edits)
+
+        assert isinstance(result, ResumeDocument)
+        assert result == apply_edits(dict(LINES), edits)
+        assert result[3] is doc[2]
+        assert diff_lines(doc, result) == diff_lines(LINES, result.to_lines())
+
+    # * Pickle & copy round-trip through constructor
+    def test_pickle_and_copy(self):
+        doc = ResumeDocument.from_lines({1: "a", 3: "b"})
+
+        assert pickle.loads(pickle.dumps(doc)) == doc
+        assert copy.deepcopy(doc) == doc
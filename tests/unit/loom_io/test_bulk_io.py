@@ -13,8 +13,23 @@ from src.loom_io.bulk_io import (
     write_run_metadata,
     write_job_artifacts,
     write_matrix_files,
+    cluster_duplicate_postings,
+    link_duplicate_artifacts,
+    read_run_metadata,
+    find_base_resume,
+    load_bulk_result,
+)
+from src.loom_io.result_journal import JOURNAL_NAME, ResultJournal
+from src.core.exceptions import ConfigurationError
+from src.core.bulk_types import (
+    JobSpec,
+    JobStatus,
+    JobResult,
+    BulkResult,
+    CascadeSummary,
+    PassResult,
+    DuplicateCluster,
 )
-from src.core.bulk_types import JobSpec, JobStatus, JobResult, BulkResult
 
 
 class TestDiscoverJobs:
@@ -174,6 +189,63 @@ class TestDeduplicateJobSpecs:
         assert result[1].name == "Job B"
 
 
+class TestDuplicatePostings:
+    POSTING = (
+        "Platform engineer to build internal developer tooling, CI pipelines and "
+        "Kubernetes infrastructure on AWS; own on-call rotations, write Terraform "
+        "modules, improve build times and partner w/ product teams on releases."
+    )
+
+    # * Clusters reposts under first discovered posting w/ member similarity
+    def test_clusters_reposts(self, tmp_path):
+        (tmp_path / "a.txt").write_text(self.POSTING + " Location: Austin.")
+        (tmp_path / "b.txt").write_text("Barista for weekend shifts at our cafe.")
+        (tmp_path / "c.txt").write_text(self.POSTING + " Location: Denver.")
+        specs = discover_jobs(tmp_path)
+
+        clusters = cluster_duplicate_postings(specs, threshold=0.75)
+
+        assert len(clusters) == 1
+        assert clusters[0].representative == "a"
+        assert clusters[0].members == ["c"]
+        assert clusters[0].similarity["c"] >= 0.75
+
+    # * Links representative outputs but not per-job metadata
+    def test_link_duplicate_artifacts(self, tmp_path):
+        source = tmp_path / "a"
+        source.mkdir()
+        (source / "edits.json").write_text("{}")
+        (source / "tailored_resume.docx").write_bytes(b"docx")
+        (source / "job.txt").write_text("job a")
+        (source / "triage").mkdir()
+
+        linked = link_duplicate_artifacts(source, tmp_path / "c")
+
+        assert sorted(p.name for p in linked) == ["edits.json", "tailored_resume.docx"]
+        assert (tmp_path / "c" / "tailored_resume.docx").read_bytes() == b"docx"
+        assert not (tmp_path / "c" / "job.txt").exists()
+
+    # * run.json records duplicate clusters
+    def test_run_metadata_records_clusters(self, tmp_path):
+        write_run_metadata(
+            tmp_path,
+            resume_path=tmp_path / "resume.docx",
+            model="gpt-4o",
+            settings_snapshot={},
+            job_specs=[],
+            duplicates=[
+                DuplicateCluster(
+                    representative="a", members=["c"], similarity={"c": 0.91234}
+                )
+            ],
+        )
+
+        data = json.loads((tmp_path / "run.json").read_text())
+        assert data["duplicates"] == [
+            {"representative": "a", "members": ["c"], "similarity": {"c": 0.912}}
+        ]
+
+
 class TestCreateBulkOutputLayout:
     # * Creates bulk_TIMESTAMP directory
     def test_creates_timestamped_dir(self, tmp_path):
@@ -223,6 +295,22 @@ class TestWriteRunMetadata:
         assert "test" in data["jobs"]
         assert data["jobs"]["test"]["content_hash"] is not None
 
+    # * Base resume copied beside run.json & found again for rebasing
+    def test_snapshots_resume(self, tmp_path):
+        bulk_dir = tmp_path / "bulk_test"
+        bulk_dir.mkdir()
+        resume = tmp_path / "resume.tex"
+        resume.write_text("Jane Doe")
+
+        write_run_metadata(bulk_dir, resume, "gpt-4o", {}, [])
+
+        data = read_run_metadata(bulk_dir)
+        assert data["resume_snapshot"] == "base_resume.tex"
+        snapshot = find_base_resume(bulk_dir, data)
+        assert snapshot is not None and snapshot.read_text() == "Jane Doe"
+        with pytest.raises(ConfigurationError):
+            read_run_metadata(tmp_path)
+
 
 class TestWriteJobArtifacts:
     # * Writes job.json & job.txt to job directory
@@ -320,3 +408,101 @@ class TestWriteMatrixFiles:
         md_content = (tmp_path / "matrix.md").read_text()
         assert "# Bulk Processing Results" in md_content
         assert "| Rank |" in md_content
+
+    # * matrix.md includes cascade summary & per-job passes
+    def test_md_contains_cascade(self, tmp_path):
+        job = JobResult(
+            spec=JobSpec(path=tmp_path / "job.txt", id="test", name="Test"),
+            status=JobStatus.SUCCESS,
+            fit_score=0.8,
+            model="gpt-5",
+            passes=[
+                PassResult(stage="triage", model="gpt-5-nano", fit_score=0.6),
+                PassResult(stage="final", model="gpt-5", fit_score=0.8),
+            ],
+        )
+        result = BulkResult(
+            resume_path=tmp_path / "resume.docx",
+            model="gpt-5",
+            timestamp="2025-01-01T00:00:00",
+            output_dir=tmp_path,
+            jobs=[job],
+            cascade=CascadeSummary(
+                triage_model="gpt-5-nano", final_model="gpt-5", triaged=3, promoted=1
+            ),
+        )
+
+        write_matrix_files(tmp_path, result)
+
+        md_content = (tmp_path / "matrix.md").read_text()
+        assert "## Cascade" in md_content
+        assert "**Final Passes Avoided:** 2" in md_content
+        assert "triage (gpt-5-nano, 0.60) → final (gpt-5, 0.80)" in md_content
+
+    # * matrix.json & matrix.md record near-duplicate clusters
+    def test_matrix_contains_duplicates(self, tmp_path):
+        result = BulkResult(
+            resume_path=tmp_path / "resume.docx",
+            model="gpt-4o",
+            timestamp="2025-01-01T00:00:00",
+            output_dir=tmp_path,
+            jobs=[
+                JobResult(
+                    spec=JobSpec(path=tmp_path / "a.txt", id="a"),
+                    status=JobStatus.SUCCESS,
+                    fit_score=0.7,
+                ),
+                JobResult(
+                    spec=JobSpec(path=tmp_path / "c.txt", id="c"),
+                    status=JobStatus.SUCCESS,
+                    fit_score=0.7,
+                    duplicate_of="a",
+                ),
+            ],
+            duplicates=[DuplicateCluster(representative="a", members=["c"])],
+        )
+
+        write_matrix_files(tmp_path, result)
+
+        data = json.loads((tmp_path / "matrix.json").read_text())
+        assert data["duplicates"][0]["members"] == ["c"]
+        assert data["jobs"][1]["duplicate_of"] == "a"
+        md_content = (tmp_path / "matrix.md").read_text()
+        assert "**Near-duplicates:** 1 jobs reused outputs" in md_content
+        assert "- **Duplicate Of:** a" in md_content
+
+
+class TestLoadBulkResult:
+    # * Journal replay: final entry supersedes triage, jobs keep run.json order
+    def test_rebuilds_from_journal(self, tmp_path):
+        specs = [JobSpec(path=tmp_path / f"{j}.txt", id=j) for j in "abc"]
+        write_run_metadata(tmp_path, tmp_path / "resume.docx", "gpt-5", {}, specs)
+
+        def result(job_id, score, model):
+            return JobResult(
+                spec=JobSpec(path=tmp_path / f"{job_id}.txt", id=job_id),
+                status=JobStatus.SUCCESS,
+                fit_score=score,
+                model=model,
+            )
+
+        with ResultJournal(tmp_path / JOURNAL_NAME) as journal:
+            journal.append_result(result("b", 0.4, "gpt-5-nano"), "triage")
+            journal.append_result(result("a", 0.3, "gpt-5-nano"), "triage")
+            journal.append_result(result("a", 0.9, "gpt-5"), "final")
+            journal.append(
+                {
+                    "type": "cascade",
+                    "summary": CascadeSummary("gpt-5-nano", "gpt-5").to_dict(),
+                }
+            )
+
+        loaded = load_bulk_result(tmp_path)
+
+        # "c" never finished, "b" only has its triage pass
+        assert [(j.spec.id, j.model) for j in loaded.jobs] == [
+            ("a", "gpt-5"),
+            ("b", "gpt-5-nano"),
+        ]
+        assert loaded.ranked_jobs()[0].fit_score == 0.9
+        assert loaded.cascade is not None and loaded.cascade.final_model == "gpt-5"
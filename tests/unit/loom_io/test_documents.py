@@ -5,9 +5,15 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+
 from src.loom_io.documents import (
     read_docx,
     read_docx_with_formatting,
+    load_docx,
+    clear_document_cache,
+    docx_template,
     write_docx,
     read_latex,
     write_text_lines,
@@ -137,6 +143,109 @@ class TestDocxReading:
 # * Test DOCX round-trip operations w/ formatting preservation
 
 
+class TestParsedDocxCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        clear_document_cache()
+        yield
+        clear_document_cache()
+
+    # * Repeated loads of unchanged file share one parse
+    def test_load_docx_reuses_parse(self, simple_docx_path):
+        with patch("src.loom_io.documents.Document", wraps=Document) as opened:
+            first = load_docx(simple_docx_path)
+            second = load_docx(simple_docx_path)
+            read_docx(simple_docx_path)
+
+        assert first is second
+        assert opened.call_count == 1
+
+    # * Rewriting file (new mtime/size) invalidates cached parse
+    def test_changed_file_is_reparsed(self, tmp_path):
+        path = tmp_path / "resume.docx"
+        write_docx({1: "First"}, path)
+        clear_document_cache()
+        assert read_docx(path) == {1: "First"}
+
+        # saved outside loom_io, so only the mtime/size check can notice
+        doc = Document()
+        doc.add_paragraph("First")
+        doc.add_paragraph("Second line")
+        doc.save(str(path))
+
+        assert read_docx(path) == {1: "First", 2: "Second line"}
+
+    # * Formatting reader returns private clone; cached tree stays untouched
+    def test_read_docx_with_formatting_is_copy_on_write(self, simple_docx_path):
+        original = dict(load_docx(simple_docx_path).lines)
+        lines, doc, paragraph_map = read_docx_with_formatting(simple_docx_path)
+
+        paragraph_map[1].text = "Mutated"
+        lines[1] = "Mutated"
+
+        assert doc is not load_docx(simple_docx_path).doc
+        assert doc.paragraphs[0].text == "Mutated"
+        assert read_docx(simple_docx_path) == original
+
+    # * Saved DOCX output is cached so reading it back skips parsing
+    def test_written_output_is_cached(self, simple_docx_path, tmp_path):
+        output = tmp_path / "out.docx"
+        lines = read_docx(simple_docx_path)
+        lines[1] = "Edited first line"
+        apply_edits_to_docx(simple_docx_path, lines, output)
+
+        with patch("src.loom_io.documents.Document") as opened:
+            result = read_docx(output)
+
+        opened.assert_not_called()
+        assert result[1] == "Edited first line"
+
+
+class TestDocxTemplate:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        clear_document_cache()
+        yield
+        clear_document_cache()
+
+    # * Many writes from one source parse it once & leave template untouched
+    def test_source_parsed_once_across_writes(self, sample_docx_path, tmp_path):
+        lines = read_docx(sample_docx_path)
+        with patch("src.loom_io.documents.Document", wraps=Document) as opened:
+            for i in range(3):
+                edited = dict(lines)
+                edited[2] = f"Job {i} headline"
+                apply_edits_to_docx(sample_docx_path, edited, tmp_path / f"{i}.docx")
+
+        assert opened.call_count == 1
+        assert docx_template(sample_docx_path).parsed.lines == lines
+        clear_document_cache()
+        assert read_docx(tmp_path / "2.docx")[2] == "Job 2 headline"
+
+    # * Body clone is independent of template tree
+    def test_clone_body_is_private(self, sample_docx_path):
+        template = docx_template(sample_docx_path)
+        element, paragraph_map = template.clone_body()
+
+        paragraph_map[1].text = "Changed"
+
+        assert template.parsed.paragraph_map[1].text != "Changed"
+        assert element.body[0] is paragraph_map[1]._element
+
+    # * Rebuild applies precomputed paragraph formats (centered header stays centered)
+    def test_rebuild_uses_format_table(self, sample_docx_path, tmp_path):
+        template = docx_template(sample_docx_path)
+        output = tmp_path / "rebuilt.docx"
+
+        apply_edits_to_docx(
+            sample_docx_path, read_docx(sample_docx_path), output, "rebuild"
+        )
+
+        assert ("alignment", WD_ALIGN_PARAGRAPH.CENTER) in template.paragraph_formats[1]
+        centered = Document(str(output)).paragraphs[0]
+        assert centered.alignment == WD_ALIGN_PARAGRAPH.CENTER
+
+
 class TestDocxRoundTrip:
 
     # * Test DOCX read→write cycle preserves basic content
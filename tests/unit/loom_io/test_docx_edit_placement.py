@@ -0,0 +1,168 @@
+# tests/unit/loom_io/test_docx_edit_placement.py
+# Regression tests for sorted-merge in-place DOCX edit placement vs. legacy scan
+
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+from docx.opc.oxml import serialize_part_xml
+from docx.oxml import OxmlElement
+from docx.text.paragraph import Paragraph
+
+from src.loom_io.documents import (
+    _categorize_edits,
+    _edit_body,
+    _set_paragraph_text_preserving_format,
+    clear_document_cache,
+    docx_template,
+)
+
+_FIXTURES = Path(__file__).parent.parent.parent / "fixtures" / "documents"
+
+
+# * Frozen copy of previous in-place edit placement (linear anchor scan per line)
+def _legacy_categorize(original_lines, new_lines):
+    modifications: Dict[int, str] = {}
+    additions: List[Tuple[int | None, int, str]] = []
+    original_set = set(original_lines)
+    new_set = set(new_lines)
+    for line_num in sorted(new_set):
+        if line_num in original_set and new_lines[line_num] != original_lines[line_num]:
+            modifications[line_num] = new_lines[line_num]
+    deletions = {ln for ln in original_set if ln not in new_set}
+    for line_num in sorted(new_set):
+        if line_num not in original_set:
+            insert_after = None
+            for existing_line in sorted(original_set):
+                if existing_line < line_num:
+                    insert_after = existing_line
+                else:
+                    break
+            additions.append((insert_after, line_num, new_lines[line_num]))
+    return modifications, additions, deletions
+
+
+def _legacy_edit_body(body, parent, paragraph_map, lines, new_lines):
+    modifications, additions, deletions = _legacy_categorize(lines, new_lines)
+    for line_num in sorted(deletions, reverse=True):
+        if line_num in paragraph_map:
+            p_element = paragraph_map[line_num]._element
+            p_element.getparent().remove(p_element)
+    for line_num, new_text in modifications.items():
+        if line_num in paragraph_map:
+            _set_paragraph_text_preserving_format(paragraph_map[line_num], new_text)
+    by_position: Dict[int | None, List[Tuple[int, str]]] = {}
+    for insert_after, line_num, text in additions:
+        by_position.setdefault(insert_after, []).append((line_num, text))
+    for position in by_position:
+        by_position[position].sort(key=lambda x: x[0])
+    numeric = sorted([p for p in by_position if p is not None], reverse=True)
+    for insert_after in numeric:
+        reference_para = paragraph_map.get(insert_after)
+        if not reference_para:
+            continue
+        for _, text in reversed(by_position[insert_after]):
+            new_p = OxmlElement("w:p")
+            reference_para._p.addnext(new_p)
+            new_para = Paragraph(new_p, reference_para._parent)
+            if text:
+                new_para.add_run(text)
+            if reference_para.style:
+                new_para.style = reference_para.style
+    if None in by_position:
+        for _, text in reversed(by_position[None]):
+            new_p = OxmlElement("w:p")
+            body.insert(0, new_p)
+            if text:
+                Paragraph(new_p, parent).add_run(text)
+
+
+# edit scenarios over original lines; anchors always survive (legacy-safe)
+def _modify_and_append(lines):
+    edited = dict(lines)
+    edited[1] = "Jane Doe"
+    edited[len(lines)] = lines[len(lines)] + " (updated)"
+    for i in range(1, 4):
+        edited[len(lines) + i] = f"• Appended bullet {i}"
+    return edited
+
+
+def _prepend_and_delete(lines):
+    edited = {ln: text for ln, text in lines.items() if ln % 3}
+    edited[0] = "Headline summary"
+    edited[-1] = ""
+    return edited
+
+
+def _mixed_edits(lines):
+    # originals are numbered 1..n, so new lines land before line 1 or after line n
+    last = max(lines)
+    edited = {ln: text for ln, text in lines.items() if ln % 4 or ln == last}
+    edited[2] = "Rewritten second line"
+    edited[0] = "Prepended line"
+    for i in range(1, 6):
+        edited[last + i * 2] = "" if i == 3 else f"Appended line {i}"
+    return edited
+
+
+_SCENARIOS = [_modify_and_append, _prepend_and_delete, _mixed_edits]
+
+
+def _edited_xml(path: Path, scenario, edit_body) -> bytes:
+    template = docx_template(path)
+    lines = template.parsed.lines
+    element, paragraph_map = template.clone_body()
+    edit_body(
+        element.body, template.parsed.doc._body, paragraph_map, lines, scenario(lines)
+    )
+    return serialize_part_xml(element)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_document_cache()
+    yield
+    clear_document_cache()
+
+
+class TestEditPlacementParity:
+    # * Sorted-merge placement writes byte-identical XML to legacy scan
+    @pytest.mark.parametrize("scenario", _SCENARIOS, ids=lambda s: s.__name__)
+    @pytest.mark.parametrize(
+        "path", sorted(_FIXTURES.glob("*.docx")), ids=lambda p: p.name
+    )
+    def test_matches_legacy_xml(self, path, scenario):
+        expected = _edited_xml(path, scenario, _legacy_edit_body)
+        actual = _edited_xml(path, scenario, _edit_body)
+
+        assert actual == expected
+
+    # * Categorized edits match legacy for sparse & dense line numbers
+    def test_categorize_matches_legacy(self):
+        original = {ln: f"line {ln}" for ln in range(1, 50)}
+        edited = {ln * 3: f"line {ln}" for ln in range(-5, 40)}
+        edited.update({ln: "new" for ln in range(100, 110)})
+
+        assert _categorize_edits(original, edited) == _legacy_categorize(
+            original, edited
+        )
+
+
+class TestEditPlacement:
+    # * Lines added after a deleted line take its place instead of being dropped
+    def test_addition_after_deleted_anchor_is_kept(self):
+        path = _FIXTURES / "basic_formatted_resume.docx"
+        template = docx_template(path)
+        lines = template.parsed.lines
+        last = max(lines)
+        edited = {ln: text for ln, text in lines.items() if ln != last}
+        edited[last + 1] = "Replacement closing line"
+        element, paragraph_map = template.clone_body()
+
+        _edit_body(
+            element.body, template.parsed.doc._body, paragraph_map, lines, edited
+        )
+
+        texts = [p.text for p in element.body.xpath("./w:p")]
+        assert "Replacement closing line" in texts
+        assert lines[last] not in texts
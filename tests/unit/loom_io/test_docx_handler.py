@@ -0,0 +1,117 @@
+# tests/unit/loom_io/test_docx_handler.py
+# Unit tests for deterministic local DOCX section detection
+
+from pathlib import Path
+
+from docx import Document
+
+from src.loom_io.documents import get_handler, read_docx
+from src.loom_io.docx_handler import (
+    DocxHandler,
+    heading_score,
+    is_confident_payload,
+    read_docx_features,
+)
+from src.loom_io.docx_patterns import ParagraphFeatures
+
+
+def _bold_line(doc, text: str) -> None:
+    doc.add_paragraph().add_run(text).bold = True
+
+
+def _build_resume(path: Path) -> Path:
+    doc = Document()
+    _bold_line(doc, "Jane Doe")
+    doc.add_paragraph("jane@example.com | 555-0100")
+    doc.add_heading("Experience", level=1)
+    doc.add_paragraph("Acme Corp, Software Engineer 2020-2023")
+    doc.add_paragraph("Built APIs in Python", style="List Bullet")
+    doc.add_paragraph("Led migration to Kubernetes", style="List Bullet")
+    _bold_line(doc, "EDUCATION")
+    doc.add_paragraph("State University, BS Computer Science")
+    _bold_line(doc, "Skills")
+    doc.add_paragraph("Python, SQL, Docker")
+    doc.save(str(path))
+    return path
+
+
+class TestHeadingScore:
+    # * Heading styles score highest regardless of text
+    def test_heading_style_is_strongest_signal(self):
+        score, kind = heading_score("Experience", ParagraphFeatures(heading_level=1))
+        assert score == 0.95
+        assert kind == "experience"
+
+    # * Numbered/bulleted paragraphs are never headings
+    def test_numbered_paragraph_is_not_heading(self):
+        score, _ = heading_score("Skills", ParagraphFeatures(bold=True, numbered=True))
+        assert score == 0.0
+
+    # * Long sentences are content even when bold
+    def test_long_line_is_not_heading(self):
+        text = "Led a team of five engineers building payment APIs."
+        score, _ = heading_score(text, ParagraphFeatures(bold=True))
+        assert score == 0.0
+
+    # * All-caps semantic text scores w/o formatting features
+    def test_text_only_caps_heading(self):
+        score, kind = heading_score("PROFESSIONAL EXPERIENCE")
+        assert score >= 0.75
+        assert kind == "experience"
+
+
+class TestDocxHandler:
+    # * Registry returns DOCX handler for .docx paths
+    def test_registered_for_docx(self):
+        assert isinstance(get_handler(Path("resume.docx")), DocxHandler)
+
+    # * Formatting features line up w/ read_docx line numbers
+    def test_features_follow_line_numbering(self, tmp_path):
+        path = _build_resume(tmp_path / "resume.docx")
+        features = read_docx_features(path)
+
+        assert set(features) == set(read_docx(path))
+        assert features[3].heading_level == 1
+        assert features[5].numbered
+        assert features[7].bold
+
+    # * Sections detected from heading style, bold & caps w/ list items
+    def test_build_context_detects_sections(self, tmp_path):
+        path = _build_resume(tmp_path / "resume.docx")
+        lines = read_docx(path)
+        handler = DocxHandler()
+
+        _, analysis = handler.build_context(path, lines, "\n".join(lines.values()))
+        payload = handler.sections_to_payload(analysis)
+
+        spans = [
+            (s["kind"], s["start_line"], s["end_line"]) for s in payload["sections"]
+        ]
+        assert spans == [
+            ("experience", 3, 6),
+            ("education", 7, 8),
+            ("skills", 9, 10),
+        ]
+        assert payload["sections"][0]["items"] == [5, 6]
+        assert analysis.header_lines == [1, 2]
+        assert is_confident_payload(payload)
+
+    # * Missing file falls back to text-only heuristics w/ a note
+    def test_missing_file_uses_text_heuristics(self, tmp_path):
+        lines = {1: "Jane Doe", 2: "EXPERIENCE", 3: "Acme", 4: "EDUCATION", 5: "BS"}
+        handler = DocxHandler()
+
+        _, analysis = handler.build_context(tmp_path / "gone.docx", lines, "")
+
+        assert [s.key for s in analysis.sections] == ["experience", "education"]
+        assert any("text-only" in note for note in analysis.notes)
+
+    # * Unstructured resume is low-confidence so the AI sectionizer is used
+    def test_unstructured_resume_is_low_confidence(self):
+        lines = {1: "Jane Doe", 2: "I have worked at Acme for five years."}
+        handler = DocxHandler()
+
+        analysis = handler.analyze(lines)
+
+        assert not is_confident_payload(handler.sections_to_payload(analysis))
+        assert any("AI sectionizer" in note for note in analysis.notes)
@@ -0,0 +1,64 @@
+# tests/unit/loom_io/test_docx_text.py
+# Unit tests for streaming DOCX text reader parity w/ python-docx paragraph text
+
+from pathlib import Path
+
+import pytest
+from docx import Document
+from docx.enum.text import WD_BREAK
+from docx.oxml import parse_xml
+
+from src.core.exceptions import DocumentParseError
+from src.loom_io.documents import _index_docx
+from src.loom_io.docx_text import read_docx_text
+
+_FIXTURES = Path(__file__).parent.parent.parent / "fixtures" / "documents"
+_W_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def _model_lines(path: Path) -> dict:
+    return _index_docx(Document(str(path))).lines
+
+
+class TestReadDocxText:
+    # * Streamed lines match python-docx model for every fixture
+    @pytest.mark.parametrize(
+        "path", sorted(_FIXTURES.glob("*.docx")), ids=lambda p: p.name
+    )
+    def test_matches_object_model_on_fixtures(self, path):
+        assert read_docx_text(path) == _model_lines(path)
+
+    # * Tabs, breaks, hyperlinks & table cells follow python-docx text rules
+    def test_inline_content_and_tables(self, tmp_path):
+        doc = Document()
+        para = doc.add_paragraph("Name")
+        para.add_run().add_tab()
+        para.add_run("Title")
+        wrapped = doc.add_paragraph("Line one")
+        wrapped.runs[0].add_break()
+        wrapped.add_run("line two")
+        paged = doc.add_paragraph("Before page")
+        paged.runs[0].add_break(WD_BREAK.PAGE)
+        linked = doc.add_paragraph("See ")
+        link = f"<w:hyperlink {_W_NS}><w:r><w:t>portfolio</w:t></w:r></w:hyperlink>"
+        linked._p.append(parse_xml(link))
+        doc.add_table(rows=1, cols=1).cell(0, 0).text = "Cell text"
+        doc.add_paragraph("After table")
+        path = tmp_path / "inline.docx"
+        doc.save(str(path))
+
+        lines = read_docx_text(path)
+
+        assert lines == _model_lines(path)
+        assert "Cell text" not in lines.values()
+        assert lines[2] == "Line one\nline two"
+
+    # * Missing & corrupt files raise DocumentParseError
+    def test_invalid_files_raise(self, tmp_path):
+        with pytest.raises(DocumentParseError, match="not found"):
+            read_docx_text(tmp_path / "missing.docx")
+
+        bogus = tmp_path / "bogus.docx"
+        bogus.write_bytes(b"not a zip")
+        with pytest.raises(DocumentParseError, match="not a valid zip"):
+            read_docx_text(bogus)
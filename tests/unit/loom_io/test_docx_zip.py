@@ -0,0 +1,99 @@
+# tests/unit/loom_io/test_docx_zip.py
+# Unit tests for zero-copy DOCX package writer & in-place apply output equivalence
+
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.exceptions import DocumentParseError
+from src.loom_io.documents import (
+    apply_edits_to_docx,
+    clear_document_cache,
+    docx_template,
+    read_docx,
+)
+from src.loom_io.docx_zip import _raw_member, write_patched_package
+
+
+@pytest.fixture
+def sample_docx_path():
+    fixtures_dir = Path(__file__).parent.parent.parent / "fixtures" / "documents"
+    return fixtures_dir / "basic_formatted_resume.docx"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_document_cache()
+    yield
+    clear_document_cache()
+
+
+def _edited_lines(path: Path) -> dict:
+    lines = read_docx(path)
+    lines[2] = "Rewritten second line"
+    lines[len(lines) + 1] = "Appended line"
+    del lines[3]
+    return lines
+
+
+class TestWritePatchedPackage:
+    # * Untouched members keep their compressed bytes; patched part is replaced
+    def test_copies_untouched_members_raw(self, sample_docx_path, tmp_path):
+        output = tmp_path / "out.docx"
+        write_patched_package(
+            sample_docx_path, output, {"word/document.xml": b"<w:document/>"}
+        )
+
+        with zipfile.ZipFile(sample_docx_path) as src, zipfile.ZipFile(output) as out:
+            assert out.testzip() is None
+            assert out.namelist() == src.namelist()
+            assert out.read("word/document.xml") == b"<w:document/>"
+            for info in src.infolist():
+                if info.filename == "word/document.xml":
+                    continue
+                copied = out.getinfo(info.filename)
+                assert copied.CRC == info.CRC
+                assert _raw_member(out.fp, copied) == _raw_member(src.fp, info)
+
+    # * Invalid source archive surfaces as DocumentParseError & leaves no temp file
+    def test_invalid_source_raises(self, tmp_path):
+        bogus = tmp_path / "bogus.docx"
+        bogus.write_bytes(b"not a zip")
+
+        with pytest.raises(DocumentParseError):
+            write_patched_package(bogus, tmp_path / "out.docx", {})
+        assert not list(tmp_path.glob("*.tmp"))
+        assert not (tmp_path / "out.docx").exists()
+
+
+class TestInPlaceZeroCopyOutput:
+    # * Zero-copy output matches full python-docx save part-for-part
+    def test_matches_full_save(self, sample_docx_path, tmp_path):
+        lines = _edited_lines(sample_docx_path)
+        fast = tmp_path / "fast.docx"
+        full = tmp_path / "full.docx"
+
+        apply_edits_to_docx(sample_docx_path, lines, fast)
+        with patch("src.loom_io.documents.DocxTemplate.is_current", return_value=False):
+            apply_edits_to_docx(sample_docx_path, lines, full)
+
+        with zipfile.ZipFile(fast) as a, zipfile.ZipFile(full) as b:
+            assert sorted(a.namelist()) == sorted(b.namelist())
+            for name in b.namelist():
+                assert a.read(name) == b.read(name), name
+        clear_document_cache()
+        assert read_docx(fast) == read_docx(full)
+        assert read_docx(full)[2] == "Rewritten second line"
+
+    # * Source changed after template was built is not patched (full save)
+    def test_stale_source_is_not_patched(self, sample_docx_path, tmp_path):
+        source = tmp_path / "resume.docx"
+        source.write_bytes(sample_docx_path.read_bytes())
+        template = docx_template(source)
+        assert template.patchable and template.is_current()
+
+        source.write_bytes(sample_docx_path.read_bytes() + b"\0")
+
+        assert not template.is_current()
@@ -0,0 +1,154 @@
+# tests/unit/loom_io/test_keyword_packs.py
+# Unit tests for keyword pack loading, discovery & compiled matcher caching
+
+import json
+
+import pytest
+
+from src.core.exceptions import ConfigurationError
+from src.core.keyword_matcher import DEFAULT_MATCHER
+from src.loom_io.keyword_packs import (
+    build_keyword_matcher,
+    find_keyword_packs,
+    keyword_pack_dirs,
+    load_keyword_matcher,
+    load_keyword_pack,
+)
+from src.loom_io.template_io import TEMPLATE_FILENAME
+
+HEALTHCARE_PACK = """
+words = ["HIPAA", "Epic"]
+phrases = ["electronic health records"]
+
+[pack]
+name = "healthcare"
+
+[aliases]
+Kubernetes = ["k8s", "kube"]
+"electronic health records" = "EHR"
+
+[labels]
+required = ["you will need"]
+"""
+
+JOB = "You will need: HIPAA, EHR & k8s\nNice to have: Epic"
+
+
+@pytest.fixture
+def pack_path(tmp_path):
+    path = tmp_path / "healthcare.toml"
+    path.write_text(HEALTHCARE_PACK)
+    return path
+
+
+class TestLoadKeywordPack:
+    # * TOML pack fields are parsed & string aliases normalized to lists
+    def test_load_toml(self, pack_path):
+        pack = load_keyword_pack(pack_path)
+
+        assert pack.name == "healthcare"
+        assert pack.words == ["HIPAA", "Epic"]
+        assert pack.aliases["electronic health records"] == ["EHR"]
+        assert pack.required_labels == ["you will need"]
+        assert pack.source_path == pack_path
+
+    # * JSON pack w/o name falls back to file stem
+    def test_load_json(self, tmp_path):
+        path = tmp_path / "fintech.json"
+        path.write_text(json.dumps({"words": ["PCI"], "aliases": {"PCI": ["PCI-DSS"]}}))
+
+        pack = load_keyword_pack(path)
+
+        assert pack.name == "fintech"
+        assert pack.words == ["PCI"]
+        assert pack.aliases == {"PCI": ["PCI-DSS"]}
+
+    # * Malformed packs raise ConfigurationError
+    @pytest.mark.parametrize(
+        "content",
+        ['words = "HIPAA"', "[aliases]\nk8s = 3", "labels = [1]", "not toml ["],
+    )
+    def test_invalid_pack(self, tmp_path, content):
+        path = tmp_path / "bad.toml"
+        path.write_text(content)
+
+        with pytest.raises(ConfigurationError):
+            load_keyword_pack(path)
+
+    # * Missing pack file raises ConfigurationError
+    def test_missing_pack(self, tmp_path):
+        with pytest.raises(ConfigurationError, match="not found"):
+            load_keyword_pack(tmp_path / "missing.toml")
+
+
+class TestPackDiscovery:
+    # * .loom/keywords first, then keywords/ next to template descriptor
+    def test_pack_dirs_include_template_dir(self, tmp_path):
+        template_dir = tmp_path / "templates" / "swe"
+        template_dir.mkdir(parents=True)
+        (template_dir / TEMPLATE_FILENAME).write_text('[template]\nid = "swe"')
+        resume = template_dir / "resume.tex"
+        resume.write_text("content")
+
+        dirs = keyword_pack_dirs(tmp_path / ".loom", resume)
+
+        assert dirs == [tmp_path / ".loom" / "keywords", template_dir / "keywords"]
+        assert keyword_pack_dirs(tmp_path / ".loom") == [
+            tmp_path / ".loom" / "keywords"
+        ]
+
+    # * Only pack files are found, sorted per directory; missing dirs ignored
+    def test_find_packs(self, tmp_path):
+        first = tmp_path / "a"
+        first.mkdir()
+        for name in ("b.toml", "a.json", "notes.md"):
+            (first / name).write_text("")
+
+        found = find_keyword_packs([first, tmp_path / "missing"])
+
+        assert [p.name for p in found] == ["a.json", "b.toml"]
+
+
+class TestKeywordMatcherLoading:
+    # * Pack vocabulary, aliases & labels extend built-ins
+    def test_build_extends_builtins(self, pack_path):
+        matcher = build_keyword_matcher([load_keyword_pack(pack_path)])
+
+        required, preferred = matcher.extract(JOB + "\nPython")
+
+        assert required == ["electronic health records", "HIPAA", "Kubernetes"]
+        assert preferred == ["Epic", "Python"]
+        assert len(matcher) > len(DEFAULT_MATCHER)
+
+    # * No packs reuses shared built-in matcher w/o touching cache
+    def test_no_packs_uses_default(self, tmp_path):
+        assert load_keyword_matcher([], tmp_path / "cache") is DEFAULT_MATCHER
+        assert not (tmp_path / "cache").exists()
+
+    # * Compiled matcher cached by content hash & reused until pack changes
+    def test_cache_hit_and_invalidation(self, tmp_path, pack_path):
+        cache_dir = tmp_path / "cache"
+
+        first = load_keyword_matcher([pack_path], cache_dir)
+        cached = list(cache_dir.glob("keywords-*.json"))
+        second = load_keyword_matcher([pack_path], cache_dir)
+
+        assert len(cached) == 1
+        assert second is not first
+        assert second.extract(JOB) == first.extract(JOB)
+
+        pack_path.write_text(pack_path.read_text() + "\n# edited\n")
+        load_keyword_matcher([pack_path], cache_dir)
+        assert len(list(cache_dir.glob("keywords-*.json"))) == 2
+
+    # * Corrupt cache entry is rebuilt instead of failing
+    def test_corrupt_cache_rebuilt(self, tmp_path, pack_path):
+        cache_dir = tmp_path / "cache"
+        load_keyword_matcher([pack_path], cache_dir)
+        (cache_file,) = cache_dir.glob("keywords-*.json")
+        cache_file.write_text("{not json")
+
+        matcher = load_keyword_matcher([pack_path], cache_dir)
+
+        assert "HIPAA" in matcher.extract(JOB)[0]
+        assert json.loads(cache_file.read_text())["format"] == 1
@@ -0,0 +1,74 @@
+# tests/unit/loom_io/test_object_store.py
+# Unit tests for content-addressed artifact store (dedup via hard links & gc)
+
+import hashlib
+import os
+
+from src.loom_io.generics import write_json_safe
+from src.loom_io.object_store import ObjectStore
+
+
+def _store(tmp_path) -> ObjectStore:
+    return ObjectStore(tmp_path / "objects")
+
+
+class TestObjectStore:
+    # * Identical bytes in different job dirs share one blob inode
+    def test_put_bytes_dedups(self, tmp_path):
+        store = _store(tmp_path)
+        a, b = tmp_path / "run1" / "job.txt", tmp_path / "run2" / "job.txt"
+
+        digest = store.put_bytes(b"Python role", a)
+        assert store.put_bytes(b"Python role", b) == digest
+
+        blob = store.blob_path(digest)
+        assert digest == hashlib.sha256(b"Python role").hexdigest()
+        assert a.read_bytes() == b"Python role"
+        assert os.path.samefile(a, b) and os.path.samefile(a, blob)
+        assert blob.stat().st_nlink == 3
+
+    # * Adopting written files links duplicates to first copy's blob
+    def test_adopt_dir(self, tmp_path):
+        store = _store(tmp_path)
+        for job in ("a", "b"):
+            (tmp_path / job).mkdir()
+            (tmp_path / job / "edits.json").write_text('{"ops": []}')
+        (tmp_path / "b" / "job.txt").write_text("unique")
+
+        assert store.adopt_dir(tmp_path / "a") == 1
+        assert store.adopt_dir(tmp_path / "b") == 2
+        edits = tmp_path / "a" / "edits.json"
+        assert os.path.samefile(edits, tmp_path / "b" / "edits.json")
+        # stored blobs (& so their links) are read-only
+        assert not edits.stat().st_mode & 0o222
+
+    # * Rewriting a linked JSON file replaces it instead of changing the shared blob
+    def test_rewrite_breaks_link(self, tmp_path):
+        store = _store(tmp_path)
+        a, b = tmp_path / "a.json", tmp_path / "b.json"
+        digest = store.put_bytes(b'{"v": 1}', a)
+        store.put_bytes(b'{"v": 1}', b)
+
+        write_json_safe({"v": 2}, a)
+
+        assert b.read_bytes() == b'{"v": 1}'
+        assert store.blob_path(digest).read_bytes() == b'{"v": 1}'
+
+    # * gc removes only blobs no longer linked from any job dir
+    def test_gc_removes_unreferenced(self, tmp_path):
+        store = _store(tmp_path)
+        kept = tmp_path / "keep.txt"
+        dropped = tmp_path / "drop.txt"
+        store.put_bytes(b"keep", kept)
+        digest = store.put_bytes(b"drop me", dropped)
+        dropped.unlink()
+
+        preview = store.gc(dry_run=True)
+        assert (preview.removed, preview.kept) == (1, 1)
+        assert store.blob_path(digest).exists()
+
+        result = store.gc()
+        assert result.removed == 1 and result.freed_bytes == len(b"drop me")
+        assert not store.blob_path(digest).exists()
+        assert not store.blob_path(digest).parent.exists()
+        assert kept.read_bytes() == b"keep"
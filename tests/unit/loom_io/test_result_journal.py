@@ -0,0 +1,35 @@
+# tests/unit/loom_io/test_result_journal.py
+# Unit tests for append-only bulk result journal (fsync'd JSONL)
+
+from src.core.bulk_types import JobResult, JobSpec, JobStatus
+from src.loom_io.result_journal import ResultJournal, read_journal
+
+
+class TestResultJournal:
+    # * Entries are readable line by line in write order, even before close
+    def test_append_and_read(self, tmp_path):
+        path = tmp_path / "run" / "results.jsonl"
+        journal = ResultJournal(path)
+        result = JobResult(
+            spec=JobSpec.from_path(tmp_path / "a.txt"), status=JobStatus.SUCCESS
+        )
+
+        journal.append_result(result, "triage")
+        journal.append({"type": "cascade", "summary": {}})
+
+        entries = list(read_journal(path))
+        assert [e["type"] for e in entries] == ["job", "cascade"]
+        assert entries[0]["stage"] == "triage"
+        assert entries[0]["result"]["id"] == "a"
+        journal.close()
+
+    # * Torn line from a crash mid-write is skipped & later appends stay whole
+    def test_torn_line_skipped(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        path.write_text('{"type": "job", "result": {"id": "a"}}\n{"type": "jo')
+
+        with ResultJournal(path) as journal:
+            journal.append({"type": "cascade", "summary": {}})
+
+        assert [e["type"] for e in read_journal(path)] == ["job", "cascade"]
+        assert list(read_journal(tmp_path / "missing.jsonl")) == []
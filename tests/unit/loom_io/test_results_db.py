@@ -0,0 +1,110 @@
+# tests/unit/loom_io/test_results_db.py
+# Unit tests for SQLite bulk results index (ranking, per-company top N & aggregation)
+
+import pytest
+
+from src.core.bulk_types import BulkResult, JobResult, JobSpec, JobStatus
+from src.core.exceptions import ConfigurationError
+from src.loom_io.results_db import ResultQuery, ResultsDB
+
+
+# bulk run dir w/ (job_id, company, model, fit, status) results started at timestamp
+def _run(tmp_path, name, timestamp, jobs) -> tuple[BulkResult, dict]:
+    result = BulkResult(
+        resume_path=tmp_path / "resume.docx",
+        model="gpt-5",
+        timestamp=timestamp,
+        output_dir=tmp_path / name,
+        jobs=[
+            JobResult(
+                spec=JobSpec(path=tmp_path / f"{job_id}.txt", id=job_id, company=co),
+                status=status,
+                model=model,
+                fit_score=fit,
+            )
+            for job_id, co, model, fit, status in jobs
+        ],
+    )
+    return result, {"timestamp": timestamp, "jobs": {}}
+
+
+def _db(tmp_path) -> ResultsDB:
+    db = ResultsDB(tmp_path / ".loom" / "results.db")
+    ok = JobStatus.SUCCESS
+    db.record_run(
+        *_run(
+            tmp_path,
+            "bulk_old",
+            "2025-01-01T09:00:00",
+            [
+                ("a", "Acme", "gpt-5", 0.9, ok),
+                ("b", "Globex", "gpt-5", 0.4, ok),
+            ],
+        )
+    )
+    db.record_run(
+        *_run(
+            tmp_path,
+            "bulk_new",
+            "2025-02-01T09:00:00",
+            [
+                ("a", "Acme", "gpt-5-mini", 0.7, ok),
+                ("c", "Acme Labs", "gpt-5-mini", 0.8, ok),
+                ("d", "Globex", "gpt-5-mini", 0.6, JobStatus.FAILED),
+            ],
+        )
+    )
+    return db
+
+
+class TestResultsDB:
+    # * Successful jobs across runs ranked by fit; re-recording a run replaces its rows
+    def test_top_jobs_across_runs(self, tmp_path):
+        db = _db(tmp_path)
+        db.record_run(
+            *_run(
+                tmp_path,
+                "bulk_old",
+                "2025-01-01T09:00:00",
+                [("a", "Acme", "gpt-5", 0.9, JobStatus.SUCCESS)],
+            )
+        )
+
+        rows = db.top_jobs(ResultQuery())
+
+        assert [(r["run"], r["job_id"]) for r in rows] == [
+            ("bulk_old", "a"),
+            ("bulk_new", "c"),
+            ("bulk_new", "a"),
+        ]
+        assert len(db.top_jobs(ResultQuery(status=None))) == 4
+
+    # * Filters compose; per-company keeps each company's best N
+    def test_filters_and_per_company(self, tmp_path):
+        db = _db(tmp_path)
+
+        recent = db.top_jobs(ResultQuery(since="2025-01-15", company="acme"))
+        best = db.top_jobs(ResultQuery(), per_company=1)
+
+        assert [r["job_id"] for r in recent] == ["c", "a"]
+        assert [(r["company"], r["fit_score"]) for r in best] == [
+            ("Acme", 0.9),
+            ("Acme Labs", 0.8),
+            ("Globex", 0.4),
+        ]
+        assert db.top_jobs(ResultQuery(company="%")) == []
+
+    # * Aggregates group counts & fit stats; unknown group is rejected
+    def test_aggregate_by_model(self, tmp_path):
+        db = _db(tmp_path)
+
+        rows = db.aggregate(ResultQuery(), by="model")
+
+        assert [(r["key"], r["jobs"], r["max_fit"]) for r in rows] == [
+            ("gpt-5-mini", 2, 0.8),
+            ("gpt-5", 2, 0.9),
+        ]
+        assert rows[0]["avg_fit"] == pytest.approx(0.75)
+        with pytest.raises(ConfigurationError):
+            db.aggregate(ResultQuery(), by="resume")
+        assert ResultsDB(tmp_path / "missing.db").top_jobs(ResultQuery()) == []
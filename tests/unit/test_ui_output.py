@@ -95,6 +95,25 @@ def test_success_reporting_tailor():
         assert "/tmp/output.docx" in output
 
 
+# * Test tailor reporting summarizes output diff hunks
+def test_success_reporting_tailor_diff_stats():
+    from src.core.line_diff import diff_hunks
+
+    mock_settings = Mock(spec=LoomSettings)
+    mock_settings.diff_path = Path("/tmp/diff.txt")
+    hunks = diff_hunks({1: "a", 2: "b"}, {1: "a", 2: "B", 3: "c"})
+
+    with capture_rich_output() as console:
+        report_result(
+            "tailor",
+            settings=mock_settings,
+            edits_path=Path("/tmp/edits.json"),
+            output_path=Path("/tmp/output.docx"),
+            hunks=hunks,
+        )
+        assert "(+2 -1 in 1 hunk)" in extract_plain_text(console)
+
+
 # * Test apply command reporting w/ formatting preservation
 def test_success_reporting_apply_with_formatting():
     mock_settings = Mock(spec=LoomSettings)